@@ -40,12 +40,18 @@
 # ------------------------------------------------------------------------------
 """This module contains base classes for the ledger API connection."""
 import asyncio
+import functools
 import inspect
+import json
+import threading
+import time
 from abc import ABC, abstractmethod
 from asyncio import Task
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from concurrent.futures._base import Executor
 from logging import Logger
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, Union, cast
 
 from aea.crypto.base import LedgerApi
 from aea.crypto.registries import Registry, ledger_apis_registry
@@ -55,10 +61,336 @@ from aea.mail.base import Envelope
 from aea.protocols.base import Message
 from aea.protocols.dialogue.base import Dialogue, Dialogues
 
+from packages.valory.connections.ledger.lanes import (
+    Priority,
+    REQUEST_PRIORITY,
+    RequestTimeoutError,
+)
+from packages.valory.connections.ledger.metrics import MetricsRegistry, RpcStats
+from packages.valory.connections.ledger.routing import make_ledger_api
+
+
+DEFAULT_HEALTH_CHECK_INTERVAL = 60.0
+REJECT_POLICY = "reject"
+SHED_OLDEST_POLICY = "shed_oldest"
+SATURATION_POLICIES = (REJECT_POLICY, SHED_OLDEST_POLICY)
+DEFAULT_EXECUTOR_CONFIG: Dict[str, Any] = dict(
+    max_workers=8,
+    max_queue_depth=256,
+    saturation_policy=REJECT_POLICY,
+)
+DEFAULT_EXECUTOR_NAME = "default"
+
+LedgerApiKey = Tuple[str, str]
+WorkItem = Tuple[Future, Callable, Tuple[Any, ...], Dict[str, Any]]
+
+
+class ExecutorSaturatedError(Exception):
+    """Raised when a call is rejected or shed by a saturated executor."""
+
+
+class BoundedExecutor(Executor):
+    """
+    A named thread pool executor with a bounded queue.
+
+    At most `max_workers` calls run at a time and at most `max_queue_depth` calls wait for a worker.
+    When the queue is full, the `saturation_policy` decides what happens to a new call:
+    `reject` fails the new call, `shed_oldest` fails the call that has been waiting the longest
+    and queues the new one, so that stale requests give way to fresh ones.
+    Failed calls raise an `ExecutorSaturatedError`.
+
+    The calls are queued by the priority of the request they are made for (`REQUEST_PRIORITY`),
+    and a free worker takes the oldest call of the most urgent priority.
+    A full queue always sheds the oldest of its least urgent calls for a more urgent new call.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        max_queue_depth: int,
+        saturation_policy: str = REJECT_POLICY,
+    ) -> None:
+        """
+        Initialize the executor.
+
+        :param name: the name of the executor, also used as the prefix of its threads' names.
+        :param max_workers: the maximum number of calls that run at a time.
+        :param max_queue_depth: the maximum number of calls that wait for a worker.
+        :param saturation_policy: what to do with a new call when the queue is full.
+        """
+        if saturation_policy not in SATURATION_POLICIES:
+            raise ValueError(
+                f"Saturation policy must be one of {SATURATION_POLICIES}, provided: {saturation_policy!r}"
+            )
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.saturation_policy = saturation_policy
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix=name)
+        self._queues: Dict[Priority, Deque[WorkItem]] = {
+            priority: deque() for priority in Priority
+        }
+        self._queue_depth = 0
+        self._running = 0
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.shed = 0
+        self.peak_queue_depth = 0
+
+    def submit(  # type: ignore  # pylint: disable=arguments-differ
+        self, fn: Callable, *args: Any, **kwargs: Any
+    ) -> Future:
+        """
+        Submit a call, queueing it if all the workers are busy.
+
+        :param fn: the callable.
+        :param args: the positional arguments of the call.
+        :param kwargs: the keyword arguments of the call.
+        :return: the future of the call.
+        """
+        future: Future = Future()
+        priority = REQUEST_PRIORITY.get()
+        shed: Optional[WorkItem] = None
+        with self._lock:
+            self.submitted += 1
+            if self._running < self.max_workers:
+                self._start((future, fn, args, kwargs))
+                return future
+            if self._queue_depth >= self.max_queue_depth:
+                least_urgent = max(
+                    (p for p, queue in self._queues.items() if queue), default=None
+                )
+                if least_urgent is None or not (
+                    least_urgent > priority
+                    or least_urgent == priority
+                    and self.saturation_policy == SHED_OLDEST_POLICY
+                ):
+                    self.rejected += 1
+                    raise ExecutorSaturatedError(
+                        f"Executor {self.name!r} is saturated: {self._running} calls running "
+                        f"and {self._queue_depth} queued."
+                    )
+                shed = self._queues[least_urgent].popleft()
+                self._queue_depth -= 1
+                self.shed += 1
+            self._queues[priority].append((future, fn, args, kwargs))
+            self._queue_depth += 1
+            self.peak_queue_depth = max(self.peak_queue_depth, self._queue_depth)
+        if shed is not None:
+            shed_future = shed[0]
+            if shed_future.set_running_or_notify_cancel():
+                shed_future.set_exception(
+                    ExecutorSaturatedError(
+                        f"Call shed by the saturated executor {self.name!r}."
+                    )
+                )
+        return future
+
+    def _start(self, item: WorkItem) -> None:
+        """Start a call on a worker. Must be called with the lock held."""
+        self._running += 1
+        self._pool.submit(self._run, item)
+
+    def _run(self, item: WorkItem) -> None:
+        """Run a call, then start the most urgent queued one."""
+        future, fn, args, kwargs = item
+        try:
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as e:  # pylint: disable=broad-except
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self.completed += 1
+                for queue in self._queues.values():
+                    if queue:
+                        self._queue_depth -= 1
+                        self._start(queue.popleft())
+                        break
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """
+        Shut the executor down.
+
+        :param wait: whether to wait for the running calls to finish.
+        :param cancel_futures: whether to cancel the queued calls.
+        """
+        if cancel_futures:
+            with self._lock:
+                queued = [item for queue in self._queues.values() for item in queue]
+                for queue in self._queues.values():
+                    queue.clear()
+                self._queue_depth = 0
+            for future, *_ in queued:
+                future.cancel()
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Get the metrics of the executor."""
+        with self._lock:
+            queue_depth = self._queue_depth
+            running = self._running
+        return dict(
+            max_workers=self.max_workers,
+            max_queue_depth=self.max_queue_depth,
+            running=running,
+            queue_depth=queue_depth,
+            peak_queue_depth=self.peak_queue_depth,
+            saturated=queue_depth >= self.max_queue_depth,
+            submitted=self.submitted,
+            completed=self.completed,
+            rejected=self.rejected,
+            shed=self.shed,
+        )
+
+
+class LedgerApiPool:
+    """
+    A pool of long-lived ledger apis, keyed by the ledger id and the normalized api config.
+
+    Reusing the apis avoids building a new provider for every request,
+    and keeps the HTTP sessions that the provider has opened alive.
+    An api is health checked at most once per `health_check_interval` seconds, out of band,
+    and it is evicted if it is no longer connected, so that the next request makes a new one.
+    """
+
+    def __init__(
+        self,
+        make: Callable[..., LedgerApi],
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        :param make: the factory of the ledger apis, called with the ledger id and the api config.
+        :param health_check_interval: the minimum interval between the health checks of an api, in seconds.
+        """
+        self._make = make
+        self.health_check_interval = health_check_interval
+        self._apis: Dict[LedgerApiKey, LedgerApi] = {}
+        self._last_checked: Dict[LedgerApiKey, float] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.health_checks = 0
+
+    @staticmethod
+    def make_key(ledger_id: str, config: Dict[str, Any]) -> LedgerApiKey:
+        """Make the key of an api, the same for equal configs regardless of their key order."""
+        return ledger_id, json.dumps(config, sort_keys=True, default=str)
+
+    def get(self, ledger_id: str, config: Dict[str, Any]) -> LedgerApi:
+        """
+        Get the api for the given ledger id and config, making it if it is not pooled.
+
+        :param ledger_id: the ledger id.
+        :param config: the api config.
+        :return: the ledger api.
+        """
+        key = self.make_key(ledger_id, config)
+        with self._lock:
+            api = self._apis.get(key, None)
+            if api is not None:
+                self.hits += 1
+                return api
+            self.misses += 1
+            api = self._make(ledger_id, **config)
+            self._apis[key] = api
+            self._last_checked[key] = time.monotonic()
+            return api
+
+    def due_for_health_check(self, ledger_id: str, config: Dict[str, Any]) -> bool:
+        """
+        Check whether the api for the given ledger id and config is due for a health check.
+
+        The check is considered started when this returns True, so it is due only once per interval.
+
+        :param ledger_id: the ledger id.
+        :param config: the api config.
+        :return: whether the api should be health checked.
+        """
+        key = self.make_key(ledger_id, config)
+        now = time.monotonic()
+        with self._lock:
+            last_checked = self._last_checked.get(key, None)
+            if last_checked is None or now - last_checked < self.health_check_interval:
+                return False
+            self._last_checked[key] = now
+            return True
+
+    def check_health(self, ledger_id: str, config: Dict[str, Any]) -> bool:
+        """
+        Check that the pooled api for the given ledger id and config is connected, evicting it otherwise.
+
+        This performs a request, so it should not be run in the event loop.
+        Apis which cannot tell whether they are connected are considered healthy.
+
+        :param ledger_id: the ledger id.
+        :param config: the api config.
+        :return: whether the api is healthy.
+        """
+        key = self.make_key(ledger_id, config)
+        with self._lock:
+            api = self._apis.get(key, None)
+        if api is None:
+            return False
+        self.health_checks += 1
+        is_connected = getattr(api.api, "is_connected", None)
+        if is_connected is None:
+            return True
+        try:
+            is_healthy = bool(is_connected())
+        except Exception:  # pylint: disable=broad-except
+            is_healthy = False
+        if not is_healthy:
+            self.evict(ledger_id, config)
+        return is_healthy
+
+    def evict(self, ledger_id: str, config: Dict[str, Any]) -> None:
+        """
+        Evict the api for the given ledger id and config, if it is pooled.
+
+        :param ledger_id: the ledger id.
+        :param config: the api config.
+        """
+        key = self.make_key(ledger_id, config)
+        with self._lock:
+            if self._apis.pop(key, None) is not None:
+                self.evictions += 1
+            self._last_checked.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all the apis from the pool."""
+        with self._lock:
+            self._apis.clear()
+            self._last_checked.clear()
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Get the metrics of the pool."""
+        return dict(
+            size=len(self._apis),
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            health_checks=self.health_checks,
+        )
+
 
 class RequestDispatcher(ABC):
     """Base class for a request dispatcher."""
 
+    dispatcher_type = "request"
+
     def __init__(  # pylint: disable=too-many-arguments
         self,
         logger: Logger,
@@ -68,6 +400,9 @@ class RequestDispatcher(ABC):
         loop: Optional[asyncio.AbstractEventLoop] = None,
         executor: Optional[Executor] = None,
         api_configs: Optional[Dict[str, Dict[str, str]]] = None,
+        ledger_api_pool: Optional[LedgerApiPool] = None,
+        executor_configs: Optional[Dict[str, Dict[str, Any]]] = None,
+        call_metrics: Optional[MetricsRegistry] = None,
     ):
         """
         Initialize the request dispatcher.
@@ -77,8 +412,12 @@ class RequestDispatcher(ABC):
         :param logger: the logger.
         :param connection_state: connection state.
         :param loop: the asyncio loop.
-        :param executor: an executor.
+        :param executor: an executor, used for all the chains instead of the bounded per chain executors.
         :param api_configs: api configs.
+        :param ledger_api_pool: the pool of the ledger apis, shared with the other dispatchers.
+        :param executor_configs: the configs of the bounded per chain executors,
+            keyed by executor name (`<dispatcher type>:<chain id>`) or by chain id, with a `default` fallback.
+        :param call_metrics: the registry of the metrics of the calls, shared with the other dispatchers.
         """
         self.connection_state = connection_state
         self.loop = loop if loop is not None else asyncio.get_event_loop()
@@ -87,6 +426,18 @@ class RequestDispatcher(ABC):
         self.logger = logger
         self.retry_attempts = retry_attempts
         self.retry_timeout = retry_timeout
+        self.ledger_api_pool = (
+            ledger_api_pool
+            if ledger_api_pool is not None
+            else LedgerApiPool(
+                functools.partial(make_ledger_api, self.ledger_api_registry)
+            )
+        )
+        self._executor_configs = executor_configs or {}
+        self.call_metrics = (
+            call_metrics if call_metrics is not None else MetricsRegistry()
+        )
+        self._chain_executors: Dict[str, BoundedExecutor] = {}
 
     def api_config(self, ledger_id: str) -> Dict[str, str]:
         """Get api config."""
@@ -95,12 +446,53 @@ class RequestDispatcher(ABC):
             config = self._api_configs[ledger_id]
         return config
 
-    async def run_async(
+    def executor_config(self, chain_id: str) -> Dict[str, Any]:
+        """Get the config of the executor of a chain."""
+        name = f"{self.dispatcher_type}:{chain_id}"
+        for key in (name, chain_id, DEFAULT_EXECUTOR_NAME):
+            if key in self._executor_configs:
+                return {**DEFAULT_EXECUTOR_CONFIG, **self._executor_configs[key]}
+        return dict(DEFAULT_EXECUTOR_CONFIG)
+
+    def get_executor(self, chain_id: str) -> Optional[Executor]:
+        """
+        Get the executor of the calls to a chain.
+
+        :param chain_id: the chain id.
+        :return: the executor given to the dispatcher, if any, otherwise the bounded executor of the chain.
+        """
+        if self.executor is not None:
+            return self.executor
+        executor = self._chain_executors.get(chain_id, None)
+        if executor is None:
+            executor = BoundedExecutor(
+                f"{self.dispatcher_type}:{chain_id}", **self.executor_config(chain_id)
+            )
+            self._chain_executors[chain_id] = executor
+        return executor
+
+    @property
+    def executor_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Get the metrics of the bounded per chain executors, by executor name."""
+        return {
+            executor.name: executor.metrics
+            for executor in self._chain_executors.values()
+        }
+
+    def shutdown_executors(self) -> None:
+        """Shut the bounded per chain executors down, cancelling the queued calls."""
+        for executor in self._chain_executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._chain_executors.clear()
+
+    async def run_async(  # pylint: disable=too-many-arguments
         self,
         func: Callable[[Any], Task],
         api: LedgerApi,
         message: Message,
         dialogue: Dialogue,
+        executor: Optional[Executor] = None,
+        timeout: Optional[float] = None,
     ) -> Union[Message, Task]:
         """
         Run a function in executor.
@@ -109,8 +501,12 @@ class RequestDispatcher(ABC):
         :param api: the ledger api.
         :param message: a Ledger API message.
         :param dialogue: a Ledger API dialogue.
+        :param executor: the executor to run the function in, the dispatcher's executor if not given.
+        :param timeout: the time after which the function is cancelled, in seconds, or None for no limit.
         :return: the return value of the function.
         """
+        stats = RpcStats()
+        start = time.perf_counter()
         try:
             if inspect.iscoroutinefunction(func):
                 # If it is a coroutine, no need to run it in an executor
@@ -118,12 +514,58 @@ class RequestDispatcher(ABC):
                 task = func(api, message, dialogue)  # type: ignore
             else:
                 task = self.loop.run_in_executor(  # type: ignore
-                    self.executor, func, api, message, dialogue
+                    executor if executor is not None else self.executor,
+                    stats.run,
+                    func,
+                    api,
+                    message,
+                    dialogue,
                 )
-            response = await task
-            return response
+            response = await asyncio.wait_for(task, timeout)
+        except asyncio.TimeoutError:
+            response = self.get_error_message(
+                RequestTimeoutError(f"Request timed out after {timeout:.1f} seconds."),
+                api,
+                message,
+                dialogue,
+            )
+        except ExecutorSaturatedError as exception:
+            self.logger.warning(str(exception))
+            response = self.get_error_message(exception, api, message, dialogue)
         except Exception as exception:  # pylint: disable=broad-except
-            return self.get_error_message(exception, api, message, dialogue)
+            response = self.get_error_message(exception, api, message, dialogue)
+        self.record_call(message, response, time.perf_counter() - start, stats)
+        return response
+
+    def record_call(
+        self,
+        message: Message,
+        response: Optional[Message],
+        latency: float,
+        stats: RpcStats,
+    ) -> None:
+        """
+        Record the metrics of a call, per ledger id, contract id and callable.
+
+        :param message: the request.
+        :param response: the response, if any; a call without a response message is recorded as failed.
+        :param latency: the latency of the call, in seconds.
+        :param stats: the RPC responses and retries of the call.
+        """
+        # the fields are read from the slots of the messages, the properties are too slow for every call
+        key = (
+            message.get("ledger_id") or self.get_ledger_id(message),
+            message.get("contract_id") or "",
+            message.get("callable") or message.get("performative").value,
+        )
+        self.call_metrics.record(
+            key,
+            latency,
+            stats.size if stats.responses else None,
+            not isinstance(response, Message)
+            or response.get("performative").value == "error",
+            stats.retries,
+        )
 
     async def wait_for(
         self, func: Callable, *args: Any, timeout: Optional[float] = None
@@ -164,11 +606,12 @@ class RequestDispatcher(ABC):
         """
         return
 
-    def dispatch(self, envelope: Envelope) -> Task:
+    def dispatch(self, envelope: Envelope, timeout: Optional[float] = None) -> Task:
         """
         Dispatch the request to the right sender handler.
 
         :param envelope: the envelope.
+        :param timeout: the time after which the request is cancelled, in seconds, or None for no limit.
         :return: an awaitable.
         """
         if not isinstance(envelope.message, Message):  # pragma: nocover
@@ -177,7 +620,17 @@ class RequestDispatcher(ABC):
         ledger_id = self.get_ledger_id(message)
         chain_id = self.get_chain_id(message)
         self.set_extra_kwargs(message)
-        api = self.ledger_api_registry.make(ledger_id, **self.api_config(chain_id))
+        api_config = self.api_config(chain_id)
+        api = self.ledger_api_pool.get(ledger_id, api_config)
+        executor = self.get_executor(chain_id)
+        if self.ledger_api_pool.due_for_health_check(ledger_id, api_config):
+            try:
+                self.loop.run_in_executor(
+                    executor, self.ledger_api_pool.check_health, ledger_id, api_config
+                )
+            except ExecutorSaturatedError:
+                # the check will be retried on the next interval
+                pass
         dialogue = self.dialogues.update(message)
         if dialogue is None:
             raise ValueError(  # pragma: nocover
@@ -185,7 +638,23 @@ class RequestDispatcher(ABC):
             )
         performative = message.performative
         handler = self.get_handler(performative)
-        return self.loop.create_task(self.run_async(handler, api, message, dialogue))
+        return self.loop.create_task(
+            self.run_async(handler, api, message, dialogue, executor, timeout)
+        )
+
+    def reject(self, envelope: Envelope, exception: Exception) -> Optional[Message]:
+        """
+        Reply to a request which is not dispatched with an error.
+
+        :param envelope: the envelope of the request.
+        :param exception: the reason of the rejection.
+        :return: the error message, or None if the request does not fit a dialogue.
+        """
+        message = cast(Message, envelope.message)
+        dialogue = self.dialogues.update(message)
+        if dialogue is None:  # pragma: nocover
+            return None
+        return self.get_error_message(exception, None, message, dialogue)
 
     def get_handler(self, performative: Any) -> Callable[[Any], Task]:
         """
@@ -196,14 +665,14 @@ class RequestDispatcher(ABC):
         """
         handler = getattr(self, performative.value, None)
         if handler is None:
-            raise Exception("Performative not recognized.")  # pragma: nocover
+            raise ValueError("Performative not recognized.")  # pragma: nocover
         return handler
 
     @abstractmethod
     def get_error_message(
         self,
         exception: Exception,
-        api: LedgerApi,
+        api: Optional[LedgerApi],
         message: Message,
         dialogue: Dialogue,
     ) -> Message:
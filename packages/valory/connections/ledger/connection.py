@@ -21,25 +21,52 @@
 """Scaffold connection and channel."""
 
 import asyncio
+import functools
+import itertools
 from typing import Any, Dict, Optional
 
 from aea.configurations.base import PublicId
 from aea.connections.base import Connection, ConnectionStates
+from aea.crypto.registries import ledger_apis_registry
 from aea.mail.base import Envelope
 from aea.protocols.base import Message
 
-from packages.valory.connections.ledger.base import RequestDispatcher
+from packages.valory.connections.ledger.base import (
+    DEFAULT_HEALTH_CHECK_INTERVAL,
+    LedgerApiPool,
+    RequestDispatcher,
+)
 from packages.valory.connections.ledger.contract_dispatcher import (
     ContractApiRequestDispatcher,
 )
+from packages.valory.connections.ledger.lanes import (
+    Lane,
+    LaneFullError,
+    Priority,
+    REQUEST_PRIORITY,
+    RequestTimeoutError,
+    get_priority,
+    make_lanes,
+    pop_deadline,
+)
 from packages.valory.connections.ledger.ledger_dispatcher import (
     LedgerApiRequestDispatcher,
 )
+from packages.valory.connections.ledger.metrics import (
+    MetricsExporter,
+    MetricsRegistry,
+    make_exporter,
+)
+from packages.valory.connections.ledger.receipt_waiter import (
+    DEFAULT_BLOCK_POLL_INTERVAL,
+)
+from packages.valory.connections.ledger.routing import make_ledger_api
 from packages.valory.protocols.contract_api import ContractApiMessage
 from packages.valory.protocols.ledger_api import LedgerApiMessage
 
 
 PUBLIC_ID = PublicId.from_str("valory/ledger:0.19.0")
+DEFAULT_EXPORT_INTERVAL = 60.0
 
 
 class LedgerConnection(Connection):
@@ -56,8 +83,11 @@ class LedgerConnection(Connection):
         self._ledger_dispatcher: Optional[LedgerApiRequestDispatcher] = None
         self._contract_dispatcher: Optional[ContractApiRequestDispatcher] = None
         self._response_envelopes: Optional[asyncio.Queue] = None
+        self._ledger_api_pool: Optional[LedgerApiPool] = None
+        self._sequence = itertools.count()
 
         self.task_to_request: Dict[asyncio.Future, Envelope] = {}
+        self._task_to_lane: Dict[asyncio.Future, Lane] = {}
         self.api_configs = self.configuration.config.get(
             "ledger_apis", {}
         )  # type: Dict[str, Dict[str, str]]
@@ -67,10 +97,33 @@ class LedgerConnection(Connection):
         self.request_retry_timeout = self.configuration.config.get(
             "retry_timeout", self.TIMEOUT
         )
+        self.health_check_interval = self.configuration.config.get(
+            "health_check_interval", DEFAULT_HEALTH_CHECK_INTERVAL
+        )
+        self.executor_configs = self.configuration.config.get(
+            "executors", {}
+        )  # type: Dict[str, Dict[str, Any]]
+        self.block_poll_interval = self.configuration.config.get(
+            "block_poll_interval", DEFAULT_BLOCK_POLL_INTERVAL
+        )
+        self.lane_configs = self.configuration.config.get(
+            "lanes", {}
+        )  # type: Dict[str, Dict[str, Any]]
+        self.lanes: Dict[Priority, Lane] = make_lanes()
+        self.metrics_config = self.configuration.config.get(
+            "metrics", {}
+        )  # type: Dict[str, Any]
+        self.call_metrics = MetricsRegistry()
+        self._metrics_exporter: Optional[MetricsExporter] = None
+        self._export_task: Optional[asyncio.Task] = None
 
     @property
     def response_envelopes(self) -> asyncio.Queue:
-        """Get the response envelopes. Only intended to be accessed when connected."""
+        """
+        Get the response envelopes. Only intended to be accessed when connected.
+
+        The responses are queued by the priority of their requests, then in the order they are ready.
+        """
         if self._response_envelopes is None:
             raise ValueError(
                 "`asyncio.Queue` for `_response_envelopes` not set. Is the ledger connection active?"
@@ -85,6 +138,11 @@ class LedgerConnection(Connection):
 
         self.state = ConnectionStates.connecting
 
+        # the ledger apis are shared by the dispatchers, for as long as the connection is up
+        self._ledger_api_pool = LedgerApiPool(
+            functools.partial(make_ledger_api, ledger_apis_registry),
+            self.health_check_interval,
+        )
         self._ledger_dispatcher = LedgerApiRequestDispatcher(
             self._state,
             loop=self.loop,
@@ -93,6 +151,10 @@ class LedgerConnection(Connection):
             retry_attempts=self.request_retry_attempts,
             retry_timeout=self.request_retry_timeout,
             connection_id=self.connection_id,
+            ledger_api_pool=self._ledger_api_pool,
+            executor_configs=self.executor_configs,
+            block_poll_interval=self.block_poll_interval,
+            call_metrics=self.call_metrics,
         )
         self._contract_dispatcher = ContractApiRequestDispatcher(
             self._state,
@@ -102,9 +164,20 @@ class LedgerConnection(Connection):
             retry_attempts=self.request_retry_attempts,
             retry_timeout=self.request_retry_timeout,
             connection_id=self.connection_id,
+            ledger_api_pool=self._ledger_api_pool,
+            executor_configs=self.executor_configs,
+            call_metrics=self.call_metrics,
         )
 
-        self._response_envelopes = asyncio.Queue()
+        metrics_config = dict(self.metrics_config or {})
+        exporter = metrics_config.pop("exporter", None)
+        if exporter is not None:
+            interval = metrics_config.pop("interval", DEFAULT_EXPORT_INTERVAL)
+            self._metrics_exporter = make_exporter(exporter, **metrics_config)
+            self._export_task = self.loop.create_task(self._export_metrics(interval))
+
+        self.lanes = make_lanes(self.lane_configs)
+        self._response_envelopes = asyncio.PriorityQueue()
         self.state = ConnectionStates.connected
 
     async def disconnect(self) -> None:
@@ -117,48 +190,156 @@ class LedgerConnection(Connection):
         for task in self.task_to_request.keys():
             if not task.cancelled():  # pragma: nocover
                 task.cancel()
+        for lane in self.lanes.values():
+            self.logger.debug(f"Lane {lane.name!r} metrics: {lane.metrics}")
+            lane.queue.clear()
+        if self._export_task is not None:
+            self._export_task.cancel()
+            self._export_task = None
+        if self._metrics_exporter is not None:
+            self._export_snapshot()
+            self._metrics_exporter = None
+        for dispatcher in (self._ledger_dispatcher, self._contract_dispatcher):
+            if dispatcher is not None:
+                self.logger.debug(f"Executor metrics: {dispatcher.executor_metrics}")
+                dispatcher.shutdown_executors()
+        if self._contract_dispatcher is not None:
+            self.logger.debug(
+                f"Coalescing metrics: {self._contract_dispatcher.coalescing_metrics}"
+            )
+            self.logger.debug(
+                f"Contract instance cache metrics: {self._contract_dispatcher.contract_instance_cache.metrics}"
+            )
+        if self._ledger_api_pool is not None:
+            self.logger.debug(
+                f"Ledger API pool metrics: {self._ledger_api_pool.metrics}"
+            )
+            self._ledger_api_pool.clear()
         self._ledger_dispatcher = None
         self._contract_dispatcher = None
         self._response_envelopes = None
+        self._ledger_api_pool = None
 
         self.state = ConnectionStates.disconnected
 
+    async def _export_metrics(self, interval: float) -> None:
+        """Export the metrics of the calls periodically."""
+        while True:
+            await asyncio.sleep(interval)
+            await self.loop.run_in_executor(None, self._export_snapshot)
+
+    def _export_snapshot(self) -> None:
+        """Export a snapshot of the metrics of the calls."""
+        if self._metrics_exporter is None:  # pragma: nocover
+            return
+        try:
+            self._metrics_exporter.export(self.call_metrics.snapshot())
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.warning(f"Could not export the metrics of the calls: {e}")
+
     async def send(self, envelope: "Envelope") -> None:
         """
         Send an envelope.
 
+        The request goes to the lane of its priority class. It is dispatched if the lane has a free slot,
+        otherwise it waits in the lane, or it is rejected with an error response if the lane is full.
+
         :param envelope: the envelope to send.
         """
-        task = self._schedule_request(envelope)
+        if not isinstance(envelope.message, Message):  # pragma: nocover
+            raise ValueError("Ledger connection expects non-serialized messages.")
+        lane = self.lanes[get_priority(envelope.message)]
+        lane.submitted += 1
+        deadline = self._get_deadline(lane, envelope.message)
+        if lane.has_slot:
+            self._dispatch(lane, envelope, deadline)
+            return
+        try:
+            lane.push(envelope, deadline)
+        except LaneFullError as e:
+            self.logger.warning(str(e))
+            self._reject(envelope, e, lane.priority)
+
+    def _get_deadline(self, lane: Lane, message: Message) -> Optional[float]:
+        """Get the loop time by which a request must be served: the deadline set by its skill, or its lane's timeout if earlier."""
+        now = self.loop.time()
+        deadlines = []
+        remaining = pop_deadline(message)
+        if remaining is not None:
+            deadlines.append(now + remaining)
+        if lane.timeout is not None:
+            deadlines.append(now + lane.timeout)
+        return min(deadlines, default=None)
+
+    def _dispatch(
+        self, lane: Lane, envelope: Envelope, deadline: Optional[float]
+    ) -> None:
+        """Dispatch a request of a lane, to be served before the deadline."""
+        timeout = None if deadline is None else max(deadline - self.loop.time(), 0.0)
+        # the task and the calls it makes to the executors inherit the priority
+        token = REQUEST_PRIORITY.set(lane.priority)
+        try:
+            task = self._schedule_request(envelope, timeout)
+        finally:
+            REQUEST_PRIORITY.reset(token)
+        lane.in_flight += 1
         task.add_done_callback(self._handle_done_task)
         self.task_to_request[task] = envelope
-
-    def _schedule_request(self, envelope: Envelope) -> asyncio.Task:
-        """
-        Schedule a ledger API request.
-
-        :param envelope: the message.
-        :return: task
-        """
-        dispatcher: RequestDispatcher
+        self._task_to_lane[task] = lane
+
+    def _pump(self, lane: Lane) -> None:
+        """Dispatch the queued requests of a lane while it has free slots, cancelling the ones past their deadline."""
+        while lane.queue and lane.has_slot:
+            envelope, deadline = lane.queue.popleft()
+            if deadline is not None and self.loop.time() >= deadline:
+                lane.timed_out += 1
+                self._reject(
+                    envelope,
+                    RequestTimeoutError(
+                        f"Request timed out in the {lane.name} lane before it was dispatched."
+                    ),
+                    lane.priority,
+                )
+                continue
+            self._dispatch(lane, envelope, deadline)
+
+    def _reject(
+        self, envelope: Envelope, exception: Exception, priority: Priority
+    ) -> None:
+        """Reply to a request which is not dispatched with an error."""
+        response_message = self._get_dispatcher(envelope).reject(envelope, exception)
+        self._put_response(envelope, response_message, priority)
+
+    def _get_dispatcher(self, envelope: Envelope) -> RequestDispatcher:
+        """Get the dispatcher of the protocol of a request."""
         if (
             envelope.protocol_specification_id
             == LedgerApiMessage.protocol_specification_id
         ):
             if self._ledger_dispatcher is None:  # pragma: nocover
                 raise ValueError("No ledger dispatcher set.")
-            dispatcher = self._ledger_dispatcher
-        elif (
+            return self._ledger_dispatcher
+        if (
             envelope.protocol_specification_id
             == ContractApiMessage.protocol_specification_id
         ):
             if self._contract_dispatcher is None:  # pragma: nocover
                 raise ValueError("No contract dispatcher set.")
-            dispatcher = self._contract_dispatcher
-        else:
-            raise ValueError("Protocol not supported")
+            return self._contract_dispatcher
+        raise ValueError("Protocol not supported")
 
-        task = dispatcher.dispatch(envelope)
+    def _schedule_request(
+        self, envelope: Envelope, timeout: Optional[float] = None
+    ) -> asyncio.Task:
+        """
+        Schedule a ledger API request.
+
+        :param envelope: the message.
+        :param timeout: the time after which the request is cancelled, in seconds, or None for no limit.
+        :return: task
+        """
+        dispatcher = self._get_dispatcher(envelope)
+        task = dispatcher.dispatch(envelope, timeout)
         return task
 
     async def receive(self, *args: Any, **kwargs: Any) -> Optional["Envelope"]:
@@ -169,7 +350,8 @@ class LedgerConnection(Connection):
         :param kwargs: the keyword arguments
         :return: the envelope received, or None.
         """
-        return await self.response_envelopes.get()
+        *_, envelope = await self.response_envelopes.get()
+        return envelope
 
     def _handle_done_task(self, task: asyncio.Future) -> None:
         """
@@ -178,8 +360,19 @@ class LedgerConnection(Connection):
         :param task: the done task.
         """
         request = self.task_to_request.pop(task)
+        lane = self._task_to_lane.pop(task)
+        lane.in_flight -= 1
         response_message: Optional[Message] = task.result()
-
+        self._put_response(request, response_message, lane.priority)
+        self._pump(lane)
+
+    def _put_response(
+        self,
+        request: Envelope,
+        response_message: Optional[Message],
+        priority: Priority,
+    ) -> None:
+        """Queue the response to a request."""
         response_envelope = None
         if response_message is not None:
             response_envelope = Envelope(
@@ -189,5 +382,8 @@ class LedgerConnection(Connection):
                 context=request.context,
             )
 
-        # not handling `asyncio.QueueFull` exception, because the maxsize we defined for the Queue is infinite
-        self.response_envelopes.put_nowait(response_envelope)
+        # not handling `asyncio.QueueFull` exception, because the maxsize we defined for the Queue is infinite,
+        # the backpressure is applied to the requests, by the lanes
+        self.response_envelopes.put_nowait(
+            (priority, next(self._sequence), response_envelope)
+        )
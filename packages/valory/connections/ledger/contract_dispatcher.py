@@ -40,10 +40,18 @@
 # ------------------------------------------------------------------------------
 
 """This module contains the implementation of the contract API request dispatcher."""
+import asyncio
+import functools
 import inspect
+import json
 import logging
+import threading
+from asyncio import Task
+from collections import OrderedDict
 from collections.abc import Mapping
-from typing import Any, Callable, Optional, Union, cast
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Optional, Tuple, Union, cast
+from weakref import WeakKeyDictionary
 
 from aea.common import JSONLike
 from aea.contracts import Contract, contract_registry
@@ -57,6 +65,7 @@ from aea.protocols.dialogue.base import Dialogue as BaseDialogue
 from aea.protocols.dialogue.base import Dialogues as BaseDialogues
 
 from packages.valory.connections.ledger.base import RequestDispatcher
+from packages.valory.connections.ledger.lanes import RequestTimeoutError
 from packages.valory.protocols.contract_api import ContractApiMessage
 from packages.valory.protocols.contract_api.dialogues import ContractApiDialogue
 from packages.valory.protocols.contract_api.dialogues import (
@@ -68,6 +77,138 @@ _default_logger = logging.getLogger(
     "aea.packages.valory.connections.ledger.contract_dispatcher"
 )
 
+# ledger id, chain id, contract id, contract address, callable, serialized kwargs
+CoalescingKey = Tuple[str, str, str, str, str, str]
+DEFAULT_MAX_CONTRACT_INSTANCES = 1024
+MAX_ARGS_SPECS = 1024
+
+
+@functools.lru_cache(maxsize=MAX_ARGS_SPECS)
+def _get_full_args_spec(method: Callable) -> inspect.FullArgSpec:
+    """Get the argument spec of a contract callable, which does not change for the lifetime of the process."""
+    return inspect.getfullargspec(method)
+
+
+class ContractInstanceCache:
+    """
+    A cache of the web3 contract instances, keyed by the ledger api, the contract id and the contract address.
+
+    Building a contract instance parses the ABI of the contract,
+    so the instances are built once per ledger api and reused by the following requests.
+    """
+
+    def __init__(self, max_instances: int = DEFAULT_MAX_CONTRACT_INSTANCES) -> None:
+        """
+        Initialize the cache.
+
+        :param max_instances: the maximum number of cached instances per ledger api.
+        """
+        self.max_instances = max_instances
+        self.hits = 0
+        self.misses = 0
+        self._instances: "WeakKeyDictionary[LedgerApi, OrderedDict[Tuple[str, Optional[str]], Any]]" = (
+            WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        ledger_api: LedgerApi,
+        contract_id: str,
+        contract_address: Optional[str],
+        make: Callable[[], Any],
+    ) -> Any:
+        """
+        Get a contract instance, making it if it is not cached.
+
+        :param ledger_api: the ledger api the instance is bound to.
+        :param contract_id: the contract id.
+        :param contract_address: the contract address, or None for the deployment instance.
+        :param make: the function which makes the instance.
+        :return: the contract instance.
+        """
+        key = (contract_id, contract_address)
+        with self._lock:
+            instances = self._instances.setdefault(ledger_api, OrderedDict())
+            instance = instances.get(key, None)
+            if instance is not None:
+                instances.move_to_end(key)
+                self.hits += 1
+                return instance
+            self.misses += 1
+
+        instance = make()
+        with self._lock:
+            instances[key] = instance
+            if len(instances) > self.max_instances:
+                instances.popitem(last=False)
+        return instance
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Get the metrics of the cache."""
+        with self._lock:
+            size = sum(len(instances) for instances in self._instances.values())
+        return dict(size=size, hits=self.hits, misses=self.misses)
+
+
+class CachedLedgerApi:
+    """
+    A ledger api, whose instances of one contract are served from a contract instance cache.
+
+    The contract packages build their instances through the `get_contract_instance` of the ledger api they are passed,
+    so passing them this wrapper caches their instances without changing the contract classes.
+    Every other attribute is looked up on the wrapped ledger api.
+    """
+
+    def __init__(
+        self,
+        ledger_api: LedgerApi,
+        cache: ContractInstanceCache,
+        contract_id: str,
+        contract_interface: Dict[str, Any],
+    ) -> None:
+        """
+        Initialize the wrapper.
+
+        :param ledger_api: the wrapped ledger api.
+        :param cache: the contract instance cache.
+        :param contract_id: the id of the contract whose instances are cached.
+        :param contract_interface: the interface of the contract on the ledger.
+        """
+        self._ledger_api = ledger_api
+        self._cache = cache
+        self._contract_id = contract_id
+        self._contract_interface = contract_interface
+
+    def get_contract_instance(
+        self, contract_interface: Dict[str, Any], contract_address: Optional[str] = None
+    ) -> Any:
+        """
+        Get the instance of a contract, from the cache if it is an instance of the wrapped contract.
+
+        :param contract_interface: the contract interface.
+        :param contract_address: the contract address.
+        :return: the contract instance.
+        """
+        if contract_interface is not self._contract_interface:
+            # the instances of the other contracts that the contract reads from are not cached
+            return self._ledger_api.get_contract_instance(
+                contract_interface, contract_address
+            )
+        return self._cache.get(
+            self._ledger_api,
+            self._contract_id,
+            contract_address,
+            lambda: self._ledger_api.get_contract_instance(
+                contract_interface, contract_address
+            ),
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        """Get an attribute of the wrapped ledger api."""
+        return getattr(self._ledger_api, name)
+
 
 class ContractApiDialogues(BaseContractApiDialogues):
     """The dialogues class keeps track of all dialogues."""
@@ -102,6 +243,8 @@ class ContractApiDialogues(BaseContractApiDialogues):
 class ContractApiRequestDispatcher(RequestDispatcher):
     """Implement the contract API request dispatcher."""
 
+    dispatcher_type = "contract"
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the dispatcher."""
         logger = kwargs.pop("logger", None)
@@ -109,6 +252,124 @@ class ContractApiRequestDispatcher(RequestDispatcher):
         logger = logger if logger is not None else _default_logger
         super().__init__(logger, *args, **kwargs)
         self._contract_api_dialogues = ContractApiDialogues(connection_id=connection_id)
+        # the in flight `get_state` requests, which identical requests wait for instead of calling again
+        self._in_flight: Dict[CoalescingKey, asyncio.Future] = {}
+        self.coalesced_calls = 0
+        self.coalesced_requests = 0
+        # the contracts are stateless, so each one is made once
+        self._contracts: Dict[str, Contract] = {}
+        self.contract_instance_cache = ContractInstanceCache()
+
+    @property
+    def coalescing_metrics(self) -> Dict[str, int]:
+        """Get the number of coalesced calls, and of the requests which waited for them instead of calling again."""
+        return dict(
+            calls=self.coalesced_calls,
+            coalesced_requests=self.coalesced_requests,
+            in_flight=len(self._in_flight),
+        )
+
+    def _get_coalescing_key(self, message: Message) -> Optional[CoalescingKey]:
+        """Get the key under which identical requests are coalesced, or None if the request cannot be coalesced."""
+        if (
+            not isinstance(message, ContractApiMessage)
+            or message.performative != ContractApiMessage.Performative.GET_STATE
+        ):
+            return None
+        try:
+            kwargs = json.dumps(message.kwargs.body, sort_keys=True)
+        except TypeError:
+            return None
+        return (
+            message.ledger_id,
+            self.get_chain_id(message),
+            message.contract_id,
+            message.contract_address,
+            message.callable,
+            kwargs,
+        )
+
+    async def run_async(  # pylint: disable=too-many-arguments
+        self,
+        func: Callable[[Any], Task],
+        api: LedgerApi,
+        message: Message,
+        dialogue: BaseDialogue,
+        executor: Optional[Executor] = None,
+        timeout: Optional[float] = None,
+    ) -> Union[Message, Task]:
+        """
+        Run a function in executor, sharing the call of identical in flight `get_state` requests.
+
+        The first of a group of concurrent identical requests makes the call,
+        and its response is copied in the dialogues of the rest.
+
+        :param func: the function to execute.
+        :param api: the ledger api.
+        :param message: a Contract API message.
+        :param dialogue: a Contract API dialogue.
+        :param executor: the executor to run the function in, the dispatcher's executor if not given.
+        :param timeout: the time after which the function is cancelled, in seconds, or None for no limit.
+        :return: the return value of the function.
+        """
+        key = self._get_coalescing_key(message)
+        if key is None:
+            return await super().run_async(
+                func, api, message, dialogue, executor, timeout
+            )
+
+        call = self._in_flight.get(key, None)
+        if call is None:
+            call = asyncio.ensure_future(
+                super().run_async(func, api, message, dialogue, executor, timeout)
+            )
+            self._in_flight[key] = call
+            call.add_done_callback(lambda _: self._in_flight.pop(key, None))
+            self.coalesced_calls += 1
+            # shielded, so that cancelling this request does not cancel the waiting ones
+            return await asyncio.shield(call)
+
+        self.coalesced_requests += 1
+        try:
+            response = cast(
+                ContractApiMessage,
+                await asyncio.wait_for(asyncio.shield(call), timeout),
+            )
+        except asyncio.TimeoutError:
+            return self.get_error_message(
+                RequestTimeoutError(f"Request timed out after {timeout:.1f} seconds."),
+                api,
+                message,
+                dialogue,
+            )
+        return self._copy_response(response, message, dialogue)
+
+    @staticmethod
+    def _copy_response(
+        response: ContractApiMessage,
+        message: Message,
+        dialogue: BaseDialogue,
+    ) -> ContractApiMessage:
+        """Reply to a coalesced request with the response to the request which made the call."""
+        if response.performative == ContractApiMessage.Performative.STATE:
+            return cast(
+                ContractApiMessage,
+                dialogue.reply(
+                    performative=ContractApiMessage.Performative.STATE,
+                    target_message=message,
+                    state=response.state,
+                ),
+            )
+        return cast(
+            ContractApiMessage,
+            dialogue.reply(
+                performative=ContractApiMessage.Performative.ERROR,
+                target_message=message,
+                code=response.code,
+                message=response.message,
+                data=response.data,
+            ),
+        )
 
     @property
     def dialogues(self) -> BaseDialogues:
@@ -120,6 +381,43 @@ class ContractApiRequestDispatcher(RequestDispatcher):
         """Get the contract registry."""
         return contract_registry
 
+    def get_contract(self, contract_id: str) -> Contract:
+        """
+        Get a contract, making it on the first request for it.
+
+        :param contract_id: the contract id.
+        :return: the contract.
+        """
+        contract = self._contracts.get(contract_id, None)
+        if contract is None:
+            contract = self.contract_registry.make(contract_id)
+            self._contracts[contract_id] = contract
+        return contract
+
+    def get_cached_ledger_api(
+        self, ledger_api: LedgerApi, contract_id: str, contract: Contract
+    ) -> LedgerApi:
+        """
+        Get the ledger api to pass to a contract, so that the contract's instances are cached.
+
+        :param ledger_api: the ledger api.
+        :param contract_id: the contract id.
+        :param contract: the contract.
+        :return: the ledger api, with the instances of the contract cached.
+        """
+        contract_interface = contract.contract_interface.get(ledger_api.identifier)
+        if contract_interface is None:
+            return ledger_api
+        return cast(
+            LedgerApi,
+            CachedLedgerApi(
+                ledger_api,
+                self.contract_instance_cache,
+                contract_id,
+                contract_interface,
+            ),
+        )
+
     def get_ledger_id(self, message: Message) -> str:
         """Get the ledger id."""
         if not isinstance(message, ContractApiMessage):  # pragma: nocover
@@ -130,7 +428,7 @@ class ContractApiRequestDispatcher(RequestDispatcher):
     def get_error_message(
         self,
         exception: Exception,
-        api: LedgerApi,
+        api: Optional[LedgerApi],
         message: Message,
         dialogue: BaseDialogue,
     ) -> ContractApiMessage:
@@ -173,9 +471,12 @@ class ContractApiRequestDispatcher(RequestDispatcher):
         :param response_builder: callable that from bytes builds a contract API message.
         :return: the response message.
         """
-        contract = self.contract_registry.make(message.contract_id)
+        contract = self.get_contract(message.contract_id)
+        cached_ledger_api = self.get_cached_ledger_api(
+            ledger_api, message.contract_id, contract
+        )
         try:
-            data = self._get_data(ledger_api, message, contract)
+            data = self._get_data(cached_ledger_api, message, contract)
             response = response_builder(data, dialogue)
         except AEAException as exception:
             self.logger.debug(
@@ -405,7 +706,7 @@ class ContractApiRequestDispatcher(RequestDispatcher):
                 **message.kwargs.body,
             )
 
-        full_args_spec = inspect.getfullargspec(method_to_call)
+        full_args_spec = _get_full_args_spec(method_to_call)
         if message.performative in [
             ContractApiMessage.Performative.GET_STATE,
             ContractApiMessage.Performative.GET_RAW_MESSAGE,
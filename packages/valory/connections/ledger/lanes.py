@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the priority lanes of the requests of the ledger connection."""
+import contextvars
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Any, Deque, Dict, Iterable, Optional, Tuple
+
+from aea.mail.base import Envelope
+from aea.protocols.base import Message
+
+
+class Priority(IntEnum):
+    """The priority classes of the requests, from the most to the least urgent."""
+
+    SUBMISSION = 0
+    RECEIPT = 1
+    READ = 2
+    SCAN = 3
+
+
+# the priority of the request on whose behalf the current context runs, read by the executors
+REQUEST_PRIORITY: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "request_priority", default=Priority.READ
+)
+
+SUBMISSION_PERFORMATIVES = frozenset(
+    {
+        "get_deploy_transaction",
+        "get_raw_message",
+        "get_raw_transaction",
+        "send_signed_transaction",
+        "send_signed_transactions",
+    }
+)
+RECEIPT_PERFORMATIVES = frozenset({"get_transaction_receipt"})
+SCAN_CALLABLES = frozenset({"get_logs", "get_filter_logs"})
+SCAN_KWARGS = frozenset({"from_block", "fromBlock"})
+
+DEFAULT_LANE_CONFIGS: Dict[str, Dict[str, Any]] = {
+    Priority.SUBMISSION.name.lower(): dict(
+        max_in_flight=64, max_queue_depth=256, timeout=None
+    ),
+    Priority.RECEIPT.name.lower(): dict(
+        max_in_flight=256, max_queue_depth=256, timeout=None
+    ),
+    Priority.READ.name.lower(): dict(
+        max_in_flight=64, max_queue_depth=1024, timeout=None
+    ),
+    Priority.SCAN.name.lower(): dict(max_in_flight=4, max_queue_depth=64, timeout=None),
+}
+# the request kwarg with the unix time after which the skill stops waiting for the response
+DEADLINE_KWARG = "request_deadline"
+
+
+class LaneFullError(Exception):
+    """Raised when a request is rejected by a full lane."""
+
+
+class RequestTimeoutError(Exception):
+    """Raised when a request is not served before its deadline."""
+
+
+def pop_deadline(message: Message) -> Optional[float]:
+    """
+    Pop the deadline set by the skill from the kwargs of a request, so that it is not passed on to the called method.
+
+    The deadline travels with the request, so it holds wherever the skill runs;
+    it is a unix time, as the clocks of the skill and the connection are only shared through the wall clock.
+
+    :param message: the request.
+    :return: the time left until the deadline, in seconds, or None if the request has no deadline.
+    """
+    if not message.is_set("kwargs"):
+        return None
+    deadline = message.kwargs.body.pop(DEADLINE_KWARG, None)
+    return None if deadline is None else deadline - time.time()
+
+
+def is_scan(callable_name: str, kwargs: Iterable[str]) -> bool:
+    """Check whether a call scans the history of the chain."""
+    return callable_name in SCAN_CALLABLES or not SCAN_KWARGS.isdisjoint(kwargs)
+
+
+def get_priority(message: Message) -> Priority:
+    """
+    Get the priority class of a request.
+
+    The transactions are built and sent first, then the receipts are looked up,
+    then the state is read; the reads of the history of the chain, by logs or by block ranges, come last.
+
+    :param message: the request.
+    :return: the priority class.
+    """
+    performative = message.performative.value
+    if performative in SUBMISSION_PERFORMATIVES:
+        return Priority.SUBMISSION
+    if performative in RECEIPT_PERFORMATIVES:
+        return Priority.RECEIPT
+    if performative == "get_state_batch":
+        calls = message.calls.calls
+        scans = any(is_scan(call["callable"], call["kwargs"]) for call in calls)
+        return Priority.SCAN if scans else Priority.READ
+    if performative == "get_state":
+        if is_scan(message.callable, message.kwargs.body):
+            return Priority.SCAN
+    return Priority.READ
+
+
+class Lane:
+    """
+    A lane of the requests of a priority class.
+
+    At most `max_in_flight` requests of the lane are dispatched at a time,
+    and at most `max_queue_depth` wait for a slot; the lane rejects the requests beyond that.
+    A request which is not served by the deadline set by its skill, or within `timeout` seconds if set, is cancelled.
+    """
+
+    def __init__(
+        self,
+        priority: Priority,
+        max_in_flight: int,
+        max_queue_depth: int,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the lane.
+
+        :param priority: the priority class of the requests of the lane.
+        :param max_in_flight: the maximum number of dispatched requests.
+        :param max_queue_depth: the maximum number of requests waiting for a slot.
+        :param timeout: the maximum time to serve a request, in seconds, or None for no limit.
+        """
+        self.priority = priority
+        self.max_in_flight = max_in_flight
+        self.max_queue_depth = max_queue_depth
+        self.timeout = timeout
+        self.queue: Deque[Tuple[Envelope, Optional[float]]] = deque()
+        self.in_flight = 0
+        self.submitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.peak_queue_depth = 0
+
+    @property
+    def name(self) -> str:
+        """Get the name of the lane."""
+        return self.priority.name.lower()
+
+    @property
+    def has_slot(self) -> bool:
+        """Check whether a request of the lane can be dispatched."""
+        return self.in_flight < self.max_in_flight
+
+    def push(self, envelope: Envelope, deadline: Optional[float]) -> None:
+        """Queue a request until a slot is free."""
+        if len(self.queue) >= self.max_queue_depth:
+            self.rejected += 1
+            raise LaneFullError(
+                f"The {self.name} lane is full: {self.in_flight} requests in flight "
+                f"and {len(self.queue)} queued."
+            )
+        self.queue.append((envelope, deadline))
+        self.peak_queue_depth = max(self.peak_queue_depth, len(self.queue))
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Get the metrics of the lane."""
+        return dict(
+            max_in_flight=self.max_in_flight,
+            max_queue_depth=self.max_queue_depth,
+            in_flight=self.in_flight,
+            queue_depth=len(self.queue),
+            peak_queue_depth=self.peak_queue_depth,
+            submitted=self.submitted,
+            rejected=self.rejected,
+            timed_out=self.timed_out,
+        )
+
+
+def make_lanes(
+    configs: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Dict[Priority, Lane]:
+    """Make a lane per priority class, from the configs keyed by the lowercase names of the classes."""
+    configs = configs or {}
+    unknown = set(configs) - set(DEFAULT_LANE_CONFIGS)
+    if unknown:
+        raise ValueError(
+            f"Unknown lanes {sorted(unknown)}, the lanes are {list(DEFAULT_LANE_CONFIGS)}."
+        )
+    return {
+        priority: Lane(
+            priority,
+            **{
+                **DEFAULT_LANE_CONFIGS[priority.name.lower()],
+                **configs.get(priority.name.lower(), {}),
+            },
+        )
+        for priority in Priority
+    }
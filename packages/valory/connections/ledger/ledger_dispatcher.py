@@ -41,8 +41,10 @@
 """This module contains the implementation of the ledger API request dispatcher."""
 import asyncio
 import logging
-from typing import Any, cast
+import weakref
+from typing import Any, List, Optional, Tuple, cast
 
+from aea.common import JSONLike
 from aea.connections.base import ConnectionStates
 from aea.crypto.base import LedgerApi
 from aea.helpers.transaction.base import RawTransaction, State, TransactionDigest
@@ -51,7 +53,16 @@ from aea.protocols.dialogue.base import Dialogue as BaseDialogue
 from aea.protocols.dialogue.base import Dialogues as BaseDialogues
 
 from packages.valory.connections.ledger.base import RequestDispatcher
+from packages.valory.connections.ledger.receipt_waiter import (
+    DEFAULT_BLOCK_POLL_INTERVAL,
+    ReceiptWaiter,
+)
+from packages.valory.connections.ledger.state_batcher import (
+    BatchNotSupportedError,
+    StateBatcher,
+)
 from packages.valory.protocols.ledger_api.custom_types import (
+    States,
     TransactionDigests,
     TransactionReceipt,
 )
@@ -100,13 +111,24 @@ class LedgerApiDialogues(BaseLedgerApiDialogues):
 class LedgerApiRequestDispatcher(RequestDispatcher):
     """Implement ledger API request dispatcher."""
 
+    dispatcher_type = "ledger"
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the dispatcher."""
         logger = kwargs.pop("logger", None)
         connection_id = kwargs.pop("connection_id")
+        self.block_poll_interval = kwargs.pop(
+            "block_poll_interval", DEFAULT_BLOCK_POLL_INTERVAL
+        )
         logger = logger if logger is not None else _default_logger
         super().__init__(logger, *args, **kwargs)
         self._ledger_api_dialogues = LedgerApiDialogues(connection_id=connection_id)
+        self._receipt_waiters: "weakref.WeakKeyDictionary[LedgerApi, ReceiptWaiter]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._state_batchers: "weakref.WeakKeyDictionary[LedgerApi, StateBatcher]" = (
+            weakref.WeakKeyDictionary()
+        )
 
     def get_ledger_id(self, message: Message) -> str:
         """Get the ledger id from message."""
@@ -214,6 +236,73 @@ class LedgerApiRequestDispatcher(RequestDispatcher):
             )
         return response
 
+    async def get_state_batch(
+        self,
+        api: LedgerApi,
+        message: LedgerApiMessage,
+        dialogue: LedgerApiDialogue,
+    ) -> LedgerApiMessage:
+        """
+        Send the request 'get_state_batch'.
+
+        The JSON-RPC requests of the calls are sent as batches, if the ledger api supports it.
+        The calls which cannot be batched are made on their own, concurrently.
+
+        :param api: the API object.
+        :param message: the Ledger API message
+        :param dialogue: the Ledger API dialogue
+        :return: response Ledger API message
+        """
+        calls = message.calls.calls
+        executor = self.get_executor(self.get_chain_id(message))
+        states: List[Optional[JSONLike]] = [None] * len(calls)
+        if StateBatcher.supports(api):
+            batcher = self._state_batchers.get(api, None)
+            if batcher is None:
+                batcher = StateBatcher(api)
+                self._state_batchers[api] = batcher
+            try:
+                states = await self.loop.run_in_executor(
+                    executor, batcher.get_states, calls
+                )
+            except BatchNotSupportedError as e:
+                self.logger.warning(f"Could not batch the calls: {e}")
+
+        unbatched = [i for i, state in enumerate(states) if state is None]
+        results = await asyncio.gather(
+            *(
+                self.loop.run_in_executor(
+                    executor, self._get_single_state, api, calls[i]
+                )
+                for i in unbatched
+            )
+        )
+        for i, state in zip(unbatched, results):
+            states[i] = state
+
+        return cast(
+            LedgerApiMessage,
+            dialogue.reply(
+                performative=LedgerApiMessage.Performative.STATE_BATCH,
+                target_message=message,
+                states=States(cast(List[JSONLike], states)),
+                ledger_id=message.ledger_id,
+            ),
+        )
+
+    @staticmethod
+    def _get_single_state(api: LedgerApi, call: JSONLike) -> JSONLike:
+        """Get the state of a single call of a batch, or the error it failed with."""
+        try:
+            result = api.get_state(
+                call["callable"], *call["args"], raise_on_try=True, **call["kwargs"]
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            return {"error": str(e)}
+        if result is None:
+            return {"error": "Failed to get state"}
+        return {"state": result}
+
     def get_raw_transaction(
         self,
         api: LedgerApi,
@@ -286,6 +375,90 @@ class LedgerApiRequestDispatcher(RequestDispatcher):
             else message.retry_timeout
         )
 
+        if ReceiptWaiter.supports(api):
+            waiter = self._get_receipt_waiter(api, message)
+            transaction_receipt, transaction = await waiter.wait(
+                message.transaction_digest.body, timeout=retry_attempts * retry_timeout
+            )
+            is_settled = transaction_receipt is not None and api.is_transaction_settled(
+                transaction_receipt
+            )
+        else:
+            (
+                transaction_receipt,
+                is_settled,
+                transaction,
+            ) = await self._poll_transaction_receipt(
+                api, message, retry_attempts, retry_timeout
+            )
+        self.logger.debug(
+            f"Transaction receipt: {transaction_receipt}, settled: {is_settled}, transaction: {transaction}"
+        )
+
+        if not is_settled:
+            response = self.get_error_message(
+                ValueError("Transaction not settled within timeout"),
+                api,
+                message,
+                dialogue,
+            )
+        elif transaction_receipt is None:  # pragma: nocover
+            response = self.get_error_message(
+                ValueError("No transaction_receipt returned"), api, message, dialogue
+            )
+        elif transaction is None:
+            response = self.get_error_message(
+                ValueError("No transaction returned"), api, message, dialogue
+            )
+        else:
+            response = cast(
+                LedgerApiMessage,
+                dialogue.reply(
+                    performative=LedgerApiMessage.Performative.TRANSACTION_RECEIPT,
+                    target_message=message,
+                    transaction_receipt=TransactionReceipt(
+                        message.transaction_digest.ledger_id,
+                        transaction_receipt,
+                        transaction,
+                    ),
+                ),
+            )
+        return response
+
+    def _get_receipt_waiter(
+        self, api: LedgerApi, message: LedgerApiMessage
+    ) -> ReceiptWaiter:
+        """Get the receipt waiter of a ledger api."""
+        waiter = self._receipt_waiters.get(api, None)
+        if waiter is None:
+            waiter = ReceiptWaiter(
+                api,
+                self.loop,
+                self.get_executor(self.get_chain_id(message)),
+                self.block_poll_interval,
+                self.logger,
+            )
+            self._receipt_waiters[api] = waiter
+        return waiter
+
+    async def _poll_transaction_receipt(
+        self,
+        api: LedgerApi,
+        message: LedgerApiMessage,
+        retry_attempts: int,
+        retry_timeout: float,
+    ) -> Tuple[Optional[JSONLike], bool, Optional[JSONLike]]:
+        """
+        Poll for the receipt and then for the transaction, with a linear backoff.
+
+        This is used for the ledger apis which the receipt waiter does not support.
+
+        :param api: the API object.
+        :param message: the Ledger API message
+        :param retry_attempts: the maximum number of attempts of each poll.
+        :param retry_timeout: the timeout of each attempt, and the backoff step.
+        :return: the receipt, whether the transaction is settled, and the transaction.
+        """
         transaction_receipt = None
         is_settled = False
         attempts = 0
@@ -310,9 +483,6 @@ class LedgerApiRequestDispatcher(RequestDispatcher):
                 is_settled = api.is_transaction_settled(transaction_receipt)
             attempts += 1
             await asyncio.sleep(retry_timeout * attempts)
-        self.logger.debug(
-            f"Transaction receipt: {transaction_receipt}, settled: {is_settled}"
-        )
 
         attempts = 0
         transaction = None
@@ -335,37 +505,7 @@ class LedgerApiRequestDispatcher(RequestDispatcher):
 
             attempts += 1
             await asyncio.sleep(retry_timeout * attempts)
-        self.logger.debug(f"Transaction: {transaction}")
-
-        if not is_settled:
-            response = self.get_error_message(
-                ValueError("Transaction not settled within timeout"),
-                api,
-                message,
-                dialogue,
-            )
-        elif transaction_receipt is None:  # pragma: nocover
-            response = self.get_error_message(
-                ValueError("No transaction_receipt returned"), api, message, dialogue
-            )
-        elif transaction is None:
-            response = self.get_error_message(
-                ValueError("No transaction returned"), api, message, dialogue
-            )
-        else:
-            response = cast(
-                LedgerApiMessage,
-                dialogue.reply(
-                    performative=LedgerApiMessage.Performative.TRANSACTION_RECEIPT,
-                    target_message=message,
-                    transaction_receipt=TransactionReceipt(
-                        message.transaction_digest.ledger_id,
-                        transaction_receipt,
-                        transaction,
-                    ),
-                ),
-            )
-        return response
+        return transaction_receipt, is_settled, transaction
 
     def send_signed_transactions(
         self,
@@ -447,7 +587,7 @@ class LedgerApiRequestDispatcher(RequestDispatcher):
     def get_error_message(
         self,
         exception: Exception,
-        api: LedgerApi,
+        api: Optional[LedgerApi],
         message: Message,
         dialogue: BaseDialogue,
     ) -> LedgerApiMessage:
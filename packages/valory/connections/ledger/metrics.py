@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the metrics of the calls of the ledger connection, and their exporters."""
+import importlib
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from web3.types import RPCResponse
+
+
+# the upper bounds of the buckets, the last bucket is unbounded
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# (ledger id, contract id, callable)
+CallKey = Tuple[str, str, str]
+
+_local = threading.local()
+
+
+class Histogram:
+    """A histogram with fixed buckets."""
+
+    __slots__ = ("bounds", "counts", "count", "total", "max")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        """Initialize the histogram."""
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Count a value in its bucket."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile as the upper bound of its bucket, or the maximum for the last bucket."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the histogram as a JSON serializable dict."""
+        return dict(
+            buckets={
+                **{str(bound): count for bound, count in zip(self.bounds, self.counts)},
+                "inf": self.counts[-1],
+            },
+            count=self.count,
+            sum=self.total,
+            max=self.max,
+            p50=self.quantile(0.5),
+            p95=self.quantile(0.95),
+            p99=self.quantile(0.99),
+        )
+
+
+class CallMetrics:
+    """The metrics of the calls to a callable."""
+
+    __slots__ = ("latency", "size", "errors", "retries")
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.size = Histogram(SIZE_BUCKETS)
+        self.errors = 0
+        self.retries = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the metrics as a JSON serializable dict."""
+        return dict(
+            calls=self.latency.count,
+            errors=self.errors,
+            retries=self.retries,
+            latency=self.latency.to_dict(),
+            size=self.size.to_dict(),
+        )
+
+
+class MetricsRegistry:
+    """An in-memory registry of the metrics of the calls, per ledger id, contract id and callable."""
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._metrics: Dict[CallKey, CallMetrics] = {}
+        self._lock = threading.Lock()
+
+    def record(  # pylint: disable=too-many-arguments
+        self,
+        key: CallKey,
+        latency: float,
+        size: Optional[int] = None,
+        error: bool = False,
+        retries: int = 0,
+    ) -> None:
+        """
+        Record a call.
+
+        :param key: the ledger id, the contract id, empty for the ledger calls, and the callable.
+        :param latency: the latency of the call, in seconds.
+        :param size: the size of the RPC responses to the call, in bytes, if it is known.
+        :param error: whether the call failed.
+        :param retries: the number of retried RPC requests of the call.
+        """
+        with self._lock:
+            metrics = self._metrics.get(key, None)
+            if metrics is None:
+                metrics = self._metrics[key] = CallMetrics()
+            metrics.latency.observe(latency)
+            if size is not None:
+                metrics.size.observe(size)
+            metrics.errors += error
+            metrics.retries += retries
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get the metrics as a JSON serializable dict, keyed by `<ledger id>/<contract id>/<callable>`."""
+        with self._lock:
+            return {
+                "/".join(key): metrics.to_dict()
+                for key, metrics in sorted(self._metrics.items())
+            }
+
+    def clear(self) -> None:
+        """Forget the recorded calls."""
+        with self._lock:
+            self._metrics.clear()
+
+
+class MetricsExporter(ABC):
+    """Exports the snapshots of a metrics registry."""
+
+    @abstractmethod
+    def export(self, snapshot: Dict[str, Dict[str, Any]]) -> None:
+        """Export a snapshot."""
+
+
+class JsonFileExporter(MetricsExporter):
+    """Dumps the snapshots to a JSON file, replacing the previous one."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize the exporter."""
+        self.path = path
+
+    def export(self, snapshot: Dict[str, Dict[str, Any]]) -> None:
+        """Dump a snapshot."""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+EXPORTERS: Dict[str, Callable[..., MetricsExporter]] = {"json": JsonFileExporter}
+
+
+def make_exporter(name: str, **kwargs: Any) -> MetricsExporter:
+    """
+    Make an exporter.
+
+    :param name: the name of a built-in exporter, or the `<module>:<class>` path of a custom one.
+    :param kwargs: the keyword arguments of the exporter.
+    :return: the exporter.
+    """
+    if name in EXPORTERS:
+        return EXPORTERS[name](**kwargs)
+    module_name, _, class_name = name.partition(":")
+    if not class_name:
+        raise ValueError(
+            f"Unknown metrics exporter {name!r}, expected one of {list(EXPORTERS)} or a `<module>:<class>` path."
+        )
+    exporter_cls = getattr(importlib.import_module(module_name), class_name)
+    return exporter_cls(**kwargs)
+
+
+class RpcStats:
+    """The RPC responses and retries of the calls made by a function, in the thread which runs it."""
+
+    __slots__ = ("responses", "size", "retries")
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self.responses = 0
+        self.size = 0
+        self.retries = 0
+
+    def run(self, func: Callable, *args: Any) -> Any:
+        """Run a function, counting its RPC responses and retries."""
+        _local.stats = self
+        try:
+            return func(*args)
+        finally:
+            _local.stats = None
+
+
+def record_rpc_response(size: int) -> None:
+    """Count an RPC response of the given size for the function running in the current thread."""
+    stats: Optional[RpcStats] = getattr(_local, "stats", None)
+    if stats is not None:
+        stats.responses += 1
+        stats.size += size
+
+
+def record_rpc_retry() -> None:
+    """Count a retried RPC request for the function running in the current thread."""
+    stats: Optional[RpcStats] = getattr(_local, "stats", None)
+    if stats is not None:
+        stats.retries += 1
+
+
+def instrument_provider(provider: Any) -> None:
+    """Count the sizes of the responses decoded by a JSON-RPC provider."""
+    decode = provider.decode_rpc_response
+
+    def decode_rpc_response(raw_response: bytes) -> RPCResponse:
+        record_rpc_response(len(raw_response))
+        return decode(raw_response)
+
+    provider.decode_rpc_response = decode_rpc_response
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains a waiter of transaction receipts, driven by new blocks."""
+import asyncio
+import json
+import logging
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from aea.common import JSONLike
+from aea.crypto.base import LedgerApi
+from aea_ledger_ethereum.ethereum import AttributeDictTranslator
+from web3 import HTTPProvider
+from web3._utils.method_formatters import PYTHONIC_RESULT_FORMATTERS
+from web3._utils.request import make_post_request
+from web3._utils.rpc_abi import RPC
+from web3.datastructures import AttributeDict
+
+
+_default_logger = logging.getLogger(
+    "aea.packages.valory.connections.ledger.receipt_waiter"
+)
+
+DEFAULT_BLOCK_POLL_INTERVAL = 1.0
+MAX_BATCH_SIZE = 100
+RECEIPT = RPC.eth_getTransactionReceipt
+TRANSACTION = RPC.eth_getTransactionByHash
+
+# (JSON-RPC method, transaction hash)
+Lookup = Tuple[str, str]
+
+
+class ReceiptWaiter:  # pylint: disable=too-many-instance-attributes
+    """
+    Waits for the receipts and the transactions of the pending transaction hashes of a ledger api.
+
+    The block number is polled every `poll_interval` seconds, and on every new block,
+    the receipts and the transactions which are still missing are all looked up in a single JSON-RPC batch.
+    A newly pending hash is looked up on the next poll, without waiting for a new block.
+    The poller only runs while there are pending hashes.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        api: LedgerApi,
+        loop: asyncio.AbstractEventLoop,
+        executor: Optional[Executor] = None,
+        poll_interval: float = DEFAULT_BLOCK_POLL_INTERVAL,
+        logger: logging.Logger = _default_logger,
+    ) -> None:
+        """
+        Initialize the waiter.
+
+        :param api: the ledger api, which must be supported.
+        :param loop: the event loop.
+        :param executor: the executor of the requests.
+        :param poll_interval: the interval between the polls of the block number, in seconds.
+        :param logger: the logger.
+        """
+        self.api = api
+        self.loop = loop
+        self.executor = executor
+        self.poll_interval = poll_interval
+        self.logger = logger
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._found: Dict[str, Dict[str, Optional[JSONLike]]] = {}
+        self._unchecked: Set[str] = set()
+        self._last_block: Optional[int] = None
+        self._poller: Optional[asyncio.Task] = None
+        self.batches = 0
+
+    @staticmethod
+    def supports(api: LedgerApi) -> bool:
+        """Check whether the waiter can batch the requests of the given api."""
+        web3 = getattr(api, "api", None)
+        return isinstance(getattr(web3, "provider", None), HTTPProvider)
+
+    async def wait(
+        self, tx_hash: str, timeout: float
+    ) -> Tuple[Optional[JSONLike], Optional[JSONLike]]:
+        """
+        Wait for the receipt and the transaction of a transaction hash.
+
+        :param tx_hash: the transaction hash.
+        :param timeout: for how long to wait, in seconds.
+        :return: the receipt and the transaction, or None for what was not found within the timeout.
+        """
+        future = self.loop.create_future()
+        self._pending.setdefault(tx_hash, []).append(future)
+        self._found.setdefault(tx_hash, {RECEIPT: None, TRANSACTION: None})
+        self._unchecked.add(tx_hash)
+        if self._poller is None or self._poller.done():
+            self._poller = self.loop.create_task(self._poll())
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            found = self._found[tx_hash]
+            return found[RECEIPT], found[TRANSACTION]
+        finally:
+            futures = self._pending[tx_hash]
+            futures.remove(future)
+            if not futures:
+                del self._pending[tx_hash]
+                del self._found[tx_hash]
+                self._unchecked.discard(tx_hash)
+            if not self._pending and self._poller is not None:
+                self._poller.cancel()
+
+    async def _poll(self) -> None:
+        """Look up the pending hashes on every new block, for as long as there are any."""
+        while self._pending:
+            lookups: List[Lookup] = []
+            try:
+                block_number = await self.loop.run_in_executor(
+                    self.executor, self._get_block_number
+                )
+                is_new_block = block_number != self._last_block
+                self._last_block = block_number
+                hashes = set(self._pending) if is_new_block else self._unchecked
+                lookups = [
+                    (method, tx_hash)
+                    for tx_hash in hashes & set(self._pending)
+                    for method, value in self._found[tx_hash].items()
+                    if value is None
+                ]
+                self._unchecked = self._unchecked - hashes
+                if lookups:
+                    results = await self.loop.run_in_executor(
+                        self.executor, self._fetch, lookups
+                    )
+                    self._resolve(results)
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.warning(f"Error while waiting for receipts: {e}")
+                # look the hashes up again on the next poll
+                self._unchecked.update(tx_hash for _, tx_hash in lookups)
+            await asyncio.sleep(self.poll_interval)
+
+    def _resolve(self, results: Dict[Lookup, Optional[JSONLike]]) -> None:
+        """Store the results and resolve the hashes for which both the receipt and the transaction are found."""
+        for (method, tx_hash), result in results.items():
+            if tx_hash not in self._found or result is None:
+                # the waits for this hash have timed out
+                continue
+            found = self._found[tx_hash]
+            found[method] = result
+            if found[RECEIPT] is None or found[TRANSACTION] is None:
+                continue
+            for future in self._pending[tx_hash]:
+                if not future.done():
+                    future.set_result((found[RECEIPT], found[TRANSACTION]))
+
+    def _get_block_number(self) -> int:
+        """Get the latest block number."""
+        return self.api.api.eth.block_number
+
+    def _fetch(self, lookups: List[Lookup]) -> Dict[Lookup, Optional[JSONLike]]:
+        """Look the receipts and the transactions up, in JSON-RPC batches of up to `MAX_BATCH_SIZE` requests."""
+        provider = self.api.api.provider
+        results: Dict[Lookup, Optional[JSONLike]] = {}
+        for start in range(0, len(lookups), MAX_BATCH_SIZE):
+            chunk = lookups[start : start + MAX_BATCH_SIZE]
+            payload = [
+                {"jsonrpc": "2.0", "id": i, "method": method, "params": [tx_hash]}
+                for i, (method, tx_hash) in enumerate(chunk)
+            ]
+            self.batches += 1
+            responses = json.loads(
+                make_post_request(
+                    provider.endpoint_uri,
+                    json.dumps(payload).encode(),
+                    **provider.get_request_kwargs(),
+                )
+            )
+            if not isinstance(responses, list):
+                raise ValueError(
+                    f"Unexpected response to a JSON-RPC batch: {responses}"
+                )
+            for response in responses:
+                method, tx_hash = chunk[response["id"]]
+                results[(method, tx_hash)] = self._format(method, tx_hash, response)
+        return results
+
+    def _format(
+        self, method: str, tx_hash: str, response: Dict[str, Any]
+    ) -> Optional[JSONLike]:
+        """Format a result like the ledger api does, or return None if it is missing."""
+        result = response.get("result", None)
+        if result is None:
+            return None
+        formatted = AttributeDictTranslator.to_dict(
+            AttributeDict.recursive(PYTHONIC_RESULT_FORMATTERS[method](result))
+        )
+        if method == RECEIPT and not formatted["status"]:
+            # the ledger api adds the revert reason to the receipts of the failed transactions
+            return self.api.get_transaction_receipt(tx_hash)
+        return formatted
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the routing of the RPC requests of a chain over multiple endpoints."""
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Deque, Dict, FrozenSet, List, Optional, Set
+
+from aea.crypto.base import LedgerApi
+from aea.crypto.registries import Registry
+from requests.exceptions import ConnectTimeout
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from urllib3.exceptions import NewConnectionError
+from web3 import HTTPProvider
+from web3._utils.request import make_post_request
+from web3.types import RPCEndpoint, RPCResponse
+
+from packages.valory.connections.ledger.metrics import (
+    instrument_provider,
+    record_rpc_retry,
+)
+
+
+DEFAULT_MAX_FAILURES = 3
+DEFAULT_EJECTION_TIME = 30.0
+DEFAULT_HEDGE_PERCENTILE = 95.0
+DEFAULT_HEDGE_MIN_SAMPLES = 20
+DEFAULT_MAX_HEDGING_WORKERS = 16
+LATENCY_WINDOW = 100
+EWMA_WEIGHT = 0.2
+# requests with side effects are never duplicated: they are neither hedged,
+# nor failed over once they may have reached an endpoint
+UNHEDGED_METHODS: FrozenSet[str] = frozenset(
+    {"eth_sendRawTransaction", "eth_sendTransaction", "eth_sign", "eth_signTransaction"}
+)
+
+
+def is_unsent(exception: Exception) -> bool:
+    """Check whether a request failed before it was sent, because the connection to the endpoint could not be made."""
+    if isinstance(exception, ConnectTimeout):
+        return True
+    if not isinstance(exception, RequestsConnectionError) or not exception.args:
+        return False
+    return isinstance(getattr(exception.args[0], "reason", None), NewConnectionError)
+
+
+class Endpoint:
+    """The state of an RPC endpoint: its recent latencies and failures."""
+
+    def __init__(self, uri: str) -> None:
+        """Initialize the endpoint."""
+        self.uri = uri
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.ewma: Optional[float] = None
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.ejections = 0
+
+    def is_admitted(self, now: float) -> bool:
+        """Check whether the endpoint can be routed to."""
+        return now >= self.ejected_until
+
+    def record_success(self, latency: float) -> None:
+        """Record a successful request."""
+        self.requests += 1
+        self.consecutive_failures = 0
+        self.latencies.append(latency)
+        self.ewma = (
+            latency
+            if self.ewma is None
+            else EWMA_WEIGHT * latency + (1 - EWMA_WEIGHT) * self.ewma
+        )
+
+    def record_failure(
+        self, now: float, max_failures: int, ejection_time: float
+    ) -> None:
+        """Record a failed request, ejecting the endpoint after `max_failures` consecutive failures."""
+        self.requests += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= max_failures:
+            self.ejected_until = now + ejection_time
+            self.ejections += 1
+            # on re-admission, a single failure ejects the endpoint again
+            self.consecutive_failures = max_failures - 1
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Get a percentile of the recent latencies."""
+        if not self.latencies:
+            return None
+        latencies = sorted(self.latencies)
+        index = min(len(latencies) - 1, int(len(latencies) * percent / 100))
+        return latencies[index]
+
+
+class RoutingHTTPProvider(HTTPProvider):
+    """
+    An HTTP provider which routes each request to one of multiple endpoints of the same chain.
+
+    The endpoints are picked at random, weighted by the inverse of their average latency,
+    and a failed request fails over to the next endpoint;
+    a request with side effects only fails over if it could not be sent.
+    An endpoint which fails `max_failures` times in a row is ejected for `ejection_time` seconds,
+    and it is re-admitted on probation afterwards: a single failure ejects it again.
+    With `hedge` enabled, a read which takes longer than the `hedge_percentile` of its endpoint's latencies
+    is duplicated to a second endpoint, and the first response wins.
+    The `endpoint_uri` is the admitted endpoint with the lowest average latency,
+    so that the JSON-RPC batches which are posted to it directly go to the fastest endpoint.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        endpoint_uris: List[str],
+        request_kwargs: Optional[Any] = None,
+        max_failures: int = DEFAULT_MAX_FAILURES,
+        ejection_time: float = DEFAULT_EJECTION_TIME,
+        hedge: bool = False,
+        hedge_percentile: float = DEFAULT_HEDGE_PERCENTILE,
+        hedge_min_samples: int = DEFAULT_HEDGE_MIN_SAMPLES,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the provider.
+
+        :param endpoint_uris: the uris of the endpoints.
+        :param request_kwargs: the keyword arguments of the HTTP requests.
+        :param max_failures: the number of consecutive failures after which an endpoint is ejected.
+        :param ejection_time: for how long an endpoint is ejected, in seconds.
+        :param hedge: whether to hedge the slow reads.
+        :param hedge_percentile: the percentile of an endpoint's latencies after which a read is hedged.
+        :param hedge_min_samples: the number of latencies of an endpoint needed before its reads are hedged.
+        :param seed: the seed of the routing.
+        """
+        if not endpoint_uris:
+            raise ValueError("At least one endpoint uri is required.")
+        self.endpoints = [Endpoint(uri) for uri in endpoint_uris]
+        self.max_failures = max_failures
+        self.ejection_time = ejection_time
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedged = 0
+        self.hedges_won = 0
+        self._random = random.Random(seed)  # nosec
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        super().__init__(endpoint_uris[0], request_kwargs)
+
+    @property  # type: ignore
+    def endpoint_uri(self) -> str:  # type: ignore
+        """Get the uri of the admitted endpoint with the lowest average latency."""
+        now = time.monotonic()
+        with self._lock:
+            admitted = [
+                e for e in self.endpoints if e.is_admitted(now)
+            ] or self.endpoints
+            fastest = min(
+                admitted, key=lambda e: e.ewma if e.ewma is not None else float("inf")
+            )
+        return fastest.uri
+
+    @endpoint_uri.setter
+    def endpoint_uri(self, _: str) -> None:
+        """The uri is derived from the state of the endpoints, so it cannot be set."""
+
+    def __str__(self) -> str:
+        """Get the string representation of the provider."""
+        return f"RPC connection {[e.uri for e in self.endpoints]}"
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Make a request, failing over to the other endpoints if it has no side effects or was not sent, and hedging it if it is a slow read."""
+        request_data = self.encode_rpc_request(method, params)
+        tried: Set[str] = set()
+        last_exception: Optional[Exception] = None
+        while True:
+            endpoint = self._choose(tried)
+            if endpoint is None:
+                if last_exception is None:  # pragma: nocover
+                    raise ConnectionError("No RPC endpoint available.")
+                raise last_exception
+            if tried:
+                record_rpc_retry()
+            tried.add(endpoint.uri)
+            try:
+                if self.hedge and method not in UNHEDGED_METHODS:
+                    return self._send_hedged(endpoint, request_data, tried)
+                return self._send(endpoint, request_data)
+            except Exception as e:  # pylint: disable=broad-except
+                if method in UNHEDGED_METHODS and not is_unsent(e):
+                    raise
+                last_exception = e
+
+    def _choose(self, exclude: Set[str]) -> Optional[Endpoint]:
+        """Choose an endpoint at random, weighted by the inverse of the average latency."""
+        now = time.monotonic()
+        with self._lock:
+            candidates = [e for e in self.endpoints if e.uri not in exclude]
+            admitted = [e for e in candidates if e.is_admitted(now)]
+            if not admitted:
+                # all the endpoints are ejected, try the one which will be re-admitted first
+                return min(candidates, key=lambda e: e.ejected_until, default=None)
+            known_weights = [1 / e.ewma for e in admitted if e.ewma]
+            # the endpoints without latencies yet are tried as if they were the fastest
+            default_weight = max(known_weights, default=1.0)
+            weights = [1 / e.ewma if e.ewma else default_weight for e in admitted]
+            return self._random.choices(admitted, weights)[0]
+
+    def _send(self, endpoint: Endpoint, request_data: bytes) -> RPCResponse:
+        """Send a request to an endpoint, recording its latency or failure."""
+        start = time.perf_counter()
+        try:
+            raw_response = make_post_request(
+                endpoint.uri, request_data, **self.get_request_kwargs()
+            )
+            response = self.decode_rpc_response(raw_response)
+        except Exception:
+            with self._lock:
+                endpoint.record_failure(
+                    time.monotonic(), self.max_failures, self.ejection_time
+                )
+            raise
+        with self._lock:
+            endpoint.record_success(time.perf_counter() - start)
+        return response
+
+    def _send_hedged(
+        self, endpoint: Endpoint, request_data: bytes, tried: Set[str]
+    ) -> RPCResponse:
+        """Send a request, and duplicate it to a second endpoint if it is slower than the hedging threshold."""
+        with self._lock:
+            threshold = (
+                endpoint.percentile(self.hedge_percentile)
+                if len(endpoint.latencies) >= self.hedge_min_samples
+                else None
+            )
+        if threshold is None or len(self.endpoints) < 2:
+            return self._send(endpoint, request_data)
+
+        executor = self._get_executor()
+        first = executor.submit(self._send, endpoint, request_data)
+        done, _ = wait([first], timeout=threshold)
+        if done:
+            return first.result()
+        second_endpoint = self._choose(tried)
+        if second_endpoint is None:
+            return first.result()
+        tried.add(second_endpoint.uri)
+        second = executor.submit(self._send, second_endpoint, request_data)
+        with self._lock:
+            self.hedged += 1
+
+        pending = {first, second}
+        last_exception: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                last_exception = future.exception()
+                if last_exception is None:
+                    if future is second:
+                        with self._lock:
+                            self.hedges_won += 1
+                    return future.result()
+        raise last_exception  # type: ignore
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the executor of the hedged requests."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    DEFAULT_MAX_HEDGING_WORKERS, thread_name_prefix="rpc-hedging"
+                )
+            return self._executor
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Get the metrics of the routing."""
+        now = time.monotonic()
+        with self._lock:
+            endpoints = {
+                e.uri: dict(
+                    admitted=e.is_admitted(now),
+                    requests=e.requests,
+                    failures=e.failures,
+                    ejections=e.ejections,
+                    ewma=e.ewma,
+                    p95=e.percentile(95),
+                )
+                for e in self.endpoints
+            }
+            return dict(
+                endpoints=endpoints, hedged=self.hedged, hedges_won=self.hedges_won
+            )
+
+
+def make_ledger_api(registry: Registry, ledger_id: str, **config: Any) -> LedgerApi:
+    """
+    Make a ledger api, routing its requests over multiple endpoints if the config has `addresses`.
+
+    The optional `routing` config holds the keyword arguments of the `RoutingHTTPProvider`.
+    The sizes of the responses of the HTTP providers are counted in the metrics of the calls.
+
+    :param registry: the registry of the ledger apis.
+    :param ledger_id: the ledger id.
+    :param config: the api config.
+    :return: the ledger api.
+    """
+    config = dict(config)
+    addresses = config.pop("addresses", None)
+    routing = config.pop("routing", None) or {}
+    if addresses:
+        config["address"] = addresses[0]
+    api = registry.make(ledger_id, **config)
+    if addresses:
+        api.api.provider = RoutingHTTPProvider(addresses, **routing)
+    provider = getattr(getattr(api, "api", None), "provider", None)
+    if isinstance(provider, HTTPProvider):
+        instrument_provider(provider)
+    return api
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains a batcher of the state requests of a ledger api, which sends them as JSON-RPC batches."""
+import json
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from aea.common import JSONLike
+from aea.crypto.base import LedgerApi
+from aea_ledger_ethereum.ethereum import AttributeDictTranslator
+from web3 import HTTPProvider, Web3
+from web3._utils.encoding import FriendlyJsonSerde, Web3JsonEncoder
+from web3._utils.request import make_post_request
+from web3.datastructures import AttributeDict
+from web3.providers import BaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from packages.valory.connections.ledger.metrics import record_rpc_response
+
+
+MAX_BATCH_SIZE = 100
+# the calls which still make requests after this many batches are made on their own
+MAX_ROUNDS = 8
+
+# (JSON-RPC method, params)
+Request = Tuple[str, Any]
+
+
+class BatchNotSupportedError(Exception):
+    """The node did not answer a JSON-RPC batch."""
+
+
+class _PendingRequest(BaseException):
+    """
+    Interrupts a replayed call at its first request whose response is not known yet.
+
+    It is not an `Exception`, so that it goes through the error handling of web3 and its middlewares.
+    """
+
+
+class _Replay:
+    """A call, the requests it made so far, and the responses to them."""
+
+    __slots__ = ("call", "requests", "responses", "served", "state")
+
+    def __init__(self, call: JSONLike) -> None:
+        """Initialize the replay."""
+        self.call = call
+        self.requests: List[Request] = []
+        self.responses: List[RPCResponse] = []
+        self.served = 0
+        self.state: Optional[JSONLike] = None
+
+
+class _ReplayProvider(BaseProvider):
+    """A provider which serves the recorded responses of the call replayed by the current thread."""
+
+    def __init__(self) -> None:
+        """Initialize the provider."""
+        self._local = threading.local()
+
+    @property
+    def replay(self) -> Optional[_Replay]:
+        """Get the call replayed by the current thread."""
+        return getattr(self._local, "replay", None)
+
+    @replay.setter
+    def replay(self, replay: Optional[_Replay]) -> None:
+        """Set the call replayed by the current thread."""
+        self._local.replay = replay
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Serve the recorded response of a request, or record the request and interrupt the call."""
+        replay = self.replay
+        if replay is None:  # pragma: nocover
+            raise ValueError("The batching provider only serves replayed calls.")
+        index = replay.served
+        replay.served += 1
+        if index < len(replay.responses):
+            if replay.requests[index] != (method, params):
+                raise ValueError("The call made different requests when replayed.")
+            return replay.responses[index]
+        replay.requests.append((method, params))
+        raise _PendingRequest()
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        """The connection is the one of the ledger api."""
+        return True
+
+
+class StateBatcher:
+    """
+    Runs the `get_state` calls of a ledger api, sending the JSON-RPC requests they make as batches.
+
+    Each call runs against a web3 instance with the middlewares of the ledger api,
+    whose provider records the request the call makes and interrupts it.
+    The recorded requests of all the calls are sent in a single JSON-RPC batch,
+    and the calls are replayed with the responses, until they return or make another request.
+    A call made against the replayed responses gives the same result as a call against the node,
+    because web3 formats the responses of both in the same way.
+    """
+
+    def __init__(self, api: LedgerApi) -> None:
+        """
+        Initialize the batcher.
+
+        :param api: the ledger api, which must be supported.
+        """
+        self.api = api
+        self.batches = 0
+        self._provider = _ReplayProvider()
+        self._w3 = Web3(
+            self._provider, middlewares=api.api.middleware_onion.middlewares
+        )
+
+    @staticmethod
+    def supports(api: LedgerApi) -> bool:
+        """Check whether the requests of a ledger api can be sent as JSON-RPC batches."""
+        web3 = getattr(api, "api", None)
+        return isinstance(getattr(web3, "provider", None), HTTPProvider)
+
+    @staticmethod
+    def format_state(callable_name: str, result: Any) -> Optional[JSONLike]:
+        """Format the result of a call like the `get_state` of the ledger api does, or return None if it cannot."""
+        if isinstance(result, AttributeDict):
+            return AttributeDictTranslator.to_dict(result)
+        if type(result) in (int, float, bytes, str, list, dict):
+            return {f"{callable_name}_result": result}
+        return None
+
+    def get_states(self, calls: List[JSONLike]) -> List[Optional[JSONLike]]:
+        """
+        Run the calls.
+
+        :param calls: the calls, dicts with their `callable`, `args` and `kwargs`.
+        :return: a state per call, `{"state": ...}` or `{"error": ...}`, or None for the calls which must be made on their own.
+        """
+        replays = [_Replay(call) for call in calls]
+        pending = replays
+        for _ in range(MAX_ROUNDS):
+            pending = [replay for replay in pending if not self._run(replay)]
+            if not pending:
+                break
+            try:
+                responses = self._send([replay.requests[-1] for replay in pending])
+            except BatchNotSupportedError:
+                return [None] * len(calls)
+            for replay, response in zip(pending, responses):
+                replay.responses.append(response)
+        return [replay.state for replay in replays]
+
+    def _run(self, replay: _Replay) -> bool:
+        """Replay a call, and return whether it is done."""
+        call = replay.call
+        replay.served = 0
+        self._provider.replay = replay
+        try:
+            result = getattr(self._w3.eth, call["callable"])(
+                *call["args"], **call["kwargs"]
+            )
+        except _PendingRequest:
+            return False
+        except Exception as e:  # pylint: disable=broad-except
+            replay.state = {"error": str(e)}
+            return True
+        finally:
+            self._provider.replay = None
+
+        state = self.format_state(call["callable"], result)
+        replay.state = (
+            {"error": "Failed to get state"} if state is None else {"state": state}
+        )
+        return True
+
+    def _send(self, requests: List[Request]) -> List[RPCResponse]:
+        """Send the requests, in JSON-RPC batches of up to `MAX_BATCH_SIZE` requests."""
+        provider = self.api.api.provider
+        responses: List[RPCResponse] = []
+        for start in range(0, len(requests), MAX_BATCH_SIZE):
+            chunk = requests[start : start + MAX_BATCH_SIZE]
+            payload = [
+                {"jsonrpc": "2.0", "id": i, "method": method, "params": params or []}
+                for i, (method, params) in enumerate(chunk)
+            ]
+            self.batches += 1
+            try:
+                raw_response = make_post_request(
+                    provider.endpoint_uri,
+                    FriendlyJsonSerde().json_encode(payload, Web3JsonEncoder).encode(),
+                    **provider.get_request_kwargs(),
+                )
+                record_rpc_response(len(raw_response))
+                raw_responses = json.loads(raw_response)
+            except Exception as e:  # pylint: disable=broad-except
+                raise BatchNotSupportedError(f"The JSON-RPC batch failed: {e}") from e
+            if not isinstance(raw_responses, list):
+                raise BatchNotSupportedError(
+                    f"Unexpected response to a JSON-RPC batch: {raw_responses}"
+                )
+            by_id: Dict[Any, RPCResponse] = {
+                response.get("id", None): response for response in raw_responses
+            }
+            if set(by_id.keys()) != set(range(len(chunk))):
+                raise BatchNotSupportedError(
+                    f"Missing responses to a JSON-RPC batch: {raw_responses}"
+                )
+            responses.extend(by_id[i] for i in range(len(chunk)))
+        return responses
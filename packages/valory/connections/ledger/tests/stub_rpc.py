@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Local JSON-RPC stub servers with configurable latency and errors, to test the routing over multiple endpoints."""
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Any, List, Optional, Type
+
+
+CHAIN_ID = 1337
+
+
+class StubRpcServer:
+    """
+    A minimal Ethereum JSON-RPC server.
+
+    Every HTTP request is delayed by `latency` seconds, and fails with the HTTP status `error_status`
+    with probability `error_rate`. Both can be changed while the server is running.
+    JSON-RPC batches are served in a single HTTP request.
+    """
+
+    def __init__(
+        self, latency: float = 0.0, error_rate: float = 0.0, error_status: int = 503
+    ) -> None:
+        """Initialize the server."""
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.block_number = 1
+        self.requests = 0
+        self.methods: List[str] = []
+        self._random = random.Random(0)  # nosec
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """Get the url of the server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubRpcServer":
+        """Start serving in a background thread."""
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Stop the server."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _result(self, method: str) -> Any:
+        """Get the result of a JSON-RPC method."""
+        if method == "eth_chainId":
+            return hex(CHAIN_ID)
+        if method == "eth_blockNumber":
+            return hex(self.block_number)
+        if method == "eth_sendRawTransaction":
+            return "0x" + "ab" * 32
+        if method == "eth_getBalance":
+            return hex(10**18)
+        return "stub/v0.1.0"
+
+    def _make_handler(self) -> Type[BaseHTTPRequestHandler]:
+        """Make the HTTP request handler class bound to this server."""
+        stub = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            """Serve the JSON-RPC requests."""
+
+            def do_POST(self) -> None:  # pylint: disable=invalid-name
+                """Serve a JSON-RPC request."""
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                requests = body if isinstance(body, list) else [body]
+                with stub._lock:  # pylint: disable=protected-access
+                    stub.requests += 1
+                    stub.methods.extend(request["method"] for request in requests)
+                    fails = (
+                        stub._random.random() < stub.error_rate
+                    )  # pylint: disable=protected-access
+                time.sleep(stub.latency)
+                if fails:
+                    self.send_response(stub.error_status)
+                    self.end_headers()
+                    return
+                responses = [
+                    {
+                        "jsonrpc": "2.0",
+                        "id": request["id"],
+                        "result": stub._result(  # pylint: disable=protected-access
+                            request["method"]
+                        ),
+                    }
+                    for request in requests
+                ]
+                content = json.dumps(
+                    responses if isinstance(body, list) else responses[0]
+                ).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args: Any) -> None:
+                """Do not log the requests."""
+
+        return _Handler
@@ -19,6 +19,10 @@
 
 """This module contains the tests of the ledger connection module."""
 
+import asyncio
+import threading
+import time
+from typing import Any, List
 from unittest import mock
 from unittest.mock import ANY, MagicMock, Mock, patch
 
@@ -26,6 +30,8 @@ import pytest
 from aea_ledger_ethereum import EthereumCrypto
 
 from aea.common import Address
+from aea.configurations.base import ContractConfig
+from aea.contracts.base import Contract
 from aea.crypto.ledger_apis import ETHEREUM_DEFAULT_ADDRESS
 from aea.crypto.registries import ledger_apis_registry
 from aea.exceptions import AEAException
@@ -36,6 +42,7 @@ from aea.protocols.dialogue.base import Dialogue
 
 from packages.valory.connections.ledger.contract_dispatcher import (
     ContractApiRequestDispatcher,
+    _get_full_args_spec,
 )
 
 # pylint: skip-file
@@ -274,7 +281,122 @@ async def test_run_async() -> None:
 @pytest.mark.asyncio
 async def test_get_handler() -> None:
     """Test failed to get handler."""
-    with pytest.raises(Exception, match="Performative not recognized."):
+    with pytest.raises(ValueError, match="Performative not recognized."):
         ContractApiRequestDispatcher(
             MultiplexerStatus(), connection_id="test_id"
         ).get_handler(ContractApiMessage.Performative.ERROR)
+
+
+@pytest.mark.asyncio
+async def test_get_state_coalescing() -> None:
+    """Test that concurrent identical get_state requests share one call."""
+    n_requests = 20
+    calls: List[Any] = []
+    lock = threading.Lock()
+
+    def get_state(ledger_api: Any, contract_address: str, **kwargs: Any) -> Any:
+        with lock:
+            calls.append(kwargs)
+        time.sleep(0.5)
+        return {"data": kwargs["job"]}
+
+    contract = Mock()
+    contract.get_state = get_state
+    dispatcher = ContractApiRequestDispatcher(
+        AsyncState(), connection_id="test_id", loop=asyncio.get_event_loop()
+    )
+    contract_api_dialogues = ContractApiDialogues(SOME_SKILL_ID)
+
+    def request(job: str) -> Any:
+        message, dialogue = contract_api_dialogues.create(
+            counterparty=str(dispatcher.dialogues.self_address),
+            performative=ContractApiMessage.Performative.GET_STATE,
+            ledger_id=EthereumCrypto.identifier,
+            contract_id=str(SOME_SKILL_ID),
+            contract_address="test addr",
+            callable="get_state",
+            kwargs=ContractApiMessage.Kwargs({"job": job}),
+        )
+        # the dispatcher keeps its own copy of the dialogue
+        dispatcher_dialogue = dispatcher.dialogues.update(message)
+        return dispatcher.run_async(
+            dispatcher.get_state, Mock(), message, dispatcher_dialogue  # type: ignore
+        )
+
+    with patch.object(dispatcher.contract_registry, "make", return_value=contract):
+        responses = await asyncio.gather(
+            *(request("workable") for _ in range(n_requests)), request("other")
+        )
+
+    assert len(calls) == 2
+    assert all(
+        response.performative == ContractApiMessage.Performative.STATE
+        for response in responses
+    )
+    assert [response.state.body for response in responses] == [
+        {"data": "workable"}
+    ] * n_requests + [{"data": "other"}]
+    # every response replies to its own request
+    assert len({response.dialogue_reference for response in responses}) == (
+        n_requests + 1
+    )
+    assert dispatcher.coalescing_metrics == dict(
+        calls=2, coalesced_requests=n_requests - 1, in_flight=0
+    )
+    dispatcher.shutdown_executors()
+
+
+class DummyContract(Contract):
+    """A contract without ABI."""
+
+    contract_interface = {EthereumCrypto.identifier: {"abi": [], "bytecode": "0x"}}
+
+    @classmethod
+    def get_dummy_instance(cls, ledger_api: Any, contract_address: str) -> Any:
+        """Get the instance of the contract, the way the contract packages do."""
+        return cls.get_instance(ledger_api, contract_address)
+
+
+def test_contract_caches() -> None:
+    """Test that the contracts, their instances and the argument specs of their callables are cached."""
+    dispatcher = ContractApiRequestDispatcher(AsyncState(), connection_id="test_id")
+    ledger_api = ledger_apis_registry.make(
+        EthereumCrypto.identifier, address=ETHEREUM_DEFAULT_ADDRESS
+    )
+    other_ledger_api = ledger_apis_registry.make(
+        EthereumCrypto.identifier, address=ETHEREUM_DEFAULT_ADDRESS
+    )
+    address = "0x0000000000000000000000000000000000000001"
+    other_address = "0x0000000000000000000000000000000000000002"
+
+    with patch.object(
+        dispatcher.contract_registry,
+        "make",
+        side_effect=lambda _: DummyContract(ContractConfig("dummy", "valory", "0.1.0")),
+    ) as make:
+        contract = dispatcher.get_contract(SOME_SKILL_ID)
+        assert dispatcher.get_contract(SOME_SKILL_ID) is contract
+    make.assert_called_once()
+    # the contract class is left as it is
+    assert type(contract) is DummyContract
+
+    cached_api = dispatcher.get_cached_ledger_api(ledger_api, SOME_SKILL_ID, contract)
+    other_cached_api = dispatcher.get_cached_ledger_api(
+        other_ledger_api, SOME_SKILL_ID, contract
+    )
+    instance = contract.get_dummy_instance(cached_api, address)
+    assert contract.get_dummy_instance(cached_api, address) is instance
+    assert contract.get_instance(cached_api, address) is instance
+    assert contract.get_instance(cached_api, other_address) is not instance
+    assert contract.get_instance(other_cached_api, address) is not instance
+    # the ledger api passed directly is not affected
+    assert contract.get_instance(ledger_api, address) is not instance
+    assert instance.address == cached_api.api.to_checksum_address(address)
+    assert dispatcher.contract_instance_cache.metrics == dict(size=3, hits=2, misses=3)
+
+    _get_full_args_spec.cache_clear()
+    for _ in range(2):
+        args_spec = _get_full_args_spec(contract.get_dummy_instance)
+    assert args_spec.args == ["cls", "ledger_api", "contract_address"]
+    assert _get_full_args_spec.cache_info().hits == 1
+    dispatcher.shutdown_executors()
@@ -20,16 +20,17 @@
 """This module contains the tests of the ledger connection module."""
 
 import asyncio
+import json
 import logging
+import threading
 import time
 from asyncio import Task
 from threading import Thread
-from typing import Any, Callable, Dict, FrozenSet, Tuple, Type, cast
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple, Type, cast
 from unittest import mock
 
 import pytest
-from aea_ledger_ethereum import EthereumCrypto
-
 from aea.common import Address
 from aea.configurations.base import ConnectionConfig
 from aea.connections.base import ConnectionStates
@@ -40,13 +41,37 @@ from aea.mail.base import Envelope
 from aea.multiplexer import Multiplexer
 from aea.protocols.base import Message
 from aea.protocols.dialogue.base import Dialogue, DialogueLabel, Dialogues
+from aea_ledger_ethereum import EthereumCrypto
 
-from packages.valory.connections.ledger.base import RequestDispatcher
+from packages.valory.connections.ledger.base import (
+    BoundedExecutor,
+    ExecutorSaturatedError,
+    LedgerApiPool,
+    RequestDispatcher,
+)
 from packages.valory.connections.ledger.connection import LedgerConnection, PUBLIC_ID
+from packages.valory.connections.ledger.lanes import (
+    DEADLINE_KWARG,
+    Priority,
+    REQUEST_PRIORITY,
+    get_priority,
+    pop_deadline,
+)
 from packages.valory.connections.ledger.ledger_dispatcher import (
     LedgerApiRequestDispatcher,
 )
+from packages.valory.connections.ledger.metrics import (
+    Histogram,
+    JsonFileExporter,
+    MetricsRegistry,
+    make_exporter,
+)
+from packages.valory.connections.ledger.receipt_waiter import RECEIPT, ReceiptWaiter
 from packages.valory.connections.ledger.tests.conftest import make_ledger_api_connection
+from packages.valory.connections.ledger.tests.stub_rpc import CHAIN_ID, StubRpcServer
+from packages.valory.connections.ledger.tests.test_ledger_api import (
+    LedgerApiDialogues as SkillLedgerApiDialogues,
+)
 
 # pylint: skip-file
 from packages.valory.protocols.contract_api import ContractApiMessage
@@ -617,3 +642,472 @@ def test_ledger_connection_exceptions() -> None:
     connection._contract_dispatcher = mock.Mock()
     connection._contract_dispatcher.dispatch.return_value = 12
     assert connection._schedule_request(envelope) == 12
+
+
+class TestLedgerApiPool:
+    """Test `LedgerApiPool` class."""
+
+    config = {"address": "http://127.0.0.1:8545", "chain_id": 1}
+
+    def setup(self) -> None:
+        """Setup test vars."""
+        self.make = mock.Mock(side_effect=lambda *_, **__: mock.Mock())
+        self.pool = LedgerApiPool(self.make, health_check_interval=60)
+
+    def test_get(self) -> None:
+        """Test that an api is made once per ledger id and config."""
+        api = self.pool.get("ethereum", self.config)
+        reordered_config = dict(reversed(list(self.config.items())))
+        assert self.pool.get("ethereum", reordered_config) is api
+        assert self.pool.get("ethereum", {**self.config, "chain_id": 2}) is not api
+        assert self.pool.get("other", self.config) is not api
+        self.make.assert_any_call("ethereum", **self.config)
+        assert self.pool.metrics == dict(
+            size=3, hits=1, misses=3, evictions=0, health_checks=0
+        )
+
+    def test_health_check(self) -> None:
+        """Test that an unhealthy api is evicted and made again."""
+        api = self.pool.get("ethereum", self.config)
+        assert not self.pool.due_for_health_check("ethereum", self.config)
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 61):
+            assert self.pool.due_for_health_check("ethereum", self.config)
+            assert not self.pool.due_for_health_check("ethereum", self.config)
+
+        api.api.is_connected.return_value = True
+        assert self.pool.check_health("ethereum", self.config)
+        assert self.pool.get("ethereum", self.config) is api
+
+        api.api.is_connected.side_effect = ConnectionError
+        assert not self.pool.check_health("ethereum", self.config)
+        assert self.pool.get("ethereum", self.config) is not api
+        assert self.pool.metrics == dict(
+            size=1, hits=1, misses=2, evictions=1, health_checks=2
+        )
+
+
+def test_dispatch_reuses_ledger_api() -> None:
+    """Test that the dispatcher gets the ledger apis from the pool."""
+    pool = LedgerApiPool(mock.Mock())
+    dispatcher = LedgerApiRequestDispatcher(
+        logger=mock.Mock(),
+        connection_id=PUBLIC_ID,
+        connection_state=AsyncState(),
+        api_configs={"ethereum": {"address": "http://127.0.0.1:8545"}},
+        ledger_api_pool=pool,
+    )
+    envelope = mock.Mock(message=mock.Mock(spec=Message))
+    with mock.patch.object(
+        dispatcher, "get_ledger_id", return_value="ethereum"
+    ), mock.patch.object(dispatcher, "_ledger_api_dialogues"), mock.patch.object(
+        dispatcher, "get_handler"
+    ), mock.patch.object(
+        dispatcher, "run_async", new=mock.Mock()
+    ), mock.patch.object(
+        dispatcher.loop, "create_task"
+    ):
+        dispatcher.dispatch(envelope)
+        dispatcher.dispatch(envelope)
+    assert pool.metrics["misses"] == 1
+    assert pool.metrics["hits"] == 1
+
+
+class TestBoundedExecutor:
+    """Test `BoundedExecutor` class."""
+
+    def setup(self) -> None:
+        """Setup test vars."""
+        self.release = threading.Event()
+
+    def teardown(self) -> None:
+        """Release the blocked calls."""
+        self.release.set()
+
+    def blocked(self, value: int) -> int:
+        """Block until released, then return the value."""
+        self.release.wait(timeout=5)
+        return value
+
+    def test_reject(self) -> None:
+        """Test that new calls are rejected when the queue is full."""
+        executor = BoundedExecutor("test", max_workers=1, max_queue_depth=1)
+        running = executor.submit(self.blocked, 0)
+        queued = executor.submit(self.blocked, 1)
+        with pytest.raises(ExecutorSaturatedError, match="'test' is saturated"):
+            executor.submit(self.blocked, 2)
+        metrics = executor.metrics
+        assert metrics["saturated"]
+        assert metrics["rejected"] == 1
+        self.release.set()
+        assert running.result(timeout=5) == 0
+        assert queued.result(timeout=5) == 1
+        executor.shutdown()
+        assert executor.metrics == dict(
+            max_workers=1,
+            max_queue_depth=1,
+            running=0,
+            queue_depth=0,
+            peak_queue_depth=1,
+            saturated=False,
+            submitted=3,
+            completed=2,
+            rejected=1,
+            shed=0,
+        )
+
+    def test_shed_oldest(self) -> None:
+        """Test that the oldest queued call is shed for a new one when the queue is full."""
+        executor = BoundedExecutor(
+            "test", max_workers=1, max_queue_depth=1, saturation_policy="shed_oldest"
+        )
+        running = executor.submit(self.blocked, 0)
+        oldest = executor.submit(self.blocked, 1)
+        newest = executor.submit(self.blocked, 2)
+        with pytest.raises(ExecutorSaturatedError, match="shed"):
+            oldest.result(timeout=5)
+        self.release.set()
+        assert running.result(timeout=5) == 0
+        assert newest.result(timeout=5) == 2
+        executor.shutdown()
+        assert executor.metrics["shed"] == 1
+
+    def test_priorities(self) -> None:
+        """Test that the most urgent queued call runs first, and sheds a less urgent one from a full queue."""
+        executor = BoundedExecutor("test", max_workers=1, max_queue_depth=2)
+        order: List[Priority] = []
+
+        def submit(priority: Priority) -> Any:
+            """Submit a call on behalf of a request of the given priority."""
+            token = REQUEST_PRIORITY.set(priority)
+            try:
+                return executor.submit(order.append, priority)
+            finally:
+                REQUEST_PRIORITY.reset(token)
+
+        running = executor.submit(self.blocked, 0)
+        scan = submit(Priority.SCAN)
+        read = submit(Priority.READ)
+        submission = submit(Priority.SUBMISSION)
+        with pytest.raises(ExecutorSaturatedError, match="shed"):
+            scan.result(timeout=5)
+        # a call is not shed for a less urgent one
+        with pytest.raises(ExecutorSaturatedError, match="saturated"):
+            submit(Priority.SCAN)
+        self.release.set()
+        running.result(timeout=5)
+        read.result(timeout=5)
+        submission.result(timeout=5)
+        assert order == [Priority.SUBMISSION, Priority.READ]
+        executor.shutdown()
+
+    def test_invalid_policy(self) -> None:
+        """Test that an unknown saturation policy is not accepted."""
+        with pytest.raises(ValueError, match="Saturation policy must be one of"):
+            BoundedExecutor("test", 1, 1, saturation_policy="drop")
+
+
+def test_executor_per_chain() -> None:
+    """Test that the dispatchers run the calls of each chain in a configured, named executor."""
+    dispatcher = LedgerApiRequestDispatcher(
+        logger=mock.Mock(),
+        connection_id=PUBLIC_ID,
+        connection_state=AsyncState(),
+        executor_configs={
+            "default": {"max_workers": 2},
+            "ledger:arbitrum": {"max_queue_depth": 10},
+        },
+    )
+    ethereum = cast(BoundedExecutor, dispatcher.get_executor("ethereum"))
+    arbitrum = cast(BoundedExecutor, dispatcher.get_executor("arbitrum"))
+    assert dispatcher.get_executor("ethereum") is ethereum
+    assert (ethereum.name, ethereum.max_workers, ethereum.max_queue_depth) == (
+        "ledger:ethereum",
+        2,
+        256,
+    )
+    assert (arbitrum.name, arbitrum.max_workers, arbitrum.max_queue_depth) == (
+        "ledger:arbitrum",
+        8,
+        10,
+    )
+    assert set(dispatcher.executor_metrics) == {"ledger:ethereum", "ledger:arbitrum"}
+    dispatcher.shutdown_executors()
+    assert dispatcher.executor_metrics == {}
+
+
+@pytest.mark.asyncio
+async def test_receipt_waiter() -> None:
+    """Test that the receipt waiter looks all the pending hashes up in one batch per new block."""
+    chain: Dict[str, Any] = {"block": 1, "included": {}, "without_transaction": set()}
+    fetched = []
+
+    def fetch(lookups: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Any]:
+        """Serve the included receipts and transactions."""
+        fetched.append(lookups)
+        return {
+            (method, tx_hash): {"status": 1, "hash": tx_hash}
+            if chain["included"].get(tx_hash, chain["block"] + 1) <= chain["block"]
+            and (method == RECEIPT or tx_hash not in chain["without_transaction"])
+            else None
+            for method, tx_hash in lookups
+        }
+
+    waiter = ReceiptWaiter(mock.Mock(), asyncio.get_event_loop(), poll_interval=0.01)
+    with mock.patch.object(
+        waiter, "_get_block_number", side_effect=lambda: chain["block"]
+    ), mock.patch.object(waiter, "_fetch", side_effect=fetch):
+        waits = asyncio.gather(
+            waiter.wait("0xa", timeout=5), waiter.wait("0xb", timeout=5)
+        )
+        await asyncio.sleep(0.1)
+        # the new hashes are looked up once, then only on a new block
+        assert len(fetched) == 1
+
+        chain["included"] = {"0xa": 2, "0xb": 2}
+        chain["block"] = 2
+        results = await waits
+        assert len(fetched) == 2
+        # the receipts and the transactions of both hashes in a single batch
+        assert len(fetched[1]) == 4
+        assert results == [
+            ({"status": 1, "hash": "0xa"}, {"status": 1, "hash": "0xa"}),
+            ({"status": 1, "hash": "0xb"}, {"status": 1, "hash": "0xb"}),
+        ]
+
+        # what has been found is returned on timeout
+        chain["included"]["0xc"] = 2
+        chain["without_transaction"].add("0xc")
+        receipt, transaction = await waiter.wait("0xc", timeout=0.1)
+        assert receipt == {"status": 1, "hash": "0xc"}
+        assert transaction is None
+
+
+def make_request(performative: str, **kwargs: Any) -> Any:
+    """Make a request stand-in with the given performative value and attributes."""
+    return SimpleNamespace(performative=SimpleNamespace(value=performative), **kwargs)
+
+
+@pytest.mark.parametrize(
+    "request_, priority",
+    (
+        (make_request("send_signed_transaction"), Priority.SUBMISSION),
+        (make_request("get_raw_transaction"), Priority.SUBMISSION),
+        (make_request("get_transaction_receipt"), Priority.RECEIPT),
+        (make_request("get_balance"), Priority.READ),
+        (
+            make_request("get_state", callable="get_block", kwargs=Kwargs({})),
+            Priority.READ,
+        ),
+        (
+            make_request("get_state", callable="get_logs", kwargs=Kwargs({})),
+            Priority.SCAN,
+        ),
+        (
+            make_request(
+                "get_state", callable="get_events", kwargs=Kwargs({"from_block": 1})
+            ),
+            Priority.SCAN,
+        ),
+        (
+            make_request(
+                "get_state_batch",
+                calls=SimpleNamespace(
+                    calls=[{"callable": "get_logs", "args": [], "kwargs": {}}]
+                ),
+            ),
+            Priority.SCAN,
+        ),
+    ),
+)
+def test_get_priority(request_: Any, priority: Priority) -> None:
+    """Test the priority classes of the requests."""
+    assert get_priority(request_) == priority
+
+
+@pytest.mark.asyncio
+async def test_lanes() -> None:
+    """Test that the lanes queue, reject and time out the requests, and that the urgent responses come first."""
+    connection = LedgerConnection(
+        configuration=ConnectionConfig(
+            "ledger",
+            "valory",
+            "0.19.0",
+            lanes={"scan": {"max_in_flight": 1, "max_queue_depth": 1, "timeout": 0.1}},
+        ),
+        data_dir="test_data_dir",
+    )
+    await connection.connect()
+    loop = asyncio.get_event_loop()
+    scheduled: List[Tuple[Envelope, Any, asyncio.Future]] = []
+
+    def schedule(envelope: Envelope, timeout: Any = None) -> asyncio.Future:
+        """Schedule a request which is served when its future is resolved."""
+        future = loop.create_future()
+        scheduled.append((envelope, timeout, future))
+        return future
+
+    dispatcher = mock.Mock()
+    dispatcher.reject.side_effect = lambda envelope, e: LedgerApiMessage(
+        LedgerApiMessage.Performative.ERROR,  # type: ignore
+        code=500,
+        message=str(e),
+        data=b"",
+    )
+
+    def envelope_of(callable_name: str, **kwargs: Any) -> Envelope:
+        """Make the envelope of a `get_state` request."""
+        return Envelope(
+            to=str(PUBLIC_ID),
+            sender=SOME_SKILL_ID,
+            message=LedgerApiMessage(
+                LedgerApiMessage.Performative.GET_STATE,  # type: ignore
+                dialogue_reference=("", ""),
+                ledger_id="ethereum",
+                callable=callable_name,
+                args=(),
+                kwargs=Kwargs(kwargs),
+            ),
+        )
+
+    with mock.patch.object(
+        connection, "_schedule_request", side_effect=schedule
+    ), mock.patch.object(connection, "_get_dispatcher", return_value=dispatcher):
+        for _ in range(3):
+            await connection.send(envelope_of("get_logs"))
+        await connection.send(envelope_of("get_block"))
+        scan_lane = connection.lanes[Priority.SCAN]
+        assert len(scheduled) == 2
+        assert scheduled[0][1] == pytest.approx(0.1, abs=0.05)
+        # the read lane has no timeout by default
+        assert scheduled[1][1] is None
+        assert scan_lane.metrics["in_flight"] == 1
+        assert scan_lane.metrics["queue_depth"] == 1
+        assert scan_lane.metrics["rejected"] == 1
+        rejection = await connection.receive()
+        assert "lane is full" in rejection.message.message  # type: ignore
+
+        # the queued scan times out while it waits for the slot
+        await asyncio.sleep(0.15)
+        response = LedgerApiMessage(
+            LedgerApiMessage.Performative.ERROR, code=0, data=b""  # type: ignore
+        )
+        scheduled[0][2].set_result(response)
+        scheduled[1][2].set_result(response)
+        await asyncio.sleep(0)
+        assert len(scheduled) == 2
+        assert scan_lane.metrics["timed_out"] == 1
+        assert scan_lane.metrics["in_flight"] == 0
+
+        # the response of the read comes before the ones of the scans
+        priorities = [connection.response_envelopes.get_nowait()[0] for _ in range(3)]
+        assert priorities == [Priority.READ, Priority.SCAN, Priority.SCAN]
+
+        # the requests are served by the deadlines set by their skills, or by their lane's timeout if earlier
+        read = envelope_of("get_block", **{DEADLINE_KWARG: time.time() + 5.0})
+        await connection.send(read)
+        await connection.send(
+            envelope_of("get_logs", **{DEADLINE_KWARG: time.time() + 5.0})
+        )
+        assert scheduled[2][1] == pytest.approx(5.0, abs=0.05)
+        assert scheduled[3][1] == pytest.approx(0.1, abs=0.05)
+        # the deadline is not passed on to the called method
+        assert read.message.kwargs.body == {}  # type: ignore
+        scheduled[2][2].set_result(response)
+        scheduled[3][2].set_result(response)
+        await asyncio.sleep(0)
+
+    await connection.disconnect()
+
+
+def test_pop_deadline() -> None:
+    """Test that the deadline of a request is popped from its kwargs."""
+    message = LedgerApiMessage(
+        LedgerApiMessage.Performative.GET_STATE,  # type: ignore
+        ledger_id="ethereum",
+        callable="get_block",
+        args=(),
+        kwargs=Kwargs({"block_identifier": 1, DEADLINE_KWARG: time.time() + 10.0}),
+    )
+    assert pop_deadline(message) == pytest.approx(10.0, abs=0.05)
+    assert message.kwargs.body == {"block_identifier": 1}
+    assert pop_deadline(message) is None
+
+    # the requests without kwargs have no deadline
+    message = LedgerApiMessage(
+        LedgerApiMessage.Performative.GET_BALANCE,  # type: ignore
+        ledger_id="ethereum",
+        address="address",
+    )
+    assert pop_deadline(message) is None
+
+
+def test_metrics_registry(tmp_path: Any) -> None:
+    """Test the histograms of the calls, and their export."""
+    histogram = Histogram((1, 10, 100))
+    for value in (0.5, 5, 5, 50, 500):
+        histogram.observe(value)
+    assert histogram.counts == [1, 2, 1, 1]
+    assert (histogram.quantile(0.5), histogram.quantile(1.0)) == (10, 500)
+    assert Histogram((1,)).quantile(0.5) is None
+
+    registry = MetricsRegistry()
+    key = ("ethereum", "valory/keep3r_v2:0.1.0", "get_jobs")
+    registry.record(key, 0.02, 2048)
+    registry.record(key, 0.2, error=True, retries=2)
+    metrics = registry.snapshot()["ethereum/valory/keep3r_v2:0.1.0/get_jobs"]
+    assert (metrics["calls"], metrics["errors"], metrics["retries"]) == (2, 1, 2)
+    assert metrics["latency"]["buckets"]["0.025"] == 1
+    assert metrics["latency"]["max"] == 0.2
+    assert metrics["size"]["count"] == 1
+
+    path = str(tmp_path / "metrics.json")
+    for exporter in (
+        make_exporter("json", path=path),
+        make_exporter(
+            "packages.valory.connections.ledger.metrics:JsonFileExporter", path=path
+        ),
+    ):
+        assert isinstance(exporter, JsonFileExporter)
+        exporter.export(registry.snapshot())
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f) == registry.snapshot()
+    with pytest.raises(ValueError, match="Unknown metrics exporter"):
+        make_exporter("prometheus")
+
+
+@pytest.mark.asyncio
+async def test_call_metrics() -> None:
+    """Test that the dispatchers record the latency, the errors and the response sizes of the calls."""
+    with StubRpcServer() as server:
+        dispatcher = LedgerApiRequestDispatcher(
+            logger=mock.Mock(),
+            connection_id=PUBLIC_ID,
+            connection_state=AsyncState(ConnectionStates.connected),
+            loop=asyncio.get_event_loop(),
+            api_configs={"ethereum": {"address": server.url, "chain_id": CHAIN_ID}},
+        )
+        dialogues = SkillLedgerApiDialogues(self_address=SOME_SKILL_ID)
+        for callable_name in ("get_balance", "get_balance", "no_such_callable"):
+            request, _ = dialogues.create(
+                counterparty=str(PUBLIC_ID),
+                performative=LedgerApiMessage.Performative.GET_STATE,  # type: ignore
+                ledger_id="ethereum",
+                callable=callable_name,
+                args=("0x" + "00" * 19 + "01",),
+                kwargs=Kwargs({}),
+            )
+            await dispatcher.dispatch(
+                Envelope(to=request.to, sender=request.sender, message=request)
+            )
+        dispatcher.shutdown_executors()
+
+    snapshot = dispatcher.call_metrics.snapshot()
+    balance = snapshot["ethereum//get_balance"]
+    assert (balance["calls"], balance["errors"]) == (2, 0)
+    assert balance["latency"]["count"] == 2
+    # a JSON-RPC response per call
+    assert balance["size"]["count"] == 2
+    assert 0 < balance["size"]["max"] < 256
+    failing = snapshot["ethereum//no_such_callable"]
+    assert (failing["calls"], failing["errors"]) == (1, 1)
+    assert failing["size"]["count"] == 0
@@ -51,14 +51,6 @@ from typing import Any, Dict, Optional, cast
 from unittest.mock import Mock, patch
 
 import pytest
-from aea_ledger_ethereum import EthereumCrypto
-from aea_ledger_ethereum.test_tools.constants import ETHEREUM_PRIVATE_KEY_PATH
-from aea_ledger_ethereum.test_tools.fixture_helpers import (  # noqa: F401 pylint: disable=unsed-import
-    DEFAULT_GANACHE_CHAIN_ID,
-    ganache,
-)
-from web3.eth import Eth
-
 from aea.common import Address
 from aea.configurations.data_types import PublicId
 from aea.connections.base import Connection, ConnectionStates
@@ -74,11 +66,18 @@ from aea.helpers.transaction.base import (
 )
 from aea.mail.base import Envelope, Message
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
+from aea_ledger_ethereum import EthereumCrypto
+from aea_ledger_ethereum.test_tools.constants import ETHEREUM_PRIVATE_KEY_PATH
+from aea_ledger_ethereum.test_tools.fixture_helpers import (  # noqa: F401 pylint: disable=unsed-import
+    DEFAULT_GANACHE_CHAIN_ID,
+    ganache,
+)
 
 from packages.valory.connections.ledger.connection import LedgerConnection
 from packages.valory.connections.ledger.ledger_dispatcher import (
     LedgerApiRequestDispatcher,
 )
+from packages.valory.connections.ledger.receipt_waiter import ReceiptWaiter
 from packages.valory.protocols.ledger_api.custom_types import Kwargs
 from packages.valory.protocols.ledger_api.dialogues import LedgerApiDialogue
 from packages.valory.protocols.ledger_api.dialogues import (
@@ -579,17 +578,18 @@ class TestLedgerDispatcher:
         update_default_ethereum_ledger_api: None,
         ethereum_testnet_config: Dict,
     ) -> None:
-        """Test retry strategy when the node is blocking."""
-        retry_attempts = expected_times_called = 2
-        retry_timeout = 0.001
+        """Test that the receipt waiter gives up on time when the node is blocking."""
+        retry_attempts = 2
+        retry_timeout = 0.1
+        expected_times_called = 1
         blocking_duration = 1
 
-        # the retry strategy's total duration is an arithmetic progression
-        expected_duration = sum(i * retry_timeout for i in range(retry_attempts))
+        # the receipt waiter waits for `retry_attempts * retry_timeout` in total
+        expected_duration = retry_attempts * retry_timeout
         assert expected_duration < blocking_duration, (
-            "The purpose of this test is to check whether the retry strategy works if a node is blocking."
+            "The purpose of this test is to check whether the receipt waiter works if a node is blocking."
             f"Therefore, the blocking time ({blocking_duration}) must be larger than the expected duration "
-            f"({expected_duration}) of the retry strategy."
+            f"({expected_duration}) of the wait."
         )
 
         ledger_api_dialogues = LedgerApiDialogues(SOME_SKILL_ID)
@@ -611,8 +611,8 @@ class TestLedgerDispatcher:
         ), patch.object(
             ledger_apis_connection._ledger_dispatcher, "retry_timeout", retry_timeout
         ), patch.object(
-            Eth,
-            "get_transaction_receipt",
+            ReceiptWaiter,
+            "_fetch",
             side_effect=lambda *_: time.sleep(blocking_duration),
         ) as get_transaction_receipt_mock:
             await ledger_apis_connection.send(envelope)
@@ -623,7 +623,7 @@ class TestLedgerDispatcher:
                 )
             except asyncio.exceptions.TimeoutError:
                 raise AssertionError(
-                    "The retry strategy did not finish before the given `blocking_duration`, "
+                    "The receipt waiter did not finish before the given `blocking_duration`, "
                     "which suggests that the ledger api's call was also blocked, "
                     "and the dispatcher was waiting for its response."
                 )
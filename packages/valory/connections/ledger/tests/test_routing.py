@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the routing of the RPC requests over multiple endpoints."""
+import time
+from contextlib import ExitStack
+from typing import List
+from unittest import mock
+
+import pytest
+from aea.crypto.registries import ledger_apis_registry
+from aea_ledger_ethereum import EthereumApi
+from requests.exceptions import HTTPError
+
+from packages.valory.connections.ledger.routing import (
+    RoutingHTTPProvider,
+    make_ledger_api,
+)
+from packages.valory.connections.ledger.tests.stub_rpc import CHAIN_ID, StubRpcServer
+
+
+def start_servers(stack: ExitStack, *latencies: float) -> List[StubRpcServer]:
+    """Start a stub server per latency."""
+    return [
+        stack.enter_context(StubRpcServer(latency=latency)) for latency in latencies
+    ]
+
+
+def block_number(provider: RoutingHTTPProvider) -> int:
+    """Get the block number through the provider."""
+    return int(provider.make_request("eth_blockNumber", [])["result"], 16)  # type: ignore
+
+
+def test_latency_weighted_routing() -> None:
+    """Test that most of the requests are routed to the fastest endpoint."""
+    with ExitStack() as stack:
+        fast, slow = start_servers(stack, 0.0, 0.05)
+        provider = RoutingHTTPProvider([slow.url, fast.url], seed=0)
+        for _ in range(100):
+            assert block_number(provider) == 1
+        assert fast.requests > 80
+        assert slow.requests >= 1
+        assert provider.endpoint_uri == fast.url
+
+
+def test_ejection_and_readmission() -> None:
+    """Test that a failing endpoint is ejected, its requests fail over, and it is re-admitted later."""
+    with ExitStack() as stack:
+        failing, healthy = start_servers(stack, 0.0, 0.0)
+        failing.error_rate = 1.0
+        provider = RoutingHTTPProvider(
+            [failing.url, healthy.url], max_failures=2, ejection_time=0.5, seed=0
+        )
+        for _ in range(20):
+            assert block_number(provider) == 1
+        # ejected after two failures, which failed over to the healthy endpoint
+        assert failing.requests == 2
+        assert provider.metrics["endpoints"][failing.url]["ejections"] == 1
+        assert not provider.metrics["endpoints"][failing.url]["admitted"]
+
+        failing.error_rate = 0.0
+        time.sleep(0.5)
+        for _ in range(20):
+            assert block_number(provider) == 1
+        assert failing.requests > 2
+        assert provider.metrics["endpoints"][failing.url]["admitted"]
+
+
+def test_all_endpoints_failing() -> None:
+    """Test that the last error is raised when every endpoint fails."""
+    with ExitStack() as stack:
+        servers = start_servers(stack, 0.0, 0.0)
+        for server in servers:
+            server.error_rate = 1.0
+        provider = RoutingHTTPProvider([server.url for server in servers])
+        with pytest.raises(HTTPError, match="503"):
+            block_number(provider)
+        assert [server.requests for server in servers] == [1, 1]
+
+
+def test_transactions_failover() -> None:
+    """Test that a transaction only fails over if it could not be sent."""
+    with ExitStack() as stack:
+        failing, healthy = start_servers(stack, 0.0, 0.0)
+        with StubRpcServer() as closed:
+            closed_url = closed.url
+        failing.error_rate = 1.0
+        provider = RoutingHTTPProvider([closed_url, failing.url, healthy.url])
+        endpoints = {e.uri: e for e in provider.endpoints}
+
+        # the endpoint which refuses the connection never receives the transaction
+        order = iter([closed_url, healthy.url])
+        choose = lambda _: endpoints[next(order)]  # noqa: E731
+        with mock.patch.object(provider, "_choose", side_effect=choose):
+            provider.make_request("eth_sendRawTransaction", ["0x00"])  # type: ignore
+        assert healthy.methods.count("eth_sendRawTransaction") == 1
+
+        # the endpoint which fails after receiving the transaction may have broadcast it
+        choose = lambda _: endpoints[failing.url]  # noqa: E731
+        with mock.patch.object(provider, "_choose", side_effect=choose):
+            with pytest.raises(HTTPError, match="503"):
+                provider.make_request("eth_sendRawTransaction", ["0x00"])  # type: ignore
+        assert failing.requests == 1
+        assert healthy.methods.count("eth_sendRawTransaction") == 1
+
+
+def test_hedged_reads() -> None:
+    """Test that a read slower than the endpoint's p95 is duplicated to a second endpoint."""
+    with ExitStack() as stack:
+        slow, fast = start_servers(stack, 0.0, 0.0)
+        provider = RoutingHTTPProvider(
+            [slow.url, fast.url], hedge=True, hedge_min_samples=5, seed=0
+        )
+        for _ in range(40):
+            block_number(provider)
+        # the jitter of the warm-up latencies may already trigger a few hedges
+        hedged, hedges_won = provider.hedged, provider.hedges_won
+
+        slow.latency = 1.0
+        endpoints = {e.uri: e for e in provider.endpoints}
+        choose = lambda tried: endpoints[fast.url if tried else slow.url]  # noqa: E731
+        with mock.patch.object(provider, "_choose", side_effect=choose):
+            start = time.perf_counter()
+            assert block_number(provider) == 1
+            assert time.perf_counter() - start < 0.5
+            assert provider.hedged == hedged + 1
+            assert provider.hedges_won == hedges_won + 1
+
+            # the transactions are never duplicated
+            provider.make_request("eth_sendRawTransaction", ["0x00"])  # type: ignore
+        assert provider.hedged == hedged + 1
+        assert fast.methods.count("eth_sendRawTransaction") == 0
+        assert slow.methods.count("eth_sendRawTransaction") == 1
+
+
+def test_make_ledger_api() -> None:
+    """Test that the ledger apis with multiple addresses route their requests."""
+    with ExitStack() as stack:
+        servers = start_servers(stack, 0.0, 0.0)
+        api = make_ledger_api(
+            ledger_apis_registry,
+            "ethereum",
+            addresses=[server.url for server in servers],
+            chain_id=CHAIN_ID,
+            routing={"max_failures": 1},
+        )
+        assert isinstance(api, EthereumApi)
+        provider = api.api.provider
+        assert isinstance(provider, RoutingHTTPProvider)
+        assert provider.max_failures == 1
+        assert api.api.eth.block_number == 1
+
+        api = make_ledger_api(
+            ledger_apis_registry, "ethereum", address=servers[0].url, chain_id=CHAIN_ID
+        )
+        assert not isinstance(api.api.provider, RoutingHTTPProvider)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the batching of the state requests."""
+import asyncio
+from typing import Any, List, cast
+from unittest import mock
+
+import pytest
+from aea.connections.base import ConnectionStates
+from aea.crypto.registries import ledger_apis_registry
+from aea.helpers.async_utils import AsyncState
+from aea.mail.base import Envelope
+
+from packages.valory.connections.ledger.connection import PUBLIC_ID
+from packages.valory.connections.ledger.ledger_dispatcher import (
+    LedgerApiRequestDispatcher,
+)
+from packages.valory.connections.ledger.state_batcher import StateBatcher
+from packages.valory.connections.ledger.tests.stub_rpc import CHAIN_ID, StubRpcServer
+from packages.valory.connections.ledger.tests.test_ledger_api import LedgerApiDialogues
+from packages.valory.protocols.ledger_api.custom_types import Calls
+from packages.valory.protocols.ledger_api.message import LedgerApiMessage
+
+
+ADDRESSES = ["0x" + f"{i:040x}" for i in range(1, 6)]
+
+
+def make_calls(*extra: Any) -> List[Any]:
+    """Make a `get_balance` call per address, followed by the given calls."""
+    return [
+        {"callable": "get_balance", "args": [address], "kwargs": {}}
+        for address in ADDRESSES
+    ] + list(extra)
+
+
+def test_state_batcher() -> None:
+    """Test that the batched calls give the same states as the single calls, in a single HTTP request."""
+    with StubRpcServer() as server:
+        api = ledger_apis_registry.make(
+            "ethereum", address=server.url, chain_id=CHAIN_ID
+        )
+        assert StateBatcher.supports(api)
+        assert not StateBatcher.supports(mock.Mock(spec=[]))
+        batcher = StateBatcher(api)
+        calls = make_calls(
+            {"callable": "get_balance", "args": ["not an address"], "kwargs": {}},
+            {"callable": "no_such_callable", "args": [], "kwargs": {}},
+        )
+
+        server.requests = 0
+        states = batcher.get_states(calls)
+        assert server.requests == batcher.batches == 1
+        assert server.methods[-len(ADDRESSES) :] == ["eth_getBalance"] * len(ADDRESSES)
+
+        expected = [
+            {"state": api.get_state("get_balance", address)} for address in ADDRESSES
+        ]
+        assert states[: len(ADDRESSES)] == expected
+        assert states[-2]["error"]  # type: ignore
+        assert "no_such_callable" in states[-1]["error"]  # type: ignore
+
+
+def test_state_batcher_without_batches() -> None:
+    """Test that the calls are left to be made on their own if the node does not answer batches."""
+    with StubRpcServer() as server:
+        api = ledger_apis_registry.make(
+            "ethereum", address=server.url, chain_id=CHAIN_ID
+        )
+        batcher = StateBatcher(api)
+        with mock.patch(
+            "packages.valory.connections.ledger.state_batcher.make_post_request",
+            return_value=b'{"jsonrpc": "2.0", "id": null, "error": {"code": -32600}}',
+        ):
+            assert batcher.get_states(make_calls()) == [None] * len(ADDRESSES)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batches", (True, False))
+async def test_get_state_batch(batches: bool) -> None:
+    """Test that the dispatcher replies to a batch of calls with a state per call."""
+    with StubRpcServer() as server:
+        dispatcher = LedgerApiRequestDispatcher(
+            logger=mock.Mock(),
+            connection_id=PUBLIC_ID,
+            connection_state=AsyncState(ConnectionStates.connected),
+            loop=asyncio.get_event_loop(),
+            api_configs={"ethereum": {"address": server.url, "chain_id": CHAIN_ID}},
+        )
+        dialogues = LedgerApiDialogues(self_address="some/skill:0.1.0")
+        request, _ = dialogues.create(
+            counterparty=str(PUBLIC_ID),
+            performative=LedgerApiMessage.Performative.GET_STATE_BATCH,  # type: ignore
+            ledger_id="ethereum",
+            calls=Calls(
+                make_calls({"callable": "no_such_callable", "args": [], "kwargs": {}})
+            ),
+        )
+        envelope = Envelope(to=request.to, sender=request.sender, message=request)
+        server.requests = 0
+        with mock.patch.object(StateBatcher, "supports", return_value=batches):
+            response = cast(LedgerApiMessage, await dispatcher.dispatch(envelope))
+        dispatcher.shutdown_executors()
+
+        assert response.performative == LedgerApiMessage.Performative.STATE_BATCH
+        states = response.states.states
+        assert states[: len(ADDRESSES)] == [
+            {"state": {"get_balance_result": 10**18}}
+        ] * len(ADDRESSES)
+        assert "no_such_callable" in states[-1]["error"]
+        # a single HTTP request for the batch, otherwise one per call which makes a request
+        assert server.requests == (1 if batches else len(ADDRESSES))
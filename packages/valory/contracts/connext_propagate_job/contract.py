@@ -20,7 +20,10 @@
 """This module contains a class for the ConnextPropagateJob contract."""
 import json
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple, Type, cast
 
@@ -49,6 +52,8 @@ REQUIRED_LEDGER_APIS = [
     ARBITRUM,
     ZKSYNC,
 ]
+# the fee estimates are reused for the same L1 block, but never for longer than this
+FEE_ESTIMATE_TTL = 30.0  # seconds
 
 
 @dataclass
@@ -507,6 +512,8 @@ CONNECTOR_CONFIGS: Dict[int, List[Tuple[str, Optional[Type[L2Network]]]]] = {
     GOERLI_ID: GOERLI_CONFIG,
 }
 
+CallDataArgs = Tuple[List[str], List[bytes], List[int]]
+
 
 class ConnextPropagateJobContract(Contract):
     """Class for the ConnextPropagateJob contract."""
@@ -526,19 +533,44 @@ class ConnextPropagateJobContract(Contract):
         """
         return dict(set_ledger_api_configs=True)
 
-    @staticmethod
+    # ledger apis are reused across calls, one per chain and config
+    _ledger_api_pool: Dict[Tuple[str, str], EthereumApi] = {}
+    _ledger_api_pool_lock = threading.Lock()
+    # the estimation of each L2 connector runs in its own thread
+    _executor: Optional[ThreadPoolExecutor] = None
+    # chain id -> (L1 block number, time of the estimate, call data args)
+    _fee_estimates: Dict[int, Tuple[int, float, CallDataArgs]] = {}
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Get the executor used for estimating the fees of the L2 connectors."""
+        if cls._executor is None:
+            max_workers = max(
+                sum(l2_network is not None for _, l2_network in config)
+                for config in CONNECTOR_CONFIGS.values()
+            )
+            cls._executor = ThreadPoolExecutor(max_workers=max_workers)
+        return cls._executor
+
+    @classmethod
     def _get_call_data(
+        cls,
         ledger_apis: Dict[str, EthereumApi],
         chain_id: int,
-    ) -> Tuple[List[str], List[bytes], List[int]]:
-        """Get the call data"""
+    ) -> CallDataArgs:
+        """Get the call data, estimating the fees of all the L2 connectors concurrently."""
         connector_config = CONNECTOR_CONFIGS[chain_id]
+        executor = cls._get_executor()
+        futures = {
+            i: executor.submit(l2_network(ledger_apis).get_call_data)
+            for i, (_, l2_network) in enumerate(connector_config)
+            if l2_network is not None
+        }
         connectors, encoded_data, fees = [], [], []
-        for connector, l2_network in connector_config:
+        for i, (connector, _) in enumerate(connector_config):
             single_encoded_data, fee = b"", 0
-            if l2_network is not None:
-                l2_network_instance = l2_network(ledger_apis)
-                call_data = l2_network_instance.get_call_data()
+            if i in futures:
+                call_data = futures[i].result()
                 single_encoded_data = call_data.encoded_data
                 fee = call_data.fee
             connectors.append(
@@ -548,19 +580,52 @@ class ConnextPropagateJobContract(Contract):
             fees.append(fee)
         return connectors, encoded_data, fees
 
+    @classmethod
+    def _get_cached_call_data(
+        cls,
+        ledger_apis: Dict[str, EthereumApi],
+        chain_id: int,
+        block_number: Optional[int] = None,
+    ) -> CallDataArgs:
+        """
+        Get the call data, reusing the estimate made for the same L1 block within the TTL.
+
+        :param ledger_apis: the ledger apis of the L1 and the L2 networks.
+        :param chain_id: the chain id of the L1 network.
+        :param block_number: the latest L1 block number known to the caller, requested if not given.
+        :return: the connectors, their encoded call data and their fees.
+        """
+        if block_number is None:
+            block_number = ledger_apis[ETHEREUM_L1].api.eth.block_number
+        now = time.monotonic()
+        cached = cls._fee_estimates.get(chain_id, None)
+        if cached is not None:
+            cached_block_number, estimated_at, call_data_args = cached
+            if (
+                cached_block_number == block_number
+                and now - estimated_at < FEE_ESTIMATE_TTL
+            ):
+                return call_data_args
+        call_data_args = cls._get_call_data(ledger_apis, chain_id)
+        cls._fee_estimates[chain_id] = (block_number, now, call_data_args)
+        return call_data_args
+
     @classmethod
     def _get_ledger_apis(
         cls, api_configs: Dict[str, Dict[str, Any]]
     ) -> Dict[str, EthereumApi]:
-        """Get the ledger APIs."""
+        """Get the ledger APIs, from the pool if they have been made before."""
         ledgers: Dict[str, EthereumApi] = {}
         for ledger_api_id in REQUIRED_LEDGER_APIS:
             if ledger_api_id not in api_configs:
                 raise ValueError(f"Ledger API {ledger_api_id!r} not found in configs.")
-            ledger_api = ledger_apis_registry.make(
-                ETHEREUM_L1, **api_configs[ledger_api_id]
-            )
-            ledgers[ledger_api_id] = cast(EthereumApi, ledger_api)
+            config = api_configs[ledger_api_id]
+            key = (ledger_api_id, json.dumps(config, sort_keys=True, default=str))
+            with cls._ledger_api_pool_lock:
+                if key not in cls._ledger_api_pool:
+                    ledger_api = ledger_apis_registry.make(ETHEREUM_L1, **config)
+                    cls._ledger_api_pool[key] = cast(EthereumApi, ledger_api)
+            ledgers[ledger_api_id] = cls._ledger_api_pool[key]
         return ledgers
 
     @classmethod
@@ -602,7 +667,7 @@ class ConnextPropagateJobContract(Contract):
 
         :param ledger_api: the ledger API object
         :param contract_address: the contract address
-        :param kwargs: keyword arguments
+        :param kwargs: keyword arguments, with the `ledger_api_configs`, and optionally the latest `block_number`
 
         :return: the raw transaction
         """
@@ -612,7 +677,9 @@ class ConnextPropagateJobContract(Contract):
             raise ValueError("'ledger_api_configs' is required.")
         ledger_apis = cls._get_ledger_apis(ledger_api_configs)
         chain_id = ledger_api.api.eth.chainId
-        connectors, encoded_data, fees = cls._get_call_data(ledger_apis, chain_id)
+        connectors, encoded_data, fees = cls._get_cached_call_data(
+            ledger_apis, chain_id, kwargs.get("block_number", None)
+        )
         data = contract.encodeABI(
             fn_name="propagateKeep3r",
             args=[connectors, fees, encoded_data],
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the Connext propagate job contract."""
+
+from typing import Any, Dict, Iterator, List
+from unittest import mock
+
+import pytest
+
+from packages.valory.contracts.connext_propagate_job.contract import (
+    CallDataArgs,
+    ConnextPropagateJobContract,
+    ETHEREUM_L1,
+    FEE_ESTIMATE_TTL,
+)
+
+
+MAINNET, GOERLI = 1, 5
+BLOCK_NUMBER = 100
+
+
+class DummyEstimator:
+    """Estimates the call data of a chain, recording the estimated chains."""
+
+    def __init__(self) -> None:
+        """Initialize the estimator."""
+        self.chain_ids: List[int] = []
+
+    def __call__(self, _ledger_apis: Dict[str, Any], chain_id: int) -> CallDataArgs:
+        """Estimate the call data, with a fee that tells the estimates apart."""
+        self.chain_ids.append(chain_id)
+        return [f"0xConnector{chain_id}"], [b""], [len(self.chain_ids)]
+
+
+class TestFeeEstimateCache:
+    """Test the cache of the fee estimates."""
+
+    @pytest.fixture(autouse=True)
+    def estimator(self) -> Iterator[DummyEstimator]:
+        """Patch the estimation of the call data, on an empty cache."""
+        estimator = DummyEstimator()
+        with mock.patch.object(
+            ConnextPropagateJobContract, "_fee_estimates", {}
+        ), mock.patch.object(
+            ConnextPropagateJobContract, "_get_call_data", side_effect=estimator
+        ):
+            yield estimator
+
+    @staticmethod
+    def _ledger_apis(block_number: int = BLOCK_NUMBER) -> Dict[str, Any]:
+        """Get the ledger APIs, with the L1 at the given block."""
+        ledger_api = mock.MagicMock()
+        ledger_api.api.eth.block_number = block_number
+        return {ETHEREUM_L1: ledger_api}
+
+    @staticmethod
+    def _get(
+        ledger_apis: Dict[str, Any], chain_id: int = MAINNET, **kwargs: Any
+    ) -> CallDataArgs:
+        """Get the call data through the cache."""
+        # pylint: disable=protected-access
+        return ConnextPropagateJobContract._get_cached_call_data(
+            ledger_apis, chain_id, **kwargs
+        )
+
+    def test_hit_on_same_block(self, estimator: DummyEstimator) -> None:
+        """Test that the estimate is reused on the same block, within the TTL."""
+        ledger_apis = self._ledger_apis()
+        assert self._get(ledger_apis) == self._get(ledger_apis)
+        assert estimator.chain_ids == [MAINNET]
+
+    def test_ttl_expiry(self, estimator: DummyEstimator) -> None:
+        """Test that the estimate is made again once the TTL has passed, even on the same block."""
+        ledger_apis = self._ledger_apis()
+        with mock.patch(
+            "packages.valory.contracts.connext_propagate_job.contract.time.monotonic",
+            side_effect=[0.0, FEE_ESTIMATE_TTL - 1, FEE_ESTIMATE_TTL + 1],
+        ):
+            first, cached, expired = (self._get(ledger_apis) for _ in range(3))
+            assert first == cached != expired
+        assert estimator.chain_ids == [MAINNET, MAINNET]
+
+    def test_new_block_invalidation(self, estimator: DummyEstimator) -> None:
+        """Test that the estimate is made again on a new block, within the TTL."""
+        first = self._get(self._ledger_apis(BLOCK_NUMBER))
+        assert self._get(self._ledger_apis(BLOCK_NUMBER + 1)) != first
+        assert estimator.chain_ids == [MAINNET, MAINNET]
+
+    def test_chain_isolation(self, estimator: DummyEstimator) -> None:
+        """Test that the estimates of different chains are cached separately."""
+        ledger_apis = self._ledger_apis()
+        mainnet = self._get(ledger_apis, MAINNET)
+        goerli = self._get(ledger_apis, GOERLI)
+        assert mainnet != goerli
+        assert self._get(ledger_apis, MAINNET) == mainnet
+        assert self._get(ledger_apis, GOERLI) == goerli
+        assert estimator.chain_ids == [MAINNET, GOERLI]
+
+    def test_given_block_number(self, estimator: DummyEstimator) -> None:
+        """Test that the block number is not requested when it is given by the caller."""
+        ledger_apis = self._ledger_apis()
+        block_number = mock.PropertyMock(return_value=BLOCK_NUMBER)
+        type(ledger_apis[ETHEREUM_L1].api.eth).block_number = block_number
+        first = self._get(ledger_apis, block_number=BLOCK_NUMBER)
+        assert self._get(ledger_apis, block_number=BLOCK_NUMBER) == first
+        assert self._get(ledger_apis, block_number=BLOCK_NUMBER + 1) != first
+        block_number.assert_not_called()
+        assert estimator.chain_ids == [MAINNET, MAINNET]
+
+
+def test_build_work_tx_block_number() -> None:
+    """Test that the block number given to `build_work_tx` is used for the estimate."""
+    ledger_api = mock.MagicMock()
+    ledger_api.api.eth.chainId = MAINNET
+    ledger_apis = {ETHEREUM_L1: mock.MagicMock()}
+    call_data_args: CallDataArgs = (["0xConnector"], [b""], [0])
+    with mock.patch.object(
+        ConnextPropagateJobContract, "get_instance"
+    ), mock.patch.object(
+        ConnextPropagateJobContract, "_get_ledger_apis", return_value=ledger_apis
+    ), mock.patch.object(
+        ConnextPropagateJobContract,
+        "_get_cached_call_data",
+        return_value=call_data_args,
+    ) as get_cached_call_data:
+        ConnextPropagateJobContract.build_work_tx(
+            ledger_api, "0xContract", ledger_api_configs={}, block_number=BLOCK_NUMBER
+        )
+    get_cached_call_data.assert_called_once_with(ledger_apis, MAINNET, BLOCK_NUMBER)
@@ -26,7 +26,7 @@ from aea.common import JSONLike
 from aea.configurations.base import PublicId
 from aea.contracts.base import Contract
 from aea_ledger_ethereum import EthereumApi
-from web3.types import Nonce, TxParams, Wei
+from web3.types import BlockIdentifier, Nonce, TxParams, Wei
 
 from packages.valory.contracts.keep3r_v1_library.contract import (  # type: ignore # noqa: F401
     PUBLIC_ID as LIB_PUBLIC_ID,
@@ -79,11 +79,12 @@ class Keep3rV1Contract(Contract):
         cls,
         ledger_api: EthereumApi,
         contract_address: str,
+        block_identifier: BlockIdentifier = "latest",
     ) -> JSONLike:
         """Bonding duration before one can activate to become a keeper"""
 
         contract = cls.get_instance(ledger_api, contract_address)
-        bond = contract.functions.BOND().call()
+        bond = contract.functions.BOND().call(block_identifier=block_identifier)
         return dict(data=bond)
 
     @classmethod
@@ -93,11 +94,14 @@ class Keep3rV1Contract(Contract):
         contract_address: str,
         address: str,
         bonding_asset: str,
+        block_identifier: BlockIdentifier = "latest",
     ) -> JSONLike:
         """Tracks all current bond times (start)"""
 
         contract = cls.get_instance(ledger_api, contract_address)
-        bondings = contract.functions.bondings(address, bonding_asset).call()
+        bondings = contract.functions.bondings(address, bonding_asset).call(
+            block_identifier=block_identifier
+        )
         return dict(data=bondings)
 
     @classmethod
@@ -106,11 +110,14 @@ class Keep3rV1Contract(Contract):
         ledger_api: EthereumApi,
         contract_address: str,
         address: str,
+        block_identifier: BlockIdentifier = "latest",
     ) -> JSONLike:
         """Check blacklist of keepers not allowed to participate"""
 
         contract = cls.get_instance(ledger_api, contract_address)
-        is_blacklisted = contract.functions.blacklist(address).call()
+        is_blacklisted = contract.functions.blacklist(address).call(
+            block_identifier=block_identifier
+        )
         return dict(data=is_blacklisted)
 
     @classmethod
@@ -119,11 +126,14 @@ class Keep3rV1Contract(Contract):
         ledger_api: EthereumApi,
         contract_address: str,
         address: str,
+        block_identifier: BlockIdentifier = "latest",
     ) -> JSONLike:
         """Check current credit available for a job"""
 
         contract = cls.get_instance(ledger_api, contract_address)
-        credits = contract.functions.credits(address, contract.address).call()
+        credits = contract.functions.credits(address, contract.address).call(
+            block_identifier=block_identifier
+        )
         return dict(data=credits)
 
     @classmethod
@@ -131,11 +141,12 @@ class Keep3rV1Contract(Contract):
         cls,
         ledger_api: EthereumApi,
         contract_address: str,
+        block_identifier: BlockIdentifier = "latest",
     ) -> JSONLike:
         """Full listing of all jobs ever added."""
 
         contract = cls.get_instance(ledger_api, contract_address)
-        addresses = contract.functions.getJobs().call()
+        addresses = contract.functions.getJobs().call(block_identifier=block_identifier)
         checksummed_addresses = [
             ledger_api.api.to_checksum_address(address) for address in addresses
         ]
@@ -147,11 +158,14 @@ class Keep3rV1Contract(Contract):
         ledger_api: EthereumApi,
         contract_address: str,
         address: str,
+        block_identifier: BlockIdentifier = "latest",
     ) -> JSONLike:
         """Check if address is a registered keeper."""
 
         contract = cls.get_instance(ledger_api, contract_address)
-        is_keeper = contract.functions.isKeeper(keeper=address).call()
+        is_keeper = contract.functions.isKeeper(keeper=address).call(
+            block_identifier=block_identifier
+        )
         return dict(data=is_keeper)
 
     @classmethod
@@ -233,11 +247,14 @@ class Keep3rV1Contract(Contract):
         contract_address: str,
         owner: str,
         spender: str,
+        block_identifier: BlockIdentifier = "latest",
     ) -> JSONLike:
         """Get the number of tokens `spender` is approved to spend on behalf of `account`."""
 
         contract = cls.get_instance(ledger_api, contract_address)
-        allowance = contract.functions.allowance(owner, spender).call()
+        allowance = contract.functions.allowance(owner, spender).call(
+            block_identifier=block_identifier
+        )
         return dict(data=allowance)
 
     @classmethod
@@ -327,9 +344,12 @@ class Keep3rV1Contract(Contract):
         ledger_api: EthereumApi,
         contract_address: str,
         keeper_address: str,
+        block_identifier: BlockIdentifier = "latest",
     ) -> JSONLike:
         """Get the balance of an address."""
 
         contract = cls.get_instance(ledger_api, contract_address)
-        balance = contract.functions.balanceOf(keeper_address).call()
+        balance = contract.functions.balanceOf(keeper_address).call(
+            block_identifier=block_identifier
+        )
         return dict(data=balance)
@@ -18,16 +18,21 @@
 # ------------------------------------------------------------------------------
 
 """This module contains the Keep3rV1 contract definition."""
-import asyncio
 import concurrent.futures
+import json
 import logging
-from typing import Dict, List, Union, cast
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
 from aea.common import JSONLike
 from aea.configurations.base import PublicId
 from aea.contracts.base import Contract
 from aea_ledger_ethereum import EthereumApi
-from web3.types import BlockIdentifier, Nonce, TxParams, Wei
+from web3 import HTTPProvider
+from web3._utils.request import make_post_request
+from web3.types import BlockIdentifier, Nonce, RPCEndpoint, TxParams, Wei
 
 
 ENCODING = "utf-8"
@@ -40,6 +45,321 @@ _logger = logging.getLogger(
 
 RawTransaction = Dict[str, Union[int, str]]
 
+# Multicall3 is deployed at the same address on all the major EVM chains
+# more info here: https://github.com/mds1/multicall
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "getBlockNumber",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "getCurrentBlockTimestamp",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [{"internalType": "address", "name": "addr", "type": "address"}],
+        "name": "getEthBalance",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+# the subset of the ERC20 interface needed to read the keeper's token state
+ERC20_ABI = [
+    {
+        "inputs": [
+            {"internalType": "address", "name": "owner", "type": "address"},
+            {"internalType": "address", "name": "spender", "type": "address"},
+        ],
+        "name": "allowance",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [{"internalType": "address", "name": "account", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+
+# the number of blocks queried per `eth_getLogs` request
+DEFAULT_LOG_CHUNK_SIZE = 10_000
+
+
+# the number of most recent blocks that are indexed again on every update, to recover from reorgs
+DEFAULT_CONFIRMATIONS = 12
+
+
+class EventIndex:
+    """
+    A checkpointed local index of contract events.
+
+    The events are stored per key, e.g. (contract, event, keeper, asset), along with the last indexed block,
+    so that only the blocks after it are fetched on the next update.
+    The last `confirmations` indexed blocks are dropped and fetched again on every update, to recover from reorgs.
+    If a path is given, the index is persisted there as json.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Initialize the index, loading it from the path if it exists."""
+        self.path = path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if path is not None and os.path.exists(path):
+            with open(path, encoding=ENCODING) as file:
+                self._entries = json.load(file)
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Make the key of an entry."""
+        return ":".join(part.lower() for part in parts)
+
+    def last_block(self, key: str) -> Optional[int]:
+        """Get the last indexed block of an entry, or None if it has not been indexed yet."""
+        entry = self._entries.get(key)
+        return None if entry is None else entry["last_block"]
+
+    def events(
+        self, key: str, from_block: int = 0, to_block: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get the indexed events of an entry in the given block range, sorted by block number."""
+        entry = self._entries.get(key, {"events": []})
+        return [
+            event
+            for event in entry["events"]
+            if event["block_number"] >= from_block
+            and (to_block is None or event["block_number"] <= to_block)
+        ]
+
+    def update(  # pylint: disable=too-many-arguments
+        self,
+        key: str,
+        fetch: Callable[[int, int], List[Dict[str, Any]]],
+        latest_block: int,
+        start_block: int = 0,
+        confirmations: int = DEFAULT_CONFIRMATIONS,
+        chunk_size: int = DEFAULT_LOG_CHUNK_SIZE,
+    ) -> None:
+        """
+        Index the events of an entry up to the latest block.
+
+        :param key: the key of the entry
+        :param fetch: fetches the events in an inclusive block range
+        :param latest_block: the block to index up to
+        :param start_block: the block to start indexing from, if the entry has not been indexed yet
+        :param confirmations: the number of most recent blocks to index again
+        :param chunk_size: the number of blocks fetched at once
+        """
+        entry = self._entries.setdefault(
+            key, {"last_block": start_block - 1, "events": []}
+        )
+        # the unconfirmed blocks might have been reorged, drop them and index them again
+        rewind_to = max(entry["last_block"] - confirmations, start_block - 1)
+        entry["events"] = [
+            event for event in entry["events"] if event["block_number"] <= rewind_to
+        ]
+        entry["last_block"] = rewind_to
+        while entry["last_block"] < latest_block:
+            from_block = entry["last_block"] + 1
+            to_block = min(from_block + chunk_size - 1, latest_block)
+            entry["events"].extend(fetch(from_block, to_block))
+            entry["last_block"] = to_block
+        entry["events"].sort(
+            key=lambda event: (event["block_number"], event["log_index"])
+        )
+        self._save()
+
+    def _save(self) -> None:
+        """Persist the index, if it has a path."""
+        if self.path is None:
+            return
+        # the temporary file is per process, so that the processes sharing the path do not overwrite each other's
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding=ENCODING) as file:
+            json.dump(self._entries, file)
+        os.replace(tmp_path, self.path)
+
+
+# the number of concurrent receipt requests
+DEFAULT_RECEIPT_WORKERS = 5
+# the number of receipts requested per JSON-RPC batch
+DEFAULT_RECEIPT_BATCH_SIZE = 100
+# the number of finalized receipts kept in memory
+DEFAULT_RECEIPT_CACHE_SIZE = 100_000
+
+# the topic of the `ExecutionSuccess(bytes32,uint256)` event of the Gnosis Safe
+EXECUTION_SUCCESS_TOPIC = (
+    "0x442e715f626346e8c54381002da614f62bee8d27386535b2521ec8540898556e"
+)
+
+# the sender, the amount spent in wei, the block number, the status of a transaction,
+# and the safes whose execution succeeded in it
+GasSpent = Dict[str, Any]
+
+
+class ReceiptFetcher:
+    """
+    Fetches the gas spent by transactions, from their receipts.
+
+    The receipts are requested in JSON-RPC batches, on a worker pool that is reused across calls.
+    The gas spent by transactions that are `confirmations` blocks deep is kept in an LRU cache.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_RECEIPT_WORKERS,
+        batch_size: int = DEFAULT_RECEIPT_BATCH_SIZE,
+        cache_size: int = DEFAULT_RECEIPT_CACHE_SIZE,
+        confirmations: int = DEFAULT_CONFIRMATIONS,
+    ) -> None:
+        """Initialize the fetcher."""
+        self.batch_size = batch_size
+        self.cache_size = cache_size
+        self.confirmations = confirmations
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers, thread_name_prefix="receipt_fetcher"
+        )
+        self._cache: "OrderedDict[str, GasSpent]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def gas_spent(
+        self, ledger_api: EthereumApi, transaction_hashes: List[str]
+    ) -> List[GasSpent]:
+        """
+        Get the sender, the amount spent in gas, the block, the status and the executed safes of each transaction.
+
+        :param ledger_api: the ledger API object
+        :param transaction_hashes: the transaction hashes
+        :return: the gas spent by each transaction, in the given order
+        """
+        hash_to_spent: Dict[str, GasSpent] = {}
+        with self._lock:
+            for tx_hash in transaction_hashes:
+                if tx_hash in self._cache:
+                    self._cache.move_to_end(tx_hash)
+                    hash_to_spent[tx_hash] = self._cache[tx_hash]
+        missing = list(
+            dict.fromkeys(h for h in transaction_hashes if h not in hash_to_spent)
+        )
+        if len(missing) > 0:
+            finalized_block = ledger_api.api.eth.block_number - self.confirmations
+            batches = [
+                missing[i : i + self.batch_size]
+                for i in range(0, len(missing), self.batch_size)
+            ]
+            for batch_result in self._pool.map(
+                lambda batch: self._fetch(ledger_api, batch), batches
+            ):
+                for tx_hash, spent in batch_result.items():
+                    hash_to_spent[tx_hash] = spent
+                    if spent["block_number"] <= finalized_block:
+                        self._cache_spent(tx_hash, spent)
+        return [hash_to_spent[tx_hash] for tx_hash in transaction_hashes]
+
+    def _cache_spent(self, tx_hash: str, spent: GasSpent) -> None:
+        """Cache the gas spent by a finalized transaction."""
+        with self._lock:
+            self._cache[tx_hash] = spent
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    @staticmethod
+    def _fetch(
+        ledger_api: EthereumApi, transaction_hashes: List[str]
+    ) -> Dict[str, GasSpent]:
+        """Fetch the receipts of the transactions, and get the gas spent by each."""
+        receipts: List[Optional[Dict[str, Any]]] = [None] * len(transaction_hashes)
+        provider = ledger_api.api.provider
+        if isinstance(provider, HTTPProvider):
+            batch = [
+                {
+                    "jsonrpc": "2.0",
+                    "id": i,
+                    "method": "eth_getTransactionReceipt",
+                    "params": [tx_hash],
+                }
+                for i, tx_hash in enumerate(transaction_hashes)
+            ]
+            responses = json.loads(
+                make_post_request(
+                    provider.endpoint_uri,
+                    json.dumps(batch).encode(),
+                    **provider.get_request_kwargs(),
+                )
+            )
+            if isinstance(responses, list):
+                for response in responses:
+                    receipts[response["id"]] = response.get("result")
+
+        results = {}
+        for tx_hash, receipt in zip(transaction_hashes, receipts):
+            if receipt is None:
+                # the provider does not support batches, or the receipt is missing from the batch
+                receipt = ledger_api.api.provider.make_request(
+                    RPCEndpoint("eth_getTransactionReceipt"), [tx_hash]
+                ).get("result")
+            if receipt is None:
+                raise ValueError(f"Receipt of transaction {tx_hash} not found.")
+            effective_gas_price = receipt.get("effectiveGasPrice")
+            if effective_gas_price is None:
+                # pre-London receipts do not include the gas price
+                effective_gas_price = ledger_api.get_transaction(tx_hash)["gasPrice"]
+            results[tx_hash] = dict(
+                sender=ledger_api.api.to_checksum_address(receipt["from"]),
+                amount=int(receipt["gasUsed"], 16) * _to_int(effective_gas_price),
+                block_number=int(receipt["blockNumber"], 16),
+                status=int(receipt.get("status", "0x1"), 16) == 1,
+                executed_safes=[
+                    ledger_api.api.to_checksum_address(log["address"])
+                    for log in receipt.get("logs", [])
+                    if log["topics"][:1] == [EXECUTION_SUCCESS_TOPIC]
+                ],
+            )
+        return results
+
+
+def _to_int(value: Union[int, str]) -> int:
+    """Convert a JSON-RPC quantity to an int."""
+    return value if isinstance(value, int) else int(value, 16)
+
 
 class KeeperV2(Contract):
     """
@@ -56,6 +376,11 @@ class KeeperV2(Contract):
     """
 
     contract_id: PublicId = PUBLIC_ID
+    # (chain id, index path) -> event index
+    _event_indexes: Dict[Tuple[int, Optional[str]], EventIndex] = {}
+    # (chain id, contract address) -> the block in which the contract was deployed
+    _deployment_blocks: Dict[Tuple[int, str], int] = {}
+    _receipt_fetchers: Dict[Tuple[int, int], ReceiptFetcher] = {}
 
     @staticmethod
     def get_tx_parameters(ledger_api: EthereumApi, address: str) -> TxParams:
@@ -78,11 +403,14 @@ class KeeperV2(Contract):
         contract_address: str,
         address: str,
         bonding_asset: str,
+        block_identifier: BlockIdentifier = "latest",
     ) -> JSONLike:
         """Tracks all current bond times (start)"""
 
         contract = cls.get_instance(ledger_api, contract_address)
-        bondings = contract.functions.bonds(address, bonding_asset).call()
+        bondings = contract.functions.bonds(address, bonding_asset).call(
+            block_identifier=block_identifier
+        )
         return dict(data=bondings)
 
     @classmethod
@@ -92,11 +420,14 @@ class KeeperV2(Contract):
         contract_address: str,
         address: str,
         bonding_asset: str,
+        block_identifier: BlockIdentifier = "latest",
     ) -> JSONLike:
         """Bonds that are not yet active."""
 
         contract = cls.get_instance(ledger_api, contract_address)
-        bondings = contract.functions.pendingBonds(address, bonding_asset).call()
+        bondings = contract.functions.pendingBonds(address, bonding_asset).call(
+            block_identifier=block_identifier
+        )
         return dict(data=bondings)
 
     @classmethod
@@ -106,11 +437,14 @@ class KeeperV2(Contract):
         contract_address: str,
         address: str,
         bonding_asset: str,
+        block_identifier: BlockIdentifier = "latest",
     ) -> JSONLike:
         """Unbonds that are not yet active."""
 
         contract = cls.get_instance(ledger_api, contract_address)
-        unbondings = contract.functions.pendingUnbonds(address, bonding_asset).call()
+        unbondings = contract.functions.pendingUnbonds(address, bonding_asset).call(
+            block_identifier=block_identifier
+        )
         return dict(data=unbondings)
 
     @classmethod
@@ -119,11 +453,14 @@ class KeeperV2(Contract):
         ledger_api: EthereumApi,
         contract_address: str,
         address: str,
+        block_identifier: BlockIdentifier = "latest",
     ) -> JSONLike:
         """Check current credit available for a job"""
 
         contract = cls.get_instance(ledger_api, contract_address)
-        credits = contract.functions.jobTokenCredits(address, contract.address).call()
+        credits = contract.functions.jobTokenCredits(address, contract.address).call(
+            block_identifier=block_identifier
+        )
         return dict(data=credits)
 
     @classmethod
@@ -131,11 +468,12 @@ class KeeperV2(Contract):
         cls,
         ledger_api: EthereumApi,
         contract_address: str,
+        block_identifier: BlockIdentifier = "latest",
     ) -> JSONLike:
         """Full listing of all jobs ever added."""
 
         contract = cls.get_instance(ledger_api, contract_address)
-        addresses = contract.functions.jobs().call()
+        addresses = contract.functions.jobs().call(block_identifier=block_identifier)
         checksummed_addresses = [
             ledger_api.api.to_checksum_address(address) for address in addresses
         ]
@@ -147,14 +485,113 @@ class KeeperV2(Contract):
         ledger_api: EthereumApi,
         contract_address: str,
         address: str,
+        block_identifier: BlockIdentifier = "latest",
     ) -> JSONLike:
         """Check if address is a registered keeper."""
 
         contract = cls.get_instance(ledger_api, contract_address)
-        keepers = contract.functions.keepers().call()
-        is_keeper = address in keepers
+        # `isKeeper` is a constant-time lookup, unlike downloading the full `keepers()` list
+        is_keeper = contract.functions.isKeeper(
+            ledger_api.api.to_checksum_address(address)
+        ).call(block_identifier=block_identifier)
         return dict(data=is_keeper)
 
+    @classmethod
+    def get_keeper_state(  # pylint: disable=too-many-arguments,too-many-locals
+        cls,
+        ledger_api: EthereumApi,
+        contract_address: str,
+        address: str,
+        bonding_asset: str,
+        k3pr_address: str,
+        spender: str,
+        multicall_address: str = MULTICALL3_ADDRESS,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> JSONLike:
+        """
+        Read all the keeper state needed for path selection in a single `eth_call`.
+
+        The reads are aggregated through Multicall3, so they are all executed against the same block.
+        The number and the timestamp of that block are returned alongside the keeper state.
+        Fields whose underlying call reverted are set to `None`.
+
+        :param ledger_api: the ledger API object
+        :param contract_address: the keep3rV2 contract address
+        :param address: the keeper address
+        :param bonding_asset: the asset that is bonded to become a keeper
+        :param k3pr_address: the K3PR address, i.e. the asset that the keeper is rewarded with
+        :param spender: the spender of the bonding asset
+        :param multicall_address: the Multicall3 contract address
+        :param block_identifier: the block to run the aggregate call on
+        :return: the keeper state
+        """
+        ledger_api = cast(EthereumApi, ledger_api)
+        to_checksum_address = ledger_api.api.to_checksum_address
+        address = to_checksum_address(address)
+        bonding_asset = to_checksum_address(bonding_asset)
+        k3pr_address = to_checksum_address(k3pr_address)
+        keep3r = cls.get_instance(ledger_api, contract_address)
+        erc20 = ledger_api.api.eth.contract(abi=ERC20_ABI)
+        multicall = ledger_api.api.eth.contract(
+            address=to_checksum_address(multicall_address), abi=MULTICALL3_ABI
+        )
+        # field -> (target, contract, function name, arguments)
+        reads: Dict[str, Tuple[str, Any, str, List[Any]]] = {
+            "block_number": (multicall.address, multicall, "getBlockNumber", []),
+            "timestamp": (multicall.address, multicall, "getCurrentBlockTimestamp", []),
+            "balance": (multicall.address, multicall, "getEthBalance", [address]),
+            "can_activate_after": (
+                keep3r.address,
+                keep3r,
+                "canActivateAfter",
+                [address, bonding_asset],
+            ),
+            "pending_bonds": (
+                keep3r.address,
+                keep3r,
+                "pendingBonds",
+                [address, bonding_asset],
+            ),
+            "allowance": (bonding_asset, erc20, "allowance", [address, spender]),
+            "bondings": (keep3r.address, keep3r, "bonds", [address, k3pr_address]),
+            "pending_unbonds": (
+                keep3r.address,
+                keep3r,
+                "pendingUnbonds",
+                [address, k3pr_address],
+            ),
+            "can_withdraw_after": (
+                keep3r.address,
+                keep3r,
+                "canWithdrawAfter",
+                [address, k3pr_address],
+            ),
+            "withdrawn_funds": (k3pr_address, erc20, "balanceOf", [address]),
+            "is_keeper": (keep3r.address, keep3r, "isKeeper", [address]),
+        }
+        calls = [
+            (target, True, contract.encodeABI(fn_name=fn_name, args=args))
+            for target, contract, fn_name, args in reads.values()
+        ]
+        results = multicall.functions.aggregate3(calls).call(
+            block_identifier=block_identifier
+        )
+
+        state: Dict[str, Any] = {}
+        for (field, (_, contract, fn_name, _)), (success, return_data) in zip(
+            reads.items(), results
+        ):
+            if not success:
+                _logger.warning(f"Multicall read of `{fn_name}` reverted.")
+                state[field] = None
+                continue
+            output_types = [
+                output["type"]
+                for output in contract.get_function_by_name(fn_name).abi["outputs"]
+            ]
+            (state[field],) = ledger_api.api.codec.decode(output_types, return_data)
+        return dict(data=state)
+
     @classmethod
     def can_activate_after(
         cls,
@@ -162,13 +599,14 @@ class KeeperV2(Contract):
         contract_address: str,
         address: str,
         bonding_asset: str,
+        block_identifier: BlockIdentifier = "latest",
     ) -> JSONLike:
         """Check if address is a registered keeper."""
 
         contract = cls.get_instance(ledger_api, contract_address)
         can_activate_after = contract.functions.canActivateAfter(
             address, bonding_asset
-        ).call()
+        ).call(block_identifier=block_identifier)
         return dict(data=can_activate_after)
 
     @classmethod
@@ -178,13 +616,14 @@ class KeeperV2(Contract):
         contract_address: str,
         address: str,
         bonding_asset: str,
+        block_identifier: BlockIdentifier = "latest",
     ) -> JSONLike:
         """Check if address is a registered keeper."""
 
         contract = cls.get_instance(ledger_api, contract_address)
         can_withdraw_after = contract.functions.canWithdrawAfter(
             address, bonding_asset
-        ).call()
+        ).call(block_identifier=block_identifier)
         return dict(data=can_withdraw_after)
 
     @classmethod
@@ -285,7 +724,7 @@ class KeeperV2(Contract):
         return dict(data=data)
 
     @classmethod
-    def get_unbonding_events(
+    def get_unbonding_events(  # pylint: disable=too-many-arguments
         cls,
         ledger_api: EthereumApi,
         contract_address: str,
@@ -293,6 +732,10 @@ class KeeperV2(Contract):
         bonding_asset: str,
         from_block: BlockIdentifier = "earliest",
         to_block: BlockIdentifier = "latest",
+        index_path: Optional[str] = None,
+        start_block: Optional[int] = None,
+        confirmations: int = DEFAULT_CONFIRMATIONS,
+        chunk_size: int = DEFAULT_LOG_CHUNK_SIZE,
     ) -> JSONLike:
         """
         Get all unbonding events for a given keeper.
@@ -303,33 +746,30 @@ class KeeperV2(Contract):
         :param bonding_asset: the asset that was unbonded
         :param from_block: from which block to search for events
         :param to_block: to which block to search for events
+        :param index_path: where to persist the event index, if anywhere
+        :param start_block: the block to start indexing from, by default the one in which the contract was deployed
+        :param confirmations: the number of most recent blocks to index again, to recover from reorgs
+        :param chunk_size: the number of blocks fetched per request
         :return: the unbonding events
         """
-        ledger_api = cast(EthereumApi, ledger_api)
-        contract = cls.get_instance(ledger_api, contract_address)
-        address = ledger_api.api.to_checksum_address(address)
-        entries = contract.events.Unbonding.create_filter(
-            fromBlock=from_block,
-            toBlock=to_block,
-            argument_filters=dict(_keeperOrJob=address, _unbonding=bonding_asset),
-        ).get_all_entries()
-        unbonding_events = list(
-            dict(
-                tx_hash=entry.transactionHash.hex(),
-                block_number=entry.blockNumber,
-                keeper=address,
-                unbonding_asset=bonding_asset,
-                amount=entry["args"]["_amount"],
-            )
-            for entry in entries
+        unbonding_events = cls._get_indexed_events(
+            ledger_api,
+            contract_address,
+            "Unbonding",
+            dict(_keeperOrJob=address, _unbonding=bonding_asset),
+            from_block,
+            to_block,
+            index_path,
+            start_block,
+            confirmations,
+            chunk_size,
         )
-        sorted(unbonding_events, key=lambda x: x["block_number"])
         return dict(
             data=unbonding_events,
         )
 
     @classmethod
-    def get_withdrawal_events(
+    def get_withdrawal_events(  # pylint: disable=too-many-arguments
         cls,
         ledger_api: EthereumApi,
         contract_address: str,
@@ -337,6 +777,10 @@ class KeeperV2(Contract):
         bonding_asset: str,
         from_block: BlockIdentifier = "earliest",
         to_block: BlockIdentifier = "latest",
+        index_path: Optional[str] = None,
+        start_block: Optional[int] = None,
+        confirmations: int = DEFAULT_CONFIRMATIONS,
+        chunk_size: int = DEFAULT_LOG_CHUNK_SIZE,
     ) -> JSONLike:
         """
         Get all withdrawal events for a given keeper.
@@ -347,37 +791,158 @@ class KeeperV2(Contract):
         :param bonding_asset: the asset that was withdrawn
         :param from_block: from which block to search for events
         :param to_block: to which block to search for events
+        :param index_path: where to persist the event index, if anywhere
+        :param start_block: the block to start indexing from, by default the one in which the contract was deployed
+        :param confirmations: the number of most recent blocks to index again, to recover from reorgs
+        :param chunk_size: the number of blocks fetched per request
         :return: the withdrawal events
         """
+        withdrawal_events = cls._get_indexed_events(
+            ledger_api,
+            contract_address,
+            "Withdrawal",
+            dict(_keeper=address, _bond=bonding_asset),
+            from_block,
+            to_block,
+            index_path,
+            start_block,
+            confirmations,
+            chunk_size,
+        )
+        return dict(
+            data=withdrawal_events,
+        )
+
+    @classmethod
+    def _get_indexed_events(  # pylint: disable=too-many-arguments,too-many-locals
+        cls,
+        ledger_api: EthereumApi,
+        contract_address: str,
+        event_name: str,
+        argument_filters: Dict[str, str],
+        from_block: BlockIdentifier,
+        to_block: BlockIdentifier,
+        index_path: Optional[str],
+        start_block: Optional[int],
+        confirmations: int,
+        chunk_size: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the events of a keeper, from the local event index.
+
+        The index is first brought up to date, fetching only the blocks after its checkpoint.
+        The first argument filter is the keeper and the second the asset.
+
+        :param ledger_api: the ledger API object
+        :param contract_address: the keep3rV2 contract address
+        :param event_name: the name of the event
+        :param argument_filters: the keeper and the asset filters of the event
+        :param from_block: from which block to search for events
+        :param to_block: to which block to search for events
+        :param index_path: where to persist the event index, if anywhere
+        :param start_block: the block to start indexing from, by default the one in which the contract was deployed
+        :param confirmations: the number of most recent blocks to index again, to recover from reorgs
+        :param chunk_size: the number of blocks fetched per request
+        :return: the events in the given block range, sorted by block number and log index
+        """
         ledger_api = cast(EthereumApi, ledger_api)
         contract = cls.get_instance(ledger_api, contract_address)
-        address = ledger_api.api.to_checksum_address(address)
-        entries = contract.events.Withdrawal.create_filter(
-            fromBlock=from_block,
-            toBlock=to_block,
-            argument_filters=dict(_keeper=address, _bond=bonding_asset),
-        ).get_all_entries()
-        withdrawal_events = list(
-            dict(
-                tx_hash=entry.transactionHash.hex(),
-                block_number=entry.blockNumber,
-                keeper=address,
-                unbonding_asset=bonding_asset,
-                amount=entry["args"]["_amount"],
+        keeper, asset = (
+            ledger_api.api.to_checksum_address(value)
+            for value in argument_filters.values()
+        )
+        argument_filters = dict(zip(argument_filters.keys(), (keeper, asset)))
+        event = getattr(contract.events, event_name)
+
+        def fetch(chunk_from: int, chunk_to: int) -> List[Dict[str, Any]]:
+            """Fetch the events in the given block range."""
+            entries = event.get_logs(
+                fromBlock=chunk_from,
+                toBlock=chunk_to,
+                argument_filters=argument_filters,
             )
-            for entry in entries
+            return [
+                dict(
+                    tx_hash=entry.transactionHash.hex(),
+                    block_number=entry.blockNumber,
+                    log_index=entry.logIndex,
+                    keeper=keeper,
+                    unbonding_asset=asset,
+                    amount=entry["args"]["_amount"],
+                )
+                for entry in entries
+            ]
+
+        chain_id = ledger_api.api.eth.chain_id
+        index = cls._event_indexes.get((chain_id, index_path))
+        if index is None:
+            index = EventIndex(index_path)
+            cls._event_indexes[(chain_id, index_path)] = index
+        key = index.make_key(contract.address, event_name, keeper, asset)
+        latest_block = ledger_api.api.eth.block_number
+        if start_block is None:
+            start_block = cls._get_deployment_block(
+                ledger_api, chain_id, contract.address, latest_block
+            )
+        index.update(
+            key,
+            fetch,
+            latest_block,
+            start_block=start_block,
+            confirmations=confirmations,
+            chunk_size=chunk_size,
         )
-        sorted(withdrawal_events, key=lambda x: x["block_number"])
-        return dict(
-            data=withdrawal_events,
+        return index.events(
+            key,
+            cls._to_block_number(ledger_api, from_block, latest_block),
+            cls._to_block_number(ledger_api, to_block, latest_block),
         )
 
     @classmethod
-    def sender_to_amount_spent(
+    def _get_deployment_block(
+        cls,
+        ledger_api: EthereumApi,
+        chain_id: int,
+        contract_address: str,
+        latest_block: int,
+    ) -> int:
+        """Get the block in which a contract was deployed, bisecting the blocks in which it has code."""
+        key = (chain_id, contract_address.lower())
+        if key not in cls._deployment_blocks:
+            low, high = 0, latest_block
+            while low < high:
+                middle = (low + high) // 2
+                code = ledger_api.api.eth.get_code(
+                    contract_address, block_identifier=middle
+                )
+                if len(code) > 0:
+                    high = middle
+                else:
+                    low = middle + 1
+            cls._deployment_blocks[key] = low
+        return cls._deployment_blocks[key]
+
+    @staticmethod
+    def _to_block_number(
+        ledger_api: EthereumApi, block_identifier: BlockIdentifier, latest_block: int
+    ) -> int:
+        """Get the number of the block identified."""
+        if block_identifier == "earliest":
+            return 0
+        if block_identifier == "latest":
+            return latest_block
+        if isinstance(block_identifier, int):
+            return block_identifier
+        return ledger_api.api.eth.get_block(block_identifier)["number"]
+
+    @classmethod
+    def sender_to_amount_spent(  # pylint: disable=too-many-arguments
         cls,
         ledger_api: EthereumApi,
         contract_address: str,
         transaction_hashes: List[str],
+        max_workers: int = DEFAULT_RECEIPT_WORKERS,
+        batch_size: int = DEFAULT_RECEIPT_BATCH_SIZE,
     ) -> JSONLike:
         """
         Get the amount of gas spent by each sender of the transactions provided.
@@ -385,37 +950,48 @@ class KeeperV2(Contract):
         :param ledger_api: the ledger API object
         :param contract_address: the contract address
         :param transaction_hashes: the transaction hashes
+        :param max_workers: the number of concurrent receipt requests
+        :param batch_size: the number of receipts requested per batch
         :return: the amount of gas spent by each owner (in wei)
         """
-        loop = asyncio.new_event_loop()
-        tasks = []
-        num_threads = 5
-
-        def get_gas_spent(tx_hash: str) -> Dict[str, int]:
-            tx_receipt = ledger_api.get_transaction_receipt(tx_hash)
-            tx = ledger_api.get_transaction(tx_hash)
-            gas_price = int(tx["gasPrice"])
-            gas_used = int(tx_receipt["gasUsed"])
-            total_spent = gas_price * gas_used
-            sender = tx["from"]
-            return {sender: total_spent}
-
-        with concurrent.futures.ThreadPoolExecutor(num_threads) as pool:
-            for transaction_hash in transaction_hashes:
-                task = loop.run_in_executor(pool, get_gas_spent, transaction_hash)
-                tasks.append(task)
-
-            results = cast(
-                List[JSONLike], loop.run_until_complete(asyncio.gather(*tasks))
-            )
-            loop.close()
-
-        sender_to_amount_spent = {}
-        for result in results:
-            sender = list(result.keys())[0]
-            total_spent = result[sender]
+        fetcher = cls._get_receipt_fetcher(max_workers, batch_size)
+        sender_to_amount_spent: Dict[str, int] = {}
+        for spent in fetcher.gas_spent(ledger_api, transaction_hashes):
+            sender = spent["sender"]
             if sender not in sender_to_amount_spent:
                 sender_to_amount_spent[sender] = 0
-            sender_to_amount_spent[sender] += total_spent
+            sender_to_amount_spent[sender] += spent["amount"]
 
         return dict(data=sender_to_amount_spent)
+
+    @classmethod
+    def get_gas_spent(  # pylint: disable=too-many-arguments
+        cls,
+        ledger_api: EthereumApi,
+        contract_address: str,
+        transaction_hashes: List[str],
+        max_workers: int = DEFAULT_RECEIPT_WORKERS,
+        batch_size: int = DEFAULT_RECEIPT_BATCH_SIZE,
+    ) -> JSONLike:
+        """
+        Get the sender, the amount spent in gas (in wei), the block, the status and the executed safes of each transaction.
+
+        :param ledger_api: the ledger API object
+        :param contract_address: the contract address
+        :param transaction_hashes: the transaction hashes
+        :param max_workers: the number of concurrent receipt requests
+        :param batch_size: the number of receipts requested per batch
+        :return: the gas spent by each transaction
+        """
+        fetcher = cls._get_receipt_fetcher(max_workers, batch_size)
+        gas_spent = fetcher.gas_spent(ledger_api, transaction_hashes)
+        return dict(data=dict(zip(transaction_hashes, gas_spent)))
+
+    @classmethod
+    def _get_receipt_fetcher(cls, max_workers: int, batch_size: int) -> ReceiptFetcher:
+        """Get the receipt fetcher with the given concurrency, creating it on first use."""
+        fetcher = cls._receipt_fetchers.get((max_workers, batch_size))
+        if fetcher is None:
+            fetcher = ReceiptFetcher(max_workers, batch_size)
+            cls._receipt_fetchers[(max_workers, batch_size)] = fetcher
+        return fetcher
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the Keep3r V2 contract."""
+
+import os
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, List, Tuple
+from unittest import mock
+
+from packages.valory.contracts.keep3r_v2.contract import (
+    EXECUTION_SUCCESS_TOPIC,
+    EventIndex,
+    KeeperV2,
+    ReceiptFetcher,
+)
+
+
+KEY = EventIndex.make_key("0xContract", "Unbonding", "0xKeeper", "0xAsset")
+KEEPER_ADDRESS = "0x" + "1" * 40
+ASSET_ADDRESS = "0x" + "2" * 40
+DEPLOYMENT_BLOCK = 1_000
+
+
+class DummyFetcher:
+    """Fetches the events of a dummy chain, recording the requested block ranges."""
+
+    def __init__(self, block_numbers: List[int]) -> None:
+        """Initialize the fetcher, with the blocks that have an event."""
+        self.block_numbers = block_numbers
+        self.ranges: List[Tuple[int, int]] = []
+
+    def __call__(self, from_block: int, to_block: int) -> List[Dict[str, Any]]:
+        """Fetch the events in an inclusive block range."""
+        self.ranges.append((from_block, to_block))
+        return [
+            dict(block_number=block_number, log_index=0)
+            for block_number in self.block_numbers
+            if from_block <= block_number <= to_block
+        ]
+
+
+class TestEventIndex:
+    """Test EventIndex."""
+
+    def test_update_in_chunks(self) -> None:
+        """Test that the blocks are fetched in chunks, from the start block."""
+        fetch = DummyFetcher([25, 3, 12])
+        index = EventIndex()
+        index.update(KEY, fetch, 25, start_block=1, chunk_size=10)
+        assert fetch.ranges == [(1, 10), (11, 20), (21, 25)]
+        assert index.last_block(KEY) == 25
+        assert [event["block_number"] for event in index.events(KEY)] == [3, 12, 25]
+        assert [event["block_number"] for event in index.events(KEY, 4, 24)] == [12]
+
+        # only the unconfirmed blocks are fetched again
+        fetch.ranges.clear()
+        index.update(KEY, fetch, 30, start_block=1, confirmations=2, chunk_size=10)
+        assert fetch.ranges == [(24, 30)]
+        assert [event["block_number"] for event in index.events(KEY)] == [3, 12, 25]
+
+    def test_reorg_rewind(self) -> None:
+        """Test that the events of the reorged blocks are dropped."""
+        index = EventIndex()
+        index.update(KEY, DummyFetcher([90, 95]), 100, confirmations=12)
+        # the block with the second event is reorged, and an event is added in a new block
+        fetch = DummyFetcher([90, 101])
+        index.update(KEY, fetch, 101, confirmations=12)
+        assert fetch.ranges == [(89, 101)]
+        assert [event["block_number"] for event in index.events(KEY)] == [90, 101]
+
+    def test_persistence(self) -> None:
+        """Test that the index is persisted to its path, and loaded from it."""
+        with TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "event_index.json")
+            EventIndex(path).update(KEY, DummyFetcher([5]), 10)
+            # no temporary file is left behind
+            assert os.listdir(temp_dir) == ["event_index.json"]
+            index = EventIndex(path)
+        assert index.last_block(KEY) == 10
+        assert index.events(KEY) == [dict(block_number=5, log_index=0)]
+
+    def test_in_memory(self) -> None:
+        """Test that the index is kept in memory when it has no path."""
+        index = EventIndex()
+        with mock.patch("builtins.open") as mock_open:
+            index.update(KEY, DummyFetcher([5]), 10)
+        mock_open.assert_not_called()
+        assert index.events(KEY) == [dict(block_number=5, log_index=0)]
+
+
+class TestIndexedEvents:
+    """Test the keep3r events read from the event index."""
+
+    @staticmethod
+    def _ledger_api(chain_id: int) -> mock.MagicMock:
+        """Get the ledger API of a chain, where the contract is deployed at `DEPLOYMENT_BLOCK`."""
+        ledger_api = mock.MagicMock()
+        ledger_api.api.eth.chain_id = chain_id
+        ledger_api.api.eth.block_number = DEPLOYMENT_BLOCK + 10
+        ledger_api.api.eth.get_code.side_effect = (
+            lambda _, block_identifier: b"\x01"
+            if block_identifier >= DEPLOYMENT_BLOCK
+            else b""
+        )
+        ledger_api.api.to_checksum_address.side_effect = lambda address: address
+        return ledger_api
+
+    def test_start_from_deployment(self) -> None:
+        """Test that the events are indexed per chain, from the deployment of the contract."""
+        contract = mock.MagicMock(address="0xContract")
+        contract.events.Unbonding.get_logs.return_value = []
+        mainnet, fork = self._ledger_api(chain_id=1), self._ledger_api(chain_id=5)
+        with mock.patch.object(
+            KeeperV2, "get_instance", return_value=contract
+        ), mock.patch.object(KeeperV2, "_event_indexes", {}), mock.patch.object(
+            KeeperV2, "_deployment_blocks", {}
+        ):
+            for ledger_api in (mainnet, fork, mainnet):
+                events = KeeperV2.get_unbonding_events(
+                    ledger_api, "0xContract", KEEPER_ADDRESS, ASSET_ADDRESS
+                )
+                assert events == dict(data=[])
+            assert len(KeeperV2._event_indexes) == 2
+            assert KeeperV2._deployment_blocks == {
+                (1, "0xcontract"): DEPLOYMENT_BLOCK,
+                (5, "0xcontract"): DEPLOYMENT_BLOCK,
+            }
+
+        # the deployment block is looked up once per chain
+        assert mainnet.api.eth.get_code.call_count == fork.api.eth.get_code.call_count
+        from_blocks = [
+            call.kwargs["fromBlock"]
+            for call in contract.events.Unbonding.get_logs.call_args_list
+        ]
+        # each chain is indexed from the deployment, then only its unconfirmed blocks are indexed again
+        assert from_blocks == [DEPLOYMENT_BLOCK, DEPLOYMENT_BLOCK, DEPLOYMENT_BLOCK]
+
+
+def test_is_keeper() -> None:
+    """Test that the keeper membership is checked without downloading the keeper list."""
+    contract = mock.MagicMock()
+    contract.functions.isKeeper.return_value.call.return_value = True
+    ledger_api = mock.MagicMock()
+    ledger_api.api.to_checksum_address.side_effect = lambda address: address
+    with mock.patch.object(KeeperV2, "get_instance", return_value=contract):
+        is_keeper = KeeperV2.is_keeper(
+            ledger_api, "0xContract", KEEPER_ADDRESS, block_identifier=1
+        )
+    assert is_keeper == dict(data=True)
+    contract.functions.isKeeper.assert_called_once_with(KEEPER_ADDRESS)
+    contract.functions.isKeeper.return_value.call.assert_called_once_with(
+        block_identifier=1
+    )
+    contract.functions.keepers.assert_not_called()
+
+
+def test_gas_spent_executed_safes() -> None:
+    """Test that the safes which emitted `ExecutionSuccess` are reported with the gas spent."""
+    safe_address = "0x" + "3" * 40
+    receipt = {
+        "from": KEEPER_ADDRESS,
+        "gasUsed": hex(2),
+        "effectiveGasPrice": hex(3),
+        "blockNumber": hex(DEPLOYMENT_BLOCK),
+        "status": "0x1",
+        "logs": [
+            {"address": ASSET_ADDRESS, "topics": ["0x" + "0" * 64]},
+            {"address": safe_address, "topics": [EXECUTION_SUCCESS_TOPIC]},
+        ],
+    }
+    ledger_api = mock.MagicMock()
+    ledger_api.api.eth.block_number = DEPLOYMENT_BLOCK
+    ledger_api.api.to_checksum_address.side_effect = lambda address: address
+    ledger_api.api.provider.make_request.return_value = {"result": receipt}
+    (gas_spent,) = ReceiptFetcher().gas_spent(ledger_api, ["0x0"])
+    assert gas_spent == dict(
+        sender=KEEPER_ADDRESS,
+        amount=6,
+        block_number=DEPLOYMENT_BLOCK,
+        status=True,
+        executed_safes=[safe_address],
+    )
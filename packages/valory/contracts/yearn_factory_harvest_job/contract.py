@@ -19,13 +19,17 @@
 
 """This module contains a class for the Yearn FactoryHarvestV1 Job contract."""
 
+import json
 import logging
-from typing import Any, List
+import os
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 from aea.common import JSONLike
 from aea.configurations.base import PublicId
 from aea.contracts.base import Contract
 from aea_ledger_ethereum import EthereumApi
+from web3 import HTTPProvider
+from web3._utils.request import make_post_request
 from web3.types import RPCEndpoint
 
 
@@ -73,12 +77,135 @@ TOPICS = [
     TOPIC_STRATEGY_REMOVED_FROM_QUEUE,
     TOPIC_STRATEGY_REVOKED,
 ]
+# the number of blocks queried per `eth_getLogs` request
+LOG_CHUNK_SIZE = 100_000
+# the number of most recent blocks that are indexed again on every update, to recover from reorgs
+CONFIRMATIONS = 12
+
+# the maximum number of static calls sent in a single JSON-RPC batch
+MAX_BATCH_SIZE = 50
+
+# (block number, event topic, first indexed argument, second indexed argument)
+StrategyLog = Tuple[int, str, str, Optional[str]]
+
+
+class StrategyIndex:
+    """
+    An incrementally updated index of the strategy events of the factory vaults.
+
+    Only the new blocks are queried on every update.
+    If a path is given, the index is persisted there as json.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Initialize the index, loading it from the path if it exists."""
+        self.path = path
+        self.vaults: List[str] = []
+        self.last_block = int(VAULT_FACTORY_DEPLOYMENT_BLOCK, 16) - 1
+        self.logs: List[StrategyLog] = []
+        if path is not None and os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                stored = json.load(file)
+            self.vaults = stored["vaults"]
+            self.last_block = stored["last_block"]
+            self.logs = [cast(StrategyLog, tuple(log)) for log in stored["logs"]]
+
+    def update(
+        self, ledger_api: EthereumApi, vaults: List[str], latest_block: int
+    ) -> None:
+        """
+        Index the strategy events of the vaults up to the latest block.
+
+        The vaults that were not indexed before are indexed from the factory deployment,
+        all the others only after the last indexed block.
+
+        :param ledger_api: the ledger API object
+        :param vaults: all the deployed vaults
+        :param latest_block: the block to index up to
+        """
+        # the unconfirmed blocks might have been reorged, drop them and index them again
+        rewind_to = max(
+            self.last_block - CONFIRMATIONS, int(VAULT_FACTORY_DEPLOYMENT_BLOCK, 16) - 1
+        )
+        self.logs = [log for log in self.logs if log[0] <= rewind_to]
+        indexed_vaults = set(self.vaults)
+        new_vaults = [vault for vault in vaults if vault not in indexed_vaults]
+        if len(new_vaults) > 0 and len(indexed_vaults) > 0:
+            self._index(
+                ledger_api,
+                new_vaults,
+                int(VAULT_FACTORY_DEPLOYMENT_BLOCK, 16),
+                rewind_to,
+            )
+        self.vaults = list(vaults)
+        self._index(ledger_api, self.vaults, rewind_to + 1, latest_block)
+        self.last_block = max(latest_block, rewind_to)
+        self._save()
+
+    def strategies(self) -> List[str]:
+        """Get the strategies that have been added, and not removed since, as topics."""
+        added, removed = set(), set()
+        for _, topic, first_argument, second_argument in self.logs:
+            if topic in (TOPIC_STRATEGY_ADDED, TOPIC_STRATEGY_ADDED_TO_QUEUE):
+                added.add(first_argument)
+            elif topic == TOPIC_STRATEGY_MIGRATED:
+                removed.add(first_argument)
+                added.add(cast(str, second_argument))
+            else:
+                removed.add(first_argument)
+        return list(added - removed)
+
+    def _index(
+        self,
+        ledger_api: EthereumApi,
+        vaults: List[str],
+        from_block: int,
+        to_block: int,
+    ) -> None:
+        """Index the strategy events of the given vaults, in the given block range."""
+        while from_block <= to_block:
+            chunk_end = min(from_block + LOG_CHUNK_SIZE - 1, to_block)
+            log_filter = {
+                "address": vaults,
+                "topics": [TOPICS],
+                "fromBlock": hex(from_block),
+                "toBlock": hex(chunk_end),
+            }
+            logs = ledger_api.api.provider.make_request(
+                RPCEndpoint("eth_getLogs"), [log_filter]
+            )
+            self.logs.extend(
+                (
+                    int(log["blockNumber"], 16),
+                    log["topics"][0],
+                    log["topics"][1],
+                    log["topics"][2] if len(log["topics"]) > 2 else None,
+                )
+                for log in logs["result"]
+            )
+            from_block = chunk_end + 1
+
+    def _save(self) -> None:
+        """Persist the index, if it has a path."""
+        if self.path is None:
+            return
+        stored = dict(vaults=self.vaults, last_block=self.last_block, logs=self.logs)
+        # the temporary file is per process, so that the processes sharing the path do not overwrite each other's
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(stored, file)
+        os.replace(tmp_path, self.path)
 
 
 class YearnFactoryHarvestJobContract(Contract):
     """Class for the YearnFactoryHarvest contract."""
 
     contract_id = PUBLIC_ID
+    # (chain id, index path) -> strategy index
+    _strategy_indexes: Dict[Tuple[int, Optional[str]], StrategyIndex] = {}
+    # the strategies are shared by all the calls made at the same block of the same chain
+    _strategies_snapshot: Optional[Tuple[Tuple[int, int], List[str]]] = None
+    _topic_to_address: Dict[str, str] = {}
 
     def get_off_chain_data(
         self, ledger_api: EthereumApi, contract_address: str, **kwargs: Any
@@ -104,9 +231,9 @@ class YearnFactoryHarvestJobContract(Contract):
     ) -> JSONLike:
         """Check if there are any workable strategies."""
         keep3r_address = kwargs.get("keep3r_address")
-        strategies = cls.get_strategies(ledger_api)
+        strategies = cls.get_strategies(ledger_api, kwargs.get("index_path"))
         workable_strategies = cls.get_workable_strategies(
-            ledger_api, contract_address, strategies, keep3r_address
+            ledger_api, contract_address, strategies, keep3r_address, early_exit=True
         )
         is_workable = len(workable_strategies) > 0
         return dict(data=is_workable)
@@ -129,9 +256,9 @@ class YearnFactoryHarvestJobContract(Contract):
         """
         contract = cls.get_instance(ledger_api, contract_address)
         keep3r_address = kwargs.get("keep3r_address")
-        strategies = cls.get_strategies(ledger_api)
+        strategies = cls.get_strategies(ledger_api, kwargs.get("index_path"))
         workable_strategies = cls.get_workable_strategies(
-            ledger_api, contract_address, strategies, keep3r_address
+            ledger_api, contract_address, strategies, keep3r_address, early_exit=True
         )
         data = "0x"
         # it might happen that between the workable call,
@@ -153,57 +280,48 @@ class YearnFactoryHarvestJobContract(Contract):
         return all_vaults
 
     @classmethod
-    def get_strategies(cls, ledger_api: EthereumApi) -> List[str]:
-        """Get the strategies from all vaults."""
+    def get_strategies(
+        cls, ledger_api: EthereumApi, index_path: Optional[str] = None
+    ) -> List[str]:
+        """
+        Get the strategies from all vaults.
+
+        The strategy events are read from the index of the chain, which is first brought up to date.
+        The strategies are computed once per block, and shared by `workable` and `build_work_tx`.
+
+        :param ledger_api: the ledger API object
+        :param index_path: where to persist the strategy index, if anywhere
+        :return: the sorted strategy addresses
+        """
+        chain_id = ledger_api.api.eth.chain_id
+        latest_block = ledger_api.api.eth.block_number
+        snapshot = cls._strategies_snapshot
+        if snapshot is not None and snapshot[0] == (chain_id, latest_block):
+            return list(snapshot[1])
+
         all_vaults: List[str] = cls.get_vaults(ledger_api)
-        logs_by_topic: dict = {}
-        for topic in TOPICS:
-            log_filter = {
-                "address": all_vaults,
-                "topics": [topic],
-                "fromBlock": VAULT_FACTORY_DEPLOYMENT_BLOCK,
-            }
-            logs = ledger_api.api.provider.make_request(
-                RPCEndpoint("eth_getLogs"), [log_filter]
-            )
-            logs_by_topic[topic] = logs["result"]
-
-        strategy_added = [
-            event["topics"][1] for event in logs_by_topic[TOPIC_STRATEGY_ADDED]
-        ]
-        strategy_added_to_queue = [
-            event["topics"][1] for event in logs_by_topic[TOPIC_STRATEGY_ADDED_TO_QUEUE]
-        ]
-        strategy_migrated_from = [
-            event["topics"][1] for event in logs_by_topic[TOPIC_STRATEGY_MIGRATED]
-        ]
-        strategy_migrated_to = [
-            event["topics"][2] for event in logs_by_topic[TOPIC_STRATEGY_MIGRATED]
-        ]
-        strategy_removed_from_queue = [
-            event["topics"][1]
-            for event in logs_by_topic[TOPIC_STRATEGY_REMOVED_FROM_QUEUE]
-        ]
-        strategy_revoked = [
-            event["topics"][1] for event in logs_by_topic[TOPIC_STRATEGY_REVOKED]
-        ]
-
-        all_added_strategies = (
-            strategy_added + strategy_added_to_queue + strategy_migrated_to
-        )
-        all_removed_strategies = (
-            strategy_migrated_from + strategy_removed_from_queue + strategy_revoked
-        )
-        available_strategies = set(all_added_strategies) - set(all_removed_strategies)
+        index = cls._strategy_indexes.get((chain_id, index_path))
+        if index is None:
+            index = StrategyIndex(index_path)
+            cls._strategy_indexes[(chain_id, index_path)] = index
+        index.update(ledger_api, all_vaults, latest_block)
 
         # the strategies are provided to us as topics, we need to convert them to addresses
-        available_strategy_addresses = [
-            cls.address_from_topic(ledger_api, strategy)
-            for strategy in available_strategies
-        ]
+        topic_to_address = cls._topic_to_address
+        available_strategy_addresses = []
+        for strategy in index.strategies():
+            if strategy not in topic_to_address:
+                topic_to_address[strategy] = cls.address_from_topic(
+                    ledger_api, strategy
+                )
+            available_strategy_addresses.append(topic_to_address[strategy])
         # sort the strategies to avoid mismatches in build_work_tx across agents
         available_strategy_addresses.sort()
-        return available_strategy_addresses
+        cls._strategies_snapshot = (
+            (chain_id, latest_block),
+            available_strategy_addresses,
+        )
+        return list(available_strategy_addresses)
 
     @staticmethod
     def address_from_topic(ledger_api: EthereumApi, topic: str) -> str:
@@ -217,8 +335,9 @@ class YearnFactoryHarvestJobContract(Contract):
         job_address: str,
         strategies: List[str],
         keep3r_address: str,
+        early_exit: bool = False,
     ) -> List[str]:
-        """Get the workable strategies."""
+        """Get the workable strategies, or only the first batch with a workable strategy if `early_exit` is set."""
         # BatchWorkable contract is a special contract used specifically for checking if the strategies are workable
         # It is not deployed anywhere, nor it needs to be deployed
         batch_workable_contract = ledger_api.api.eth.contract(
@@ -244,31 +363,116 @@ class YearnFactoryHarvestJobContract(Contract):
         possibly_workable_strategies = ledger_api.api.codec.decode_abi(
             ["address[]"], encoded_strategies
         )[0]
+        # Check if the strategies are workable by making static calls
+        # We need to do this because workable strategies can contain false positives
+        workable_strategies = cls.batch_static_work(
+            ledger_api,
+            job_address,
+            [
+                ledger_api.api.to_checksum_address(strategy)
+                for strategy in possibly_workable_strategies
+            ],
+            keep3r_address,
+            early_exit=early_exit,
+        )
+        return workable_strategies
+
+    @classmethod
+    def batch_static_work(  # pylint: disable=too-many-arguments,too-many-locals
+        cls,
+        ledger_api: EthereumApi,
+        job_address: str,
+        strategies: List[str],
+        keep3r_address: Optional[str],
+        early_exit: bool = False,
+        batch_size: int = MAX_BATCH_SIZE,
+    ) -> List[str]:
+        """
+        Simulate the work of each strategy, in JSON-RPC batches of static calls.
+
+        The calls are made from the keep3r, so they cannot be aggregated in a single multicall.
+        Providers that do not support batches, or reject them, are called once per strategy.
+
+        :param ledger_api: the ledger API object
+        :param job_address: the job address
+        :param strategies: the strategies to simulate the work of
+        :param keep3r_address: the keep3r to simulate the work as
+        :param early_exit: stop at the first batch with a workable strategy
+        :param batch_size: the maximum number of calls per batch, to keep responses within provider limits
+        :return: the workable strategies, in the order they were given
+        """
         contract = cls.get_instance(ledger_api, job_address)
+        call_params = []
+        for strategy in strategies:
+            params: Dict[str, str] = {
+                "to": contract.address,
+                "data": contract.encodeABI(fn_name="work", args=[strategy]),
+            }
+            if keep3r_address is not None:
+                params["from"] = ledger_api.api.to_checksum_address(keep3r_address)
+            call_params.append(params)
+
+        workable_strategies: List[str] = []
+        for start in range(0, len(strategies), batch_size):
+            batch = call_params[start : start + batch_size]
+            results = cls._batch_call(ledger_api, batch)
+            for strategy, succeeded in zip(
+                strategies[start : start + batch_size], results
+            ):
+                if succeeded:
+                    workable_strategies.append(strategy)
+                    continue
+                _logger.info(
+                    f"Strategy {strategy} is not workable for job {job_address}"
+                )
+            if early_exit and len(workable_strategies) > 0:
+                break
+        return workable_strategies
 
-        # Check if the strategy is workable by making a static call
-        # We need to do this because workable strategies can contain false positives
-        def static_work(strategy: str) -> bool:
-            """Check if the strategy is workable by making a static call."""
+    @staticmethod
+    def _batch_call(ledger_api: EthereumApi, calls: List[Dict[str, str]]) -> List[bool]:
+        """Make `eth_call`s in a single JSON-RPC batch, and get whether each of them succeeded."""
+        provider = ledger_api.api.provider
+        if isinstance(provider, HTTPProvider):
+            batch = [
+                {
+                    "jsonrpc": "2.0",
+                    "id": i,
+                    "method": "eth_call",
+                    "params": [call, "latest"],
+                }
+                for i, call in enumerate(calls)
+            ]
             try:
-                contract.functions.work(
-                    ledger_api.api.to_checksum_address(strategy)
-                ).call({"from": keep3r_address})
+                raw_response = make_post_request(
+                    provider.endpoint_uri,
+                    json.dumps(batch).encode(),
+                    **provider.get_request_kwargs(),
+                )
+                responses = json.loads(raw_response)
+            except (OSError, ValueError) as e:
+                # e.g. the provider rejects the batch with an HTTP error, or does not respond with json
+                responses = str(e)
+            if isinstance(responses, list):
+                id_to_response = {
+                    response.get("id"): response for response in responses
+                }
+                return [
+                    "result" in id_to_response.get(i, {}) for i in range(len(calls))
+                ]
+            # the provider does not support batches
+            _logger.info(f"Batch call failed, calling one by one: {responses}")
+
+        results = []
+        for call in calls:
+            try:
+                ledger_api.api.eth.call(call)
                 # If the call succeeds, the strategy is workable
-                return True
+                results.append(True)
             except ValueError:
                 # If the call fails, the strategy is not workable
-                _logger.info(
-                    f"Strategy {strategy} is not workable for job {job_address}"
-                )
-                return False
-
-        workable_strategies = [
-            ledger_api.api.to_checksum_address(strategy)
-            for strategy in possibly_workable_strategies
-            if static_work(strategy)
-        ]
-        return workable_strategies
+                results.append(False)
+        return results
 
     @classmethod
     def simulate_tx(
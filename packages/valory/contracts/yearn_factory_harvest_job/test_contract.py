@@ -20,11 +20,16 @@
 
 """Tests for the Yearn Factory Harvest Job contract."""
 
+import json
+import os
 from pathlib import Path
-from typing import Any, Dict, Generator, cast
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, Generator, List, Optional, Tuple, cast
+from unittest import mock
 
 import docker
 import pytest
+import requests
 from aea.test_tools.test_contract import BaseContractTestCase
 from aea_ledger_ethereum import EthereumCrypto
 from aea_test_autonomy.docker.base import launch_image, skip_docker_tests
@@ -38,8 +43,15 @@ from aea_test_autonomy.fixture_helpers import (  # noqa
     ganache_configuration,
     ganache_port,
 )
+from web3 import HTTPProvider
 
 from packages.valory.contracts.yearn_factory_harvest_job.contract import (
+    CONFIRMATIONS,
+    LOG_CHUNK_SIZE,
+    StrategyIndex,
+    TOPIC_STRATEGY_ADDED,
+    TOPIC_STRATEGY_REVOKED,
+    VAULT_FACTORY_DEPLOYMENT_BLOCK,
     YearnFactoryHarvestJobContract,
 )
 
@@ -48,6 +60,193 @@ ENDPOINT_GANACHE_URI = f"{DEFAULT_GANACHE_ADDR}:{DEFAULT_GANACHE_PORT}"
 RECEIPT_TIMEOUT = 30
 YEARN_FACTORY_HARVEST_JOB_ADDRESS = "0xEC771dc7Bd0aA67a10b1aF124B9b9a0DC4aF5F9B"
 
+DEPLOYMENT_BLOCK = int(VAULT_FACTORY_DEPLOYMENT_BLOCK, 16)
+VAULT_A = "0x" + "a" * 40
+VAULT_B = "0x" + "b" * 40
+STRATEGY_1 = "0x" + "1" * 40
+STRATEGY_2 = "0x" + "2" * 40
+
+
+def to_topic(address: str) -> str:
+    """Get the topic of an address."""
+    return "0x" + "0" * 24 + address[2:]
+
+
+class DummyChain:
+    """A chain serving the `eth_getLogs` requests of a strategy index."""
+
+    def __init__(self, chain_id: int = 1) -> None:
+        """Initialize the chain."""
+        self.logs: List[Dict[str, Any]] = []
+        # (from block, to block, vaults) of every `eth_getLogs` request
+        self.requests: List[Tuple[int, int, List[str]]] = []
+        self.ledger_api = mock.MagicMock()
+        self.ledger_api.api.provider.make_request = self.make_request
+        self.ledger_api.api.eth.chain_id = chain_id
+        self.ledger_api.api.to_checksum_address = lambda address: address
+
+    def add_log(self, block_number: int, vault: str, topic: str, strategy: str) -> None:
+        """Add a strategy event log."""
+        self.logs.append(
+            dict(
+                address=vault,
+                blockNumber=hex(block_number),
+                topics=[topic, to_topic(strategy)],
+            )
+        )
+
+    def make_request(self, _: str, params: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Serve an `eth_getLogs` request."""
+        (log_filter,) = params
+        from_block = int(log_filter["fromBlock"], 16)
+        to_block = int(log_filter["toBlock"], 16)
+        self.requests.append((from_block, to_block, log_filter["address"]))
+        return dict(
+            result=[
+                log
+                for log in self.logs
+                if from_block <= int(log["blockNumber"], 16) <= to_block
+                and log["address"] in log_filter["address"]
+            ]
+        )
+
+
+class TestStrategyIndex:
+    """Test StrategyIndex."""
+
+    def test_update_in_chunks(self) -> None:
+        """Test that the blocks are indexed in chunks, from the factory deployment."""
+        chain = DummyChain()
+        chain.add_log(DEPLOYMENT_BLOCK + 5, VAULT_A, TOPIC_STRATEGY_ADDED, STRATEGY_1)
+        chain.add_log(
+            DEPLOYMENT_BLOCK + LOG_CHUNK_SIZE + 1,
+            VAULT_A,
+            TOPIC_STRATEGY_ADDED,
+            STRATEGY_2,
+        )
+        latest_block = DEPLOYMENT_BLOCK + 2 * LOG_CHUNK_SIZE
+        chain.add_log(latest_block, VAULT_A, TOPIC_STRATEGY_REVOKED, STRATEGY_1)
+        index = StrategyIndex()
+        index.update(chain.ledger_api, [VAULT_A], latest_block)
+        assert chain.requests == [
+            (DEPLOYMENT_BLOCK, DEPLOYMENT_BLOCK + LOG_CHUNK_SIZE - 1, [VAULT_A]),
+            (
+                DEPLOYMENT_BLOCK + LOG_CHUNK_SIZE,
+                DEPLOYMENT_BLOCK + 2 * LOG_CHUNK_SIZE - 1,
+                [VAULT_A],
+            ),
+            (latest_block, latest_block, [VAULT_A]),
+        ]
+        assert index.last_block == latest_block
+        assert index.strategies() == [to_topic(STRATEGY_2)]
+
+    def test_reorg_rewind(self) -> None:
+        """Test that the unconfirmed blocks are indexed again on every update."""
+        chain = DummyChain()
+        latest_block = DEPLOYMENT_BLOCK + 100
+        chain.add_log(latest_block - 1, VAULT_A, TOPIC_STRATEGY_ADDED, STRATEGY_1)
+        index = StrategyIndex()
+        index.update(chain.ledger_api, [VAULT_A], latest_block)
+        assert index.strategies() == [to_topic(STRATEGY_1)]
+
+        # the block with the first strategy is reorged, and the second strategy is added instead
+        chain.logs.clear()
+        chain.add_log(latest_block, VAULT_A, TOPIC_STRATEGY_ADDED, STRATEGY_2)
+        chain.requests.clear()
+        index.update(chain.ledger_api, [VAULT_A], latest_block + 1)
+        assert chain.requests == [
+            (latest_block - CONFIRMATIONS + 1, latest_block + 1, [VAULT_A])
+        ]
+        assert index.strategies() == [to_topic(STRATEGY_2)]
+
+    def test_new_vaults(self) -> None:
+        """Test that the new vaults are indexed from the factory deployment."""
+        chain = DummyChain()
+        latest_block = DEPLOYMENT_BLOCK + 100
+        index = StrategyIndex()
+        index.update(chain.ledger_api, [VAULT_A], latest_block)
+        chain.add_log(DEPLOYMENT_BLOCK + 10, VAULT_B, TOPIC_STRATEGY_ADDED, STRATEGY_1)
+        chain.requests.clear()
+        index.update(chain.ledger_api, [VAULT_A, VAULT_B], latest_block + 1)
+        rewind_to = latest_block - CONFIRMATIONS
+        assert chain.requests == [
+            (DEPLOYMENT_BLOCK, rewind_to, [VAULT_B]),
+            (rewind_to + 1, latest_block + 1, [VAULT_A, VAULT_B]),
+        ]
+        assert index.strategies() == [to_topic(STRATEGY_1)]
+
+    def test_persistence(self) -> None:
+        """Test that the index is persisted to its path, and loaded from it."""
+        chain = DummyChain()
+        latest_block = DEPLOYMENT_BLOCK + 100
+        chain.add_log(DEPLOYMENT_BLOCK + 10, VAULT_A, TOPIC_STRATEGY_ADDED, STRATEGY_1)
+        with TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "strategy_index.json")
+            StrategyIndex(path).update(chain.ledger_api, [VAULT_A], latest_block)
+            # no temporary file is left behind
+            assert os.listdir(temp_dir) == ["strategy_index.json"]
+            index = StrategyIndex(path)
+        assert index.vaults == [VAULT_A]
+        assert index.last_block == latest_block
+        assert index.strategies() == [to_topic(STRATEGY_1)]
+
+    def test_get_strategies_per_chain(self) -> None:
+        """Test that the strategies are indexed and snapshotted per chain."""
+        mainnet, fork = DummyChain(chain_id=1), DummyChain(chain_id=5)
+        mainnet.add_log(DEPLOYMENT_BLOCK + 1, VAULT_A, TOPIC_STRATEGY_ADDED, STRATEGY_1)
+        fork.add_log(DEPLOYMENT_BLOCK + 1, VAULT_A, TOPIC_STRATEGY_ADDED, STRATEGY_2)
+        contract = YearnFactoryHarvestJobContract
+        with mock.patch.object(
+            contract, "get_vaults", return_value=[VAULT_A]
+        ), mock.patch.object(contract, "_strategy_indexes", {}), mock.patch.object(
+            contract, "_strategies_snapshot", None
+        ):
+            for chain in (mainnet, fork):
+                chain.ledger_api.api.eth.block_number = DEPLOYMENT_BLOCK + 10
+            assert contract.get_strategies(mainnet.ledger_api) == [STRATEGY_1]
+            assert contract.get_strategies(fork.ledger_api) == [STRATEGY_2]
+            assert len(contract._strategy_indexes) == 2
+            # the strategies are computed once per block
+            assert contract.get_strategies(fork.ledger_api) == [STRATEGY_2]
+            assert len(fork.requests) == 1
+
+
+CALLS = [{"to": "0xJob", "data": "0x1"}, {"to": "0xJob", "data": "0x2"}]
+
+
+@pytest.mark.parametrize(
+    "post_response, post_error, eth_calls",
+    [
+        # the batch succeeds, the second call reverts
+        (
+            json.dumps([{"id": 1, "error": "reverted"}, {"id": 0, "result": "0x"}]),
+            None,
+            0,
+        ),
+        # the provider does not support batches
+        (json.dumps({"error": "batches are not supported"}), None, 2),
+        # the provider rejects the batch with an HTTP error
+        (None, requests.HTTPError("413 Client Error: Payload Too Large"), 2),
+        # the provider does not respond with json
+        ("<html>Bad Gateway</html>", None, 2),
+    ],
+)
+def test_batch_call(
+    post_response: Optional[str], post_error: Optional[Exception], eth_calls: int
+) -> None:
+    """Test that the calls fall back to one by one when the batch fails."""
+    ledger_api = mock.MagicMock()
+    ledger_api.api.provider = HTTPProvider("http://localhost:8545")
+    ledger_api.api.eth.call.side_effect = [b"", ValueError("reverted")]
+    with mock.patch(
+        "packages.valory.contracts.yearn_factory_harvest_job.contract.make_post_request",
+        return_value=post_response,
+        side_effect=post_error,
+    ):
+        results = YearnFactoryHarvestJobContract._batch_call(ledger_api, CALLS)
+    assert results == [True, False]
+    assert ledger_api.api.eth.call.call_count == eth_calls
+
 
 @pytest.mark.skip(reason="The fork freezes because of the amount of reqs to the node.")
 @skip_docker_tests
@@ -282,3 +282,169 @@ class TransactionDigests:
         return "TransactionDigests: ledger_id={} transaction_digests={}".format(
             self.ledger_id, self.transaction_digests
         )
+
+
+class Calls:
+    """
+    This class represents an instance of Calls.
+
+    Each call is a dict with the `callable` name, its `args`, which are strings like the ones of `get_state`,
+    and its `kwargs`.
+    """
+
+    __slots__ = ("_calls",)
+
+    def __init__(
+        self,
+        calls: List[JSONLike],
+    ):
+        """Initialise an instance of Calls."""
+        self._calls = calls
+        self._check_consistency()
+
+    def _check_consistency(self) -> None:
+        """Check consistency of the object."""
+        enforce(isinstance(self._calls, list), "calls must be list.")
+        for call in self._calls:
+            enforce(
+                isinstance(call, dict)
+                and set(call.keys()) == {"callable", "args", "kwargs"},
+                "Each call must be a dict with the keys 'callable', 'args' and 'kwargs'.",
+            )
+            enforce(isinstance(call["callable"], str), "callable must be str.")
+            enforce(
+                isinstance(call["args"], list)
+                and all(isinstance(arg, str) for arg in call["args"]),
+                "args must be a list of str.",
+            )
+            enforce(
+                isinstance(call["kwargs"], dict)
+                and all(isinstance(key, str) for key in call["kwargs"].keys()),
+                "kwargs must be dict and keys must be str.",
+            )
+
+    @property
+    def calls(self) -> List[JSONLike]:
+        """Get the calls."""
+        return self._calls
+
+    @staticmethod
+    def encode(calls_protobuf_object: Any, calls_object: "Calls") -> None:
+        """
+        Encode an instance of this class into the protocol buffer object.
+
+        The protocol buffer object in the calls_protobuf_object argument is matched with the instance of this class in the 'calls_object' argument.
+
+        :param calls_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :param calls_object: an instance of this class to be encoded in the protocol buffer object.
+        """
+        calls_protobuf_object.calls.extend(
+            DictProtobufStructSerializer.encode(call) for call in calls_object.calls
+        )
+
+    @classmethod
+    def decode(cls, calls_protobuf_object: Any) -> "Calls":
+        """
+        Decode a protocol buffer object that corresponds with this class into an instance of this class.
+
+        A new instance of this class is created that matches the protocol buffer object in the 'calls_protobuf_object' argument.
+
+        :param calls_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :return: A new instance of this class that matches the protocol buffer object in the 'calls_protobuf_object' argument.
+        """
+        return cls(
+            [
+                DictProtobufStructSerializer.decode(call)
+                for call in calls_protobuf_object.calls
+            ]
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        """Check equality."""
+        return isinstance(other, Calls) and self.calls == other.calls
+
+    def __str__(self) -> str:
+        """Get string representation."""
+        return "Calls: calls={}".format(self.calls)
+
+
+class States:
+    """
+    This class represents an instance of States.
+
+    There is a state per call of a batch, in the order of the calls:
+    `{"state": <the result of the call>}` if the call succeeded, or `{"error": <the error message>}` if it failed.
+    """
+
+    __slots__ = ("_states",)
+
+    def __init__(
+        self,
+        states: List[JSONLike],
+    ):
+        """Initialise an instance of States."""
+        self._states = states
+        self._check_consistency()
+
+    def _check_consistency(self) -> None:
+        """Check consistency of the object."""
+        enforce(isinstance(self._states, list), "states must be list.")
+        for state in self._states:
+            enforce(
+                isinstance(state, dict)
+                and (
+                    (
+                        set(state.keys()) == {"state"}
+                        and isinstance(state["state"], dict)
+                    )
+                    or (
+                        set(state.keys()) == {"error"}
+                        and isinstance(state["error"], str)
+                    )
+                ),
+                "Each state must be either a dict with a dict 'state', or a dict with a str 'error'.",
+            )
+
+    @property
+    def states(self) -> List[JSONLike]:
+        """Get the states."""
+        return self._states
+
+    @staticmethod
+    def encode(states_protobuf_object: Any, states_object: "States") -> None:
+        """
+        Encode an instance of this class into the protocol buffer object.
+
+        The protocol buffer object in the states_protobuf_object argument is matched with the instance of this class in the 'states_object' argument.
+
+        :param states_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :param states_object: an instance of this class to be encoded in the protocol buffer object.
+        """
+        states_protobuf_object.states.extend(
+            DictProtobufStructSerializer.encode(state) for state in states_object.states
+        )
+
+    @classmethod
+    def decode(cls, states_protobuf_object: Any) -> "States":
+        """
+        Decode a protocol buffer object that corresponds with this class into an instance of this class.
+
+        A new instance of this class is created that matches the protocol buffer object in the 'states_protobuf_object' argument.
+
+        :param states_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :return: A new instance of this class that matches the protocol buffer object in the 'states_protobuf_object' argument.
+        """
+        return cls(
+            [
+                DictProtobufStructSerializer.decode(state)
+                for state in states_protobuf_object.states
+            ]
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        """Check equality."""
+        return isinstance(other, States) and self.states == other.states
+
+    def __str__(self) -> str:
+        """Get string representation."""
+        return "States: states={}".format(self.states)
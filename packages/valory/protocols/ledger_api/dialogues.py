@@ -62,6 +62,7 @@ class LedgerApiDialogue(Dialogue):
         {
             LedgerApiMessage.Performative.GET_BALANCE,
             LedgerApiMessage.Performative.GET_STATE,
+            LedgerApiMessage.Performative.GET_STATE_BATCH,
             LedgerApiMessage.Performative.GET_RAW_TRANSACTION,
             LedgerApiMessage.Performative.SEND_SIGNED_TRANSACTION,
             LedgerApiMessage.Performative.SEND_SIGNED_TRANSACTIONS,
@@ -72,6 +73,7 @@ class LedgerApiDialogue(Dialogue):
         {
             LedgerApiMessage.Performative.BALANCE,
             LedgerApiMessage.Performative.STATE,
+            LedgerApiMessage.Performative.STATE_BATCH,
             LedgerApiMessage.Performative.RAW_TRANSACTION,
             LedgerApiMessage.Performative.TRANSACTION_DIGEST,
             LedgerApiMessage.Performative.TRANSACTION_DIGESTS,
@@ -94,6 +96,12 @@ class LedgerApiDialogue(Dialogue):
         LedgerApiMessage.Performative.GET_STATE: frozenset(
             {LedgerApiMessage.Performative.STATE, LedgerApiMessage.Performative.ERROR}
         ),
+        LedgerApiMessage.Performative.GET_STATE_BATCH: frozenset(
+            {
+                LedgerApiMessage.Performative.STATE_BATCH,
+                LedgerApiMessage.Performative.ERROR,
+            }
+        ),
         LedgerApiMessage.Performative.GET_TRANSACTION_RECEIPT: frozenset(
             {
                 LedgerApiMessage.Performative.TRANSACTION_RECEIPT,
@@ -114,6 +122,7 @@ class LedgerApiDialogue(Dialogue):
             }
         ),
         LedgerApiMessage.Performative.STATE: frozenset(),
+        LedgerApiMessage.Performative.STATE_BATCH: frozenset(),
         LedgerApiMessage.Performative.TRANSACTION_DIGEST: frozenset(),
         LedgerApiMessage.Performative.TRANSACTION_DIGESTS: frozenset(),
         LedgerApiMessage.Performative.TRANSACTION_RECEIPT: frozenset(),
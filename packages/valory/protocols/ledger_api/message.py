@@ -48,6 +48,7 @@ from aea.configurations.base import PublicId
 from aea.exceptions import AEAEnforceError, enforce
 from aea.protocols.base import Message
 
+from packages.valory.protocols.ledger_api.custom_types import Calls as CustomCalls
 from packages.valory.protocols.ledger_api.custom_types import Kwargs as CustomKwargs
 from packages.valory.protocols.ledger_api.custom_types import (
     RawTransaction as CustomRawTransaction,
@@ -59,6 +60,7 @@ from packages.valory.protocols.ledger_api.custom_types import (
     SignedTransactions as CustomSignedTransactions,
 )
 from packages.valory.protocols.ledger_api.custom_types import State as CustomState
+from packages.valory.protocols.ledger_api.custom_types import States as CustomStates
 from packages.valory.protocols.ledger_api.custom_types import Terms as CustomTerms
 from packages.valory.protocols.ledger_api.custom_types import (
     TransactionDigest as CustomTransactionDigest,
@@ -82,6 +84,8 @@ class LedgerApiMessage(Message):
     protocol_id = PublicId.from_str("valory/ledger_api:1.0.0")
     protocol_specification_id = PublicId.from_str("valory/ledger_api:1.0.0")
 
+    Calls = CustomCalls
+
     Kwargs = CustomKwargs
 
     RawTransaction = CustomRawTransaction
@@ -92,6 +96,8 @@ class LedgerApiMessage(Message):
 
     State = CustomState
 
+    States = CustomStates
+
     Terms = CustomTerms
 
     TransactionDigest = CustomTransactionDigest
@@ -108,11 +114,13 @@ class LedgerApiMessage(Message):
         GET_BALANCE = "get_balance"
         GET_RAW_TRANSACTION = "get_raw_transaction"
         GET_STATE = "get_state"
+        GET_STATE_BATCH = "get_state_batch"
         GET_TRANSACTION_RECEIPT = "get_transaction_receipt"
         RAW_TRANSACTION = "raw_transaction"
         SEND_SIGNED_TRANSACTION = "send_signed_transaction"
         SEND_SIGNED_TRANSACTIONS = "send_signed_transactions"
         STATE = "state"
+        STATE_BATCH = "state_batch"
         TRANSACTION_DIGEST = "transaction_digest"
         TRANSACTION_DIGESTS = "transaction_digests"
         TRANSACTION_RECEIPT = "transaction_receipt"
@@ -127,11 +135,13 @@ class LedgerApiMessage(Message):
         "get_balance",
         "get_raw_transaction",
         "get_state",
+        "get_state_batch",
         "get_transaction_receipt",
         "raw_transaction",
         "send_signed_transaction",
         "send_signed_transactions",
         "state",
+        "state_batch",
         "transaction_digest",
         "transaction_digests",
         "transaction_receipt",
@@ -144,6 +154,7 @@ class LedgerApiMessage(Message):
             "args",
             "balance",
             "callable",
+            "calls",
             "code",
             "data",
             "dialogue_reference",
@@ -158,6 +169,7 @@ class LedgerApiMessage(Message):
             "signed_transaction",
             "signed_transactions",
             "state",
+            "states",
             "target",
             "terms",
             "transaction_digest",
@@ -243,6 +255,12 @@ class LedgerApiMessage(Message):
         enforce(self.is_set("callable"), "'callable' content is not set.")
         return cast(str, self.get("callable"))
 
+    @property
+    def calls(self) -> CustomCalls:
+        """Get the 'calls' content from the message."""
+        enforce(self.is_set("calls"), "'calls' content is not set.")
+        return cast(CustomCalls, self.get("calls"))
+
     @property
     def code(self) -> int:
         """Get the 'code' content from the message."""
@@ -311,6 +329,12 @@ class LedgerApiMessage(Message):
         enforce(self.is_set("state"), "'state' content is not set.")
         return cast(CustomState, self.get("state"))
 
+    @property
+    def states(self) -> CustomStates:
+        """Get the 'states' content from the message."""
+        enforce(self.is_set("states"), "'states' content is not set.")
+        return cast(CustomStates, self.get("states"))
+
     @property
     def terms(self) -> CustomTerms:
         """Get the 'terms' content from the message."""
@@ -559,6 +583,34 @@ class LedgerApiMessage(Message):
                         type(self.state)
                     ),
                 )
+            elif self.performative == LedgerApiMessage.Performative.GET_STATE_BATCH:
+                expected_nb_of_contents = 2
+                enforce(
+                    isinstance(self.ledger_id, str),
+                    "Invalid type for content 'ledger_id'. Expected 'str'. Found '{}'.".format(
+                        type(self.ledger_id)
+                    ),
+                )
+                enforce(
+                    isinstance(self.calls, CustomCalls),
+                    "Invalid type for content 'calls'. Expected 'Calls'. Found '{}'.".format(
+                        type(self.calls)
+                    ),
+                )
+            elif self.performative == LedgerApiMessage.Performative.STATE_BATCH:
+                expected_nb_of_contents = 2
+                enforce(
+                    isinstance(self.ledger_id, str),
+                    "Invalid type for content 'ledger_id'. Expected 'str'. Found '{}'.".format(
+                        type(self.ledger_id)
+                    ),
+                )
+                enforce(
+                    isinstance(self.states, CustomStates),
+                    "Invalid type for content 'states'. Expected 'States'. Found '{}'.".format(
+                        type(self.states)
+                    ),
+                )
             elif self.performative == LedgerApiMessage.Performative.ERROR:
                 expected_nb_of_contents = 1
                 enforce(
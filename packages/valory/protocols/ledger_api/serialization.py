@@ -49,11 +49,13 @@ from aea.protocols.base import Message, Serializer
 
 from packages.valory.protocols.ledger_api import ledger_api_pb2
 from packages.valory.protocols.ledger_api.custom_types import (
+    Calls,
     Kwargs,
     RawTransaction,
     SignedTransaction,
     SignedTransactions,
     State,
+    States,
     Terms,
     TransactionDigest,
     TransactionDigests,
@@ -179,6 +181,20 @@ class LedgerApiSerializer(Serializer):
             state = msg.state
             State.encode(performative.state, state)
             ledger_api_msg.state.CopyFrom(performative)
+        elif performative_id == LedgerApiMessage.Performative.GET_STATE_BATCH:
+            performative = ledger_api_pb2.LedgerApiMessage.Get_State_Batch_Performative()  # type: ignore
+            ledger_id = msg.ledger_id
+            performative.ledger_id = ledger_id
+            calls = msg.calls
+            Calls.encode(performative.calls, calls)
+            ledger_api_msg.get_state_batch.CopyFrom(performative)
+        elif performative_id == LedgerApiMessage.Performative.STATE_BATCH:
+            performative = ledger_api_pb2.LedgerApiMessage.State_Batch_Performative()  # type: ignore
+            ledger_id = msg.ledger_id
+            performative.ledger_id = ledger_id
+            states = msg.states
+            States.encode(performative.states, states)
+            ledger_api_msg.state_batch.CopyFrom(performative)
         elif performative_id == LedgerApiMessage.Performative.ERROR:
             performative = ledger_api_pb2.LedgerApiMessage.Error_Performative()  # type: ignore
             code = msg.code
@@ -301,6 +317,18 @@ class LedgerApiSerializer(Serializer):
             pb2_state = ledger_api_pb.state.state
             state = State.decode(pb2_state)
             performative_content["state"] = state
+        elif performative_id == LedgerApiMessage.Performative.GET_STATE_BATCH:
+            ledger_id = ledger_api_pb.get_state_batch.ledger_id
+            performative_content["ledger_id"] = ledger_id
+            pb2_calls = ledger_api_pb.get_state_batch.calls
+            calls = Calls.decode(pb2_calls)
+            performative_content["calls"] = calls
+        elif performative_id == LedgerApiMessage.Performative.STATE_BATCH:
+            ledger_id = ledger_api_pb.state_batch.ledger_id
+            performative_content["ledger_id"] = ledger_id
+            pb2_states = ledger_api_pb.state_batch.states
+            states = States.decode(pb2_states)
+            performative_content["states"] = states
         elif performative_id == LedgerApiMessage.Performative.ERROR:
             code = ledger_api_pb.error.code
             performative_content["code"] = code
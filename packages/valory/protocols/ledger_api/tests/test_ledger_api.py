@@ -41,11 +41,10 @@
 
 """Tests package for the 'valory/ledger_api' protocol."""
 from abc import abstractmethod
-from typing import Callable, Type
+from typing import Any, Callable, Type
 from unittest import mock
 
 import pytest
-
 from aea.common import Address
 from aea.exceptions import AEAEnforceError
 from aea.mail.base import Envelope
@@ -55,9 +54,11 @@ from aea.protocols.dialogue.base import DialogueLabel
 
 from packages.valory.protocols.ledger_api import LedgerApiMessage, message
 from packages.valory.protocols.ledger_api.custom_types import (
+    Calls,
     Kwargs,
     SignedTransactions,
     State,
+    States,
     Terms,
     TransactionDigests,
 )
@@ -625,6 +626,86 @@ def test_transaction_digests_serialization() -> None:
     assert expected_msg == actual_msg
 
 
+def test_get_state_batch_serialization() -> None:
+    """Test that the serialization for 'get_state_batch' works."""
+    msg = LedgerApiMessage(
+        performative=LedgerApiMessage.Performative.GET_STATE_BATCH,
+        ledger_id=LEDGER_ID,
+        calls=Calls(
+            [
+                dict(callable="get_block", args=["latest"], kwargs={}),
+                dict(
+                    callable="get_balance",
+                    args=[],
+                    kwargs=dict(account=CONTRACT_ADDRESS, block_identifier=1),
+                ),
+            ]
+        ),
+    )
+    msg.to = "receiver"
+    envelope = Envelope(to=msg.to, sender="sender", message=msg)
+
+    actual_envelope = Envelope.decode(envelope.encode())
+    actual_msg = LedgerApiMessage.serializer.decode(actual_envelope.message)
+    actual_msg.to = actual_envelope.to
+    actual_msg.sender = actual_envelope.sender
+    assert msg == actual_msg
+    assert actual_msg.calls.calls[1]["kwargs"]["block_identifier"] == 1
+
+
+def test_state_batch_serialization() -> None:
+    """Test that the serialization for 'state_batch' works."""
+    msg = LedgerApiMessage(
+        performative=LedgerApiMessage.Performative.STATE_BATCH,
+        ledger_id=LEDGER_ID,
+        states=States(
+            [
+                {"state": {"number": 1, "hash": b"\x01", "transactions": []}},
+                {"error": "some error"},
+            ]
+        ),
+    )
+    msg.to = "receiver"
+    envelope = Envelope(to=msg.to, sender="sender", message=msg)
+
+    actual_envelope = Envelope.decode(envelope.encode())
+    actual_msg = LedgerApiMessage.serializer.decode(actual_envelope.message)
+    actual_msg.to = actual_envelope.to
+    actual_msg.sender = actual_envelope.sender
+    assert msg == actual_msg
+
+
+@pytest.mark.parametrize(
+    "calls",
+    (
+        {},
+        [dict(callable="get_block", args=["latest"])],
+        [dict(callable=1, args=[], kwargs={})],
+        [dict(callable="get_block", args=[1], kwargs={})],
+        [dict(callable="get_block", args=[], kwargs={1: 1})],
+    ),
+)
+def test_invalid_calls(calls: Any) -> None:
+    """Test that the calls are checked."""
+    with pytest.raises(AEAEnforceError):
+        Calls(calls)
+
+
+@pytest.mark.parametrize(
+    "states",
+    (
+        {},
+        [{"state": {}, "error": ""}],
+        [{"state": 1}],
+        [{"error": {}}],
+    ),
+)
+def test_invalid_states(states: Any) -> None:
+    """Test that the states are checked."""
+    with pytest.raises(AEAEnforceError):
+        States(states)
+
+
 class BaseTestMessageConstruction:
     """Base class to test message construction for the ABCI protocol."""
 
@@ -46,10 +46,12 @@ from typing import List
 from aea.test_tools.test_protocol import BaseProtocolMessagesTestCase
 
 from packages.valory.protocols.ledger_api.custom_types import (
+    Calls,
     Kwargs,
     RawTransaction,
     SignedTransaction,
     State,
+    States,
     Terms,
     TransactionDigest,
     TransactionReceipt,
@@ -132,6 +134,18 @@ class TestMessageLedgerApi(BaseProtocolMessagesTestCase):
                 ledger_id="some str",
                 state=State(ledger_id=LEDGER_ID, body={}),  # check it please!
             ),
+            LedgerApiMessage(
+                performative=LedgerApiMessage.Performative.GET_STATE_BATCH,
+                ledger_id="some str",
+                calls=Calls(
+                    [{"callable": "some str", "args": ["some str"], "kwargs": {}}]
+                ),
+            ),
+            LedgerApiMessage(
+                performative=LedgerApiMessage.Performative.STATE_BATCH,
+                ledger_id="some str",
+                states=States([{"state": {}}, {"error": "some str"}]),
+            ),
             LedgerApiMessage(
                 performative=LedgerApiMessage.Performative.ERROR,
                 code=12,
@@ -191,6 +205,16 @@ class TestMessageLedgerApi(BaseProtocolMessagesTestCase):
                 # skip content: ledger_id
                 state=State(ledger_id=LEDGER_ID, body={}),
             ),
+            LedgerApiMessage(
+                performative=LedgerApiMessage.Performative.GET_STATE_BATCH,
+                # skip content: ledger_id
+                calls=Calls([]),
+            ),
+            LedgerApiMessage(
+                performative=LedgerApiMessage.Performative.STATE_BATCH,
+                # skip content: ledger_id
+                states=States([]),
+            ),
             LedgerApiMessage(
                 performative=LedgerApiMessage.Performative.ERROR,
                 # skip content: code
@@ -22,24 +22,30 @@
 import datetime
 import hashlib
 import heapq
+import io
 import itertools
 import json
 import logging
+import pickle  # nosec
 import re
 import sys
+import tempfile
 import textwrap
 import uuid
 from abc import ABC, ABCMeta, abstractmethod
-from collections import Counter
+from array import array
+from collections import Counter, OrderedDict, deque
 from copy import copy, deepcopy
 from dataclasses import asdict, astuple, dataclass, field
 from enum import Enum
 from inspect import isclass
 from typing import (
     Any,
+    Deque,
     Dict,
     FrozenSet,
     Generic,
+    IO,
     List,
     Mapping,
     Optional,
@@ -62,6 +68,7 @@ from packages.valory.connections.ledger.connection import (
 from packages.valory.protocols.abci.custom_types import Header
 from packages.valory.skills.abstract_round_abci.utils import (
     consensus_threshold,
+    freeze,
     is_json_serializable,
 )
 
@@ -79,6 +86,8 @@ RESET_COUNT_START = 0
 VALUE_NOT_PROVIDED = object()
 # tolerance in seconds for new blocks not having arrived yet
 BLOCKS_STALL_TOLERANCE = 15
+# the number of verified transactions remembered, to verify them once for `check_tx` and `deliver_tx`
+DEFAULT_SIGNATURE_CACHE_SIZE = 4096
 
 EventType = TypeVar("EventType")
 
@@ -262,6 +271,70 @@ class Transaction(ABC):
             raise SignatureNotValidError(f"Signature not valid on transaction: {self}")
 
 
+class SignatureCache:
+    """
+    A bounded LRU cache of the transactions which signatures have been verified.
+
+    The transactions are identified by the hash of their bytes and their signer, so a transaction is verified
+    when it is checked, and not again when it is delivered, or checked again.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_SIGNATURE_CACHE_SIZE) -> None:
+        """
+        Initialize the cache.
+
+        :param max_size: the maximum number of verified transactions to remember.
+        """
+        self.max_size = max_size
+        self._verified: "OrderedDict[Tuple[str, str, bytes], None]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Get the number of verified transactions which are remembered."""
+        return len(self._verified)
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the ratio of the verifications which were served by the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def verify(
+        self, transaction: Transaction, transaction_bytes: bytes, ledger_id: str
+    ) -> None:
+        """
+        Verify the signature of a transaction, unless it has already been verified.
+
+        :param transaction: the transaction.
+        :param transaction_bytes: the bytes which the transaction was decoded from.
+        :param ledger_id: the ledger id of the address
+        :raises: SignatureNotValidError: if the signature is not valid.
+        """
+        key = (
+            ledger_id,
+            transaction.payload.sender,
+            hashlib.sha256(transaction_bytes).digest(),
+        )
+        if key in self._verified:
+            self._verified.move_to_end(key)
+            self.hits += 1
+            return
+
+        self.misses += 1
+        transaction.verify(ledger_id)
+        self._verified[key] = None
+        if len(self._verified) > self.max_size:
+            self._verified.popitem(last=False)
+
+    def __repr__(self) -> str:
+        """Get a string representation of the cache."""
+        return (
+            f"{self.__class__.__name__}(size={len(self)}, hits={self.hits}, "
+            f"misses={self.misses}, hit_rate={self.hit_rate:.1%})"
+        )
+
+
 class Block:  # pylint: disable=too-few-public-methods
     """Class to represent (a subset of) data of a Tendermint block."""
 
@@ -290,19 +363,47 @@ class Blockchain:
     Class to represent a (naive) Tendermint blockchain.
 
     The consistency of the data in the blocks is guaranteed by Tendermint.
+
+    # Retention
+
+    By default, all the blocks are kept in memory, until the blockchain is reset.
+    If `max_blocks` is set, only the last `max_blocks` blocks are kept in memory, and the older ones are either
+    discarded, or, if `spill_dir` is set, appended to an on-disk log, from which they are read back on demand.
+    The log is an anonymous temporary file in `spill_dir`, which is deleted along with the blockchain,
+    so that the blockchains replaced on a reset do not leave their blocks behind.
+    In any case, the height and the length of the blockchain count all its blocks.
     """
 
-    def __init__(self, height_offset: int = 0, is_init: bool = True) -> None:
+    def __init__(
+        self,
+        height_offset: int = 0,
+        is_init: bool = True,
+        max_blocks: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+    ) -> None:
         """Initialize the blockchain."""
-        self._blocks: List[Block] = []
+        if max_blocks is not None and max_blocks < 1:
+            raise ValueError(f"`max_blocks` must be positive, got {max_blocks}.")
+        self._blocks: Deque[Block] = deque()
         self._height_offset = height_offset
         self._is_init = is_init
+        self._max_blocks = max_blocks
+        self._spill_dir = spill_dir
+        self._spill_log: Optional[IO[bytes]] = None
+        # the offsets of the spilled blocks in the log, in the order of their heights
+        self._spill_offsets = array("Q")
+        self._n_evicted = 0
 
     @property
     def is_init(self) -> bool:
         """Returns true if the blockchain is initialized."""
         return self._is_init
 
+    @property
+    def max_blocks(self) -> Optional[int]:
+        """Get the maximum number of blocks kept in memory, or `None` if all of them are kept."""
+        return self._max_blocks
+
     def add_block(self, block: Block) -> None:
         """Add a block to the list."""
         expected_height = self.height + 1
@@ -317,6 +418,59 @@ class Blockchain:
                 f"expected height {expected_height}, got {actual_height}"
             )
         self._blocks.append(block)
+        if self._max_blocks is not None and len(self._blocks) > self._max_blocks:
+            self._evict(self._blocks.popleft())
+
+    def _evict(self, block: Block) -> None:
+        """Evict a block from memory, spilling it to the log if there is one."""
+        self._n_evicted += 1
+        if self._spill_dir is None:
+            return
+        if self._spill_log is None:
+            # closed, and thus deleted, when the blockchain is garbage collected
+            # pylint: disable=consider-using-with
+            self._spill_log = tempfile.TemporaryFile(
+                prefix="blocks-", dir=self._spill_dir
+            )
+        self._spill_log.seek(0, io.SEEK_END)
+        self._spill_offsets.append(self._spill_log.tell())
+        self._spill_log.write(pickle.dumps(block))  # nosec
+
+    def _read_spilled(self, index: int) -> Block:
+        """Read a spilled block from the log."""
+        log = cast(IO[bytes], self._spill_log)
+        start = self._spill_offsets[index]
+        end = (
+            self._spill_offsets[index + 1]
+            if index + 1 < len(self._spill_offsets)
+            else None
+        )
+        log.seek(start)
+        data = log.read() if end is None else log.read(end - start)
+        # the log is written by, and only readable to, the blockchain itself
+        return pickle.loads(data)  # nosec
+
+    def get_block(self, height: int) -> Block:
+        """
+        Get the block at the given height, without copying the blocks.
+
+        :param height: the height of the block.
+        :return: the block.
+        :raises ValueError: if there is no block at the given height, or if it was evicted and not spilled.
+        """
+        index = height - self._height_offset - 1
+        if not 0 <= index < self.length:
+            raise ValueError(
+                f"no block at height {height}, the heights are in "
+                f"[{self._height_offset + 1}, {self.height}]"
+            )
+        if index >= self._n_evicted:
+            return self._blocks[index - self._n_evicted]
+        if self._spill_log is None:
+            raise ValueError(
+                f"the block at height {height} was evicted from memory and not spilled to disk"
+            )
+        return self._read_spilled(index)
 
     @property
     def height(self) -> int:
@@ -333,11 +487,11 @@ class Blockchain:
     @property
     def length(self) -> int:
         """Get the blockchain length."""
-        return len(self._blocks)
+        return self._n_evicted + len(self._blocks)
 
     @property
     def blocks(self) -> Tuple[Block, ...]:
-        """Get the blocks."""
+        """Get the blocks kept in memory. Use `get_block` or `last_block` to access a block without copying them."""
         return tuple(self._blocks)
 
     @property
@@ -398,6 +552,16 @@ class BlockBuilder:
         )
 
 
+class DBHashMode(Enum):
+    """The ways of hashing an `AbciAppDB` to produce the app hash."""
+
+    # the sha256 of the whole serialized db, the app hash of the previous versions
+    LEGACY = "legacy"
+    # a root over the digests of the periods and of their key histories,
+    # rehashing only the histories which changed since the last hash
+    INCREMENTAL = "incremental"
+
+
 class AbciAppDB:
     """Class to represent all data replicated across agents.
 
@@ -473,6 +637,29 @@ class AbciAppDB:
     * the in-built `copy` module is used, which automatically detects if an item is immutable and skips copying it.
     For more information take a look at the `_deepcopy_atomic` method and its usage:
     https://github.com/python/cpython/blob/3.10/Lib/copy.py#L182-L183
+
+    # Read-only values
+    -----------------------------------
+    With `read_only_values` enabled, the values are stored read-only instead of being copied on every access:
+    the lists and dicts which are written to the database are copied once to read-only ones (see `freeze`),
+    and the values which are already read-only, e.g., the ones read from the database, are shared.
+    The getters then return the stored values without copying them, and modifying them raises a `TypeError`.
+    This breaks the callers which modify the values they read, so it is disabled by default.
+    To modify a value, get a mutable copy of it with `get_copy`, and write the copy back with `update`.
+
+    # Hashing
+    -----------------------------------
+    The hash of the database is the app hash of the blocks, so all the agents must use the same `hash_mode`.
+    In the `legacy` mode, the hash is the sha256 of the whole serialized database, as in the previous versions.
+    In the `incremental` mode, every value of a key history is hashed once, and every period and key history has a digest,
+    which is only recomputed when the history changes. The hash is the digest of the periods' digests:
+
+        value digest = sha256(json.dumps(value, sort_keys=True))
+        history digest = sha256(value digest_0 || value digest_1 || ...)
+        period digest = sha256(json.dumps(sorted([key, history digest], ...)))
+        hash = sha256(json.dumps(sorted([reset index, period digest], ...)))
+
+    Switching modes changes the app hashes, so it has to be done on a new chain, e.g., after a Tendermint reset.
     """
 
     # database keys which values are always set for the next period by default
@@ -489,6 +676,8 @@ class AbciAppDB:
         self,
         setup_data: Dict[str, List[Any]],
         cross_period_persisted_keys: Optional[FrozenSet[str]] = None,
+        hash_mode: Union[DBHashMode, str] = DBHashMode.LEGACY,
+        read_only_values: bool = False,
     ) -> None:
         """Initialize the AbciApp database.
 
@@ -498,9 +687,12 @@ class AbciAppDB:
 
         :param setup_data: the setup data
         :param cross_period_persisted_keys: data keys that will be kept after a new period starts
+        :param hash_mode: the way of hashing the db, see `DBHashMode`
+        :param read_only_values: whether to store the values read-only instead of copying them on every access
         """
         AbciAppDB._check_data(setup_data)
-        self._setup_data = deepcopy(setup_data)
+        self._read_only_values = read_only_values
+        self._setup_data = self._copy_data(setup_data)
         self._data: Dict[int, Dict[str, List[Any]]] = {
             RESET_COUNT_START: self.setup_data  # the key represents the reset index
         }
@@ -511,6 +703,14 @@ class AbciAppDB:
         )
         self._cross_period_check()
 
+        self._hash_mode = DBHashMode(hash_mode)
+        # the digests of the incremental hashing, by reset index
+        self._value_digests: Dict[int, Dict[str, List[bytes]]] = {}
+        self._history_digests: Dict[int, Dict[str, bytes]] = {}
+        self._period_digests: Dict[int, bytes] = {}
+        # the keys which histories changed since the last hash, by reset index
+        self._changed_keys: Dict[int, Set[str]] = {}
+
     def _cross_period_check(self) -> None:
         """Check the cross period keys against the setup data."""
         not_in_cross_period = set(self._setup_data).difference(
@@ -530,7 +730,26 @@ class AbciAppDB:
         :return: the setup_data
         """
         # do not return data if no value has been set
-        return {k: v for k, v in deepcopy(self._setup_data).items() if len(v)}
+        return {
+            k: [self._get_value(value) for value in v]
+            for k, v in self._setup_data.items()
+            if len(v)
+        }
+
+    def _store_value(self, value: Any) -> Any:
+        """Get the value to store: read-only, or a copy."""
+        return freeze(value) if self._read_only_values else deepcopy(value)
+
+    def _get_value(self, value: Any) -> Any:
+        """Get a stored value to return: as it is if it is read-only, or a copy."""
+        return value if self._read_only_values else deepcopy(value)
+
+    def _copy_data(self, data: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+        """Copy the histories of the given data, with the values to store."""
+        return {
+            key: [self._store_value(value) for value in history]
+            for key, history in data.items()
+        }
 
     @staticmethod
     def _check_data(data: Any) -> None:
@@ -562,6 +781,16 @@ class AbciAppDB:
         """Set the round count."""
         self._round_count = round_count
 
+    @property
+    def hash_mode(self) -> DBHashMode:
+        """Get the hash mode."""
+        return self._hash_mode
+
+    @property
+    def read_only_values(self) -> bool:
+        """Whether the values are stored read-only instead of being copied on every access."""
+        return self._read_only_values
+
     @property
     def cross_period_persisted_keys(self) -> FrozenSet[str]:
         """Keys in the database which are persistent across periods."""
@@ -570,7 +799,7 @@ class AbciAppDB:
     def get(self, key: str, default: Any = VALUE_NOT_PROVIDED) -> Optional[Any]:
         """Given a key, get its last for the current reset index."""
         if key in self._data[self.reset_index]:
-            return deepcopy(self._data[self.reset_index][key][-1])
+            return self._get_value(self._data[self.reset_index][key][-1])
         if default != VALUE_NOT_PROVIDED:
             return default
         raise ValueError(
@@ -581,6 +810,11 @@ class AbciAppDB:
         """Get a value from the data dictionary and raise if it is None."""
         return self.get(key)
 
+    def get_copy(self, key: str) -> Any:
+        """Get a mutable copy of the last value of a key for the current reset index, even if the values are read-only."""
+        value = self.get_strict(key)
+        return deepcopy(value) if self._read_only_values else value
+
     @staticmethod
     def validate(data: Any) -> None:
         """Validate if the given data are json serializable and therefore can be accepted into the database.
@@ -600,8 +834,9 @@ class AbciAppDB:
 
         # Append new data to the key history
         data = self._data[self.reset_index]
-        for key, value in deepcopy(kwargs).items():
-            data.setdefault(key, []).append(value)
+        for key, value in kwargs.items():
+            data.setdefault(key, []).append(self._store_value(value))
+        self._changed_keys.setdefault(self.reset_index, set()).update(kwargs)
 
     def create(self, **kwargs: Any) -> None:
         """Add a new entry to the data.
@@ -628,13 +863,15 @@ class AbciAppDB:
     def _create_from_keys(self, **kwargs: Any) -> None:
         """Add a new entry to the data using the provided key-value pairs."""
         AbciAppDB._check_data(kwargs)
-        self._data[self.reset_index + 1] = deepcopy(kwargs)
+        reset_index = self.reset_index + 1
+        self._data[reset_index] = self._copy_data(kwargs)
+        self._drop_digests(reset_index)
 
     def get_latest_from_reset_index(self, reset_index: int) -> Dict[str, Any]:
         """Get the latest key-value pairs from the data dictionary for the specified period."""
         return {
-            key: values[-1]
-            for key, values in deepcopy(self._data.get(reset_index, {})).items()
+            key: self._get_value(values[-1])
+            for key, values in self._data.get(reset_index, {}).items()
         }
 
     def get_latest(self) -> Dict[str, Any]:
@@ -666,6 +903,9 @@ class AbciAppDB:
             key: self._data[key]
             for key in sorted(self._data.keys())[-cleanup_history_depth:]
         }
+        dropped = set(self._period_digests).union(self._changed_keys)
+        for reset_index in dropped.difference(self._data):
+            self._drop_digests(reset_index)
         if cleanup_history_depth_current:
             self.cleanup_current_histories(cleanup_history_depth_current)
 
@@ -674,9 +914,18 @@ class AbciAppDB:
         cleanup_history_depth_current = max(
             cleanup_history_depth_current, MIN_HISTORY_DEPTH
         )
+        data = self._data[self.reset_index]
+        value_digests = self._value_digests.get(self.reset_index, {})
+        changed_keys = self._changed_keys.setdefault(self.reset_index, set())
+        for key, history in data.items():
+            n_removed = len(history) - cleanup_history_depth_current
+            if n_removed > 0:
+                del value_digests.get(key, [])[:n_removed]
+                changed_keys.add(key)
+
         self._data[self.reset_index] = {
             key: history[-cleanup_history_depth_current:]
-            for key, history in self._data[self.reset_index].items()
+            for key, history in data.items()
         }
 
     def serialize(self) -> str:
@@ -711,10 +960,64 @@ class AbciAppDB:
             ) from exc
 
         self._check_data(dict(tuple(loaded_data.values())[0]))
+        if self._read_only_values:
+            loaded_data = {
+                reset_index: self._copy_data(data)
+                for reset_index, data in loaded_data.items()
+            }
         self._data = loaded_data
+        for reset_index in set(self._period_digests).union(self._changed_keys):
+            self._drop_digests(reset_index)
+
+    def _drop_digests(self, reset_index: int) -> None:
+        """Drop the digests of a period, so that they are recomputed by the next incremental hash, if it is in the db."""
+        self._value_digests.pop(reset_index, None)
+        self._history_digests.pop(reset_index, None)
+        self._period_digests.pop(reset_index, None)
+        self._changed_keys.pop(reset_index, None)
+
+    def _incremental_hash(self) -> bytes:
+        """Create a hash of the data, rehashing only the key histories which changed since the last hash."""
+        for reset_index in set(self._data).difference(self._period_digests):
+            self._changed_keys[reset_index] = set(self._data[reset_index])
+
+        for reset_index, keys in self._changed_keys.items():
+            data = self._data[reset_index]
+            value_digests = self._value_digests.setdefault(reset_index, {})
+            history_digests = self._history_digests.setdefault(reset_index, {})
+            for key in keys:
+                history = data[key]
+                digests = value_digests.setdefault(key, [])
+                digests.extend(
+                    hashlib.sha256(json.dumps(value, sort_keys=True).encode()).digest()
+                    for value in history[len(digests) :]
+                )
+                history_digests[key] = hashlib.sha256(b"".join(digests)).digest()
+            self._period_digests[reset_index] = hashlib.sha256(
+                json.dumps(
+                    sorted(
+                        [key, digest.hex()] for key, digest in history_digests.items()
+                    )
+                ).encode()
+            ).digest()
+        self._changed_keys.clear()
+
+        hash_ = hashlib.sha256(
+            json.dumps(
+                [
+                    [reset_index, self._period_digests[reset_index].hex()]
+                    for reset_index in sorted(self._data)
+                ]
+            ).encode()
+        ).digest()
+        _logger.debug(f"root hash: {hash_.hex()}")
+        return hash_
 
     def hash(self) -> bytes:
         """Create a hash of the data."""
+        if self._hash_mode is DBHashMode.INCREMENTAL:
+            return self._incremental_hash()
+
         # Compute the sha256 hash of the serialized data
         sha256 = hashlib.sha256()
         data = self.serialize()
@@ -1177,10 +1480,16 @@ class AbstractRound(Generic[EventType], ABC, metaclass=_MetaAbstractRound):
         if len(votes_by_participant) == 0:
             return
 
-        votes = votes_by_participant.values()
-        vote_count = Counter(tuple(sorted(v.data.items())) for v in votes)
-        largest_nb_votes = max(vote_count.values())
-        nb_votes_received = sum(vote_count.values())
+        if isinstance(votes_by_participant, PayloadCollection):
+            # the payloads of a round are of the same class, so their values group them as their data do
+            _, largest_nb_votes = cast(
+                Tuple[Tuple[Any, ...], int], votes_by_participant.most_voted
+            )
+        else:
+            votes = votes_by_participant.values()
+            vote_count = Counter(tuple(sorted(v.data.items())) for v in votes)
+            largest_nb_votes = max(vote_count.values())
+        nb_votes_received = len(votes_by_participant)
         nb_remaining_votes = nb_participants - nb_votes_received
 
         if (
@@ -1246,6 +1555,112 @@ class DegenerateRound(AbstractRound, ABC):
         )
 
 
+class PayloadCollection(Dict[str, BaseTxPayload]):
+    """
+    The payloads collected by a round, by sender, with a tally of their values.
+
+    The tally catches up with the newly collected payloads when it is accessed, in their collection order,
+    so that the counts, and the order of the equally voted values, are those of
+    `Counter(payload.values for payload in collection.values())`, without counting all the payloads every time.
+    It is rebuilt only if a payload is replaced or removed.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the collection."""
+        super().__init__(*args, **kwargs)
+        self._reset_tally()
+
+    def _reset_tally(self) -> None:
+        """Reset the tally, to rebuild it on the next access."""
+        self._tally: Counter = Counter()
+        # the order in which the values were first tallied, to break the ties as `Counter.most_common` does
+        self._positions: Dict[Tuple[Any, ...], int] = {}
+        self._most_voted: Optional[Tuple[Tuple[Any, ...], int]] = None
+        self._n_tallied = 0
+
+    def __setitem__(self, sender: str, payload: BaseTxPayload) -> None:
+        """Collect a payload."""
+        replaced = sender in self
+        super().__setitem__(sender, payload)
+        if replaced:
+            self._reset_tally()
+
+    def __delitem__(self, sender: str) -> None:
+        """Remove a payload."""
+        super().__delitem__(sender)
+        self._reset_tally()
+
+    def pop(self, *args: Any) -> Any:
+        """Remove a payload and return it."""
+        payload = super().pop(*args)
+        self._reset_tally()
+        return payload
+
+    def popitem(self) -> Tuple[str, BaseTxPayload]:
+        """Remove the last collected payload and return it."""
+        item = super().popitem()
+        self._reset_tally()
+        return item
+
+    def clear(self) -> None:
+        """Remove all the payloads."""
+        super().clear()
+        self._reset_tally()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # type: ignore
+        """Collect several payloads."""
+        super().update(*args, **kwargs)
+        self._reset_tally()
+
+    def __ior__(self, other: Any) -> "PayloadCollection":  # type: ignore
+        """Collect several payloads."""
+        self.update(other)
+        return self
+
+    def __copy__(self) -> "PayloadCollection":
+        """Copy the collection, with a tally of its own."""
+        return type(self)(self)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Reduce the collection to its payloads, so that its copies and unpickled instances rebuild their tally."""
+        return type(self), (dict(self),)
+
+    def _catch_up(self) -> None:
+        """Tally the payloads collected since the last access."""
+        if self._n_tallied == len(self):
+            return
+        tally, positions = self._tally, self._positions
+        most_voted, max_votes = self._most_voted or (None, 0)
+        try:
+            for payload in itertools.islice(self.values(), self._n_tallied, None):
+                values = payload.values
+                votes = tally[values] + 1
+                tally[values] = votes
+                position = positions.setdefault(values, len(positions))
+                if votes > max_votes or (
+                    votes == max_votes and position < positions[most_voted]
+                ):
+                    most_voted, max_votes = values, votes
+        except TypeError:
+            # e.g., unhashable values, which cannot be counted
+            self._reset_tally()
+            raise
+        self._most_voted = (most_voted, max_votes)
+        self._n_tallied = len(self)
+
+    @property
+    def tally(self) -> Counter:
+        """Get the count of the payloads' values. It must not be modified."""
+        self._catch_up()
+        return self._tally
+
+    @property
+    def most_voted(self) -> Optional[Tuple[Tuple[Any, ...], int]]:
+        """Get the most voted payload values along with their votes, or `None` if there are no payloads."""
+        self._catch_up()
+        return self._most_voted
+
+
 class CollectionRound(AbstractRound, ABC):
     """
     CollectionRound.
@@ -1263,7 +1678,17 @@ class CollectionRound(AbstractRound, ABC):
     def __init__(self, *args: Any, **kwargs: Any):
         """Initialize the collection round."""
         super().__init__(*args, **kwargs)
-        self.collection: Dict[str, BaseTxPayload] = {}
+        self._collection = PayloadCollection()
+
+    @property
+    def collection(self) -> PayloadCollection:
+        """The collected payloads by sender, which values are tallied as they are collected."""
+        return self._collection
+
+    @collection.setter
+    def collection(self, collection: DeserializedCollection) -> None:
+        """Set the collected payloads."""
+        self._collection = PayloadCollection(collection)
 
     @staticmethod
     def serialize_collection(
@@ -1302,7 +1727,7 @@ class CollectionRound(AbstractRound, ABC):
     @property
     def payload_values_count(self) -> Counter:
         """Get count of payload values."""
-        return Counter(map(lambda p: p.values, self.payloads))
+        return Counter(self.collection.tally)
 
     def process_payload(self, payload: BaseTxPayload) -> None:
         """Process payload."""
@@ -1397,9 +1822,9 @@ class CollectDifferentUntilAllRound(_CollectUntilAllRound, ABC):
     def check_payload(self, payload: BaseTxPayload) -> None:
         """Check Payload"""
         new = payload.values
-        existing = [payload_.values for payload_ in self.collection.values()]
 
-        if payload.sender not in self.collection and new in existing:
+        if payload.sender not in self.collection and new in self.collection.tally:
+            existing = [payload_.values for payload_ in self.collection.values()]
             raise TransactionNotValidError(
                 f"`CollectDifferentUntilAllRound` encountered a value '{new}' that already exists. "
                 f"All values: {existing}"
@@ -1418,13 +1843,13 @@ class CollectSameUntilAllRound(_CollectUntilAllRound, ABC):
     def check_payload(self, payload: BaseTxPayload) -> None:
         """Check Payload"""
         new = payload.values
-        existing_ = [payload_.values for payload_ in self.collection.values()]
 
         if (
             payload.sender not in self.collection
             and len(self.collection)
-            and new not in existing_
+            and new not in self.collection.tally
         ):
+            existing_ = [payload_.values for payload_ in self.collection.values()]
             raise TransactionNotValidError(
                 f"`CollectSameUntilAllRound` encountered a value '{new}' "
                 f"which is not the same as the already existing one: '{existing_[0]}'"
@@ -1444,9 +1869,7 @@ class CollectSameUntilAllRound(_CollectUntilAllRound, ABC):
         self,
     ) -> Tuple[Any, ...]:
         """Get the common payload among the agents."""
-        most_common_payload_values, max_votes = self.payload_values_count.most_common(
-            1
-        )[0]
+        most_common_payload_values, max_votes = self.collection.most_voted or ((), 0)
         if max_votes < self.synchronized_data.max_participants:
             raise ABCIAppInternalError(
                 f"{max_votes} votes are not enough for `CollectSameUntilAllRound`. Expected: "
@@ -1484,10 +1907,8 @@ class CollectSameUntilThresholdRound(CollectionRound, ABC):
         self,
     ) -> bool:
         """Check if the threshold has been reached."""
-        counts = self.payload_values_count.values()
-        return any(
-            count >= self.synchronized_data.consensus_threshold for count in counts
-        )
+        _, max_votes = self.collection.most_voted or ((), 0)
+        return max_votes >= self.synchronized_data.consensus_threshold
 
     @property
     def most_voted_payload(
@@ -1505,9 +1926,7 @@ class CollectSameUntilThresholdRound(CollectionRound, ABC):
         self,
     ) -> Tuple[Any, ...]:
         """Get the most voted payload values."""
-        most_voted_payload_values, max_votes = self.payload_values_count.most_common()[
-            0
-        ]
+        most_voted_payload_values, max_votes = self.collection.most_voted or ((), 0)
         if max_votes < self.synchronized_data.consensus_threshold:
             raise ABCIAppInternalError("not enough votes")
         return most_voted_payload_values
@@ -2563,9 +2982,16 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
         WAITING_FOR_DELIVER_TX = "waiting_for_deliver_tx"
         WAITING_FOR_COMMIT = "waiting_for_commit"
 
-    def __init__(self, abci_app_cls: Type[AbciApp]):
+    def __init__(
+        self,
+        abci_app_cls: Type[AbciApp],
+        max_blocks: Optional[int] = None,
+        blocks_spill_dir: Optional[str] = None,
+    ):
         """Initialize the round."""
-        self._blockchain = Blockchain()
+        self._max_blocks = max_blocks
+        self._blocks_spill_dir = blocks_spill_dir
+        self._blockchain = self._new_blockchain()
         self._syncing_up = True
 
         self._block_construction_phase = (
@@ -2624,6 +3050,17 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
             raise ABCIAppInternalError("AbciApp not set")  # pragma: nocover
         return self._abci_app
 
+    def _new_blockchain(
+        self, height_offset: int = 0, is_init: bool = True
+    ) -> Blockchain:
+        """Create a blockchain with the configured retention."""
+        return Blockchain(
+            height_offset,
+            is_init,
+            max_blocks=self._max_blocks,
+            spill_dir=self._blocks_spill_dir,
+        )
+
     @property
     def blockchain(self) -> Blockchain:
         """Get the Blockchain instance."""
@@ -2680,7 +3117,7 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
     def last_timestamp(self) -> datetime.datetime:
         """Get the last timestamp."""
         last_timestamp = (
-            self._blockchain.blocks[-1].timestamp
+            self._blockchain.last_block.timestamp
             if self._blockchain.length != 0
             else None
         )
@@ -2773,7 +3210,7 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
     def init_chain(self, initial_height: int) -> None:
         """Init chain."""
         # reduce `initial_height` by 1 to get block count offset as per Tendermint protocol
-        self._blockchain = Blockchain(initial_height - 1)
+        self._blockchain = self._new_blockchain(initial_height - 1)
 
     def begin_block(self, header: Header) -> None:
         """Begin block."""
@@ -2882,7 +3319,7 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
             self._block_construction_phase = (
                 RoundSequence._BlockConstructionState.WAITING_FOR_BEGIN_BLOCK
             )
-        self._blockchain = Blockchain(is_init=is_init)
+        self._blockchain = self._new_blockchain(is_init=is_init)
 
     def _update_round(self) -> None:
         """
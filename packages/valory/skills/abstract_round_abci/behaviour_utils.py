@@ -26,6 +26,7 @@ import json
 import pprint
 import re
 import sys
+import time
 from abc import ABC, ABCMeta, abstractmethod
 from enum import Enum
 from functools import partial
@@ -117,6 +118,8 @@ GENESIS_TIME_FMT = "%Y-%m-%dT%H:%M:%S.%fZ"
 INITIAL_APP_HASH = ""
 INITIAL_HEIGHT = "0"
 TM_REQ_TIMEOUT = 5  # 5 seconds
+# the request kwarg with the unix time after which the ledger connection cancels the request
+REQUEST_DEADLINE_KWARG = "request_deadline"
 
 
 class SendException(Exception):
@@ -1625,6 +1628,7 @@ class BaseBehaviour(
         self,
         performative: LedgerApiMessage.Performative,
         ledger_callable: str,
+        timeout: Optional[float] = None,
         **kwargs: Any,
     ) -> Generator[None, None, LedgerApiMessage]:
         """
@@ -1637,6 +1641,7 @@ class BaseBehaviour(
 
         :param performative: the message performative
         :param ledger_callable: the callable to call on the contract
+        :param timeout: seconds to wait for the response, after which the ledger connection cancels the request.
         :param kwargs: keyword argument for the contract api request
         :return: the contract api response
         :yields: the contract api response
@@ -1644,6 +1649,8 @@ class BaseBehaviour(
         ledger_api_dialogues = cast(
             LedgerApiDialogues, self.context.ledger_api_dialogues
         )
+        if timeout is not None:
+            kwargs[REQUEST_DEADLINE_KWARG] = time.time() + timeout
         kwargs = {
             "performative": performative,
             "counterparty": LEDGER_API_ADDRESS,
@@ -1663,7 +1670,8 @@ class BaseBehaviour(
             request_nonce
         ] = self.get_callback_request()
         self.context.outbox.put_message(message=ledger_api_msg)
-        response = yield from self.wait_for_message()
+        # notify caller by propagating potential timeout exception.
+        response = yield from self.wait_for_message(timeout=timeout)
         return response
 
     def get_contract_api_response(
@@ -1672,6 +1680,7 @@ class BaseBehaviour(
         contract_address: Optional[str],
         contract_id: str,
         contract_callable: str,
+        timeout: Optional[float] = None,
         **kwargs: Any,
     ) -> Generator[None, None, ContractApiMessage]:
         """
@@ -1686,6 +1695,7 @@ class BaseBehaviour(
         :param contract_address: the contract address
         :param contract_id: the contract id
         :param contract_callable: the callable to call on the contract
+        :param timeout: seconds to wait for the response, after which the ledger connection cancels the request.
         :param kwargs: keyword argument for the contract api request
         :return: the contract api response
         :yields: the contract api response
@@ -1693,6 +1703,8 @@ class BaseBehaviour(
         contract_api_dialogues = cast(
             ContractApiDialogues, self.context.contract_api_dialogues
         )
+        if timeout is not None:
+            kwargs[REQUEST_DEADLINE_KWARG] = time.time() + timeout
         kwargs = {
             "performative": performative,
             "counterparty": LEDGER_API_ADDRESS,
@@ -1716,7 +1728,8 @@ class BaseBehaviour(
             request_nonce
         ] = self.get_callback_request()
         self.context.outbox.put_message(message=contract_api_msg)
-        response = yield from self.wait_for_message()
+        # notify caller by propagating potential timeout exception.
+        response = yield from self.wait_for_message(timeout=timeout)
         return response
 
     @staticmethod
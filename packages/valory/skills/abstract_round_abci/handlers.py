@@ -46,9 +46,11 @@ from packages.valory.skills.abstract_abci.handlers import ABCIHandler
 from packages.valory.skills.abstract_round_abci.base import (
     ABCIAppInternalError,
     AddBlockError,
+    DEFAULT_SIGNATURE_CACHE_SIZE,
     ERROR_CODE,
     LateArrivingTransaction,
     OK_CODE,
+    SignatureCache,
     SignatureNotValidError,
     Transaction,
     TransactionNotValidError,
@@ -73,6 +75,14 @@ class ABCIRoundHandler(ABCIHandler):
 
     SUPPORTED_PROTOCOL = AbciMessage.protocol_id
 
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize the handler."""
+        signature_cache_size = kwargs.pop(
+            "signature_cache_size", DEFAULT_SIGNATURE_CACHE_SIZE
+        )
+        super().__init__(**kwargs)
+        self.signature_cache = SignatureCache(signature_cache_size)
+
     def info(  # pylint: disable=no-self-use,useless-super-delegation
         self, message: AbciMessage, dialogue: AbciDialogue
     ) -> AbciMessage:
@@ -158,7 +168,9 @@ class ABCIRoundHandler(ABCIHandler):
         # check we can decode the transaction
         try:
             transaction = Transaction.decode(transaction_bytes)
-            transaction.verify(self.context.default_ledger_id)
+            self.signature_cache.verify(
+                transaction, transaction_bytes, self.context.default_ledger_id
+            )
             cast(SharedState, self.context.state).round_sequence.check_is_finished()
         except (
             SignatureNotValidError,
@@ -198,7 +210,9 @@ class ABCIRoundHandler(ABCIHandler):
         shared_state = cast(SharedState, self.context.state)
         try:
             transaction = Transaction.decode(transaction_bytes)
-            transaction.verify(self.context.default_ledger_id)
+            self.signature_cache.verify(
+                transaction, transaction_bytes, self.context.default_ledger_id
+            )
             shared_state.round_sequence.check_is_finished()
             shared_state.round_sequence.deliver_tx(transaction)
         except (
@@ -262,6 +276,7 @@ class ABCIRoundHandler(ABCIHandler):
         except AddBlockError as exception:
             self._log_exception(exception)
             raise exception
+        self.context.logger.debug(f"Signature verifications: {self.signature_cache}")
         # The Merkle root hash of the application state.
         data = self.context.state.round_sequence.root_hash
         # Blocks below this height may be removed. Defaults to 0 (retain all).
@@ -49,6 +49,7 @@ from packages.valory.skills.abstract_round_abci.base import (
     AbciApp,
     AbciAppDB,
     BaseSynchronizedData,
+    DBHashMode,
     ROUND_COUNT_DEFAULT,
     RoundSequence,
     VALUE_NOT_PROVIDED,
@@ -303,6 +304,17 @@ class BaseParams(
         )
         self.tendermint_p2p_url: str = self._ensure("tendermint_p2p_url", kwargs, str)
         self.use_termination: bool = self._ensure("use_termination", kwargs, bool)
+        # optional, defaulting to the hash of the previous versions, so that the services keep their app hashes
+        self.db_hash_mode: DBHashMode = DBHashMode(
+            kwargs.pop("db_hash_mode", DBHashMode.LEGACY.value)
+        )
+        # optional, defaulting to copying the values of the db on every access, as the previous versions do
+        self.db_read_only_values: bool = kwargs.pop("db_read_only_values", False)
+        # optional, defaulting to keeping all the blocks in memory until the blockchain is reset
+        self.max_blocks_in_memory: Optional[int] = kwargs.pop(
+            "max_blocks_in_memory", None
+        )
+        self.blocks_spill_dir: Optional[str] = kwargs.pop("blocks_spill_dir", None)
         self.setup_params: Dict[str, Any] = self._ensure("setup", kwargs, dict)
 
         # we sanitize for null values as these are just kept for schema definitions
@@ -436,13 +448,20 @@ class SharedState(Model, ABC, metaclass=_MetaSharedState):  # type: ignore
 
     def setup(self) -> None:
         """Set up the model."""
-        self._round_sequence = RoundSequence(self.abci_app_cls)
-        setup_params = cast(BaseParams, self.context.params).setup_params
+        params = cast(BaseParams, self.context.params)
+        self._round_sequence = RoundSequence(
+            self.abci_app_cls,
+            max_blocks=params.max_blocks_in_memory,
+            blocks_spill_dir=params.blocks_spill_dir,
+        )
+        setup_params = params.setup_params
         self.round_sequence.setup(
             BaseSynchronizedData(
                 AbciAppDB(
                     setup_data=AbciAppDB.data_to_lists(setup_params),
                     cross_period_persisted_keys=self.abci_app_cls.cross_period_persisted_keys,
+                    hash_mode=params.db_hash_mode,
+                    read_only_values=params.db_read_only_values,
                 )
             ),
             self.context.logger,
@@ -25,6 +25,7 @@ import json
 import logging
 import re
 import shutil
+import tracemalloc
 from abc import ABC
 from contextlib import suppress
 from copy import copy, deepcopy
@@ -80,9 +81,11 @@ from packages.valory.skills.abstract_round_abci.base import (
     BlockBuilder,
     Blockchain,
     CollectionRound,
+    DBHashMode,
     EventType,
     LateArrivingTransaction,
     RoundSequence,
+    SignatureCache,
     SignatureNotValidError,
     Timeouts,
     Transaction,
@@ -199,7 +202,9 @@ def test_base_tx_payload() -> None:
     assert type(hash(payload)) == int
 
 
-def test_meta_round_abstract_round_when_instance_not_subclass_of_abstract_round() -> None:
+def test_meta_round_abstract_round_when_instance_not_subclass_of_abstract_round() -> (
+    None
+):
     """Test instantiation of meta class when instance not a subclass of abstract round."""
 
     class MyAbstractRound(metaclass=_MetaAbstractRound):
@@ -317,6 +322,38 @@ def test_verify_transaction_negative_case(*_mocks: Any) -> None:
         transaction.verify("")
 
 
+def test_signature_cache() -> None:
+    """Test that the signatures of the transactions are verified once, and that the cache is bounded."""
+    cache = SignatureCache(max_size=2)
+    transactions = [
+        Transaction(PayloadA(sender=f"sender_{i}"), "signature") for i in range(3)
+    ]
+    with mock.patch(
+        "aea.crypto.ledger_apis.LedgerApis.recover_message",
+        side_effect=lambda **kwargs: {json.loads(kwargs["message"])["sender"]},
+    ) as recover_message:
+        for transaction in (*transactions[:2], *transactions[:2]):
+            cache.verify(transaction, transaction.encode(), "ethereum")
+        assert (recover_message.call_count, cache.hits, cache.misses) == (2, 2, 2)
+        assert cache.hit_rate == 0.5
+
+        # the least recently verified transaction is forgotten
+        cache.verify(transactions[2], transactions[2].encode(), "ethereum")
+        assert len(cache) == 2
+        cache.verify(transactions[1], transactions[1].encode(), "ethereum")
+        cache.verify(transactions[0], transactions[0].encode(), "ethereum")
+        assert recover_message.call_count == 4
+        assert "hits=3, misses=4, hit_rate=42.9%" in repr(cache)
+
+        # the transactions with invalid signatures are not cached
+        recover_message.side_effect = lambda **_: {"wrong_sender"}
+        forged = Transaction(PayloadA(sender="sender_0"), "forged")
+        for _ in range(2):
+            with pytest.raises(SignatureNotValidError):
+                cache.verify(forged, forged.encode(), "ethereum")
+        assert recover_message.call_count == 6
+
+
 @dataclass(frozen=True)
 class SomeClass(BaseTxPayload):
     """Test class."""
@@ -343,6 +380,14 @@ def test_initialize_block() -> None:
     assert block.transactions == tuple()
 
 
+@dataclass(frozen=True)
+class DummyHeader:
+    """A header which can be spilled to disk."""
+
+    height: int
+    timestamp: datetime.datetime = datetime.datetime(2023, 1, 1)
+
+
 class TestBlockchain:
     """Test a blockchain object."""
 
@@ -386,6 +431,82 @@ class TestBlockchain:
         """Test 'blocks' property getter."""
         assert self.blockchain.blocks == tuple()
 
+    @pytest.mark.parametrize("spill", (False, True))
+    def test_retention(self, spill: bool, tmp_path: Path) -> None:
+        """Test that only the last blocks are kept in memory, and that the older ones are spilled, if configured."""
+        height_offset, max_blocks, n_blocks = 10, 3, 8
+        blockchain = Blockchain(
+            height_offset,
+            max_blocks=max_blocks,
+            spill_dir=str(tmp_path) if spill else None,
+        )
+        assert blockchain.max_blocks == max_blocks
+        blocks = [
+            Block(
+                DummyHeader(height_offset + i + 1),
+                [Transaction(PayloadA(f"sender_{i}"), "signature")],
+            )
+            for i in range(n_blocks)
+        ]
+        for block in blocks:
+            blockchain.add_block(block)
+
+        assert blockchain.height == height_offset + n_blocks
+        assert blockchain.length == n_blocks
+        assert blockchain.blocks == tuple(blocks[-max_blocks:])
+        assert blockchain.last_block is blocks[-1]
+        for i, block in enumerate(blocks[-max_blocks:], n_blocks - max_blocks):
+            assert blockchain.get_block(height_offset + i + 1) is block
+        # the log is anonymous, so that it is deleted along with the blockchain
+        assert not list(tmp_path.iterdir())
+
+        evicted_height = height_offset + 1
+        if spill:
+            spilled = blockchain.get_block(evicted_height)
+            assert spilled.header == blocks[0].header
+            assert spilled.transactions == blocks[0].transactions
+            assert (
+                blockchain.get_block(height_offset + n_blocks - max_blocks).header
+                == blocks[-max_blocks - 1].header
+            )
+        else:
+            with pytest.raises(
+                ValueError, match="was evicted from memory and not spilled"
+            ):
+                blockchain.get_block(evicted_height)
+
+        for height in (height_offset, height_offset + n_blocks + 1):
+            with pytest.raises(ValueError, match=f"no block at height {height}"):
+                blockchain.get_block(height)
+
+        with pytest.raises(ValueError, match="`max_blocks` must be positive, got 0."):
+            Blockchain(max_blocks=0)
+
+    def test_soak(self, tmp_path: Path) -> None:
+        """Test that the memory of a blockchain with a bounded retention does not grow with its blocks."""
+        blockchain = Blockchain(max_blocks=100, spill_dir=str(tmp_path))
+        payload = SomeClass(sender="sender", content={"data": "0" * 1024})
+
+        def add_blocks(n_blocks: int) -> None:
+            """Add blocks of a kilobyte-sized transaction."""
+            for _ in range(n_blocks):
+                header = DummyHeader(blockchain.height + 1)
+                blockchain.add_block(Block(header, [Transaction(payload, "0x")]))
+
+        tracemalloc.start()
+        try:
+            add_blocks(1000)
+            warm = tracemalloc.get_traced_memory()[0]
+            add_blocks(9000)
+            grown = tracemalloc.get_traced_memory()[0] - warm
+        finally:
+            tracemalloc.stop()
+
+        assert blockchain.length == 10_000
+        assert len(blockchain.blocks) == 100
+        # only the offsets of the spilled blocks are kept, about 8 bytes per block
+        assert grown < 9000 * 64
+
 
 class TestBlockBuilder:
     """Test block builder."""
@@ -610,6 +731,34 @@ class TestAbciAppDB:
             f"by updating the item(s) retrieved via the `{mutable_getters}` method(s)!"
         )
 
+    def test_read_only_values(self) -> None:
+        """Test that the read-only values are read without copying them, and cannot be modified."""
+        db = AbciAppDB(
+            setup_data=dict(participants=[self.participants]), read_only_values=True
+        )
+        assert db.read_only_values
+        assert not self.db.read_only_values
+
+        mutable_key = "mutable"
+        mutable_value = ["test"]
+        db.update(**{mutable_key: mutable_value.copy()})
+        retrieved = db.get_strict(mutable_key)
+        with pytest.raises(TypeError, match="values are read-only"):
+            retrieved.append("new_value_attempt")
+        # the values are read without copying them
+        assert db.get(mutable_key) is db.get_latest()[mutable_key]
+
+        # the copies are mutable
+        copied = db.get_copy(mutable_key)
+        copied.append("new_value")
+        assert copied == ["test", "new_value"]
+        assert db.get(mutable_key) == mutable_value
+
+        # the synced values are read-only too
+        db.sync(db.serialize())
+        with pytest.raises(TypeError, match="values are read-only"):
+            db.get_strict(mutable_key).append("new_value_attempt")
+
     def test_increment_round_count(self) -> None:
         """Test increment_round_count."""
         assert self.db.round_count == -1
@@ -924,6 +1073,70 @@ class TestAbciAppDB:
         expected_hash = b"\x89j\xd8\xf7\x9b\x98>\x97b|\xbeI~y\x8b\x9a\xba\x92\xd4I\x05 \xe8\xc9\xcaQ\x80\xbf{:\xef\xc2"
         assert self.db.hash() == expected_hash
 
+    def test_incremental_hash(self) -> None:
+        """Test that the incremental hash only depends on the data, not on the operations which produced them."""
+        db = AbciAppDB(
+            setup_data=dict(participants=[self.participants]),
+            hash_mode=DBHashMode.INCREMENTAL,
+        )
+        assert db.hash_mode == DBHashMode.INCREMENTAL
+        assert db.hash() != self.db.hash()
+
+        def update_and_cleanup() -> None:
+            """Update the db twice, then clean up the histories before hashing."""
+            db.update(a=5)
+            db.update(a=6)
+            db.cleanup_current_histories(2)
+
+        initial_hash = db.hash()
+        hashes = {initial_hash}
+        for operation in (
+            lambda: db.update(a=1, b={"c": [1, 2]}),
+            lambda: db.update(a=2),
+            lambda: db.create(
+                all_participants=self.participants,
+                consensus_threshold=2,
+                safe_contract_address="0x",
+            ),
+            lambda: db.update(a=3),
+            lambda: db.update(a=4),
+            lambda: db.cleanup_current_histories(1),
+            update_and_cleanup,
+            lambda: db.cleanup(1),
+        ):
+            operation()
+            hash_ = db.hash()
+            assert hash_ not in hashes
+            hashes.add(hash_)
+
+            synced_db = AbciAppDB(setup_data={}, hash_mode="incremental")
+            synced_db.sync(db.serialize())
+            assert synced_db.hash() == hash_
+
+        db.sync(self.db.serialize())
+        assert db.hash() == initial_hash
+
+    @pytest.mark.parametrize("sync", (False, True))
+    def test_incremental_hash_after_unhashed_cleanup(self, sync: bool) -> None:
+        """Test the incremental hash when a period is updated and cleaned up before it is hashed."""
+        db = AbciAppDB(
+            setup_data=dict(participants=[self.participants]),
+            hash_mode=DBHashMode.INCREMENTAL,
+        )
+        if sync:
+            db.hash()
+            db.sync(self.db.serialize())
+        db.update(a=1)
+        db.create(
+            all_participants=self.participants,
+            consensus_threshold=2,
+            safe_contract_address="0x",
+        )
+        db.cleanup(1)
+        synced_db = AbciAppDB(setup_data={}, hash_mode="incremental")
+        synced_db.sync(db.serialize())
+        assert db.hash() == synced_db.hash()
+
 
 class TestBaseSynchronizedData:
     """Test 'BaseSynchronizedData' class."""
@@ -1184,7 +1397,6 @@ class TestAbstractRound:
         ):
 
             class MyConcreteRound(AbstractRound):
-
                 synchronized_data_class = MagicMock()
                 payload_attribute = MagicMock()
                 # here payload_class is missing
@@ -21,7 +21,10 @@
 
 # pylint: skip-file
 
+import copy
+import pickle  # nosec
 import re
+from collections import Counter
 from enum import Enum
 from typing import FrozenSet, List, Optional, Tuple, Union, cast
 
@@ -31,6 +34,7 @@ from packages.valory.skills.abstract_round_abci.base import (
     ABCIAppInternalError,
     BaseSynchronizedData,
     BaseTxPayload,
+    PayloadCollection,
     TransactionNotValidError,
 )
 from packages.valory.skills.abstract_round_abci.test_tools.rounds import (
@@ -137,6 +141,73 @@ class TestCollectionRound(_BaseRoundTestClass):
 
         self._test_payload_with_wrong_round_count(self.test_round)
 
+    def test_payload_values_count(self) -> None:
+        """Test that the payloads' values are tallied as they are collected."""
+
+        def assert_tally_consistent(collection: PayloadCollection) -> None:
+            """Assert that the tally is the count of the collection's values."""
+            expected = Counter(payload.values for payload in collection.values())
+            assert list(collection.tally.most_common()) == expected.most_common()
+            assert collection.most_voted == next(iter(expected.most_common(1)), None)
+
+        # "b" and "a" are tied, then "a" gets ahead, then they are tied again, and "b", first voted, wins the tie
+        values = ["b", "a", "c", "a", "b"]
+        for i, value in enumerate(values):
+            self.test_round.collection[f"agent_{i}"] = DummyTxPayload(
+                f"agent_{i}", value
+            )
+            assert_tally_consistent(self.test_round.collection)
+        assert self.test_round.payload_values_count == Counter(
+            {("b", None): 2, ("a", None): 2, ("c", None): 1}
+        )
+        assert self.test_round.collection.most_voted == (("b", None), 2)
+
+        # the tally is rebuilt when the collected payloads are replaced or removed
+        collection = self.test_round.collection
+        collection["agent_0"] = DummyTxPayload("agent_0", "c")
+        assert_tally_consistent(collection)
+        del collection["agent_1"]
+        assert_tally_consistent(collection)
+        collection.pop("agent_2")
+        collection.update({"agent_3": DummyTxPayload("agent_3", "b")})
+        assert_tally_consistent(collection)
+        collection.clear()
+        assert collection.most_voted is None
+        assert_tally_consistent(collection)
+
+        # the collection is tallied, even when it is set directly
+        self.test_round.collection = {
+            participant: DummyTxPayload(participant, "a")
+            for participant in self.participants
+        }
+        assert isinstance(self.test_round.collection, PayloadCollection)
+        assert self.test_round.collection.most_voted == (
+            ("a", None),
+            len(self.participants),
+        )
+
+        # a copy tallies its payloads on its own
+        collection = self.test_round.collection
+        for copy_ in (
+            copy.copy(collection),
+            copy.deepcopy(collection),
+            pickle.loads(pickle.dumps(collection)),  # nosec
+        ):
+            assert isinstance(copy_, PayloadCollection)
+            assert copy_ == collection
+            copy_["agent_4"] = DummyTxPayload("agent_4", "b")
+            assert_tally_consistent(copy_)
+            assert_tally_consistent(collection)
+            copy_["agent_0"] = DummyTxPayload("agent_0", "b")
+            assert_tally_consistent(copy_)
+            assert_tally_consistent(collection)
+            assert collection.most_voted == (("a", None), len(self.participants))
+
+        # the unhashable values cannot be counted, as with a `Counter`
+        self.test_round.collection["agent_0"] = DummyTxPayload("agent_0", ["a"])  # type: ignore
+        with pytest.raises(TypeError, match="unhashable"):
+            _ = self.test_round.payload_values_count
+
 
 class TestCollectDifferentUntilAllRound(_BaseRoundTestClass):
     """Test class for CollectDifferentUntilAllRound."""
@@ -212,6 +212,33 @@ class TestABCIRoundHandler:
         assert response.performative == AbciMessage.Performative.RESPONSE_DELIVER_TX
         assert response.code == ERROR_CODE
 
+    @mock.patch.object(handlers, "Transaction")
+    def test_signature_verified_once(self, transaction_mock: MagicMock) -> None:
+        """Test that the signature of a transaction is verified on 'check_tx', and not again on 'deliver_tx'."""
+        for handle, performative, kwargs in (
+            (
+                self.handler.check_tx,
+                AbciMessage.Performative.REQUEST_CHECK_TX,
+                dict(type=CheckTxType(CheckTxTypeEnum.NEW)),
+            ),
+            (
+                self.handler.deliver_tx,
+                AbciMessage.Performative.REQUEST_DELIVER_TX,
+                {},
+            ),
+        ):
+            message, dialogue = self.dialogues.create(
+                counterparty="", performative=performative, tx=b"tx", **kwargs
+            )
+            response = handle(cast(AbciMessage, message), cast(AbciDialogue, dialogue))
+            assert response.code == OK_CODE
+
+        transaction_mock.decode.return_value.verify.assert_called_once()
+        assert (
+            self.handler.signature_cache.hits,
+            self.handler.signature_cache.misses,
+        ) == (1, 1)
+
     @pytest.mark.parametrize("request_height", tuple(range(3)))
     def test_end_block(self, request_height: int) -> None:
         """Test the 'end_block' handler method."""
@@ -41,6 +41,7 @@ from typing_extensions import Literal, TypedDict
 from packages.valory.skills.abstract_round_abci.base import (
     AbstractRound,
     BaseSynchronizedData,
+    DBHashMode,
     ROUND_COUNT_DEFAULT,
 )
 from packages.valory.skills.abstract_round_abci.models import (
@@ -383,6 +384,10 @@ class TestSharedState:
             "test": [],
             "all_participants": list(range(4)),
         }
+        shared_state.context.params.db_hash_mode = DBHashMode.LEGACY
+        shared_state.context.params.db_read_only_values = False
+        shared_state.context.params.max_blocks_in_memory = None
+        shared_state.context.params.blocks_spill_dir = None
         shared_state.setup()
 
     def test_setup(self, *_: Any) -> None:
@@ -418,6 +423,10 @@ class TestSharedState:
             "test": [],
             "all_participants": [["0x0"]],
         }
+        shared_state.context.params.db_hash_mode = DBHashMode.LEGACY
+        shared_state.context.params.db_read_only_values = False
+        shared_state.context.params.max_blocks_in_memory = None
+        shared_state.context.params.blocks_spill_dir = None
         shared_state.setup()
         shared_state.round_sequence.abci_app._round_results = [MagicMock()]
         shared_state.synchronized_data
@@ -431,6 +440,10 @@ class TestSharedState:
                 "oracle_contract_address": "0xoracle",
                 "all_participants": "0x0",
             }
+            mock_params.db_hash_mode = DBHashMode.LEGACY
+            mock_params.db_read_only_values = False
+            mock_params.max_blocks_in_memory = None
+            mock_params.blocks_spill_dir = None
             shared_state.setup()
             assert (
                 shared_state.synchronized_data.db.get_strict("safe_contract_address")
@@ -470,6 +483,10 @@ class TestSharedState:
             "test": [],
             "all_participants": ["0x0"],
         }
+        shared_state.context.params.db_hash_mode = DBHashMode.LEGACY
+        shared_state.context.params.db_read_only_values = False
+        shared_state.context.params.max_blocks_in_memory = None
+        shared_state.context.params.blocks_spill_dir = None
         shared_state.setup()
         shared_state.synchronized_data.update(participants=tuple(range(n_participants)))
         shared_state.address_to_acn_deliverable = address_to_acn_deliverable
@@ -19,7 +19,10 @@
 
 """Test the utils.py module of the skill."""
 
+import json
+import pickle  # nosec
 from collections import defaultdict
+from copy import copy, deepcopy
 from string import printable
 from typing import Any, Dict, List, Tuple, Type
 from unittest import mock
@@ -35,6 +38,7 @@ from packages.valory.skills.abstract_round_abci.utils import (
     VerifyDrand,
     consensus_threshold,
     filter_negative,
+    freeze,
     get_data_from_nested_dict,
     get_value_with_type,
     is_json_serializable,
@@ -252,6 +256,48 @@ def test_is_json_serializable(valid_obj: Any, invalid_obj: Any) -> None:
     assert not is_json_serializable(invalid_obj)
 
 
+@given(
+    st.recursive(
+        st.none() | st.booleans() | st.integers() | st.text(printable),
+        lambda children: st.lists(children)
+        | st.tuples(children, children)
+        | st.dictionaries(st.text(printable), children),
+    )
+)
+def test_freeze(obj: Any) -> None:
+    """Test `freeze`."""
+    frozen = freeze(obj)
+    assert frozen == obj
+    assert json.dumps(frozen) == json.dumps(obj)
+    assert freeze(frozen) is frozen
+    assert deepcopy(frozen) == obj
+    assert pickle.loads(pickle.dumps(frozen)) == obj  # nosec
+
+
+def test_frozen_containers() -> None:
+    """Test that the frozen containers cannot be modified, but their copies can."""
+    frozen = freeze({"list": [1, {"a": 2}]})
+    for modify in (
+        lambda: frozen.update(b=1),
+        lambda: frozen.__setitem__("b", 1),
+        lambda: frozen.pop("list"),
+        lambda: frozen["list"].append(3),
+        lambda: frozen["list"].sort(),
+        lambda: frozen["list"].__iadd__([3]),
+        lambda: frozen["list"][1].setdefault("b", 3),
+    ):
+        with pytest.raises(TypeError, match="values are read-only"):
+            modify()
+    assert frozen == {"list": [1, {"a": 2}]}
+
+    shallow_copy = copy(frozen)
+    shallow_copy["b"] = 1
+    deep_copy = deepcopy(frozen)
+    deep_copy["list"][1]["b"] = 3
+    assert (type(shallow_copy), type(deep_copy["list"])) == (dict, list)
+    assert frozen == {"list": [1, {"a": 2}]}
+
+
 @given(
     positive=st.dictionaries(st.text(), st.integers(min_value=0)),
     negative=st.dictionaries(st.text(), st.integers(max_value=-1)),
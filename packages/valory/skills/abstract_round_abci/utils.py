@@ -22,9 +22,11 @@
 import builtins
 import collections
 import dataclasses
+import operator
 import sys
 import types
 import typing
+from copy import deepcopy
 from hashlib import sha256
 from math import ceil
 from typing import (
@@ -477,6 +479,81 @@ def is_json_serializable(obj: Any) -> bool:
     return is_primitive_or_none(obj)
 
 
+def _read_only(self: Any, *_args: Any, **_kwargs: Any) -> None:
+    """Refuse to modify a read-only container."""
+    raise TypeError(
+        f"`{type(self).__name__}` values are read-only, copy them to modify them, e.g., with `deepcopy`."
+    )
+
+
+class FrozenList(list):
+    """
+    A list which cannot be modified.
+
+    Only built by `freeze`, so its items are read-only too. Its copies are mutable lists.
+    """
+
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only  # type: ignore
+
+    def __copy__(self) -> List[Any]:
+        """Get a mutable shallow copy."""
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> List[Any]:
+        """Get a mutable deep copy."""
+        return [deepcopy(item, memo) for item in self]
+
+    def __reduce__(self) -> Tuple[Type["FrozenList"], Tuple[List[Any]]]:
+        """Reduce without appending the items, for pickling."""
+        return FrozenList, (list(self),)
+
+
+class FrozenDict(dict):
+    """
+    A dict which cannot be modified.
+
+    Only built by `freeze`, so its values are read-only too. Its copies are mutable dicts.
+    """
+
+    clear = pop = popitem = setdefault = update = _read_only  # type: ignore
+    __setitem__ = __delitem__ = __ior__ = _read_only  # type: ignore
+
+    def __copy__(self) -> Dict[Any, Any]:
+        """Get a mutable shallow copy."""
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[Any, Any]:
+        """Get a mutable deep copy."""
+        return {key: deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self) -> Tuple[Type["FrozenDict"], Tuple[Dict[Any, Any]]]:
+        """Reduce without setting the items, for pickling."""
+        return FrozenDict, (dict(self),)
+
+
+def freeze(obj: Any) -> Any:
+    """
+    Get a read-only equivalent of a json serializable object.
+
+    The lists and dicts are copied to read-only ones, while the parts of the object which are already read-only are shared.
+
+    :param obj: the object to freeze.
+    :return: the read-only object.
+    """
+    if isinstance(obj, (FrozenList, FrozenDict)):
+        return obj
+    if isinstance(obj, list):
+        return FrozenList(freeze(item) for item in obj)
+    if isinstance(obj, dict):
+        return FrozenDict((key, freeze(value)) for key, value in obj.items())
+    if isinstance(obj, tuple):
+        items = tuple(freeze(item) for item in obj)
+        # keep the tuples which only contain read-only items, and their type
+        return obj if all(map(operator.is_, items, obj)) else items
+    return obj
+
+
 def filter_negative(mapping: Dict[str, int]) -> Iterator[str]:
     """Return the keys of a dictionary for which the values are negative integers."""
     return (key for key, number in mapping.items() if number < 0)
@@ -20,9 +20,21 @@
 """This module contains the behaviours for the 'keep3r_job_abci' skill."""
 import json
 from abc import ABC
-from typing import Any, Dict, Generator, List, Optional, Set, Tuple, Type, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    cast,
+)
 
 from aea.configurations.data_types import PublicId
+from aea.protocols.base import Message
 from hexbytes import HexBytes
 
 from packages.valory.contracts.curve_pool.contract import CurvePoolContract
@@ -45,14 +57,27 @@ from packages.valory.contracts.keep3r_v1.contract import Keep3rV1Contract
 from packages.valory.contracts.keep3r_v2.contract import KeeperV2
 from packages.valory.protocols.contract_api.message import ContractApiMessage
 from packages.valory.protocols.ledger_api.message import LedgerApiMessage
-from packages.valory.skills.abstract_round_abci.base import AbstractRound
+from packages.valory.skills.abstract_round_abci.base import (
+    AbstractRound,
+    LEDGER_API_ADDRESS,
+)
+from packages.valory.skills.abstract_round_abci.behaviour_utils import TimeoutException
 from packages.valory.skills.abstract_round_abci.behaviours import (
     AbstractRoundBehaviour,
     BaseBehaviour,
 )
+from packages.valory.skills.abstract_round_abci.dialogues import (
+    ContractApiDialogue,
+    ContractApiDialogues,
+)
+from packages.valory.skills.abstract_round_abci.models import Requests
 from packages.valory.skills.keep3r_job_abci.dynamic_package_loader import load_contract
 from packages.valory.skills.keep3r_job_abci.io_.loader import ContractPackageLoader
-from packages.valory.skills.keep3r_job_abci.models import Params, SharedState
+from packages.valory.skills.keep3r_job_abci.models import (
+    ContractStateKey,
+    Params,
+    SharedState,
+)
 from packages.valory.skills.keep3r_job_abci.payloads import (
     ActivationTxPayload,
     ApproveBondTxPayload,
@@ -108,6 +133,27 @@ AUTO_GAS_LIMIT = 0
 
 TO_WEI = 10**18
 
+# the contract state reads which take the block to read at, so the read cache makes them at the block it is scoped to
+BLOCK_PINNED_READS = frozenset(
+    {
+        "allowance",
+        "blacklist",
+        "bond",
+        "bondings",
+        "can_activate_after",
+        "can_withdraw_after",
+        "credits",
+        "get_balance",
+        "get_jobs",
+        "get_keeper_state",
+        "is_keeper",
+        "pending_bonds",
+        "pending_unbonds",
+    }
+)
+# the reads which do not depend on the state of the chain, cached for as long as the block too
+BLOCK_INDEPENDENT_READS = frozenset({"get_off_chain_data"})
+
 
 class Keep3rJobBaseBehaviour(BaseBehaviour, ABC):
     """Base state behaviour for the simple abci skill."""
@@ -115,6 +161,7 @@ class Keep3rJobBaseBehaviour(BaseBehaviour, ABC):
     def __init__(self, **kwargs: Any) -> None:
         """Init behaviour"""
         super().__init__(**kwargs, loader_cls=ContractPackageLoader)
+        self._latest_block: Optional[Dict[str, Any]] = None
 
     job_to_contract_id: Dict[str, PublicId] = {}
 
@@ -160,6 +207,136 @@ class Keep3rJobBaseBehaviour(BaseBehaviour, ABC):
         """Return the manual gas limit."""
         return self.context.params.manual_gas_limit
 
+    def async_act_wrapper(self) -> Generator:
+        """Do the act, fetching the latest block afresh on every attempt."""
+        self._latest_block = None
+        yield from super().async_act_wrapper()
+
+    def clean_up(self) -> None:
+        """Forget the latest block once the round is over."""
+        super().clean_up()
+        self._latest_block = None
+
+    def get_latest_block(self) -> Generator[None, None, Optional[Dict[str, Any]]]:
+        """
+        Get the latest block.
+
+        When the read cache is used, the block is fetched once per attempt of the behaviour's act,
+        and the contract state cache is moved to it.
+
+        :return: the latest block, or None if something went wrong
+        :yield: None
+        """
+        if self._latest_block is not None:
+            return self._latest_block
+
+        ledger_api_response = yield from self.get_ledger_api_response(
+            performative=LedgerApiMessage.Performative.GET_STATE,
+            ledger_callable="get_block",
+            block_identifier="latest",
+        )
+        if ledger_api_response.performative != LedgerApiMessage.Performative.STATE:
+            log_msg = "Failed ledger get_block call"
+            self.context.logger.error(f"{log_msg}: {ledger_api_response}")
+            return None
+        block = cast(Dict[str, Any], ledger_api_response.state.body)
+        if self.params.use_read_cache and block.get("number") is not None:
+            self._latest_block = block
+            cache = cast(SharedState, self.context.state).contract_state_cache
+            cache.update_block(block["number"])
+            self.context.logger.info(
+                f"Contract state cache at block {cache.block_number}: "
+                f"{cache.hits} hits, {cache.misses} misses."
+            )
+        return block
+
+    def get_contract_api_response(
+        self,
+        performative: ContractApiMessage.Performative,
+        contract_address: Optional[str],
+        contract_id: str,
+        contract_callable: str,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Generator[None, None, ContractApiMessage]:
+        """
+        Get the contract api response, consulting the read cache first for the cacheable `GET_STATE` requests.
+
+        The cached reads of the chain state are made at the block of the cache, not at the latest block.
+        The other requests, e.g. the `simulate_tx` ones, are never cached.
+
+        :param performative: the message performative
+        :param contract_address: the contract address
+        :param contract_id: the contract id
+        :param contract_callable: the callable to call on the contract
+        :param timeout: the timeout for the request
+        :param kwargs: the keyword arguments of the contract callable
+        :return: the contract api response
+        :yield: None
+        """
+        cache_key = None
+        if (
+            self.params.use_read_cache
+            and performative == ContractApiMessage.Performative.GET_STATE
+            and (
+                contract_callable in BLOCK_PINNED_READS
+                or contract_callable in BLOCK_INDEPENDENT_READS
+            )
+        ):
+            yield from self.get_latest_block()
+            cache_key = self._get_cache_key(
+                contract_id, contract_address, contract_callable, kwargs
+            )
+            if cache_key is not None and contract_callable in BLOCK_PINNED_READS:
+                *_, block_number = cache_key
+                kwargs["block_identifier"] = block_number
+        shared_state = cast(SharedState, self.context.state)
+        if cache_key is not None:
+            cached_response = shared_state.contract_state_cache.get(cache_key)
+            if cached_response is not None:
+                return cast(ContractApiMessage, cached_response)
+
+        contract_api_response = yield from super().get_contract_api_response(
+            performative,
+            contract_address,
+            contract_id,
+            contract_callable,
+            timeout,
+            **kwargs,
+        )
+        if (
+            cache_key is not None
+            and contract_api_response.performative
+            == ContractApiMessage.Performative.STATE
+        ):
+            shared_state.contract_state_cache.set(cache_key, contract_api_response)
+        return contract_api_response
+
+    def _with_block_number(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the latest block number to the kwargs of a job's call, if it is known, so that the job does not request it."""
+        if self._latest_block is not None:
+            kwargs.setdefault("block_number", self._latest_block["number"])
+        return kwargs
+
+    def _get_cache_key(
+        self,
+        contract_id: str,
+        contract_address: Optional[str],
+        contract_callable: str,
+        kwargs: Dict[str, Any],
+    ) -> Optional[ContractStateKey]:
+        """Get the read cache key of a contract state read, or None if the latest block is unknown."""
+        if self._latest_block is None:
+            return None
+        shared_state = cast(SharedState, self.context.state)
+        return shared_state.contract_state_cache.make_key(
+            contract_id,
+            contract_address,
+            contract_callable,
+            kwargs,
+            self._latest_block["number"],
+        )
+
     def _call_keep3r_v1(
         self, **kwargs: Any
     ) -> Generator[None, None, ContractApiMessage]:
@@ -200,6 +377,108 @@ class Keep3rJobBaseBehaviour(BaseBehaviour, ABC):
             return None
         return contract_api_response.state.body.get("data")
 
+    def read_keep3r_many(
+        self, address: str
+    ) -> Generator[None, None, Optional[Dict[str, Any]]]:
+        """
+        Read all the keeper state needed for path selection in a single request.
+
+        The reads are aggregated in one Multicall3 `eth_call`,
+        so all the returned fields refer to the same block.
+
+        :param address: the keeper address
+        :return: the keeper state, or None if something went wrong
+        :yield: None
+        """
+        keeper_state = yield from self.read_keep3r(
+            "get_keeper_state",
+            address=address,
+            bonding_asset=self.params.bonding_asset,
+            k3pr_address=self.params.k3pr_address,
+            spender=self.bond_spender,
+            multicall_address=self.params.multicall3_address,
+        )
+        if keeper_state is None:
+            # something went wrong
+            return None
+        if any(value is None for value in keeper_state.values()):
+            self.context.logger.error(f"Incomplete keeper state: {keeper_state}")
+            return None
+        return cast(Dict[str, Any], keeper_state)
+
+    def record_gas_spent(
+        self, transaction_hashes: List[str]
+    ) -> Generator[None, None, bool]:
+        """
+        Record the gas spent by the given transactions in the gas ledger.
+
+        Only the transactions in which the safe emitted `ExecutionSuccess` are recorded,
+        i.e. the same transactions that the reconciliation finds on chain.
+
+        :param transaction_hashes: the hashes of the transactions to record
+        :return: whether the transactions were recorded
+        :yield: None
+        """
+        gas_spent = yield from self.read_keep3r(
+            "get_gas_spent", transaction_hashes=transaction_hashes
+        )
+        if gas_spent is None:
+            # something went wrong
+            return False
+        safe_address = self.synchronized_data.safe_contract_address.lower()
+        ledger = cast(SharedState, self.context.state).gas_ledger
+        for tx_hash, spent in gas_spent.items():
+            executed_safes = {safe.lower() for safe in spent["executed_safes"]}
+            if safe_address not in executed_safes:
+                # only the successful executions of the safe are accounted for
+                continue
+            ledger.record(
+                tx_hash, spent["block_number"], spent["sender"], spent["amount"]
+            )
+        ledger.save()
+        return True
+
+    def send_contract_api_request(
+        self,
+        callback: Callable[[Message, BaseBehaviour], None],
+        contract_address: str,
+        contract_id: str,
+        contract_callable: str,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Send a contract api `GET_STATE` request, without waiting for its response.
+
+        Unlike `get_contract_api_response`, this allows multiple requests to be in flight at the same time.
+
+        :param callback: the callback to call with the response
+        :param contract_address: the contract address
+        :param contract_id: the contract id
+        :param contract_callable: the callable to call on the contract
+        :param kwargs: keyword argument for the contract api request
+        :return: the nonce of the request
+        """
+        contract_api_dialogues = cast(
+            ContractApiDialogues, self.context.contract_api_dialogues
+        )
+        contract_api_msg, contract_api_dialogue = contract_api_dialogues.create(
+            performative=ContractApiMessage.Performative.GET_STATE,
+            counterparty=LEDGER_API_ADDRESS,
+            ledger_id=self.context.default_ledger_id,
+            contract_address=contract_address,
+            contract_id=contract_id,
+            callable=contract_callable,
+            kwargs=ContractApiMessage.Kwargs(kwargs),
+        )
+        contract_api_dialogue = cast(ContractApiDialogue, contract_api_dialogue)
+        contract_api_dialogue.terms = self._get_default_terms()
+        request_nonce = self._get_request_nonce_from_dialogue(contract_api_dialogue)
+        cast(Requests, self.context.requests).request_id_to_callback[
+            request_nonce
+        ] = callback
+        self.context.outbox.put_message(message=contract_api_msg)
+        return request_nonce
+
     def has_bonded(
         self, address: str, bonding_asset: str
     ) -> Generator[None, None, Optional[bool]]:
@@ -274,18 +553,11 @@ class Keep3rJobBaseBehaviour(BaseBehaviour, ABC):
                 return None
             can_activate_after = bond_time + bond
 
-        ledger_api_response = yield from self.get_ledger_api_response(
-            performative=LedgerApiMessage.Performative.GET_STATE,
-            ledger_callable="get_block",
-            block_identifier="latest",
-        )
-        if ledger_api_response.performative != LedgerApiMessage.Performative.STATE:
-            log_msg = "Failed ledger get_block call in has_bonded"
-            self.context.logger.error(f"{log_msg}: {ledger_api_response}")
+        latest_block = yield from self.get_latest_block()
+        if latest_block is None:
+            # something went wrong
             return None
-        latest_block_timestamp = cast(
-            int, ledger_api_response.state.body.get("timestamp")
-        )
+        latest_block_timestamp = cast(int, latest_block.get("timestamp"))
         remaining_time = can_activate_after - latest_block_timestamp
         self.context.logger.info(f"Remaining bond time: {remaining_time}")
         return remaining_time <= 0
@@ -370,18 +642,11 @@ class Keep3rJobBaseBehaviour(BaseBehaviour, ABC):
         if can_withdraw_after is None:
             # something went wrong
             return None
-        ledger_api_response = yield from self.get_ledger_api_response(
-            performative=LedgerApiMessage.Performative.GET_STATE,
-            ledger_callable="get_block",
-            block_identifier="latest",
-        )
-        if ledger_api_response.performative != LedgerApiMessage.Performative.STATE:
-            log_msg = "Failed ledger get_block call in has_bonded"
-            self.context.logger.error(f"{log_msg}: {ledger_api_response}")
+        latest_block = yield from self.get_latest_block()
+        if latest_block is None:
+            # something went wrong
             return None
-        latest_block_timestamp = cast(
-            int, ledger_api_response.state.body.get("timestamp")
-        )
+        latest_block_timestamp = cast(int, latest_block.get("timestamp"))
         remaining_time = can_withdraw_after - latest_block_timestamp
         self.context.logger.info(f"Remaining withdraw time: {remaining_time}")
         return remaining_time <= 0
@@ -493,7 +758,7 @@ class Keep3rJobBaseBehaviour(BaseBehaviour, ABC):
             keep3r_address=safe_address,
             contract_id=str(contract_id),
             contract_callable="workable",
-            **kwargs,
+            **self._with_block_number(kwargs),
         )
         if contract_api_response.performative != ContractApiMessage.Performative.STATE:
             self.context.logger.error(
@@ -550,7 +815,7 @@ class Keep3rJobBaseBehaviour(BaseBehaviour, ABC):
             contract_callable="build_work_tx",
             contract_address=job_address,
             keep3r_address=safe_address,
-            **kwargs,
+            **self._with_block_number(kwargs),
         )
         if contract_api_response.performative != ContractApiMessage.Performative.STATE:
             self.context.logger.error(
@@ -687,7 +952,16 @@ class PathSelectionBehaviour(Keep3rJobBaseBehaviour):
             all_supported_jobs = self.params.supported_jobs_to_package_hash
             yield from self.dynamically_load_contracts(all_supported_jobs)
 
+        yield from self._record_settled_tx()
+
         safe_address = self.synchronized_data.safe_contract_address
+        if self.context.params.use_v2 and self.params.multicall3_address is not None:
+            # read the whole keeper state at once instead of issuing a request per field
+            keeper_state = yield from self.read_keep3r_many(safe_address)
+            if keeper_state is None:
+                return None
+            return self._select_path_from_state(keeper_state)
+
         if not self.context.params.use_v2:
             # only keep3r v1 has "blacklist" functionality
             blacklisted = yield from self.read_keep3r("blacklist", address=safe_address)
@@ -784,6 +1058,71 @@ class PathSelectionBehaviour(Keep3rJobBaseBehaviour):
 
         return self.transitions["NOT_ACTIVATED"].name
 
+    def _record_settled_tx(self) -> Generator:
+        """Record the gas spent by the transaction settled in the previous period, if any, in the gas ledger."""
+        if self.params.withdraw_k3pr_only:
+            # the gas spent is not used if we are only withdrawing K3PR
+            return
+        db = self.synchronized_data.db
+        previous_period = db.get_latest_from_reset_index(db.reset_index - 1)
+        tx_hash = previous_period.get("final_tx_hash")
+        if (
+            tx_hash is None
+            or tx_hash in cast(SharedState, self.context.state).gas_ledger
+        ):
+            return
+        yield from self.record_gas_spent([tx_hash])
+
+    def _select_path_from_state(  # pylint: disable=too-many-return-statements
+        self, keeper_state: Dict[str, Any]
+    ) -> str:
+        """Select the path to traverse based on a keeper state read at a single block."""
+        if keeper_state["balance"] < self.params.insufficient_funds_threshold:
+            return self.transitions["INSUFFICIENT_FUNDS"].name
+
+        if keeper_state["can_activate_after"] == 0:
+            amount_to_approve = self.params.bond_amount - keeper_state["allowance"]
+            has_pending_bond = keeper_state["pending_bonds"] > 0
+            if amount_to_approve > 0 and not has_pending_bond:
+                return self.transitions["APPROVE_BOND"].name
+            return self.transitions["NOT_BONDED"].name
+
+        latest_block_timestamp = keeper_state["timestamp"]
+        if self.params.enable_k3pr_swap:
+            pending_unbonds = keeper_state["pending_unbonds"]
+            should_unbond_k3pr = keeper_state["bondings"] >= self.k3pr_threshold
+            if pending_unbonds == 0 and should_unbond_k3pr:
+                # we only unbond if we have reached the unbond threshold and we have no pending unbonds
+                return self.transitions["UNBOND"].name
+
+            remaining_withdraw_time = (
+                keeper_state["can_withdraw_after"] - latest_block_timestamp
+            )
+            self.context.logger.info(
+                f"Remaining withdraw time: {remaining_withdraw_time}"
+            )
+            if remaining_withdraw_time <= 0 and pending_unbonds > 0:
+                return self.transitions["WITHDRAW"].name
+
+            # check if we have already withdrawn funds that we need to swap
+            if keeper_state["withdrawn_funds"] > self.k3pr_threshold:
+                return self.transitions["WITHDRAW"].name
+        else:
+            self.context.logger.info(
+                "k3pr swap is disabled, skipping unbonding and withdrawing"
+            )
+
+        remaining_bond_time = (
+            keeper_state["can_activate_after"] - latest_block_timestamp
+        )
+        self.context.logger.info(f"Remaining bond time: {remaining_bond_time}")
+        if keeper_state["is_keeper"]:
+            # we check first if we are activated, because we can be bonded and activated at the same time
+            # this can happen if we decide to increase the bond.
+            return self.transitions["HEALTHY"].name
+
+        return self.transitions["NOT_ACTIVATED"].name
+
     def async_act(self) -> Generator:
         """Behaviour to select the path to traverse"""
 
@@ -1010,27 +1349,31 @@ class CalculateSpentGasBehaviour(Keep3rJobBaseBehaviour):
         # we end at the block in which the last unbonding event happened
         to_block = unbonding_events[-1]["block_number"]
 
-        transactions = yield from self._get_safe_txs(
+        is_reconciled = yield from self._reconcile_gas_ledger(
             keeper_address, from_block, to_block
         )
-        if transactions is None:
+        if not is_reconciled:
             # something went wrong
             return CalculateSpentGasRound.ERROR_PAYLOAD
 
-        transaction_hashes = [tx["tx_hash"] for tx in transactions]
-        tx_sender_to_gas_spent = yield from self._tx_sender_to_gas_spent(
-            transaction_hashes
-        )
+        # the spends are looked up from the ledger, without any requests
+        ledger = cast(SharedState, self.context.state).gas_ledger
+        tx_sender_to_gas_spent = ledger.spent(from_block, to_block)
         # pop blacklisted addresses
         for address in self.params.blacklisted_addresses:
-            if tx_sender_to_gas_spent is not None and address in tx_sender_to_gas_spent:
-                tx_sender_to_gas_spent.pop(address)
-        if tx_sender_to_gas_spent is None:
-            # something went wrong
-            return CalculateSpentGasRound.ERROR_PAYLOAD
+            tx_sender_to_gas_spent.pop(address, None)
         tx_sender_to_gas_spent_str = json.dumps(tx_sender_to_gas_spent, sort_keys=True)
         return tx_sender_to_gas_spent_str
 
+    @property
+    def _event_index_kwargs(self) -> Dict[str, Any]:
+        """Get the event index configuration, for the keep3r event reads."""
+        return dict(
+            index_path=self.params.event_index_path,
+            start_block=self.params.event_index_start_block,
+            confirmations=self.params.event_index_confirmations,
+        )
+
     def _get_latest_withdrawal_event(
         self, keeper_address: str, bonding_asset: str
     ) -> Generator[None, None, Optional[Dict]]:
@@ -1039,6 +1382,7 @@ class CalculateSpentGasBehaviour(Keep3rJobBaseBehaviour):
             "get_withdrawal_events",
             address=keeper_address,
             bonding_asset=bonding_asset,
+            **self._event_index_kwargs,
         )
         if withdrawal_events is None:
             # something went wrong
@@ -1094,6 +1438,7 @@ class CalculateSpentGasBehaviour(Keep3rJobBaseBehaviour):
             "get_unbonding_events",
             address=keeper_address,
             bonding_asset=bonding_asset,
+            **self._event_index_kwargs,
         )
         if unbonding_events is None:
             # something went wrong
@@ -1124,19 +1469,43 @@ class CalculateSpentGasBehaviour(Keep3rJobBaseBehaviour):
         self.context.logger.info(f"{log_msg}: {contract_api_response}")
         return cast(List[Dict], contract_api_response.state.body.get("txs"))
 
-    def _tx_sender_to_gas_spent(
-        self, transaction_hashes: List[str]
-    ) -> Generator[None, None, Optional[Dict[str, int]]]:
-        """Get a mapping of tx senders to the amount of eth they've spent on gas for the given tx hashes."""
-        tx_sender_to_gas_spent = yield from self.read_keep3r(
-            "sender_to_amount_spent",
-            transaction_hashes=transaction_hashes,
-        )
-        if tx_sender_to_gas_spent is None:
-            # something went wrong
-            return None
+    def _reconcile_gas_ledger(
+        self, safe_address: str, from_block: int, to_block: int
+    ) -> Generator[None, None, bool]:
+        """
+        Record the safe txs of the blocks in the given range that the gas ledger does not cover yet.
 
-        return cast(Dict[str, int], tx_sender_to_gas_spent)
+        The blocks are caught up from the edge of the covered range, in chunks of `gas_ledger_catch_up_blocks`,
+        and each chunk is persisted once covered, so a failed reconciliation resumes where it stopped.
+
+        :param safe_address: the safe address
+        :param from_block: the first block of the range
+        :param to_block: the last block of the range
+        :return: whether the ledger covers the range
+        :yield: None
+        """
+        ledger = cast(SharedState, self.context.state).gas_ledger
+        for uncovered_from, uncovered_to in ledger.uncovered(
+            from_block, to_block, self.params.gas_ledger_catch_up_blocks
+        ):
+            transactions = yield from self._get_safe_txs(
+                safe_address, uncovered_from, uncovered_to
+            )
+            if transactions is None:
+                # something went wrong
+                return False
+
+            # the txs recorded when they were settled are not fetched again
+            transaction_hashes = [
+                tx["tx_hash"] for tx in transactions if tx["tx_hash"] not in ledger
+            ]
+            if len(transaction_hashes) > 0:
+                is_recorded = yield from self.record_gas_spent(transaction_hashes)
+                if not is_recorded:
+                    return False
+            ledger.cover(uncovered_from, uncovered_to)
+            ledger.save()
+        return True
 
 
 class SwapAndDisburseRewardsBehaviour(Keep3rJobBaseBehaviour):
@@ -1746,14 +2115,139 @@ class PerformWorkBehaviour(Keep3rJobBaseBehaviour):
 
     def _get_workable_job(self) -> Generator[None, None, Optional[str]]:
         """Get the workable jobs."""
-        job_list = self.synchronized_data.job_list
-        job_list.sort()
+        job_list = sorted(self.synchronized_data.job_list)
+        if self.params.workable_scan_parallelism > 1:
+            workable_job = yield from self._scan_workable_jobs(job_list)
+            return workable_job
         for job in job_list:
             is_workable = yield from self._is_workable(job)
             if is_workable:
                 return job
         return None
 
+    @staticmethod
+    def _first_workable_job(
+        job_list: List[str], job_to_workable: Dict[str, bool]
+    ) -> Tuple[bool, Optional[str]]:
+        """Get whether the first workable job in the list is known yet, and the job itself."""
+        for job in job_list:
+            if job not in job_to_workable:
+                # an earlier job is still being checked
+                return False, None
+            if job_to_workable[job]:
+                return True, job
+        return True, None
+
+    def _cache_off_chain_data(self, job: str, response: ContractApiMessage) -> None:
+        """Cache the off-chain data of a job, as `get_contract_api_response` would."""
+        contract_id = str(self.context.state.job_address_to_public_id[job])
+        cache_key = self._get_cache_key(contract_id, job, "get_off_chain_data", {})
+        if cache_key is not None:
+            shared_state = cast(SharedState, self.context.state)
+            shared_state.contract_state_cache.set(cache_key, response)
+
+    def _scan_workable_jobs(  # pylint: disable=too-many-locals
+        self, job_list: List[str]
+    ) -> Generator[None, None, Optional[str]]:
+        """
+        Check the workability of the jobs concurrently.
+
+        Up to `workable_scan_parallelism` jobs are checked at the same time.
+        The first workable job in the order of `job_list` is returned,
+        i.e. the same job that a serial scan would return.
+        The checks that are still outstanding once the answer is known are cancelled.
+        The checks that get no response within `workable_check_timeout` are assumed not workable.
+
+        :param job_list: the sorted job list
+        :return: the first workable job, or None if no job is workable
+        :yield: None
+        """
+        job_to_hash = {
+            job: self.params.supported_jobs_to_package_hash[job]
+            for job in job_list
+            if job not in self.context.state.job_address_to_public_id
+        }
+        if len(job_to_hash) > 0:
+            # if some contracts are not loaded yet, load them this can happen if this agent is restarted
+            yield from self.dynamically_load_contracts(job_to_hash)
+
+        if self.params.use_read_cache:
+            # the off-chain data are cached, so that they are not read again for the job that gets worked
+            yield from self.get_latest_block()
+
+        safe_address = self.synchronized_data.safe_contract_address
+        pending_jobs = list(job_list)
+        job_to_workable: Dict[str, bool] = {}
+        # request nonce -> (job, contract callable)
+        in_flight: Dict[str, Tuple[str, str]] = {}
+        responses: Dict[str, ContractApiMessage] = {}
+
+        def store_response(message: Message, _: BaseBehaviour) -> None:
+            """Store the response, to be processed by the scan."""
+            nonce = message.dialogue_reference[0]
+            if nonce in in_flight:
+                responses[nonce] = cast(ContractApiMessage, message)
+                return
+            self.context.logger.debug(f"Dropping cancelled workable check: {message}")
+
+        def check(job: str, contract_callable: str, **kwargs: Any) -> None:
+            """Send the next request of a job's workability check."""
+            contract_id = self.context.state.job_address_to_public_id[job]
+            nonce = self.send_contract_api_request(
+                store_response, job, str(contract_id), contract_callable, **kwargs
+            )
+            in_flight[nonce] = (job, contract_callable)
+
+        while True:
+            is_known, workable_job = self._first_workable_job(job_list, job_to_workable)
+            if is_known:
+                # cancel the outstanding checks, their responses will be dropped
+                in_flight.clear()
+                return workable_job
+
+            while len(pending_jobs) > 0 and (
+                len(in_flight) < self.params.workable_scan_parallelism
+            ):
+                check(pending_jobs.pop(0), "get_off_chain_data")
+
+            try:
+                yield from self.wait_for_condition(
+                    lambda: len(responses) > 0,
+                    timeout=self.params.workable_check_timeout,
+                )
+            except TimeoutException:
+                # every outstanding check was sent before the wait, so all of them have timed out
+                for job, contract_callable in in_flight.values():
+                    self.context.logger.error(
+                        f"Timed out on {contract_callable} for {job}."
+                    )
+                    job_to_workable[job] = False
+                # cancel the timed out checks, their late responses will be dropped
+                in_flight.clear()
+                continue
+            for nonce in list(responses.keys()):
+                response = responses.pop(nonce)
+                job, contract_callable = in_flight.pop(nonce)
+                if response.performative != ContractApiMessage.Performative.STATE:
+                    # something went wrong, assume this job is not workable
+                    self.context.logger.error(
+                        f"Failed {contract_callable} for {job}: {response}"
+                    )
+                    job_to_workable[job] = False
+                    continue
+                log_msg = f"`{contract_callable}` contract api response for {job}"
+                self.context.logger.info(f"{log_msg}: {response}")
+                if contract_callable == "get_off_chain_data":
+                    self._cache_off_chain_data(job, response)
+                    check(
+                        job,
+                        "workable",
+                        keep3r_address=safe_address,
+                        **self._with_block_number(dict(response.state.body)),
+                    )
+                    continue
+                job_to_workable[job] = bool(response.state.body.get("data"))
+
 
 class AwaitTopUpBehaviour(Keep3rJobBaseBehaviour):
     """AwaitTopUpBehaviour"""
@@ -17,8 +17,11 @@
 #
 # ------------------------------------------------------------------------------
 """This module contains the shared state for the 'keep3r_job_abci' application."""
+import bisect
+import json
+import os
 from enum import Enum
-from typing import Any, Dict, List, Type
+from typing import Any, Dict, List, Optional, Tuple, Type, cast
 
 from aea.configurations.data_types import PublicId
 from aea.exceptions import enforce
@@ -42,6 +45,186 @@ Requests = BaseRequests
 BenchmarkTool = BaseBenchmarkTool
 
 
+ContractStateKey = Tuple[str, str, str, str, int]
+
+
+class ContractStateCache:
+    """A read-through cache of contract state, scoped to a single block."""
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self.block_number: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[ContractStateKey, Any] = {}
+
+    def __len__(self) -> int:
+        """Get the number of cached entries."""
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(
+        contract_id: str,
+        contract_address: Optional[str],
+        contract_callable: str,
+        kwargs: Dict[str, Any],
+        block_number: int,
+    ) -> ContractStateKey:
+        """Make the key of a contract state read."""
+        serialized_kwargs = json.dumps(kwargs, sort_keys=True, default=str)
+        return (
+            contract_id,
+            str(contract_address),
+            contract_callable,
+            serialized_kwargs,
+            block_number,
+        )
+
+    def update_block(self, block_number: int) -> None:
+        """Move the cache to the given block, invalidating it if the block has changed."""
+        if block_number != self.block_number:
+            self._entries.clear()
+            self.block_number = block_number
+
+    def get(self, key: ContractStateKey) -> Optional[Any]:
+        """Get a cached value, or None if it is not cached for the current block."""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def set(self, key: ContractStateKey, value: Any) -> None:
+        """Cache a value, if it belongs to the current block."""
+        *_, block_number = key
+        if block_number == self.block_number:
+            self._entries[key] = value
+
+
+class GasLedger:
+    """
+    A persistent ledger of the gas spent by the senders of the safe transactions.
+
+    Each successful execution of the safe is recorded once, when it is settled or when the ledger is reconciled
+    with the chain, so that all the agents record the same transactions.
+    The ledger is complete for the contiguous block range that it covers,
+    so the spends in that range are looked up from cumulative sums, without any requests.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Initialize the ledger, loading it from the path if it exists."""
+        self.path = path
+        self.covered: Optional[Tuple[int, int]] = None
+        # tx hash -> (block number, sender, amount spent in wei)
+        self._records: Dict[str, Tuple[int, str, int]] = {}
+        self._blocks: List[int] = []
+        self._cumulative: List[Dict[str, int]] = []
+        self._dirty = False
+        if path is not None and os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                stored = json.load(file)
+            covered = stored["covered"]
+            self.covered = None if covered is None else (covered[0], covered[1])
+            self._records = {
+                tx_hash: (record[0], record[1], record[2])
+                for tx_hash, record in stored["records"].items()
+            }
+            self._dirty = True
+
+    def __contains__(self, tx_hash: object) -> bool:
+        """Check if a transaction has been recorded."""
+        return tx_hash in self._records
+
+    def record(self, tx_hash: str, block_number: int, sender: str, amount: int) -> None:
+        """Record the gas spent by a transaction, if it has not been recorded yet."""
+        if tx_hash in self._records:
+            return
+        self._records[tx_hash] = (block_number, sender, amount)
+        self._dirty = True
+
+    def uncovered(
+        self, from_block: int, to_block: int, max_blocks: Optional[int] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        Get the block ranges that need to be reconciled for the ledger to cover the given range.
+
+        The ranges are split in chunks of at most `max_blocks` blocks,
+        ordered outwards from the covered range, so that covering them in order keeps the covered range contiguous.
+
+        :param from_block: the first block of the range
+        :param to_block: the last block of the range
+        :param max_blocks: the maximum number of blocks of a chunk, or None to not split the ranges
+        :return: the block ranges to reconcile, in order
+        """
+        if self.covered is None:
+            return self._split(from_block, to_block, max_blocks)
+        covered_from, covered_to = self.covered
+        ranges: List[Tuple[int, int]] = []
+        if from_block < covered_from:
+            below = self._split(from_block, covered_from - 1, max_blocks)
+            ranges.extend(reversed(below))
+        if to_block > covered_to:
+            ranges.extend(self._split(covered_to + 1, to_block, max_blocks))
+        return ranges
+
+    @staticmethod
+    def _split(
+        from_block: int, to_block: int, max_blocks: Optional[int]
+    ) -> List[Tuple[int, int]]:
+        """Split a block range in consecutive chunks of at most `max_blocks` blocks."""
+        if max_blocks is None:
+            return [(from_block, to_block)]
+        return [
+            (chunk_from, min(chunk_from + max_blocks - 1, to_block))
+            for chunk_from in range(from_block, to_block + 1, max_blocks)
+        ]
+
+    def cover(self, from_block: int, to_block: int) -> None:
+        """Mark a reconciled block range, adjacent to the covered one, as covered."""
+        if self.covered is None:
+            self.covered = (from_block, to_block)
+            return
+        self.covered = (
+            min(self.covered[0], from_block),
+            max(self.covered[1], to_block),
+        )
+
+    def spent(self, from_block: int, to_block: int) -> Dict[str, int]:
+        """Get the amount spent in gas by each sender, in the given block range."""
+        if self._dirty:
+            self._rebuild()
+        start = bisect.bisect_left(self._blocks, from_block)
+        end = bisect.bisect_right(self._blocks, to_block)
+        upper = self._cumulative[end - 1] if end > 0 else {}
+        lower = self._cumulative[start - 1] if start > 0 else {}
+        sender_to_spent = {
+            sender: amount - lower.get(sender, 0) for sender, amount in upper.items()
+        }
+        return {sender: spent for sender, spent in sender_to_spent.items() if spent > 0}
+
+    def save(self) -> None:
+        """Persist the ledger, if it has a path."""
+        if self.path is None:
+            return
+        stored = dict(covered=self.covered, records=self._records)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(stored, file)
+        os.replace(tmp_path, self.path)
+
+    def _rebuild(self) -> None:
+        """Rebuild the cumulative spends per sender, in block order."""
+        records = sorted(self._records.values())
+        self._blocks = [block_number for block_number, _, _ in records]
+        self._cumulative = []
+        totals: Dict[str, int] = {}
+        for _, sender, amount in records:
+            totals[sender] = totals.get(sender, 0) + amount
+            self._cumulative.append(dict(totals))
+        self._dirty = False
+
+
 class SharedState(BaseSharedState):
     """Keep the current shared state of the skill."""
 
@@ -50,8 +233,23 @@ class SharedState(BaseSharedState):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the shared state object."""
         self.job_address_to_public_id: Dict[str, PublicId] = {}
+        self.contract_state_cache = ContractStateCache()
+        self._gas_ledger: Optional[GasLedger] = None
         super().__init__(*args, **kwargs)
 
+    def setup(self) -> None:
+        """Set up the model, reloading the gas ledger on first use."""
+        super().setup()
+        self._gas_ledger = None
+
+    @property
+    def gas_ledger(self) -> GasLedger:
+        """Get the gas ledger, loading it on first use."""
+        if self._gas_ledger is None:
+            params = cast(Params, self.context.params)
+            self._gas_ledger = GasLedger(params.gas_ledger_path)
+        return self._gas_ledger
+
 
 class Params(BaseParams):  # pylint: disable=too-many-instance-attributes
     """Parameters."""
@@ -82,6 +280,9 @@ class Params(BaseParams):  # pylint: disable=too-many-instance-attributes
         self.bonding_asset = self._ensure("bonding_asset", kwargs, str)
         self.bond_amount = self._ensure("bond_amount", kwargs, int)
         self.use_v2 = self._ensure("use_v2", kwargs, bool)
+        self.multicall3_address: Optional[str] = self._ensure(
+            "multicall3_address", kwargs, Optional[str]
+        )
         self.supported_jobs_to_package_hash = self._get_supported_jobs_to_package_hash(
             kwargs
         )
@@ -111,6 +312,32 @@ class Params(BaseParams):  # pylint: disable=too-many-instance-attributes
             "blacklisted_addresses", kwargs, List[str]
         )
         self.service_endpoint_base = self._ensure("service_endpoint_base", kwargs, str)
+        self.event_index_path: Optional[str] = self._ensure(
+            "event_index_path", kwargs, Optional[str]
+        )
+        self.event_index_start_block: Optional[int] = self._ensure(
+            "event_index_start_block", kwargs, Optional[int]
+        )
+        enforce(
+            self.event_index_start_block is None or self.event_index_start_block >= 0,
+            "`event_index_start_block` must be greater than or equal to 0.",
+        )
+        self.event_index_confirmations: int = self._ensure_gte(
+            "event_index_confirmations", kwargs, int, min_value=0
+        )
+        self.gas_ledger_path: Optional[str] = self._ensure(
+            "gas_ledger_path", kwargs, Optional[str]
+        )
+        self.gas_ledger_catch_up_blocks: int = self._ensure_gte(
+            "gas_ledger_catch_up_blocks", kwargs, int, min_value=1
+        )
+        self.use_read_cache: bool = self._ensure("use_read_cache", kwargs, bool)
+        self.workable_scan_parallelism: int = self._ensure_gte(
+            "workable_scan_parallelism", kwargs, int, min_value=1
+        )
+        self.workable_check_timeout: float = self._ensure(
+            "workable_check_timeout", kwargs, float
+        )
         super().__init__(*args, **kwargs)
 
     def _get_supported_jobs_to_package_hash(self, kwargs: Dict) -> Dict[str, str]:
@@ -19,8 +19,9 @@
 
 """Tests for valory/keep3r_job_abci skill's behaviours."""
 
+import os
 from tempfile import TemporaryDirectory
-from typing import Any, Dict, Optional, Type, cast
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Type, cast
 from unittest import mock
 
 import pytest
@@ -34,6 +35,10 @@ from packages.valory.contracts.gnosis_safe.contract import (
 from packages.valory.contracts.keep3r_v1.contract import (
     PUBLIC_ID as KEEP3R_V1_CONTRACT_ID,
 )
+from packages.valory.contracts.keep3r_v2.contract import MULTICALL3_ADDRESS
+from packages.valory.contracts.keep3r_v2.contract import (
+    PUBLIC_ID as KEEP3R_V2_CONTRACT_ID,
+)
 from packages.valory.contracts.multisend.contract import (
     PUBLIC_ID as MULTISEND_CONTRACT_ID,
 )
@@ -43,6 +48,7 @@ from packages.valory.protocols.ledger_api.message import LedgerApiMessage
 from packages.valory.skills.abstract_round_abci.base import AbciAppDB, BaseTxPayload
 from packages.valory.skills.abstract_round_abci.behaviour_utils import (
     BaseBehaviour,
+    TimeoutException,
     make_degenerate_behaviour,
 )
 from packages.valory.skills.abstract_round_abci.test_tools.base import (
@@ -122,6 +128,20 @@ DUMMY_ADDRESS_TO_GAS_SPENT = {
     "0x0000000000000000000000000000000000000003": 4,
 }
 
+DUMMY_KEEPER_STATE: Dict[str, Any] = {
+    "block_number": 1,
+    "timestamp": 3 * SECONDS_PER_DAY + 1,
+    "balance": 1,
+    "can_activate_after": 3 * SECONDS_PER_DAY,
+    "pending_bonds": 0,
+    "allowance": 0,
+    "bondings": 1,
+    "pending_unbonds": 0,
+    "can_withdraw_after": 0,
+    "withdrawn_funds": 1,
+    "is_keeper": True,
+}
+
 
 class DummyRoundId:  # pylint: disable=too-few-public-methods
     """Dummy class for setting round_id for exit condition."""
@@ -162,6 +182,10 @@ class Keep3rJobFSMBehaviourBaseCase(FSMBehaviourBaseCase):
         )
         self.fast_forward(data)
 
+    def patch_params(self, **params: Any) -> Any:
+        """Patch the frozen params of the skill, for the duration of a `with` block."""
+        return mock.patch.dict(self.behaviour.context.params.__dict__, params)
+
     @property
     def current_behaviour(self) -> BaseBehaviour:
         """Current behaviour"""
@@ -200,6 +224,25 @@ class Keep3rJobFSMBehaviourBaseCase(FSMBehaviourBaseCase):
             ),
         )
 
+    def mock_read_keep3r_v2(self, contract_callable: str, data: Any) -> None:
+        """Mock keep3r V2 contract call"""
+
+        self.mock_contract_api_request(
+            request_kwargs=dict(
+                performative=ContractApiMessage.Performative.GET_STATE,
+                callable=contract_callable,
+            ),
+            contract_id=str(KEEP3R_V2_CONTRACT_ID),
+            response_kwargs=dict(
+                performative=ContractApiMessage.Performative.STATE,
+                callable=contract_callable,
+                state=ContractApiMessage.State(
+                    ledger_id="ethereum",
+                    body={"data": data},
+                ),
+            ),
+        )
+
     def mock_read_safe(
         self, contract_callable: str, data: Any, data_field: str = "data"
     ) -> None:
@@ -426,6 +469,95 @@ class TestPathSelectionBehaviour(Keep3rJobFSMBehaviourBaseCase):
             == degenerate_state.auto_behaviour_id()
         )
 
+    def test_read_cache(self, *_: Any) -> None:
+        """Test path_selection, reading the keeper state at the block of the read cache."""
+        with self.patch_params(use_read_cache=True):
+            self.behaviour.act_wrapper()
+            self.mock_get_latest_block({"number": 1, "timestamp": 0})
+            self.mock_contract_api_request(
+                request_kwargs=dict(
+                    performative=ContractApiMessage.Performative.GET_STATE,
+                    callable="blacklist",
+                    kwargs=ContractApiMessage.Kwargs(
+                        {"address": SOME_CONTRACT_ADDRESS, "block_identifier": 1}
+                    ),
+                ),
+                contract_id=str(KEEP3R_V1_CONTRACT_ID),
+                response_kwargs=dict(
+                    performative=ContractApiMessage.Performative.STATE,
+                    callable="blacklist",
+                    state=ContractApiMessage.State(
+                        ledger_id="ethereum",
+                        body={"data": True},
+                    ),
+                ),
+            )
+            self.mock_a2a_transaction()
+        cache = self.behaviour.context.state.contract_state_cache
+        assert cache.block_number == 1
+        assert len(cache) == 1
+        self._test_done_flag_set()
+        self.end_round(done_event=Event.BLACKLISTED)
+
+    @pytest.mark.parametrize(
+        "executed_safes, is_recorded",
+        [([SOME_CONTRACT_ADDRESS], True), ([], False)],
+    )
+    def test_record_settled_tx(
+        self, _: mock.Mock, executed_safes: List[str], is_recorded: bool
+    ) -> None:
+        """Test that the tx settled in the previous period is recorded, only if the safe executed it successfully."""
+        db = AbciAppDB(
+            setup_data=AbciAppDB.data_to_lists(
+                dict(
+                    safe_contract_address=SOME_CONTRACT_ADDRESS,
+                    participants=(AGENT_ADDRESS,),
+                    all_participants=(AGENT_ADDRESS,),
+                    consensus_threshold=1,
+                    final_tx_hash="0x0",
+                )
+            )
+        )
+        # the tx was settled in the previous period
+        db.create()
+        self.fast_forward_to_behaviour(
+            self.behaviour,
+            self.behaviour_class.auto_behaviour_id(),
+            SynchronizedData(db),
+        )
+        self.behaviour.act_wrapper()
+        self.mock_read_keep3r_v1(
+            "get_gas_spent",
+            {
+                "0x0": {
+                    "sender": AGENT_ADDRESS,
+                    "amount": 1,
+                    "block_number": 1,
+                    "status": True,
+                    "executed_safes": executed_safes,
+                }
+            },
+        )
+        self.mock_read_keep3r_v1("blacklist", True)
+        self.mock_a2a_transaction()
+        self._test_done_flag_set()
+        self.end_round(done_event=Event.BLACKLISTED)
+        ledger = self.behaviour.context.state.gas_ledger
+        assert ("0x0" in ledger) is is_recorded
+
+    def test_latest_block_scope(self, *_: Any) -> None:
+        """Test that the latest block is fetched afresh on every attempt, and forgotten with the round."""
+        behaviour = cast(PathSelectionBehaviour, self.current_behaviour)
+        behaviour._latest_block = {"number": 1}
+        with mock.patch.object(
+            BaseBehaviour, "async_act_wrapper", side_effect=lambda: iter([None])
+        ):
+            next(behaviour.async_act_wrapper())
+        assert behaviour._latest_block is None
+        behaviour._latest_block = {"number": 1}
+        behaviour.clean_up()
+        assert behaviour._latest_block is None
+
     def test_insufficient_funds(self, *_: Any) -> None:
         """Test path_selection to insufficient funds."""
         self.behaviour.act_wrapper()
@@ -556,6 +688,28 @@ class TestPathSelectionBehaviour(Keep3rJobFSMBehaviourBaseCase):
             == GetJobsRound.auto_round_id()
         )
 
+    @pytest.mark.parametrize(
+        "keeper_state, event",
+        [
+            (DUMMY_KEEPER_STATE, Event.HEALTHY),
+            ({**DUMMY_KEEPER_STATE, "balance": -1}, Event.INSUFFICIENT_FUNDS),
+            ({**DUMMY_KEEPER_STATE, "can_activate_after": 0}, Event.APPROVE_BOND),
+            ({**DUMMY_KEEPER_STATE, "bondings": 51 * TO_WEI}, Event.UNBOND),
+            ({**DUMMY_KEEPER_STATE, "pending_unbonds": 1}, Event.WITHDRAW),
+            ({**DUMMY_KEEPER_STATE, "is_keeper": False}, Event.NOT_ACTIVATED),
+        ],
+    )
+    def test_read_keep3r_many(
+        self, _: mock.Mock, keeper_state: Dict[str, Any], event: Event
+    ) -> None:
+        """Test path_selection when the keeper state is read in a single request."""
+        with self.patch_params(use_v2=True, multicall3_address=MULTICALL3_ADDRESS):
+            self.behaviour.act_wrapper()
+            self.mock_read_keep3r_v2("get_keeper_state", keeper_state)
+            self.mock_a2a_transaction()
+            self._test_done_flag_set()
+        self.end_round(done_event=event)
+
 
 class TestBondingBehaviour(Keep3rJobFSMBehaviourBaseCase):
     """Test BondingBehaviour"""
@@ -619,6 +773,18 @@ class TestCalculateSpentGasBehaviour(Keep3rJobFSMBehaviourBaseCase):
         {"block_number": 3},
     ]
     _DUMMY_SAFE_TX_EVENTS = [{"tx_hash": "0x0"}, {"tx_hash": "0x1"}, {"tx_hash": "0x2"}]
+    _DUMMY_GAS_SPENT = {
+        f"0x{i}": {
+            "sender": sender,
+            "amount": amount,
+            "block_number": 2 + i % 2,
+            "status": True,
+            "executed_safes": [SOME_CONTRACT_ADDRESS],
+        }
+        for i, (sender, amount) in enumerate(
+            list(DUMMY_ADDRESS_TO_GAS_SPENT.items())[:3]
+        )
+    }
 
     def test_no_unbond_event(self) -> None:
         """Test bonding tx"""
@@ -639,7 +805,120 @@ class TestCalculateSpentGasBehaviour(Keep3rJobFSMBehaviourBaseCase):
         self.mock_read_curve("get_token_transfer_events", self._DUMMY_EXCHANGE_EVENTS)
         self.mock_read_keep3r_v1("get_withdrawal_events", self._DUMMY_WITHDRAW_EVENTS)
         self.mock_read_safe("get_safe_txs", self._DUMMY_SAFE_TX_EVENTS, "txs")
-        self.mock_read_keep3r_v1("sender_to_amount_spent", DUMMY_ADDRESS_TO_GAS_SPENT)
+        self.mock_read_keep3r_v1("get_gas_spent", self._DUMMY_GAS_SPENT)
+        self.mock_a2a_transaction()
+        self._test_done_flag_set()
+        self.end_round(done_event=Event.DONE)
+        assert (
+            self.current_behaviour.auto_behaviour_id()
+            == SwapAndDisburseRewardsBehaviour.auto_behaviour_id()
+        )
+        ledger = self.behaviour.context.state.gas_ledger
+        assert ledger.covered == (2, 3)
+        assert ledger.spent(2, 3) == dict(list(DUMMY_ADDRESS_TO_GAS_SPENT.items())[:3])
+
+    def test_persisted_gas_ledger(self) -> None:
+        """Test that the gas ledger is reloaded from its path, after a restart."""
+        state = self.behaviour.context.state
+        with TemporaryDirectory() as temp_dir, self.patch_params(
+            gas_ledger_path=os.path.join(temp_dir, "gas_ledger.json")
+        ):
+            self.test_happy_path()
+            state.setup()
+            ledger = state.gas_ledger
+            assert ledger.covered == (2, 3)
+            assert ledger.spent(2, 3) == dict(
+                list(DUMMY_ADDRESS_TO_GAS_SPENT.items())[:3]
+            )
+
+    def test_catch_up_gas_ledger(self) -> None:
+        """Test that the blocks after the covered ones are caught up in chunks, without the settled txs."""
+        ledger = self.behaviour.context.state.gas_ledger
+        settled_tx_hash, settled = list(self._DUMMY_GAS_SPENT.items())[0]
+        ledger.record(
+            settled_tx_hash,
+            settled["block_number"],
+            settled["sender"],
+            settled["amount"],
+        )
+        ledger.cover(1, 1)
+        with self.patch_params(gas_ledger_catch_up_blocks=1):
+            self.behaviour.act_wrapper()
+            self.mock_read_keep3r_v1("get_unbonding_events", self._DUMMY_UNBOND_EVENTS)
+            self.mock_read_curve(
+                "get_token_transfer_events", self._DUMMY_EXCHANGE_EVENTS
+            )
+            self.mock_read_keep3r_v1(
+                "get_withdrawal_events", self._DUMMY_WITHDRAW_EVENTS
+            )
+            for block_number in (2, 3):
+                self.mock_contract_api_request(
+                    request_kwargs=dict(
+                        performative=ContractApiMessage.Performative.GET_STATE,
+                        callable="get_safe_txs",
+                        kwargs=ContractApiMessage.Kwargs(
+                            dict(from_block=block_number, to_block=block_number)
+                        ),
+                    ),
+                    contract_id=str(GNOSIS_SAFE_CONTRACT_ID),
+                    response_kwargs=dict(
+                        performative=ContractApiMessage.Performative.STATE,
+                        callable="get_safe_txs",
+                        state=ContractApiMessage.State(
+                            ledger_id="ethereum",
+                            body={
+                                "txs": [
+                                    {"tx_hash": tx_hash}
+                                    for tx_hash, spent in self._DUMMY_GAS_SPENT.items()
+                                    if spent["block_number"] == block_number
+                                ]
+                            },
+                        ),
+                    ),
+                )
+                # the receipt of the tx recorded at settlement is not requested again
+                gas_spent = {
+                    tx_hash: spent
+                    for tx_hash, spent in self._DUMMY_GAS_SPENT.items()
+                    if spent["block_number"] == block_number
+                    and tx_hash != settled_tx_hash
+                }
+                self.mock_contract_api_request(
+                    request_kwargs=dict(
+                        performative=ContractApiMessage.Performative.GET_STATE,
+                        callable="get_gas_spent",
+                        kwargs=ContractApiMessage.Kwargs(
+                            dict(transaction_hashes=list(gas_spent))
+                        ),
+                    ),
+                    contract_id=str(KEEP3R_V1_CONTRACT_ID),
+                    response_kwargs=dict(
+                        performative=ContractApiMessage.Performative.STATE,
+                        callable="get_gas_spent",
+                        state=ContractApiMessage.State(
+                            ledger_id="ethereum", body={"data": gas_spent}
+                        ),
+                    ),
+                )
+                # each chunk is covered as soon as it is reconciled
+                assert ledger.covered == (1, block_number)
+            self.mock_a2a_transaction()
+        self._test_done_flag_set()
+        self.end_round(done_event=Event.DONE)
+        assert ledger.spent(2, 3) == dict(list(DUMMY_ADDRESS_TO_GAS_SPENT.items())[:3])
+
+    def test_covered_by_gas_ledger(self) -> None:
+        """Test that the blocks covered by the gas ledger are not scanned again."""
+        ledger = self.behaviour.context.state.gas_ledger
+        for tx_hash, spent in self._DUMMY_GAS_SPENT.items():
+            ledger.record(
+                tx_hash, spent["block_number"], spent["sender"], spent["amount"]
+            )
+        ledger.cover(1, 3)
+        self.behaviour.act_wrapper()
+        self.mock_read_keep3r_v1("get_unbonding_events", self._DUMMY_UNBOND_EVENTS)
+        self.mock_read_curve("get_token_transfer_events", self._DUMMY_EXCHANGE_EVENTS)
+        self.mock_read_keep3r_v1("get_withdrawal_events", self._DUMMY_WITHDRAW_EVENTS)
         self.mock_a2a_transaction()
         self._test_done_flag_set()
         self.end_round(done_event=Event.DONE)
@@ -795,6 +1074,154 @@ class TestPerformWorkBehaviour(Keep3rJobFSMBehaviourBaseCase):
             == degenerate_state.auto_behaviour_id()
         )
 
+    def test_run_concurrent_scan(self) -> None:
+        """Test perform work, checking the workability of the jobs concurrently."""
+        self.behaviour.context.state.job_address_to_public_id[
+            DUMMY_CONTRACT
+        ] = TEST_JOB_CONTRACT_ID
+        with self.patch_params(workable_scan_parallelism=4):
+            self.behaviour.act_wrapper()
+            self.mock_get_off_chain_data()
+            self.mock_workable_call(True)
+            self.mock_get_off_chain_data()
+            self.mock_build_work_tx_call(DUMMY_DATA)
+            self.mock_simulate_tx(True)
+            self.mock_build_safe_raw_tx()
+            self.mock_a2a_transaction()
+        self._test_done_flag_set()
+        self.end_round(done_event=Event.WORK_TX)
+        degenerate_state = make_degenerate_behaviour(FinalizeWorkRound)
+        assert (
+            self.current_behaviour.auto_behaviour_id()
+            == degenerate_state.auto_behaviour_id()
+        )
+
+    @staticmethod
+    def _scan_response(nonce: str, body: Dict[str, Any]) -> ContractApiMessage:
+        """Build the response to a workability check request."""
+        return ContractApiMessage(
+            dialogue_reference=(nonce, "stub"),
+            performative=ContractApiMessage.Performative.STATE,
+            state=State(ledger_id="ethereum", body=body),
+        )
+
+    def test_scan_workable_jobs(self) -> None:
+        """Test the concurrent scan, when the later jobs answer first."""
+        behaviour = cast(PerformWorkBehaviour, self.current_behaviour)
+        job_list = ["job_a", "job_b", "job_c", "job_d"]
+        for job in job_list:
+            behaviour.context.state.job_address_to_public_id[job] = TEST_JOB_CONTRACT_ID
+        # (job, contract callable) -> (callback, request nonce)
+        requests: Dict[Tuple[str, str], Tuple[Callable, str]] = {}
+
+        def send_contract_api_request(
+            callback: Callable, job: str, _: str, contract_callable: str, **__: Any
+        ) -> str:
+            nonce = f"nonce_{len(requests)}"
+            requests[(job, contract_callable)] = (callback, nonce)
+            return nonce
+
+        def respond(job: str, contract_callable: str, body: Dict[str, Any]) -> None:
+            callback, nonce = requests[(job, contract_callable)]
+            callback(self._scan_response(nonce, body), behaviour)
+
+        with mock.patch.object(
+            behaviour, "send_contract_api_request", new=send_contract_api_request
+        ), self.patch_params(workable_scan_parallelism=4):
+            scan = behaviour._scan_workable_jobs(job_list)
+            next(scan)
+            # all the jobs are checked at the same time
+            assert set(requests) == {(job, "get_off_chain_data") for job in job_list}
+            for job, workable in (("job_d", True), ("job_b", True)):
+                respond(job, "get_off_chain_data", {})
+                next(scan)
+                respond(job, "workable", {"data": workable})
+                next(scan)
+            # the workability of `job_c` is still being checked when the scan ends
+            respond("job_c", "get_off_chain_data", {})
+            next(scan)
+            assert ("job_c", "workable") in requests
+            respond("job_a", "get_off_chain_data", {})
+            next(scan)
+            respond("job_a", "workable", {"data": False})
+            with pytest.raises(StopIteration) as stop:
+                next(scan)
+
+        # the first workable job in the sorted order is returned, not the first to answer
+        assert stop.value.value == "job_b"
+        # the outstanding check was cancelled, and its late response is dropped
+        with mock.patch.object(behaviour.context.logger, "debug") as mock_debug:
+            respond("job_c", "workable", {"data": True})
+        assert mock_debug.call_args[0][0].startswith(
+            "Dropping cancelled workable check"
+        )
+
+    def test_scan_workable_jobs_timeout(self) -> None:
+        """Test the concurrent scan, when the workability checks time out."""
+        behaviour = cast(PerformWorkBehaviour, self.current_behaviour)
+        job_list = ["job_a", "job_b"]
+        for job in job_list:
+            behaviour.context.state.job_address_to_public_id[job] = TEST_JOB_CONTRACT_ID
+        callbacks: Dict[str, Callable] = {}
+
+        def send_contract_api_request(callback: Callable, *_: Any, **__: Any) -> str:
+            nonce = f"nonce_{len(callbacks)}"
+            callbacks[nonce] = callback
+            return nonce
+
+        def wait_for_condition(
+            condition: Callable[[], bool], timeout: Optional[float] = None
+        ) -> Generator[None, None, None]:
+            assert timeout == behaviour.params.workable_check_timeout
+            # no response arrives in time
+            assert not condition()
+            raise TimeoutException()
+            yield
+
+        with mock.patch.object(
+            behaviour, "send_contract_api_request", new=send_contract_api_request
+        ), mock.patch.object(
+            behaviour, "wait_for_condition", new=wait_for_condition
+        ), self.patch_params(
+            workable_scan_parallelism=2
+        ):
+            scan = behaviour._scan_workable_jobs(job_list)
+            with pytest.raises(StopIteration) as stop:
+                next(scan)
+
+        # the jobs whose checks timed out are assumed not workable
+        assert stop.value.value is None
+        assert len(callbacks) == len(job_list)
+        # the late responses are dropped
+        with mock.patch.object(behaviour.context.logger, "debug") as mock_debug:
+            for nonce, callback in callbacks.items():
+                callback(self._scan_response(nonce, {}), behaviour)
+        assert mock_debug.call_count == len(job_list)
+
+    def test_run_read_cache(self) -> None:
+        """Test perform work, reading the off-chain data once per block."""
+        self.behaviour.context.state.job_address_to_public_id[
+            DUMMY_CONTRACT
+        ] = TEST_JOB_CONTRACT_ID
+        cache = self.behaviour.context.state.contract_state_cache
+        hits = cache.hits
+        with self.patch_params(use_read_cache=True):
+            self.behaviour.act_wrapper()
+            self.mock_get_latest_block({"number": 1, "timestamp": 0})
+            self.mock_get_off_chain_data()
+            self.mock_workable_call(True)
+            # the second `get_off_chain_data` call is served by the cache
+            self.mock_build_work_tx_call(DUMMY_DATA)
+            self.mock_simulate_tx(True)
+            self.mock_build_safe_raw_tx()
+            self.mock_a2a_transaction()
+        assert cache.block_number == 1
+        assert cache.hits == hits + 1
+        # the workability checks, the transactions and their simulations are not cached
+        assert len(cache) == 1
+        self._test_done_flag_set()
+        self.end_round(done_event=Event.WORK_TX)
+
 
 class TestAwaitTopUpBehaviour(Keep3rJobFSMBehaviourBaseCase):
     """Test case to test AwaitTopUpBehaviour."""
@@ -278,7 +278,7 @@ class _TxHelperIntegration(_GnosisHelperIntegration, ABC):  # pragma: no cover
             )
             self.mock_a2a_transaction()
             self.behaviour.current_behaviour.params.mutable_params.tx_hash = tx_digest
-            missed_messages = self.tx_settlement_synchronized_data.missed_messages
+            missed_messages = dict(self.tx_settlement_synchronized_data.missed_messages)
             missed_messages[
                 self.tx_settlement_synchronized_data.most_voted_keeper_address
             ] += 1
@@ -294,7 +294,7 @@ class _TxHelperIntegration(_GnosisHelperIntegration, ABC):  # pragma: no cover
         """Validate the sent transaction."""
 
         if simulate_timeout:
-            missed_messages = self.tx_settlement_synchronized_data.missed_messages
+            missed_messages = dict(self.tx_settlement_synchronized_data.missed_messages)
             missed_messages[
                 tuple(self.tx_settlement_synchronized_data.all_participants)[0]
             ] += 1
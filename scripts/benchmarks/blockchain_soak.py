@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Soak test of the memory of a blockchain, per block retention policy.
+
+Blocks of a few kilobyte-sized transactions, decoded from their bytes as the ABCI round handler does,
+are added to a blockchain, and its process' resident memory is reported every few thousand blocks.
+Each policy runs in its own process, so that the memory of a policy is not reused by the next one.
+
+Usage: python -m scripts.benchmarks.blockchain_soak [--blocks N] [--agents N] [--max-blocks N] [--report-every N]
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Optional, cast
+
+from packages.valory.protocols.abci.custom_types import Header as AbciHeader
+from packages.valory.skills.abstract_round_abci.base import (
+    BaseTxPayload,
+    Block,
+    Blockchain,
+    Transaction,
+)
+
+
+@dataclass(frozen=True)
+class Header:
+    """The subset of a Tendermint header used by the blockchain."""
+
+    height: int
+    timestamp: float
+
+
+@dataclass(frozen=True)
+class JobPayload(BaseTxPayload):
+    """A payload of an agent."""
+
+    content: str
+
+
+def rss_mb() -> float:
+    """Get the resident memory of the process, in megabytes."""
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):  # pragma: nocover
+        # not on linux, fall back to the peak resident memory, in kilobytes on linux, in bytes on macos
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+
+
+def soak(
+    name: str,
+    n_blocks: int,
+    n_agents: int,
+    report_every: int,
+    max_blocks: Optional[int],
+    spill_dir: Optional[str],
+) -> None:
+    """Add blocks to a blockchain, reporting the resident memory of the process."""
+    blockchain = Blockchain(max_blocks=max_blocks, spill_dir=spill_dir)
+    encoded = [
+        Transaction(
+            JobPayload(f"0x{i:040x}", content="0" * 2048), f"0x{i:0130x}"
+        ).encode()
+        for i in range(n_agents)
+    ]
+    start_rss, start = rss_mb(), time.perf_counter()
+    for height in range(1, n_blocks + 1):
+        transactions = [Transaction.decode(data) for data in encoded]
+        header = cast(AbciHeader, Header(height, time.time()))
+        blockchain.add_block(Block(header, transactions))
+        if height % report_every == 0:
+            print(
+                f"{name:>14} {height:>8} {rss_mb() - start_rss:>10.1f} MB "
+                f"{time.perf_counter() - start:>8.1f} s"
+            )
+
+
+def main() -> None:
+    """Run the soak test."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--blocks", type=int, default=20_000)
+    parser.add_argument("--agents", type=int, default=4)
+    parser.add_argument("--max-blocks", type=int, default=1000)
+    parser.add_argument("--report-every", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{'policy':>14} {'blocks':>8} {'rss growth':>13} {'elapsed':>10}")
+    with tempfile.TemporaryDirectory() as spill_dir:
+        policies = (
+            ("unbounded", None, None),
+            ("retained", args.max_blocks, None),
+            ("spilled", args.max_blocks, spill_dir),
+        )
+        context = multiprocessing.get_context("fork")
+        for name, max_blocks, policy_spill_dir in policies:
+            process = context.Process(
+                target=soak,
+                args=(
+                    name,
+                    args.blocks,
+                    args.agents,
+                    args.report_every,
+                    max_blocks,
+                    policy_spill_dir,
+                ),
+            )
+            process.start()
+            process.join()
+
+
+if __name__ == "__main__":
+    main()
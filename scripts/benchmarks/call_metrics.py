@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+"""
+Benchmark the overhead of the metrics of the calls of the ledger connection.
+
+Measures the recording of a call by the ledger dispatcher, from building its key to counting it in the histograms,
+and the counting of the RPC responses of a call in the thread which runs it.
+
+Usage: python -m scripts.benchmarks.call_metrics [--calls N]
+"""
+
+import argparse
+import timeit
+from unittest import mock
+
+from aea.helpers.async_utils import AsyncState
+
+from packages.valory.connections.ledger.connection import PUBLIC_ID
+from packages.valory.connections.ledger.ledger_dispatcher import (
+    LedgerApiRequestDispatcher,
+)
+from packages.valory.connections.ledger.metrics import RpcStats, record_rpc_response
+from packages.valory.protocols.ledger_api.custom_types import Kwargs
+from packages.valory.protocols.ledger_api.message import LedgerApiMessage
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    dispatcher = LedgerApiRequestDispatcher(
+        logger=mock.Mock(), connection_id=PUBLIC_ID, connection_state=AsyncState()
+    )
+    request = LedgerApiMessage(
+        LedgerApiMessage.Performative.GET_STATE,  # type: ignore
+        ledger_id="ethereum",
+        callable="get_block",
+        args=("latest",),
+        kwargs=Kwargs({}),
+    )
+    response = LedgerApiMessage(
+        LedgerApiMessage.Performative.ERROR, code=500, data=b""  # type: ignore
+    )
+    stats = RpcStats()
+    stats.responses, stats.size = 1, 2048
+
+    def rpc_call() -> None:
+        """Stand in for a call which gets a single RPC response."""
+        record_rpc_response(2048)
+
+    timings = {
+        "record a call": lambda: dispatcher.record_call(request, response, 0.01, stats),
+        "run a call with its rpc stats": lambda: RpcStats().run(rpc_call),
+        "run a call without rpc stats": rpc_call,
+    }
+    for name, fn in timings.items():
+        seconds = timeit.timeit(fn, number=args.calls)
+        print(f"{name:>30}: {seconds / args.calls * 1e6:6.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+"""
+Benchmark the per-request overhead of the contract dispatcher with a no-op ledger.
+
+The ledger api points to an unreachable node and the contract callable only encodes its call data,
+so the time measured is the dispatch itself: resolving the contract, building its web3 instance from the ABI,
+and validating the callable's signature.
+Compares the dispatcher without its caches, the way it dispatched before, with the cached one.
+
+Usage: python -m scripts.benchmarks.contract_dispatch [--requests N] [--contracts N]
+"""
+
+import argparse
+import inspect
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from unittest import mock
+
+from aea.common import JSONLike
+from aea.configurations.base import ContractConfig
+from aea.contracts.base import Contract, contract_registry
+from aea.crypto.base import LedgerApi
+from aea.crypto.registries import ledger_apis_registry
+from aea.helpers.async_utils import AsyncState
+from aea_ledger_ethereum import EthereumApi
+
+from packages.valory.connections.ledger import contract_dispatcher
+from packages.valory.connections.ledger.contract_dispatcher import (
+    ContractApiRequestDispatcher,
+)
+from packages.valory.protocols.contract_api import ContractApiMessage
+
+
+LEDGER_ID = "ethereum"
+# nothing listens on the port, the benchmarked requests do not reach the ledger
+NO_OP_ADDRESS = "http://127.0.0.1:1"
+ABI_PATH = (
+    Path(__file__).parents[2]
+    / "packages"
+    / "valory"
+    / "contracts"
+    / "keep3r_v2"
+    / "build"
+    / "Keep3rV2.json"
+)
+KEEPER = "0x000000000000000000000000000000000000dEaD"
+
+
+class BenchmarkContract(Contract):
+    """A contract whose callable builds the call data of a Keep3r V2 call, like most of the repo's contracts."""
+
+    @classmethod
+    def get_raw_transaction(
+        cls, ledger_api: LedgerApi, contract_address: str, **kwargs: Any
+    ) -> Optional[JSONLike]:
+        """Get the raw transaction."""
+        raise NotImplementedError
+
+    @classmethod
+    def get_raw_message(
+        cls, ledger_api: LedgerApi, contract_address: str, **kwargs: Any
+    ) -> Optional[bytes]:
+        """Get raw message."""
+        raise NotImplementedError
+
+    @classmethod
+    def get_state(
+        cls, ledger_api: LedgerApi, contract_address: str, **kwargs: Any
+    ) -> Optional[JSONLike]:
+        """Get state."""
+        raise NotImplementedError
+
+    @classmethod
+    def get_is_keeper_data(
+        cls, ledger_api: LedgerApi, contract_address: str, keeper: str
+    ) -> JSONLike:
+        """Get the call data of `isKeeper`."""
+        instance = cls.get_instance(ledger_api, contract_address)
+        data = instance.encodeABI(fn_name="isKeeper", args=[keeper])
+        return dict(data=data)
+
+
+class UncachedContractApiRequestDispatcher(ContractApiRequestDispatcher):
+    """A dispatcher which makes a new contract for every request, like the dispatcher did before."""
+
+    def get_contract(self, contract_id: str) -> Contract:
+        """Make a new contract."""
+        return self.contract_registry.make(contract_id)
+
+    def get_cached_ledger_api(
+        self, ledger_api: LedgerApi, contract_id: str, contract: Contract
+    ) -> LedgerApi:
+        """Pass the ledger api as it is, so that a new contract instance is built for every request."""
+        return ledger_api
+
+
+def register_contracts(n_contracts: int) -> List[str]:
+    """Register the benchmarked contracts, one per contract id."""
+    contract_interface = EthereumApi.load_contract_interface(ABI_PATH)
+    contract_ids = []
+    for i in range(n_contracts):
+        configuration = ContractConfig(f"benchmark_{i}", "valory", "0.1.0")
+        contract_id = str(configuration.public_id)
+        if contract_id not in contract_registry.specs:
+            contract_registry.register(
+                id_=contract_id,
+                entry_point="scripts.benchmarks.contract_dispatch:BenchmarkContract",
+                class_kwargs={"contract_interface": {LEDGER_ID: contract_interface}},
+                contract_config=configuration,
+            )
+        contract_ids.append(contract_id)
+    return contract_ids
+
+
+def dispatch_all(
+    dispatcher: ContractApiRequestDispatcher,
+    ledger_api: LedgerApi,
+    contract_ids: List[str],
+    requests: int,
+) -> float:
+    """Dispatch `get_state` requests, cycling over the contracts, and return the mean overhead in microseconds."""
+    messages = [
+        ContractApiMessage(
+            performative=ContractApiMessage.Performative.GET_STATE,
+            ledger_id=LEDGER_ID,
+            contract_id=contract_id,
+            contract_address=f"0x{i + 1:040x}",
+            callable="get_is_keeper_data",
+            kwargs=ContractApiMessage.Kwargs(dict(keeper=KEEPER)),
+        )
+        for i, contract_id in enumerate(contract_ids)
+    ]
+
+    def build_response(data: Union[bytes, JSONLike], _: Any) -> Any:
+        return data
+
+    start = time.perf_counter()
+    for i in range(requests):
+        data = dispatcher.dispatch_request(
+            ledger_api, messages[i % len(messages)], None, build_response  # type: ignore
+        )
+        assert isinstance(data, dict) and "data" in data, data  # nosec
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def run(requests: int, n_contracts: int) -> Dict[str, float]:
+    """Run the benchmark."""
+    contract_ids = register_contracts(n_contracts)
+    ledger_api = ledger_apis_registry.make(LEDGER_ID, address=NO_OP_ADDRESS)
+    results = {}
+
+    uncached = UncachedContractApiRequestDispatcher(
+        AsyncState(), connection_id="valory/ledger:0.19.0"
+    )
+    with mock.patch.object(
+        contract_dispatcher, "_get_full_args_spec", inspect.getfullargspec
+    ):
+        results["uncached"] = dispatch_all(uncached, ledger_api, contract_ids, requests)
+    uncached.shutdown_executors()
+
+    cached = ContractApiRequestDispatcher(
+        AsyncState(), connection_id="valory/ledger:0.19.0"
+    )
+    results["cached"] = dispatch_all(cached, ledger_api, contract_ids, requests)
+    cached.shutdown_executors()
+    return results
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--contracts", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"{args.requests} requests over {args.contracts} contracts")
+    results = run(args.requests, args.contracts)
+    for name, overhead in results.items():
+        print(f"{name:>10}: {overhead:8.1f} us/request")
+    print(f"speedup: {results['uncached'] / results['cached']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
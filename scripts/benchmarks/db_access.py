@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Benchmark the per-round cost of the accesses to the AbciAppDB.
+
+A round reads the job list, the gas spent per address and the transaction history of the db, along with a few small
+values, as the synchronized data of the keep3r rounds do, and then updates the db with a few values, one of which is
+a map which was read and modified. The db is run with the values copied on every access, the default, and with the
+read-only values.
+
+Usage: python -m scripts.benchmarks.db_access [--jobs N] [--addresses N] [--history N] [--rounds N]
+"""
+
+import argparse
+import time
+from typing import Any, Dict
+
+from packages.valory.skills.abstract_round_abci.base import AbciAppDB
+
+
+READS_PER_ROUND = 5
+
+
+def make_db(
+    n_jobs: int, n_addresses: int, history: int, read_only_values: bool
+) -> AbciAppDB:
+    """Make a db with multi-kilobyte values."""
+    addresses = [f"0x{i:040x}" for i in range(max(n_jobs, n_addresses))]
+    return AbciAppDB(
+        cross_period_persisted_keys=frozenset(
+            {"job_list", "address_to_gas_spent", "tx_history"}
+        ),
+        setup_data=AbciAppDB.data_to_lists(
+            {
+                "all_participants": addresses[:4],
+                "participants": addresses[:4],
+                "consensus_threshold": 3,
+                "safe_contract_address": addresses[0],
+                "job_list": addresses[:n_jobs],
+                "address_to_gas_spent": dict.fromkeys(
+                    addresses[:n_addresses], 10**15
+                ),
+                "tx_history": [
+                    {"tx_hash": f"0x{i:064x}", "nonce": i, "status": "settled"}
+                    for i in range(history)
+                ],
+            }
+        ),
+        read_only_values=read_only_values,
+    )
+
+
+def run_round(db: AbciAppDB, round_: int) -> None:
+    """Read and update the db, as a round and its behaviour do."""
+    for _ in range(READS_PER_ROUND):
+        db.get_strict("job_list")
+        db.get_strict("tx_history")
+        db.get_strict("participants")
+        db.get_strict("safe_contract_address")
+    address_to_gas_spent: Dict[str, Any] = db.get_copy("address_to_gas_spent")
+    address_to_gas_spent[db.get_strict("safe_contract_address")] += round_
+    db.update(
+        most_voted_tx_hash=f"0x{round_:064x}",
+        address_to_gas_spent=address_to_gas_spent,
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=100)
+    parser.add_argument("--addresses", type=int, default=100)
+    parser.add_argument("--history", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(
+        f"{args.rounds} rounds, {READS_PER_ROUND} reads of {args.jobs} jobs and "
+        f"{args.history} transactions per round"
+    )
+    for read_only_values in (False, True):
+        db = make_db(args.jobs, args.addresses, args.history, read_only_values)
+        start = time.perf_counter()
+        for round_ in range(args.rounds):
+            run_round(db, round_)
+        elapsed = time.perf_counter() - start
+        mode = "read-only" if read_only_values else "copied"
+        print(f"{mode:>10}: {elapsed / args.rounds * 1e6:.1f}us/round")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Benchmark the hashing of the AbciAppDB on the commits, against the size of the db.
+
+A db of `--periods` periods, with `--keys` keys of `--history` values each, is updated with a couple of values per
+block, then hashed, as on every Tendermint commit, in the legacy and in the incremental hash mode.
+
+Usage: python -m scripts.benchmarks.db_hash [--keys N [N ...]] [--history N] [--periods N] [--commits N]
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List
+
+from packages.valory.skills.abstract_round_abci.base import AbciAppDB, DBHashMode
+
+
+def make_value(i: int) -> Dict[str, Any]:
+    """Make a value, shaped like the transaction data of the rounds."""
+    return {"tx_hash": f"0x{i:064x}", "nonce": i, "keepers": [f"0x{i:040x}"] * 4}
+
+
+def make_db(
+    hash_mode: DBHashMode, n_keys: int, history: int, periods: int
+) -> AbciAppDB:
+    """Make a db of the given size."""
+    db = AbciAppDB(setup_data={}, hash_mode=hash_mode)
+    data: Dict[str, List[Any]] = {
+        f"key_{key}": [make_value(i) for i in range(history)] for key in range(n_keys)
+    }
+    for _ in range(periods):
+        db._create_from_keys(**data)  # pylint: disable=protected-access
+    return db
+
+
+def time_commits(db: AbciAppDB, commits: int) -> float:
+    """Time the updates and the hashes of the commits, in seconds per commit."""
+    db.hash()
+    start = time.perf_counter()
+    for i in range(commits):
+        db.update(key_0=make_value(i), key_1=make_value(i + 1))
+        db.hash()
+    return (time.perf_counter() - start) / commits
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keys", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--history", type=int, default=10)
+    parser.add_argument("--periods", type=int, default=2)
+    parser.add_argument("--commits", type=int, default=100)
+    args = parser.parse_args()
+
+    print(
+        f"{'keys':>6} {'values':>8} {'legacy':>12} {'incremental':>12} {'speedup':>8}"
+    )
+    for n_keys in args.keys:
+        latencies = {
+            hash_mode: time_commits(
+                make_db(hash_mode, n_keys, args.history, args.periods), args.commits
+            )
+            for hash_mode in DBHashMode
+        }
+        legacy, incremental = (
+            latencies[DBHashMode.LEGACY],
+            latencies[DBHashMode.INCREMENTAL],
+        )
+        n_values = n_keys * args.history * args.periods
+        print(
+            f"{n_keys:>6} {n_values:>8} {legacy * 1e3:>10.2f}ms {incremental * 1e3:>10.2f}ms "
+            f"{legacy / incremental:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+"""
+Benchmark the ledger connection's dispatch of ledger api requests against a local JSON-RPC stand-in.
+
+Compares making a new ledger api per envelope, the way `RequestDispatcher.dispatch` did before,
+with the long-lived `LedgerApiPool`, in requests per second at the given concurrency.
+
+Usage: python -m scripts.benchmarks.ledger_pool [--latency SECONDS] [--requests N] [--concurrency N [N ...]]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from typing import Any, Dict, cast
+
+from aea.configurations.base import PublicId
+from aea.connections.base import ConnectionStates
+from aea.crypto.base import LedgerApi
+from aea.crypto.registries import ledger_apis_registry
+from aea.helpers.async_utils import AsyncState
+from aea.mail.base import Envelope
+from aea.protocols.base import Address, Message
+from aea.protocols.dialogue.base import Dialogue as BaseDialogue
+
+from scripts.benchmarks.stub_rpc import CHAIN_ID, StubRpcServer
+
+from packages.valory.connections.ledger.base import LedgerApiPool
+from packages.valory.connections.ledger.ledger_dispatcher import (
+    LedgerApiRequestDispatcher,
+)
+from packages.valory.protocols.ledger_api.custom_types import Kwargs
+from packages.valory.protocols.ledger_api.dialogues import LedgerApiDialogue
+from packages.valory.protocols.ledger_api.dialogues import (
+    LedgerApiDialogues as BaseLedgerApiDialogues,
+)
+from packages.valory.protocols.ledger_api.message import LedgerApiMessage
+
+
+LEDGER_ID = "ethereum"
+SKILL_ID = "valory/benchmark:0.1.0"
+# the connection module imports the contract api protocol, which is a third party package
+CONNECTION_ID = PublicId.from_str("valory/ledger:0.19.0")
+
+
+class UnpooledLedgerApis(LedgerApiPool):
+    """A stand-in for the pool which makes a new api for every request, like the dispatcher did before."""
+
+    def get(self, ledger_id: str, config: Dict[str, Any]) -> LedgerApi:
+        """Make a new api."""
+        self.misses += 1
+        return self._make(ledger_id, **config)
+
+
+class LedgerApiDialogues(BaseLedgerApiDialogues):
+    """The dialogues of the requesting skill."""
+
+    def __init__(self) -> None:
+        """Initialize dialogues."""
+
+        def role_from_first_message(  # pylint: disable=unused-argument
+            message: Message, receiver_address: Address
+        ) -> BaseDialogue.Role:
+            """Infer the role of the agent from an incoming/outgoing first message"""
+            return LedgerApiDialogue.Role.AGENT
+
+        BaseLedgerApiDialogues.__init__(
+            self,
+            self_address=SKILL_ID,
+            role_from_first_message=role_from_first_message,
+        )
+
+
+def api_config(url: str) -> Dict[str, Any]:
+    """Get an api config like the one of the agent."""
+    return dict(
+        address=url,
+        chain_id=CHAIN_ID,
+        default_gas_price_strategy="eip1559",
+        is_gas_estimation_enabled=True,
+        poa_chain=False,
+    )
+
+
+async def dispatch_all(
+    dispatcher: LedgerApiRequestDispatcher, requests: int, concurrency: int
+) -> float:
+    """Dispatch `get_block_number` requests, `concurrency` at a time, and return the requests per second."""
+    dialogues = LedgerApiDialogues()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request() -> None:
+        async with semaphore:
+            message, _ = dialogues.create(
+                counterparty=str(CONNECTION_ID),
+                performative=LedgerApiMessage.Performative.GET_STATE,
+                ledger_id=LEDGER_ID,
+                callable="get_block_number",
+                args=(),
+                kwargs=Kwargs({}),
+            )
+            envelope = Envelope(to=message.to, sender=message.sender, message=message)
+            response = cast(LedgerApiMessage, await dispatcher.dispatch(envelope))
+            assert (  # nosec
+                response.performative == LedgerApiMessage.Performative.STATE
+            ), response
+
+    start = time.perf_counter()
+    await asyncio.gather(*(request() for _ in range(requests)))
+    return requests / (time.perf_counter() - start)
+
+
+def run(latency: float, requests: int, concurrency: int) -> Dict[str, Dict[str, float]]:
+    """Run the benchmark at the given concurrency."""
+    results = {}
+    with StubRpcServer(latency=latency) as stub:
+        api_configs = {LEDGER_ID: api_config(stub.url)}
+        for name, pool in (
+            ("new api per request", UnpooledLedgerApis(ledger_apis_registry.make)),
+            ("pooled", LedgerApiPool(ledger_apis_registry.make)),
+        ):
+            loop = asyncio.new_event_loop()
+            dispatcher = LedgerApiRequestDispatcher(
+                AsyncState(ConnectionStates.connected),
+                loop=loop,
+                api_configs=api_configs,
+                logger=logging.getLogger(__name__),
+                connection_id=CONNECTION_ID,
+                ledger_api_pool=pool,
+            )
+            stub.reset_counters()
+            rps = loop.run_until_complete(
+                dispatch_all(dispatcher, requests, concurrency)
+            )
+            loop.close()
+            results[name] = {
+                "rps": rps,
+                "apis made": pool.misses,
+                "http requests": stub.http_requests,
+            }
+    return results
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    args = parser.parse_args()
+
+    print(f"rpc latency: {args.latency * 1000:.1f}ms, {args.requests} requests")
+    for concurrency in args.concurrency:
+        for name, result in run(args.latency, args.requests, concurrency).items():
+            print(
+                f"concurrency {concurrency:>3} {name:>20}: {result['rps']:8.1f} req/s  "
+                f"apis made {result['apis made']:5.0f}  http requests {result['http requests']:5.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
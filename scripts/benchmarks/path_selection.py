@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+Benchmark the keeper state reads of the path selection against a local JSON-RPC stand-in.
+
+Compares the serial reads, one request per field, with the aggregated `get_keeper_state` read.
+
+Usage: python -m scripts.benchmarks.path_selection [--latency SECONDS] [--rounds N]
+"""
+
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from aea_ledger_ethereum import EthereumApi
+from eth_abi import encode
+from web3 import Web3
+
+from scripts.benchmarks.stub_rpc import CHAIN_ID, StubRpcServer
+
+from packages.valory.contracts.keep3r_v2.contract import ERC20_ABI, KeeperV2
+
+
+KEEP3R_V2_ADDRESS = "0xeb02addCfD8B773A5FFA6B9d1FE99c566f8c44CC"
+K3PR_ADDRESS = Web3.to_checksum_address("0x1cEB5cB57C4D4E2b2433641b95Dd330A33185A44")
+BONDING_ASSET = Web3.to_checksum_address("0x1cEB5cB57C4D4E2b2433641b95Dd330A33185A44")
+KEEPER = Web3.to_checksum_address("0x9Ab4D43e5C4AD67C109716B716062F78eecb7995")
+KEEP3R_V2_BUILD = (
+    Path(__file__).parents[2]
+    / "packages"
+    / "valory"
+    / "contracts"
+    / "keep3r_v2"
+    / "build"
+    / "Keep3rV2.json"
+)
+
+
+def serial_reads(ledger_api: EthereumApi) -> None:
+    """Read the keeper state the way `select_path` does, one request per field."""
+    erc20_bonding_asset = ledger_api.api.eth.contract(
+        address=BONDING_ASSET, abi=ERC20_ABI
+    )
+    erc20_k3pr = ledger_api.api.eth.contract(address=K3PR_ADDRESS, abi=ERC20_ABI)
+    ledger_api.api.eth.get_balance(KEEPER)
+    KeeperV2.can_activate_after(ledger_api, KEEP3R_V2_ADDRESS, KEEPER, BONDING_ASSET)
+    erc20_bonding_asset.functions.allowance(KEEPER, KEEP3R_V2_ADDRESS).call()
+    KeeperV2.pending_bonds(ledger_api, KEEP3R_V2_ADDRESS, KEEPER, BONDING_ASSET)
+    KeeperV2.pending_unbonds(ledger_api, KEEP3R_V2_ADDRESS, KEEPER, K3PR_ADDRESS)
+    KeeperV2.bondings(ledger_api, KEEP3R_V2_ADDRESS, KEEPER, K3PR_ADDRESS)
+    KeeperV2.can_withdraw_after(ledger_api, KEEP3R_V2_ADDRESS, KEEPER, K3PR_ADDRESS)
+    ledger_api.api.eth.get_block("latest")
+    erc20_k3pr.functions.balanceOf(KEEPER).call()
+    KeeperV2.can_activate_after(ledger_api, KEEP3R_V2_ADDRESS, KEEPER, BONDING_ASSET)
+    ledger_api.api.eth.get_block("latest")
+    KeeperV2.is_keeper(ledger_api, KEEP3R_V2_ADDRESS, KEEPER)
+
+
+def aggregated_read(ledger_api: EthereumApi) -> None:
+    """Read the keeper state in a single aggregated call."""
+    KeeperV2.get_keeper_state(
+        ledger_api,
+        KEEP3R_V2_ADDRESS,
+        KEEPER,
+        BONDING_ASSET,
+        K3PR_ADDRESS,
+        KEEP3R_V2_ADDRESS,
+    )
+
+
+def measure(
+    stub: StubRpcServer,
+    ledger_api: EthereumApi,
+    reader: Callable[[EthereumApi], None],
+    rounds: int,
+) -> Dict[str, float]:
+    """Measure the latency of a reader."""
+    reader(ledger_api)  # warm up the contract instances and the http session
+    stub.reset_counters()
+    latencies: List[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        reader(ledger_api)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return {
+        "mean_ms": statistics.mean(latencies) * 1000,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "requests_per_read": stub.http_requests / rounds,
+    }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    KeeperV2.contract_interface = {
+        EthereumApi.identifier: json.loads(KEEP3R_V2_BUILD.read_text())
+    }
+    with StubRpcServer(latency=args.latency) as stub:
+        # `keepers()` returns an empty list
+        stub.register_call("keepers()", encode(["address[]"], [[]]))
+        ledger_api = EthereumApi(address=stub.url, chain_id=CHAIN_ID)
+        results = {
+            "serial": measure(stub, ledger_api, serial_reads, args.rounds),
+            "aggregated": measure(stub, ledger_api, aggregated_read, args.rounds),
+        }
+
+    print(f"rpc latency: {args.latency * 1000:.1f}ms, rounds: {args.rounds}")
+    for name, result in results.items():
+        print(
+            f"{name:>10}: mean {result['mean_ms']:8.2f}ms  p50 {result['p50_ms']:8.2f}ms  "
+            f"p95 {result['p95_ms']:8.2f}ms  requests/read {result['requests_per_read']:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
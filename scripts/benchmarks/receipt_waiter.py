@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+"""
+Benchmark the time to receipt of the ledger connection against a local chain stand-in which mines on a timer.
+
+Compares the linear backoff polling of the receipt and then of the transaction
+with the receipt waiter, which looks all the pending receipts and transactions up in a batch on every new block.
+The time to receipt is measured from the mining of the block which includes the transaction.
+
+Usage: python -m scripts.benchmarks.receipt_waiter [--block-time SECONDS] [--transactions N] [--retry-timeout SECONDS]
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from unittest import mock
+
+from aea.connections.base import ConnectionStates
+from aea.crypto.registries import ledger_apis_registry
+from aea.helpers.async_utils import AsyncState
+from aea.helpers.transaction.base import TransactionDigest
+from aea.mail.base import Envelope
+
+from scripts.benchmarks.ledger_pool import (
+    CONNECTION_ID,
+    LEDGER_ID,
+    LedgerApiDialogues,
+    api_config,
+)
+from scripts.benchmarks.receipts import receipt, transaction
+from scripts.benchmarks.stub_rpc import StubRpcServer
+
+from packages.valory.connections.ledger.base import LedgerApiPool
+from packages.valory.connections.ledger.ledger_dispatcher import (
+    LedgerApiRequestDispatcher,
+)
+from packages.valory.connections.ledger.receipt_waiter import ReceiptWaiter
+from packages.valory.protocols.ledger_api.message import LedgerApiMessage
+
+
+class MiningChain:
+    """
+    Mines a block every `block_time` seconds on average and includes each submitted transaction in the next block.
+
+    The block times are jittered by up to a quarter, so that the mining is not in phase with the polling.
+    """
+
+    def __init__(self, stub: StubRpcServer, block_time: float) -> None:
+        """Initialize the chain."""
+        self.stub = stub
+        self.block_time = block_time
+        self.mined_at: Dict[int, float] = {}
+        self.included_in: Dict[str, int] = {}
+        self._random = random.Random(0)  # nosec
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._mine, daemon=True)
+        stub.register("eth_getTransactionReceipt", self._receipt)
+        stub.register("eth_getTransactionByHash", transaction)
+
+    def submit(self, tx_hash: str) -> None:
+        """Submit a transaction, to be included in the next block."""
+        self.included_in[tx_hash] = self.stub.block_number + 1
+
+    def _receipt(self, params: List[Any]) -> Optional[Dict[str, Any]]:
+        """Serve the receipt of a transaction once it is included."""
+        block_number = self.included_in.get(params[0], None)
+        if block_number is None or self.stub.block_number < block_number:
+            return None
+        return {**receipt(params), "blockNumber": hex(block_number)}  # type: ignore
+
+    def _mine(self) -> None:
+        """Mine blocks until stopped."""
+        while not self._stop.wait(self.block_time * self._random.uniform(0.75, 1.25)):
+            self.stub.mine()
+            self.mined_at[self.stub.block_number] = time.perf_counter()
+
+    def start(self) -> None:
+        """Start mining."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop mining."""
+        self._stop.set()
+        self._thread.join()
+
+
+async def wait_for_receipts(
+    dispatcher: LedgerApiRequestDispatcher,
+    chain: MiningChain,
+    transactions: int,
+    interval: float,
+) -> List[float]:
+    """Submit the transactions every `interval` seconds, and get the time to receipt of each."""
+    dialogues = LedgerApiDialogues()
+    times_to_receipt: List[float] = []
+
+    async def request(i: int) -> None:
+        tx_hash = "0x" + i.to_bytes(32, "big").hex()
+        chain.submit(tx_hash)
+        message, _ = dialogues.create(
+            counterparty=str(CONNECTION_ID),
+            performative=LedgerApiMessage.Performative.GET_TRANSACTION_RECEIPT,
+            transaction_digest=TransactionDigest(LEDGER_ID, tx_hash),
+        )
+        envelope = Envelope(to=message.to, sender=message.sender, message=message)
+        response = await dispatcher.dispatch(envelope)
+        received_at = time.perf_counter()
+        assert (  # nosec
+            response.performative == LedgerApiMessage.Performative.TRANSACTION_RECEIPT
+        ), response
+        times_to_receipt.append(
+            received_at - chain.mined_at[chain.included_in[tx_hash]]
+        )
+
+    tasks = []
+    for i in range(transactions):
+        tasks.append(asyncio.ensure_future(request(i)))
+        await asyncio.sleep(interval)
+    await asyncio.gather(*tasks)
+    return times_to_receipt
+
+
+def run(
+    block_time: float, transactions: int, retry_timeout: float, waiter: bool
+) -> Dict[str, float]:
+    """Run the benchmark, with or without the receipt waiter."""
+    with StubRpcServer() as stub:
+        chain = MiningChain(stub, block_time)
+        chain.start()
+        loop = asyncio.new_event_loop()
+        dispatcher = LedgerApiRequestDispatcher(
+            AsyncState(ConnectionStates.connected),
+            loop=loop,
+            api_configs={LEDGER_ID: api_config(stub.url)},
+            logger=logging.getLogger(__name__),
+            connection_id=CONNECTION_ID,
+            ledger_api_pool=LedgerApiPool(ledger_apis_registry.make),
+            retry_timeout=retry_timeout,
+        )
+        with mock.patch.object(ReceiptWaiter, "supports", return_value=waiter):
+            times_to_receipt = loop.run_until_complete(
+                wait_for_receipts(dispatcher, chain, transactions, block_time / 3)
+            )
+        loop.close()
+        chain.stop()
+        dispatcher.shutdown_executors()
+        return {
+            "mean": statistics.mean(times_to_receipt),
+            "p50": statistics.median(times_to_receipt),
+            "max": max(times_to_receipt),
+            "http requests": stub.http_requests,
+        }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--block-time", type=float, default=2.0)
+    parser.add_argument("--transactions", type=int, default=15)
+    parser.add_argument("--retry-timeout", type=float, default=3.0)
+    args = parser.parse_args()
+    # the linear backoff logs every receipt that is not found yet
+    logging.getLogger(__name__).setLevel(logging.ERROR)
+
+    print(
+        f"block time: {args.block_time}s, {args.transactions} transactions, retry timeout: {args.retry_timeout}s"
+    )
+    for name, waiter in (("linear backoff", False), ("receipt waiter", True)):
+        result = run(args.block_time, args.transactions, args.retry_timeout, waiter)
+        print(
+            f"{name:>15}: time to receipt mean {result['mean']:6.2f}s  p50 {result['p50']:6.2f}s  "
+            f"max {result['max']:6.2f}s  http requests {result['http requests']:5.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+"""
+Benchmark `KeeperV2.sender_to_amount_spent` against a local JSON-RPC stand-in.
+
+Compares the per-call event loop and thread pool, with a receipt and a transaction request per hash,
+with the long-lived batching receipt fetcher, cold and warm (all the receipts cached).
+
+Usage: python -m scripts.benchmarks.receipts [--latency SECONDS] [--sizes N [N ...]] [--legacy-max N]
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import time
+from typing import Any, Callable, Dict, List, Optional, cast
+
+from aea_ledger_ethereum import EthereumApi
+
+from scripts.benchmarks.path_selection import KEEP3R_V2_ADDRESS
+from scripts.benchmarks.stub_rpc import CHAIN_ID, StubRpcServer
+
+from packages.valory.contracts.keep3r_v2.contract import KeeperV2
+
+
+SENDERS = ["0x" + (0xBEEF + i).to_bytes(20, "big").hex() for i in range(5)]
+GAS_USED = 21_000
+GAS_PRICE = 10**9
+
+
+def tx_index(tx_hash: str) -> int:
+    """Get the index of a synthetic transaction from its hash."""
+    return int(tx_hash, 16)
+
+
+def receipt(params: List[Any]) -> Optional[Dict[str, Any]]:
+    """Serve a synthetic receipt."""
+    i = tx_index(params[0])
+    return {
+        "transactionHash": params[0],
+        "blockNumber": hex(i // 100 + 1),
+        "from": SENDERS[i % len(SENDERS)],
+        "gasUsed": hex(GAS_USED),
+        "effectiveGasPrice": hex(GAS_PRICE),
+        "status": "0x1",
+        "logs": [],
+    }
+
+
+def transaction(params: List[Any]) -> Optional[Dict[str, Any]]:
+    """Serve a synthetic transaction."""
+    i = tx_index(params[0])
+    return {
+        "hash": params[0],
+        "blockNumber": hex(i // 100 + 1),
+        "from": SENDERS[i % len(SENDERS)],
+        "gasPrice": hex(GAS_PRICE),
+        "gas": hex(GAS_USED),
+        "nonce": hex(i),
+        "value": "0x0",
+        "input": "0x",
+    }
+
+
+def legacy_sender_to_amount_spent(
+    ledger_api: EthereumApi, transaction_hashes: List[str]
+) -> Dict[str, int]:
+    """Get the amount spent per sender, the way `sender_to_amount_spent` did before the fetcher."""
+    loop = asyncio.new_event_loop()
+
+    def get_gas_spent(tx_hash: str) -> Dict[str, int]:
+        tx_receipt = cast(Dict[str, Any], ledger_api.get_transaction_receipt(tx_hash))
+        tx = cast(Dict[str, Any], ledger_api.get_transaction(tx_hash))
+        return {tx["from"]: int(tx["gasPrice"]) * int(tx_receipt["gasUsed"])}
+
+    with concurrent.futures.ThreadPoolExecutor(5) as pool:
+        tasks = [
+            loop.run_in_executor(pool, get_gas_spent, tx_hash)
+            for tx_hash in transaction_hashes
+        ]
+        results = loop.run_until_complete(asyncio.gather(*tasks))
+        loop.close()
+    sender_to_amount_spent: Dict[str, int] = {}
+    for result in results:
+        for sender, spent in result.items():
+            sender_to_amount_spent[sender] = (
+                sender_to_amount_spent.get(sender, 0) + spent
+            )
+    return sender_to_amount_spent
+
+
+def measure(
+    stub: StubRpcServer, fn: Callable[[], Dict[str, int]], size: int
+) -> Dict[str, float]:
+    """Measure a single call."""
+    stub.reset_counters()
+    start = time.perf_counter()
+    sender_to_amount_spent = fn()
+    elapsed = time.perf_counter() - start
+    assert sum(sender_to_amount_spent.values()) == size * GAS_USED * GAS_PRICE  # nosec
+    return {
+        "ms": elapsed * 1000,
+        "requests": stub.http_requests,
+        "calls": stub.rpc_calls,
+    }
+
+
+def run(latency: float, size: int, legacy: bool) -> Dict[str, Dict[str, float]]:
+    """Run the benchmark for the given number of transaction hashes."""
+    transaction_hashes = ["0x" + i.to_bytes(32, "big").hex() for i in range(size)]
+    with StubRpcServer(latency=latency) as stub:
+        stub.register("eth_getTransactionReceipt", receipt)
+        stub.register("eth_getTransactionByHash", transaction)
+        # all the transactions are finalized
+        stub.mine(size // 100 + 100)
+        ledger_api = EthereumApi(address=stub.url, chain_id=CHAIN_ID)
+
+        def fetcher() -> Dict[str, int]:
+            """Get the amount spent per sender with the receipt fetcher."""
+            sender_to_amount_spent = KeeperV2.sender_to_amount_spent(
+                ledger_api, KEEP3R_V2_ADDRESS, transaction_hashes
+            )
+            return cast(Dict[str, int], sender_to_amount_spent["data"])
+
+        results = {}
+        if legacy:
+            results["legacy"] = measure(
+                stub,
+                lambda: legacy_sender_to_amount_spent(ledger_api, transaction_hashes),
+                size,
+            )
+        results["fetcher cold"] = measure(stub, fetcher, size)
+        results["fetcher warm"] = measure(stub, fetcher, size)
+        KeeperV2._receipt_fetchers.clear()  # pylint: disable=protected-access
+    return results
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    # the legacy implementation makes two requests per hash, it takes too long on large inputs
+    parser.add_argument("--legacy-max", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"rpc latency: {args.latency * 1000:.1f}ms")
+    for size in args.sizes:
+        for name, result in run(args.latency, size, size <= args.legacy_max).items():
+            print(
+                f"{size:>7} hashes {name:>12}: {result['ms']:10.2f}ms  "
+                f"http requests {result['requests']:7.0f}  rpc calls {result['calls']:7.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
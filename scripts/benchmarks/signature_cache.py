@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Benchmark the throughput of the transaction verifications of a node, with and without the signature cache.
+
+Every agent sends a signed payload per block, which the node decodes and verifies on `check_tx`, then on `deliver_tx`,
+as the ABCI round handler does.
+
+Usage: python -m scripts.benchmarks.signature_cache [--agents N [N ...]] [--blocks N]
+"""
+
+import argparse
+import time
+from dataclasses import dataclass
+from typing import List
+
+from aea_ledger_ethereum import EthereumCrypto
+
+from packages.valory.skills.abstract_round_abci.base import (
+    BaseTxPayload,
+    SignatureCache,
+    Transaction,
+)
+
+
+LEDGER_ID = "ethereum"
+
+
+@dataclass(frozen=True)
+class VotePayload(BaseTxPayload):
+    """A payload of an agent."""
+
+    vote: str
+
+
+def make_transactions(n_agents: int, n_blocks: int) -> List[List[bytes]]:
+    """Make the signed transactions of the agents, per block."""
+    agents = [EthereumCrypto() for _ in range(n_agents)]
+    blocks = []
+    for block in range(n_blocks):
+        transactions = []
+        for agent in agents:
+            payload = VotePayload(agent.address, vote=f"0x{block:064x}")
+            signature = agent.sign_message(payload.encode())
+            transactions.append(Transaction(payload, signature).encode())
+        blocks.append(transactions)
+    return blocks
+
+
+def verify_blocks(blocks: List[List[bytes]], cache: SignatureCache) -> float:
+    """Check then deliver the transactions of the blocks, in transactions per second."""
+    start = time.perf_counter()
+    for transactions in blocks:
+        for _ in ("check_tx", "deliver_tx"):
+            for transaction_bytes in transactions:
+                transaction = Transaction.decode(transaction_bytes)
+                cache.verify(transaction, transaction_bytes, LEDGER_ID)
+    elapsed = time.perf_counter() - start
+    return sum(map(len, blocks)) / elapsed
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, nargs="+", default=[4, 16, 64])
+    parser.add_argument("--blocks", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'agents':>6} {'uncached':>12} {'cached':>12} {'hit rate':>9}")
+    for n_agents in args.agents:
+        blocks = make_transactions(n_agents, args.blocks)
+        uncached = verify_blocks(blocks, SignatureCache(max_size=0))
+        cache = SignatureCache()
+        cached = verify_blocks(blocks, cache)
+        print(
+            f"{n_agents:>6} {uncached:>8.0f}tx/s {cached:>8.0f}tx/s {cache.hit_rate:>9.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+"""
+Benchmark the batched `get_state` calls against a local JSON-RPC stand-in.
+
+Compares the calls made one at a time, and concurrently on the default number of workers of a chain executor,
+with the calls of the `get_state_batch` performative, whose requests are sent as JSON-RPC batches.
+
+Usage: python -m scripts.benchmarks.state_batch [--latency SECONDS] [--sizes N [N ...]]
+"""
+
+import argparse
+import concurrent.futures
+import time
+from typing import Any, Callable, Dict, List
+
+from aea_ledger_ethereum import EthereumApi
+from web3 import Web3
+
+from scripts.benchmarks.stub_rpc import CHAIN_ID, StubRpcServer
+
+from packages.valory.connections.ledger.base import DEFAULT_EXECUTOR_CONFIG
+from packages.valory.connections.ledger.state_batcher import StateBatcher
+
+
+def make_calls(size: int) -> List[Dict[str, Any]]:
+    """Make the calls, alternating balances and nonces."""
+    calls = []
+    for i in range(size):
+        address = Web3.to_checksum_address(
+            "0x" + (0xBEEF + i).to_bytes(20, "big").hex()
+        )
+        callable_name = "get_balance" if i % 2 else "get_transaction_count"
+        calls.append({"callable": callable_name, "args": [address], "kwargs": {}})
+    return calls
+
+
+def get_single_state(ledger_api: EthereumApi, call: Dict[str, Any]) -> Any:
+    """Get the state of a call with a single request."""
+    return {
+        "state": ledger_api.get_state(call["callable"], *call["args"], **call["kwargs"])
+    }
+
+
+def measure(
+    stub: StubRpcServer, fn: Callable[[], List[Any]], size: int
+) -> Dict[str, float]:
+    """Measure a single run."""
+    stub.reset_counters()
+    start = time.perf_counter()
+    states = fn()
+    elapsed = time.perf_counter() - start
+    assert len(states) == size and all("state" in s for s in states)  # nosec
+    return {
+        "ms": elapsed * 1000,
+        "requests": stub.http_requests,
+        "calls": stub.rpc_calls,
+    }
+
+
+def run(latency: float, size: int) -> Dict[str, Dict[str, float]]:
+    """Run the benchmark for the given number of calls."""
+    calls = make_calls(size)
+    with StubRpcServer(latency=latency) as stub:
+        stub.register("eth_getTransactionCount", lambda _: hex(7))
+        ledger_api = EthereumApi(address=stub.url, chain_id=CHAIN_ID)
+        batcher = StateBatcher(ledger_api)
+
+        def concurrent_states() -> List[Any]:
+            """Get the states concurrently, one request per call."""
+            with concurrent.futures.ThreadPoolExecutor(
+                DEFAULT_EXECUTOR_CONFIG["max_workers"]
+            ) as pool:
+                return list(
+                    pool.map(lambda call: get_single_state(ledger_api, call), calls)
+                )
+
+        results = {
+            "sequential": measure(
+                stub,
+                lambda: [get_single_state(ledger_api, call) for call in calls],
+                size,
+            ),
+            "concurrent": measure(stub, concurrent_states, size),
+            "batched": measure(stub, lambda: batcher.get_states(calls), size),
+        }
+        expected = [get_single_state(ledger_api, call) for call in calls]
+        assert batcher.get_states(calls) == expected  # nosec
+    return results
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1_000])
+    args = parser.parse_args()
+
+    print(f"rpc latency: {args.latency * 1000:.1f}ms")
+    for size in args.sizes:
+        results = run(args.latency, size)
+        for name, result in results.items():
+            print(
+                f"{size:>6} calls {name:>10}: {result['ms']:10.2f}ms  "
+                f"http requests {result['requests']:6.0f}  rpc calls {result['calls']:6.0f}"
+            )
+        print(
+            f"{size:>6} calls speedup over concurrent: "
+            f"{results['concurrent']['ms'] / results['batched']['ms']:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
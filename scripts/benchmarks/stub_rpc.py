@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""A local JSON-RPC stand-in of an Ethereum node, to be used by the benchmarks."""
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from eth_abi import decode, encode
+from eth_utils import function_signature_to_4byte_selector
+
+
+CHAIN_ID = 31337
+ZERO_WORD = b"\x00" * 32
+AGGREGATE3_SELECTOR = function_signature_to_4byte_selector(
+    "aggregate3((address,bool,bytes)[])"
+)
+
+RpcHandler = Callable[[List[Any]], Any]
+
+
+class StubRpcServer:  # pylint: disable=too-many-instance-attributes
+    """
+    A minimal Ethereum JSON-RPC server.
+
+    Every HTTP request is delayed by `latency` seconds, to emulate the round-trip to a remote node,
+    and fails with probability `error_rate`. JSON-RPC batches are served in a single HTTP request.
+    `eth_call`s return a zero word, unless a response has been registered for the called selector,
+    and Multicall3 `aggregate3` calls return a successful zero word for every aggregated call.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Initialize the server."""
+        self.latency = latency
+        self.error_rate = error_rate
+        self.block_number = 1
+        self.http_requests = 0
+        self.rpc_calls = 0
+        self.response_bytes = 0
+        self._random = random.Random(seed)  # nosec
+        self._lock = threading.Lock()
+        self._call_responses: Dict[bytes, bytes] = {}
+        self._handlers: Dict[str, RpcHandler] = {
+            "eth_chainId": lambda _: hex(CHAIN_ID),
+            "net_version": lambda _: str(CHAIN_ID),
+            "eth_blockNumber": lambda _: hex(self.block_number),
+            "eth_gasPrice": lambda _: hex(10**9),
+            "eth_maxPriorityFeePerGas": lambda _: hex(10**9),
+            "eth_getBalance": lambda _: hex(10**18),
+            "eth_getBlockByNumber": self._get_block,
+            "eth_call": self._call,
+        }
+        self._server = ThreadingHTTPServer((host, port), _make_request_handler(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """Get the url of the server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def register(self, method: str, handler: RpcHandler) -> None:
+        """Register a handler for a JSON-RPC method; the handler receives the request params."""
+        self._handlers[method] = handler
+
+    def register_call(self, signature: str, response: bytes) -> None:
+        """Register the raw response of the `eth_call`s to the function with the given signature."""
+        self._call_responses[function_signature_to_4byte_selector(signature)] = response
+
+    def mine(self, blocks: int = 1) -> None:
+        """Advance the chain by the given number of blocks."""
+        with self._lock:
+            self.block_number += blocks
+
+    def reset_counters(self) -> None:
+        """Reset the request counters."""
+        with self._lock:
+            self.http_requests = 0
+            self.rpc_calls = 0
+            self.response_bytes = 0
+
+    def start(self) -> "StubRpcServer":
+        """Start serving in a background thread."""
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubRpcServer":
+        """Start the server on entering the context."""
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Stop the server on exiting the context."""
+        self.stop()
+
+    def _get_block(self, params: List[Any]) -> Dict[str, Any]:
+        """Get a minimal block."""
+        identifier = params[0]
+        number = self.block_number if identifier == "latest" else int(identifier, 16)
+        return {
+            "number": hex(number),
+            "hash": "0x" + number.to_bytes(32, "big").hex(),
+            "parentHash": "0x" + max(number - 1, 0).to_bytes(32, "big").hex(),
+            "timestamp": hex(number * 12),
+            "baseFeePerGas": hex(10**9),
+            "gasLimit": hex(30_000_000),
+            "gasUsed": hex(0),
+            "miner": "0x" + "00" * 20,
+            "transactions": [],
+        }
+
+    def _call(self, params: List[Any]) -> str:
+        """Serve an `eth_call`."""
+        data = bytes.fromhex(params[0].get("data", params[0].get("input", "0x"))[2:])
+        selector = data[:4]
+        if selector == AGGREGATE3_SELECTOR:
+            (calls,) = decode(["(address,bool,bytes)[]"], data[4:])
+            results = [
+                (True, self._call_responses.get(call[2][:4], ZERO_WORD))
+                for call in calls
+            ]
+            return "0x" + encode(["(bool,bytes)[]"], [results]).hex()
+        return "0x" + self._call_responses.get(selector, ZERO_WORD).hex()
+
+    def _handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle a single JSON-RPC request."""
+        response: Dict[str, Any] = {"jsonrpc": "2.0", "id": request.get("id")}
+        handler = self._handlers.get(request["method"])
+        if handler is None:
+            response["error"] = {"code": -32601, "message": "Method not found"}
+            return response
+        response["result"] = handler(request.get("params", []))
+        return response
+
+    def respond(self, body: Any) -> Optional[bytes]:
+        """Serve the body of a JSON-RPC HTTP request; `None` stands for an injected failure."""
+        with self._lock:
+            self.http_requests += 1
+            self.rpc_calls += len(body) if isinstance(body, list) else 1
+            failed = self._random.random() < self.error_rate
+        time.sleep(self.latency)
+        if failed:
+            return None
+        if isinstance(body, list):
+            response: Any = [self._handle(request) for request in body]
+        else:
+            response = self._handle(body)
+        content = json.dumps(response).encode()
+        with self._lock:
+            self.response_bytes += len(content)
+        return content
+
+
+def _make_request_handler(stub: StubRpcServer) -> Type[BaseHTTPRequestHandler]:
+    """Make the HTTP request handler class bound to a stub server."""
+
+    class _RequestHandler(BaseHTTPRequestHandler):
+        """Serve JSON-RPC over HTTP POST."""
+
+        def do_POST(self) -> None:  # pylint: disable=invalid-name
+            """Handle a POST request."""
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            content = stub.respond(body)
+            if content is None:
+                self.send_error(503, "Injected failure")
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args: Any) -> None:
+            """Do not log every request."""
+
+    return _RequestHandler
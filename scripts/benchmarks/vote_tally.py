@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Benchmark the cost of a collect-same-until-threshold round, with and without the incremental tally of the votes.
+
+The agents deliver their payloads a few per block, and the round checks whether it is done at the end of each block.
+A quarter of the agents vote for another value, so that the threshold is reached near the end of the round.
+The untallied round counts all the collected payloads on every access, as the previous versions did.
+
+Usage: python -m scripts.benchmarks.vote_tally [--agents N [N ...]] [--payload-size N] [--per-block N] [--rounds N]
+"""
+
+import argparse
+import time
+from collections import Counter
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, List, Mapping, Tuple, Type
+
+from packages.valory.skills.abstract_round_abci.base import (
+    ABCIAppException,
+    ABCIAppInternalError,
+    AbciAppDB,
+    BaseSynchronizedData,
+    BaseTxPayload,
+    CollectSameUntilThresholdRound,
+)
+
+
+class Event(Enum):
+    """The events of the round."""
+
+    DONE = "done"
+    NONE = "none"
+    NO_MAJORITY = "no_majority"
+
+
+@dataclass(frozen=True)
+class VotePayload(BaseTxPayload):
+    """A payload of an agent."""
+
+    content: str
+
+
+class VoteRound(CollectSameUntilThresholdRound):
+    """A round collecting the same content from the agents."""
+
+    payload_class = VotePayload
+    synchronized_data_class = BaseSynchronizedData
+    done_event = Event.DONE
+    none_event = Event.NONE
+    no_majority_event = Event.NO_MAJORITY
+    collection_key = "participant_to_content"
+    selection_key = "most_voted_content"
+
+
+class UntalliedVoteRound(VoteRound):
+    """A round counting all the collected payloads on every access, as the previous versions did."""
+
+    @property
+    def payload_values_count(self) -> Counter:
+        """Get count of payload values."""
+        return Counter(map(lambda p: p.values, self.payloads))
+
+    @property
+    def threshold_reached(self) -> bool:
+        """Check if the threshold has been reached."""
+        counts = self.payload_values_count.values()
+        return any(
+            count >= self.synchronized_data.consensus_threshold for count in counts
+        )
+
+    @property
+    def most_voted_payload_values(self) -> Tuple[Any, ...]:
+        """Get the most voted payload values."""
+        values, max_votes = self.payload_values_count.most_common()[0]
+        if max_votes < self.synchronized_data.consensus_threshold:
+            raise ABCIAppInternalError("not enough votes")
+        return values
+
+    def check_majority_possible(
+        self,
+        votes_by_participant: Mapping[str, BaseTxPayload],
+        nb_participants: int,
+        exception_cls: Type[ABCIAppException] = ABCIAppException,
+    ) -> None:
+        """Check the majority over a plain mapping, which is counted on every call."""
+        super().check_majority_possible(
+            dict(votes_by_participant), nb_participants, exception_cls
+        )
+
+
+def make_synchronized_data(agents: List[str]) -> BaseSynchronizedData:
+    """Make the synchronized data of the agents."""
+    return BaseSynchronizedData(
+        AbciAppDB(
+            setup_data=AbciAppDB.data_to_lists(
+                {
+                    "all_participants": agents,
+                    "participants": agents,
+                    "consensus_threshold": None,
+                    "safe_contract_address": agents[0],
+                }
+            )
+        )
+    )
+
+
+def make_payloads(agents: List[str], payload_size: int) -> List[VotePayload]:
+    """Make the payloads of the agents, a quarter of which vote for another content."""
+    dissenters = len(agents) // 4
+    return [
+        VotePayload(agent, content=("b" if i < dissenters else "a") * payload_size)
+        for i, agent in enumerate(agents)
+    ]
+
+
+def run_round(
+    round_cls: Type[VoteRound],
+    synchronized_data: BaseSynchronizedData,
+    payloads: List[VotePayload],
+    per_block: int,
+) -> float:
+    """Run a round, delivering the payloads a few per block, and return its duration in seconds."""
+    start = time.perf_counter()
+    round_ = round_cls(synchronized_data)
+    for i in range(0, len(payloads), per_block):
+        for payload in payloads[i : i + per_block]:
+            round_.check_payload(payload)
+            round_.process_payload(payload)
+        result = round_.end_block()
+        if result is not None:
+            assert result[1] == Event.DONE  # nosec
+            break
+    else:
+        raise AssertionError("The round did not end.")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, nargs="+", default=[16, 64, 256])
+    parser.add_argument("--payload-size", type=int, default=10_000)
+    parser.add_argument("--per-block", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'agents':>6} {'untallied':>12} {'tallied':>12} {'speedup':>8}")
+    for n_agents in args.agents:
+        agents = [f"0x{i:040x}" for i in range(n_agents)]
+        synchronized_data = make_synchronized_data(agents)
+        payloads = make_payloads(agents, args.payload_size)
+        untallied = min(
+            run_round(UntalliedVoteRound, synchronized_data, payloads, args.per_block)
+            for _ in range(args.rounds)
+        )
+        tallied = min(
+            run_round(VoteRound, synchronized_data, payloads, args.per_block)
+            for _ in range(args.rounds)
+        )
+        print(
+            f"{n_agents:>6} {untallied * 1e3:>9.2f} ms {tallied * 1e3:>9.2f} ms "
+            f"{untallied / tallied:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
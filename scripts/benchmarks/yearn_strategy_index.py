@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+"""
+Benchmark the per-period cost of getting the Yearn factory strategies, as the log history grows.
+
+Compares the full history scan, five `eth_getLogs` queries from the factory deployment block per call,
+with the on-disk strategy index. A period is a `workable` plus a `build_work_tx` call, a few blocks apart from the previous one.
+
+Usage: python -m scripts.benchmarks.yearn_strategy_index [--latency SECONDS] [--sizes N [N ...]] [--periods N]
+"""
+
+import argparse
+import bisect
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Set
+
+from aea_ledger_ethereum import EthereumApi
+from eth_abi import encode
+from web3.types import RPCEndpoint
+
+from scripts.benchmarks.stub_rpc import CHAIN_ID, StubRpcServer
+
+from packages.valory.contracts.yearn_factory_harvest_job.contract import (
+    TOPICS,
+    TOPIC_STRATEGY_ADDED,
+    TOPIC_STRATEGY_ADDED_TO_QUEUE,
+    VAULT_FACTORY_DEPLOYMENT_BLOCK,
+    YearnFactoryHarvestJobContract,
+)
+
+
+VAULTS = ["0x" + (0xA000 + i).to_bytes(20, "big").hex() for i in range(100)]
+LOGS_PER_BLOCK = 5
+BLOCKS_PER_PERIOD = 25
+
+
+def strategy_added_log(block: int, i: int) -> Dict[str, Any]:
+    """Make a `StrategyAdded` log."""
+    return {
+        "address": VAULTS[i % len(VAULTS)],
+        "topics": [
+            TOPIC_STRATEGY_ADDED,
+            "0x" + "00" * 12 + (i + 1).to_bytes(20, "big").hex(),
+        ],
+        "data": "0x" + encode(["uint256"] * 4, [0, 0, 0, 0]).hex(),
+        "blockNumber": hex(block),
+        "blockHash": "0x" + block.to_bytes(32, "big").hex(),
+        "transactionHash": "0x" + i.to_bytes(32, "big").hex(),
+        "transactionIndex": "0x0",
+        "logIndex": hex(i % LOGS_PER_BLOCK),
+        "removed": False,
+    }
+
+
+def legacy_get_strategies(ledger_api: EthereumApi) -> List[str]:
+    """Scan the full history, the way `get_strategies` did before the index."""
+    all_vaults = YearnFactoryHarvestJobContract.get_vaults(ledger_api)
+    logs_by_topic = {}
+    for topic in TOPICS:
+        log_filter = {
+            "address": all_vaults,
+            "topics": [topic],
+            "fromBlock": VAULT_FACTORY_DEPLOYMENT_BLOCK,
+        }
+        logs_by_topic[topic] = ledger_api.api.provider.make_request(
+            RPCEndpoint("eth_getLogs"), [log_filter]
+        )["result"]
+    added = {log["topics"][1] for log in logs_by_topic[TOPIC_STRATEGY_ADDED]}
+    removed: Set[str] = set()
+    for topic in TOPICS[1:]:
+        for log in logs_by_topic[topic]:
+            # the migrations are absent from the synthetic history
+            (added if topic == TOPIC_STRATEGY_ADDED_TO_QUEUE else removed).add(
+                log["topics"][1]
+            )
+    return sorted(
+        YearnFactoryHarvestJobContract.address_from_topic(ledger_api, strategy)
+        for strategy in added - removed
+    )
+
+
+def run(
+    latency: float, size: int, periods: int, index_path: str
+) -> Dict[str, Dict[str, float]]:
+    """Run the benchmark against a history of `size` logs."""
+    start_block = int(VAULT_FACTORY_DEPLOYMENT_BLOCK, 16)
+    logs = [
+        strategy_added_log(start_block + i // LOGS_PER_BLOCK, i) for i in range(size)
+    ]
+    log_blocks = [int(log["blockNumber"], 16) for log in logs]
+    with StubRpcServer(latency=latency) as stub:
+
+        def get_logs(params: List[Any]) -> List[Dict[str, Any]]:
+            """Serve the logs matching the filter."""
+            log_filter = params[0]
+            from_block = int(log_filter["fromBlock"], 16)
+            to_block = int(log_filter.get("toBlock", hex(stub.block_number)), 16)
+            topics = log_filter["topics"][0]
+            topics = topics if isinstance(topics, list) else [topics]
+            # the logs are sorted by block
+            first = bisect.bisect_left(log_blocks, from_block)
+            last = bisect.bisect_right(log_blocks, to_block)
+            return [log for log in logs[first:last] if log["topics"][0] in topics]
+
+        stub.register("eth_getLogs", get_logs)
+        stub.register_call("allDeployedVaults()", encode(["address[]"], [VAULTS]))
+        stub.mine(start_block + size // LOGS_PER_BLOCK)
+        ledger_api = EthereumApi(address=stub.url, chain_id=CHAIN_ID)
+
+        def indexed() -> None:
+            """Get the strategies for `workable`, then for `build_work_tx`."""
+            for _ in range(2):
+                YearnFactoryHarvestJobContract.get_strategies(ledger_api, index_path)
+
+        def legacy() -> None:
+            """Scan the full history for `workable`, then for `build_work_tx`."""
+            for _ in range(2):
+                legacy_get_strategies(ledger_api)
+
+        # the first indexed period builds the index from scratch
+        cold = measure(stub, indexed, 1)
+        return {
+            "full scan": measure(stub, legacy, periods),
+            "index cold": cold,
+            "index warm": measure(stub, indexed, periods),
+        }
+
+
+def measure(
+    stub: StubRpcServer, period: Callable[[], None], periods: int
+) -> Dict[str, float]:
+    """Measure the mean cost of a period."""
+    stub.reset_counters()
+    latencies = []
+    for _ in range(periods):
+        stub.mine(BLOCKS_PER_PERIOD)
+        start = time.perf_counter()
+        period()
+        latencies.append(time.perf_counter() - start)
+    return {
+        "ms": statistics.mean(latencies) * 1000,
+        "requests": stub.http_requests / periods,
+        "response_kb": stub.response_bytes / periods / 1024,
+    }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--periods", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"rpc latency: {args.latency * 1000:.1f}ms, periods: {args.periods}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in args.sizes:
+            index_path = str(Path(tmp_dir) / f"index_{size}.json")
+            for name, result in run(
+                args.latency, size, args.periods, index_path
+            ).items():
+                print(
+                    f"{size:>7} logs {name:>10}: {result['ms']:9.2f}ms/period  "
+                    f"requests {result['requests']:5.1f}  response {result['response_kb']:10.1f}KiB"
+                )
+
+
+if __name__ == "__main__":
+    main()